@@ -29,14 +29,19 @@ from .entities import (
     RootEntity,
 )
 from .events import (
+    CompressionDictionary,
+    DatabaseEventCompressor,
     DatabaseEventRepository,
     Event,
+    EventCompressor,
+    EventCompressorDatabaseOperationFactory,
     EventDatabaseOperationFactory,
     EventEntry,
     EventRepository,
     FieldDiff,
     FieldDiffContainer,
     IncrementalFieldDiff,
+    InMemoryEventCompressor,
     InMemoryEventRepository,
 )
 from .exceptions import (
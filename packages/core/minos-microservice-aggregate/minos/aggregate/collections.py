@@ -157,12 +157,18 @@ class IncrementalSetDiff(DeclarativeModel):
 
     @staticmethod
     def _diff(new: IncrementalSet[T], old: IncrementalSet[T], get_fn) -> list[IncrementalSetDiffEntry]:
+        if get_fn is None:
+            # The membership is based on the values themselves, so the plain sets (and their cached hashes) are used.
+            created, deleted = new.data - old.data, old.data - new.data
+        else:
+            created, deleted = new - old, old - new
+
         result = list()
-        for value in new - old:
+        for value in created:
             entry = IncrementalSetDiffEntry(Action.CREATE, value)
             result.append(entry)
 
-        for value in old - new:
+        for value in deleted:
             entry = IncrementalSetDiffEntry(Action.DELETE, value)
             result.append(entry)
 
@@ -321,7 +321,7 @@ class RootEntity(Entity):
                 f"To apply the difference, it must have same uuid. " f"Expected: {self.uuid!r} Obtained: {event.uuid!r}"
             )
 
-        logger.debug(f"Applying {event!r} to {self!r}...")
+        logger.debug("Applying %r to %r...", event, self)
         for diff in event.fields_diff.flatten_values():
             if isinstance(diff, IncrementalFieldDiff):
                 container = getattr(self, diff.name)
@@ -1,3 +1,10 @@
+from .compressors import (
+    CompressionDictionary,
+    DatabaseEventCompressor,
+    EventCompressor,
+    EventCompressorDatabaseOperationFactory,
+    InMemoryEventCompressor,
+)
 from .entries import (
     EventEntry,
 )
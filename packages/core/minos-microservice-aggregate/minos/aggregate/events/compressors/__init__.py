@@ -0,0 +1,13 @@
+from .abc import (
+    EventCompressor,
+)
+from .database import (
+    DatabaseEventCompressor,
+    EventCompressorDatabaseOperationFactory,
+)
+from .dictionaries import (
+    CompressionDictionary,
+)
+from .memory import (
+    InMemoryEventCompressor,
+)
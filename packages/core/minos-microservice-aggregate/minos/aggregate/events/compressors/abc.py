@@ -0,0 +1,241 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from asyncio import (
+    Task,
+    create_task,
+    gather,
+    get_running_loop,
+)
+from collections import (
+    defaultdict,
+)
+from collections.abc import (
+    Iterable,
+)
+from functools import (
+    partial,
+)
+from typing import (
+    Optional,
+)
+
+try:
+    from zstandard import (
+        FRAME_HEADER,
+        ZstdCompressor,
+        ZstdDecompressor,
+        get_frame_parameters,
+        train_dictionary,
+    )
+except ImportError:  # pragma: no cover
+    ZstdCompressor = None
+
+from minos.common import (
+    Injectable,
+    SetupMixin,
+)
+
+from ...exceptions import (
+    EventRepositoryException,
+)
+from .dictionaries import (
+    CompressionDictionary,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@Injectable("event_compressor")
+class EventCompressor(ABC, SetupMixin):
+    """Event Compressor base class.
+
+    The compressor transparently compresses the event data with ``zstd``. As the events of the same ``RootEntity``
+    type are highly repetitive, a dictionary is trained per entity name from the first ``training_size`` events and
+    then used to compress the following ones. The dictionaries are versioned and identified by the ``zstd`` dictionary
+    identifier, which is written on each compressed frame, so any stored data can be decompressed even after training
+    newer versions.
+
+    The automatic training runs on a background task (and the dictionary is trained on an executor), so the events are
+    compressed with the current dictionary until the new one has been trained and stored.
+
+    The data that is not a ``zstd`` frame (for example, the data stored before enabling the compression) is returned
+    as it is, and the compressed data is only used when it is smaller than the original one.
+
+    The compression requires the ``zstandard`` package, so the instances can only be built if it is installed.
+    """
+
+    def __init__(
+        self,
+        *args,
+        level: int = 3,
+        dictionary_size: int = 16 * 1024,
+        training_size: int = 1000,
+        **kwargs,
+    ):
+        if ZstdCompressor is None:
+            raise ImportError("The 'zstandard' package is required to compress the events.")
+
+        super().__init__(*args, **kwargs)
+        self._level = level
+        self._dictionary_size = dictionary_size
+        self._training_size = training_size
+
+        self._dictionaries = dict()
+        self._latest = dict()
+        self._compressors = dict()
+        self._decompressors = dict()
+        self._samples = defaultdict(list)
+        self._trainings: dict[str, Task] = dict()
+
+    async def _setup(self) -> None:
+        await super()._setup()
+        self._add_dictionaries(await self._load())
+
+    async def _destroy(self) -> None:
+        await gather(*self._trainings.values())
+        await super()._destroy()
+
+    @property
+    def dictionaries(self) -> dict[int, CompressionDictionary]:
+        """Get the known dictionaries.
+
+        :return: A ``dict`` with dictionary identifiers as keys and ``CompressionDictionary`` instances as values.
+        """
+        return dict(self._dictionaries)
+
+    def get_latest(self, name: str) -> Optional[CompressionDictionary]:
+        """Get the latest known dictionary for the given entity name.
+
+        :param name: The classname of the ``RootEntity``.
+        :return: A ``CompressionDictionary`` instance or ``None`` if there is not any dictionary for the entity name.
+        """
+        return self._latest.get(name)
+
+    async def compress(self, name: str, data: bytes) -> bytes:
+        """Compress the given data.
+
+        :param name: The classname of the ``RootEntity`` related with the data.
+        :param data: The data to be compressed.
+        :return: A ``bytes`` value.
+        """
+        if not data:
+            return data
+
+        if (dictionary := self._latest.get(name)) is None:
+            self._add_sample(name, data)
+
+        compressed = self._get_compressor(dictionary).compress(data)
+        if len(compressed) >= len(data):
+            return data
+        return compressed
+
+    async def decompress(self, data: bytes) -> bytes:
+        """Decompress the given data.
+
+        :param data: The data to be decompressed.
+        :return: A ``bytes`` value.
+        """
+        if not data.startswith(FRAME_HEADER):
+            return data
+
+        dictionary_id = get_frame_parameters(data).dict_id
+        dictionary = None
+        if dictionary_id:
+            if dictionary_id not in self._dictionaries:
+                self._add_dictionaries(await self._load({dictionary_id}))
+            try:
+                dictionary = self._dictionaries[dictionary_id]
+            except KeyError:
+                raise EventRepositoryException(f"The {dictionary_id!r} compression dictionary could not be found.")
+
+        return self._get_decompressor(dictionary).decompress(data)
+
+    async def train(self, name: str, samples: Iterable[bytes]) -> CompressionDictionary:
+        """Train and store a new dictionary version for the given entity name.
+
+        :param name: The classname of the ``RootEntity``.
+        :param samples: The (uncompressed) data samples.
+        :return: The new ``CompressionDictionary`` instance.
+        """
+        latest = self._latest.get(name)
+        version = 1 if latest is None else latest.version + 1
+
+        fn = partial(train_dictionary, self._dictionary_size, list(samples), level=self._level)
+        zstd_dict = await get_running_loop().run_in_executor(None, fn)
+        dictionary = CompressionDictionary.from_zstd_dict(name, version, zstd_dict)
+
+        await self._store(dictionary)
+        dictionary = await self._load_stored(dictionary)
+        self._add_dictionaries([dictionary])
+
+        logger.info("Trained the %r compression dictionary for %r (version %r).", dictionary.id, name, version)
+        return dictionary
+
+    async def _load_stored(self, dictionary: CompressionDictionary) -> CompressionDictionary:
+        # The dictionaries are stored only if their identifier is not stored yet, so the stored one is the one to use.
+        stored = await self._load({dictionary.id})
+        if not stored:
+            raise EventRepositoryException(f"The {dictionary.id!r} compression dictionary could not be stored.")
+
+        if stored[0] != dictionary:
+            logger.warning(
+                "The %r compression dictionary was already stored, so the stored one is used.", dictionary.id
+            )
+        return stored[0]
+
+    def _add_sample(self, name: str, data: bytes) -> None:
+        if name in self._trainings:
+            return
+
+        samples = self._samples[name]
+        samples.append(data)
+        if len(samples) < self._training_size:
+            return
+
+        del self._samples[name]
+        self._trainings[name] = create_task(self._train_in_background(name, samples))
+
+    async def _train_in_background(self, name: str, samples: list[bytes]) -> None:
+        try:
+            await self.train(name, samples)
+        except Exception as exc:
+            logger.warning("The compression dictionary for %r could not be trained: %r", name, exc)
+        finally:
+            del self._trainings[name]
+
+    def _add_dictionaries(self, dictionaries: Iterable[CompressionDictionary]) -> None:
+        for dictionary in dictionaries:
+            self._dictionaries[dictionary.id] = dictionary
+
+            latest = self._latest.get(dictionary.name)
+            if latest is None or latest.version < dictionary.version:
+                self._latest[dictionary.name] = dictionary
+
+    def _get_compressor(self, dictionary: Optional[CompressionDictionary]) -> ZstdCompressor:
+        key = None if dictionary is None else dictionary.id
+        if (compressor := self._compressors.get(key)) is None:
+            zstd_dict = None if dictionary is None else dictionary.zstd_dict
+            compressor = self._compressors[key] = ZstdCompressor(level=self._level, dict_data=zstd_dict)
+        return compressor
+
+    def _get_decompressor(self, dictionary: Optional[CompressionDictionary]) -> ZstdDecompressor:
+        key = None if dictionary is None else dictionary.id
+        if (decompressor := self._decompressors.get(key)) is None:
+            zstd_dict = None if dictionary is None else dictionary.zstd_dict
+            decompressor = self._decompressors[key] = ZstdDecompressor(dict_data=zstd_dict)
+        return decompressor
+
+    @abstractmethod
+    async def _load(self, ids: Optional[set[int]] = None) -> list[CompressionDictionary]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _store(self, dictionary: CompressionDictionary) -> None:
+        raise NotImplementedError
@@ -0,0 +1,6 @@
+from .factories import (
+    EventCompressorDatabaseOperationFactory,
+)
+from .impl import (
+    DatabaseEventCompressor,
+)
@@ -0,0 +1,47 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Optional,
+)
+
+from minos.common import (
+    DatabaseOperation,
+    DatabaseOperationFactory,
+)
+
+
+class EventCompressorDatabaseOperationFactory(DatabaseOperationFactory, ABC):
+    """Event Compressor Database Operation Factory base class."""
+
+    @abstractmethod
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the compression dictionary table.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    # noinspection PyShadowingBuiltins
+    @abstractmethod
+    def build_submit(self, id: int, name: str, version: int, data: bytes, **kwargs) -> DatabaseOperation:
+        """Build the database operation to store a compression dictionary.
+
+        :param id: The identifier of the dictionary.
+        :param name: The classname of the ``RootEntity``.
+        :param version: The version of the dictionary.
+        :param data: The content of the dictionary.
+        :param kwargs: Additional named arguments.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_query(self, ids: Optional[Iterable[int]] = None) -> DatabaseOperation:
+        """Build the database operation to get the compression dictionaries.
+
+        :param ids: The identifiers of the dictionaries. If ``None`` is given, all the dictionaries are selected.
+        :return: A ``DatabaseOperation`` instance.
+        """
@@ -0,0 +1,42 @@
+from typing import (
+    Optional,
+)
+
+from minos.common import (
+    DatabaseMixin,
+)
+
+from ..abc import (
+    EventCompressor,
+)
+from ..dictionaries import (
+    CompressionDictionary,
+)
+from .factories import (
+    EventCompressorDatabaseOperationFactory,
+)
+
+
+class DatabaseEventCompressor(EventCompressor, DatabaseMixin[EventCompressorDatabaseOperationFactory]):
+    """Database-based implementation of the event compressor class."""
+
+    def __init__(self, *args, database_key: Optional[tuple[str]] = None, **kwargs):
+        if database_key is None:
+            database_key = ("aggregate", "event")
+        super().__init__(*args, database_key=database_key, **kwargs)
+
+    async def _setup(self) -> None:
+        operation = self.database_operation_factory.build_create()
+        await self.execute_on_database(operation)
+        await super()._setup()
+
+    async def _load(self, ids: Optional[set[int]] = None) -> list[CompressionDictionary]:
+        operation = self.database_operation_factory.build_query(ids)
+        return [
+            CompressionDictionary(name, version, data)
+            async for name, version, data in self.execute_on_database_and_fetch_all(operation)
+        ]
+
+    async def _store(self, dictionary: CompressionDictionary) -> None:
+        operation = self.database_operation_factory.build_submit(**dictionary.as_raw())
+        await self.execute_on_database(operation)
@@ -0,0 +1,88 @@
+from __future__ import (
+    annotations,
+)
+
+from typing import (
+    Any,
+    Iterable,
+    Union,
+)
+
+try:
+    from zstandard import (
+        ZstdCompressionDict,
+    )
+except ImportError:  # pragma: no cover
+    ZstdCompressionDict = None
+
+
+class CompressionDictionary:
+    """Class that represents a ``zstd`` dictionary trained for the events of a ``RootEntity`` type."""
+
+    __slots__ = "name", "version", "data", "_zstd_dict"
+
+    def __init__(self, name: str, version: int, data: Union[bytes, memoryview]):
+        if ZstdCompressionDict is None:
+            raise ImportError("The 'zstandard' package is required to build compression dictionaries.")
+
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        self.name = name
+        self.version = version
+        self.data = data
+        self._zstd_dict = ZstdCompressionDict(data)
+
+    @classmethod
+    def from_zstd_dict(cls, name: str, version: int, zstd_dict: ZstdCompressionDict) -> CompressionDictionary:
+        """Build a new instance from a ``ZstdCompressionDict``.
+
+        :param name: The classname of the ``RootEntity``.
+        :param version: The version of the dictionary.
+        :param zstd_dict: The ``zstd`` dictionary.
+        :return: A new ``CompressionDictionary`` instance.
+        """
+        return cls(name, version, zstd_dict.as_bytes())
+
+    @property
+    def id(self) -> int:
+        """Get the dictionary identifier (the one that is written on the compressed frames).
+
+        :return: An ``int`` value.
+        """
+        return self._zstd_dict.dict_id()
+
+    @property
+    def zstd_dict(self) -> ZstdCompressionDict:
+        """Get the ``zstd`` dictionary.
+
+        :return: A ``ZstdCompressionDict`` instance.
+        """
+        return self._zstd_dict
+
+    def as_raw(self) -> dict[str, Any]:
+        """Get a raw representation of the instance.
+
+        :return: A dictionary in which the keys are attribute names and values the attribute contents.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "version": self.version,
+            "data": self.data,
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) == type(other) and tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __iter__(self) -> Iterable:
+        yield from (self.name, self.version, self.data)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(id={self.id!r}, name={self.name!r}, version={self.version!r}, "
+            f"len(data)={len(self.data)!r})"
+        )
@@ -0,0 +1,24 @@
+from typing import (
+    Optional,
+)
+
+from .abc import (
+    EventCompressor,
+)
+from .dictionaries import (
+    CompressionDictionary,
+)
+
+
+class InMemoryEventCompressor(EventCompressor):
+    """Memory-based implementation of the event compressor class."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._storage = dict()
+
+    async def _load(self, ids: Optional[set[int]] = None) -> list[CompressionDictionary]:
+        return [dictionary for id_, dictionary in self._storage.items() if ids is None or id_ in ids]
+
+    async def _store(self, dictionary: CompressionDictionary) -> None:
+        self._storage.setdefault(dictionary.id, dictionary)
@@ -17,7 +17,9 @@ from uuid import (
 )
 
 from minos.common import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
     NULL_UUID,
+    MinosBinaryProtocol,
     import_module,
 )
 
@@ -82,11 +84,19 @@ class EventEntry:
         self.transaction_uuid = transaction_uuid
 
     @classmethod
-    def from_event(cls, event: Event, *, transaction: Optional[TransactionEntry] = None, **kwargs) -> EventEntry:
+    def from_event(
+        cls,
+        event: Event,
+        *,
+        transaction: Optional[TransactionEntry] = None,
+        protocol: Optional[type[MinosBinaryProtocol]] = None,
+        **kwargs,
+    ) -> EventEntry:
         """Build a new instance from a ``RootEntity``.
 
         :param event: The event.
         :param transaction: Optional transaction.
+        :param protocol: The protocol used to encode the field differences. If not set, ``avro`` is used.
         :param kwargs: Additional named arguments.
         :return: A new ``EventEntry`` instance.
         """
@@ -97,7 +107,7 @@ class EventEntry:
         return cls(
             uuid=event.uuid,
             name=event.name,
-            data=event.fields_diff.avro_bytes,
+            data=event.fields_diff.to_bytes(protocol),
             action=event.action,
             **kwargs,
         )
@@ -156,12 +166,18 @@ class EventEntry:
     def field_diff_container(self) -> FieldDiffContainer:
         """Get the stored field diff container.
 
+        The stored data is trusted, so the fields of the container are checked lazily.
+
         :return: A ``FieldDiffContainer`` instance.
         """
         if not self.data:
             return FieldDiffContainer.empty()
 
-        return FieldDiffContainer.from_avro_bytes(self.data)
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            return FieldDiffContainer.from_bytes(self.data)
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
 
     def __eq__(self, other: "EventEntry") -> bool:
         return type(self) == type(other) and tuple(self) == tuple(other)
@@ -18,9 +18,6 @@ from typing import (
     TypeVar,
     Union,
 )
-from uuid import (
-    uuid4,
-)
 
 from minos.common import (
     BucketModel,
@@ -87,7 +84,9 @@ class FieldDiffContainer(BucketModel):
         self, diffs: Iterable[FieldDiff] = None, fields: Union[Iterable[Field], dict[str, Field]] = None, **kwargs
     ):
         if diffs is not None:
-            fields = map(lambda v: self._field_cls(self.generate_random_str(), FieldDiff, v), diffs)
+            fields = (
+                self._field_cls(self.generate_field_name(index), FieldDiff, diff) for index, diff in enumerate(diffs)
+            )
 
         super().__init__(fields, **kwargs)
 
@@ -168,7 +167,7 @@ class FieldDiffContainer(BucketModel):
         :param ignore: Set of fields to be ignored.
         :return: A new ``FieldDiffContainer`` instance.
         """
-        logger.debug(f"Computing the {cls!r} between {a!r} and {b!r}...")
+        logger.debug("Computing the %r between %r and %r...", cls, a, b)
         differences = cls._diff(a.fields, b.fields)
         differences = [difference for difference in differences if difference.name not in ignore]
         return cls(differences)
@@ -205,12 +204,15 @@ class FieldDiffContainer(BucketModel):
         return cls(differences)
 
     @staticmethod
-    def generate_random_str() -> str:
-        """Generate a random string
+    def generate_field_name(index: int) -> str:
+        """Generate the name of the field that stores the diff placed at the given position.
+
+        The names only depend on the position, so containers with the same structure share the same avro schema.
 
-        :return: A random string value.
+        :param index: The position of the diff.
+        :return: A ``str`` value.
         """
-        return str(uuid4())
+        return f"diff_{index}"
 
 
 def _build_mapper(fields: dict[str, Field]) -> dict[str, tuple[type, list[str]]]:
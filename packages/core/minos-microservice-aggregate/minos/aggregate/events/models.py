@@ -134,7 +134,7 @@ class Event(DeclarativeModel):
         :param action: The action that generates the ``RootEntity`` difference.
         :return: An ``Event`` instance.
         """
-        logger.debug(f"Computing the {cls!r} between {a!r} and {b!r}...")
+        logger.debug("Computing the %r between %r and %r...", cls, a, b)
 
         if a.uuid != b.uuid:
             raise ValueError(
@@ -16,6 +16,7 @@ from typing import (
     TYPE_CHECKING,
     AsyncIterator,
     Awaitable,
+    Iterable,
     Optional,
     Union,
 )
@@ -25,10 +26,13 @@ from uuid import (
 
 from minos.common import (
     NULL_UUID,
+    Config,
     Inject,
     Injectable,
     Lock,
     LockPool,
+    MinosBinaryProtocol,
+    MinosConfigException,
     NotProvidedException,
     PoolFactory,
     SetupMixin,
@@ -57,6 +61,9 @@ from ...transactions import (
     TransactionRepository,
     TransactionStatus,
 )
+from ..compressors import (
+    EventCompressor,
+)
 from ..entries import (
     EventEntry,
 )
@@ -84,6 +91,8 @@ class EventRepository(ABC, SetupMixin):
         transaction_repository: TransactionRepository,
         lock_pool: Optional[LockPool] = None,
         pool_factory: Optional[PoolFactory] = None,
+        event_compressor: Optional[EventCompressor] = None,
+        protocol: Optional[type[MinosBinaryProtocol]] = None,
         *args,
         **kwargs,
     ):
@@ -104,6 +113,23 @@ class EventRepository(ABC, SetupMixin):
         self._broker_publisher = broker_publisher
         self._transaction_repository = transaction_repository
         self._lock_pool = lock_pool
+        self._event_compressor = event_compressor
+        self._protocol = protocol
+
+    @classmethod
+    def _from_config(cls, config: Config, **kwargs) -> EventRepository:
+        if "protocol" not in kwargs:
+            with suppress(MinosConfigException):
+                kwargs["protocol"] = config.get_aggregate().get("protocols", dict()).get("event")
+        return super()._from_config(config, **kwargs)
+
+    @property
+    def protocol(self) -> Optional[type[MinosBinaryProtocol]]:
+        """Get the protocol used to encode the data of the events.
+
+        :return: A ``MinosBinaryProtocol`` subclass or ``None`` if the default (``avro``) one is used.
+        """
+        return self._protocol
 
     def transaction(self, **kwargs) -> TransactionEntry:
         """Build a transaction instance related to the repository.
@@ -156,7 +182,7 @@ class EventRepository(ABC, SetupMixin):
             transaction = TRANSACTION_CONTEXT_VAR.get()
 
             if isinstance(entry, Event):
-                entry = EventEntry.from_event(entry, transaction=transaction)
+                entry = EventEntry.from_event(entry, transaction=transaction, protocol=self._protocol)
 
             if not isinstance(entry.action, Action):
                 raise EventRepositoryException("The 'EventEntry.action' attribute must be an 'Action' instance.")
@@ -165,7 +191,7 @@ class EventRepository(ABC, SetupMixin):
                 if not await self.validate(entry, **kwargs):
                     raise EventRepositoryConflictException(f"{entry!r} could not be committed!", await self.offset)
 
-                entry = await self._submit(entry, **kwargs)
+                entry = await self._submit_compressed(entry, **kwargs)
 
             if entry.transaction_uuid == NULL_UUID:
                 await self._send_events(entry.event)
@@ -175,6 +201,61 @@ class EventRepository(ABC, SetupMixin):
 
         return entry
 
+    async def submit_many(
+        self, entries: Iterable[Union[Event, EventEntry]], batch_size: int = 1000, **kwargs
+    ) -> list[EventEntry]:
+        """Store a batch of new entries into the repository.
+
+        This method is intended for bulk ingestion (i.e. migrations or imports), so the entries are validated and their
+        versions are assigned as on ``submit``, but they are not published on the broker. The entries of the same
+        identifier must either set all their versions or none of them.
+
+        :param entries: The entries to be stored.
+        :param batch_size: The maximum number of entries to be stored per database operation (if supported).
+        :param kwargs: Additional named arguments.
+        :return: The repository entries containing the stored information, following the given order.
+        """
+
+        token = IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.set(True)
+        try:
+            transaction = TRANSACTION_CONTEXT_VAR.get()
+
+            entries = [
+                EventEntry.from_event(entry, transaction=transaction, protocol=self._protocol)
+                if isinstance(entry, Event)
+                else entry
+                for entry in entries
+            ]
+
+            if not all(isinstance(entry.action, Action) for entry in entries):
+                raise EventRepositoryException("The 'EventEntry.action' attribute must be an 'Action' instance.")
+
+            # The assigned versions are numbered from the latest stored one, so they cannot be mixed with explicit ones.
+            versioned = dict()
+            for entry in entries:
+                if entry.uuid == NULL_UUID:
+                    continue
+                if versioned.setdefault(entry.uuid, entry.version is not None) != (entry.version is not None):
+                    raise EventRepositoryException(
+                        f"The entries of {entry.uuid!s} must either set the 'EventEntry.version' attribute or not."
+                    )
+
+            async with self.write_lock():
+                validated = set()
+                for entry in entries:
+                    if (key := (entry.uuid, entry.transaction_uuid)) in validated:
+                        continue
+                    if not await self.validate(entry, **kwargs):
+                        raise EventRepositoryConflictException(f"{entry!r} could not be committed!", await self.offset)
+                    validated.add(key)
+
+                entries = await self._submit_many_compressed(entries, batch_size=batch_size, **kwargs)
+
+        finally:
+            IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.reset(token)
+
+        return entries
+
     # noinspection PyUnusedLocal
     async def validate(self, entry: EventEntry, transaction_uuid_ne: Optional[UUID] = None, **kwargs) -> bool:
         """Check if it is able to submit the given entry.
@@ -202,10 +283,45 @@ class EventRepository(ABC, SetupMixin):
 
         return True
 
+    async def _submit_compressed(self, entry: EventEntry, **kwargs) -> EventEntry:
+        if self._event_compressor is None:
+            return await self._submit(entry, **kwargs)
+
+        data = await self._event_compressor.compress(entry.name, entry.data)
+        compressed = EventEntry(**(entry.as_raw() | {"data": data}))
+        compressed = await self._submit(compressed, **kwargs)
+
+        entry.id, entry.uuid, entry.version = compressed.id, compressed.uuid, compressed.version
+        entry.created_at = compressed.created_at
+        return entry
+
     @abstractmethod
     async def _submit(self, entry: EventEntry, **kwargs) -> EventEntry:
         raise NotImplementedError
 
+    async def _submit_many_compressed(self, entries: list[EventEntry], **kwargs) -> list[EventEntry]:
+        if self._event_compressor is None:
+            return await self._submit_many(entries, **kwargs)
+
+        compressed = list()
+        for entry in entries:
+            data = await self._event_compressor.compress(entry.name, entry.data)
+            compressed.append(EventEntry(**(entry.as_raw() | {"data": data})))
+        compressed = await self._submit_many(compressed, **kwargs)
+
+        for entry, stored in zip(entries, compressed):
+            entry.id, entry.uuid, entry.version, entry.created_at = (
+                stored.id,
+                stored.uuid,
+                stored.version,
+                stored.created_at,
+            )
+        return entries
+
+    # noinspection PyUnusedLocal
+    async def _submit_many(self, entries: list[EventEntry], batch_size: int, **kwargs) -> list[EventEntry]:
+        return [await self._submit(entry, **kwargs) for entry in entries]
+
     async def _send_events(self, event: Event):
         suffix_mapper = {
             Action.CREATE: "Created",
@@ -297,6 +413,8 @@ class EventRepository(ABC, SetupMixin):
         )
         # noinspection PyTypeChecker
         async for entry in generator:
+            if self._event_compressor is not None:
+                entry.data = await self._event_compressor.decompress(entry.data)
             yield entry
 
     @abstractmethod
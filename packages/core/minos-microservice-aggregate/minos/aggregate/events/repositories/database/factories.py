@@ -9,6 +9,7 @@ from datetime import (
     datetime,
 )
 from typing import (
+    Any,
     Optional,
 )
 from uuid import (
@@ -64,6 +65,22 @@ class EventDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``DatabaseOperation`` instance.
         """
 
+    @abstractmethod
+    def build_submit_many(
+        self, transaction_uuids: Iterable[UUID], transaction_uuid: UUID, entries: Iterable[dict[str, Any]]
+    ) -> DatabaseOperation:
+        """Build the database operation to submit a batch of rows into the event table.
+
+        The operation must return the ``id``, ``uuid``, ``version`` and ``created_at`` values of the submitted rows,
+        following the same order as the given entries.
+
+        :param transaction_uuids: The sequence of nested transaction in on top of the current event's transaction.
+        :param transaction_uuid: The identifier of the transaction of the entries.
+        :param entries: The raw representation of the entries (containing the ``uuid``, ``action``, ``name``,
+            ``version``, ``data`` and ``created_at`` values).
+        :return: A ``DatabaseOperation`` instance.
+        """
+
     # noinspection PyShadowingBuiltins
     @abstractmethod
     def build_query(
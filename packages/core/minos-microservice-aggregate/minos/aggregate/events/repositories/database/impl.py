@@ -4,6 +4,7 @@ from __future__ import (
 
 from typing import (
     AsyncIterator,
+    Iterator,
     Optional,
 )
 
@@ -58,6 +59,47 @@ class DatabaseEventRepository(DatabaseMixin[EventDatabaseOperationFactory], Even
         entry.id, entry.uuid, entry.version, entry.created_at = response
         return entry
 
+    async def _submit_many(self, entries: list[EventEntry], batch_size: int, **kwargs) -> list[EventEntry]:
+        try:
+            async with self.database_transaction():
+                for batch in self._split_batches(entries, batch_size):
+                    operation = await self._build_submit_many_operation(batch)
+                    rows = [row async for row in self.execute_on_database_and_fetch_all(operation)]
+                    for entry, row in zip(batch, rows):
+                        entry.id, entry.uuid, entry.version, entry.created_at = row
+        except IntegrityException:
+            raise EventRepositoryConflictException(
+                "The entries could not be submitted due to a key (uuid, version, transaction) collision",
+                await self.offset,
+            )
+
+        return entries
+
+    @staticmethod
+    def _split_batches(entries: list[EventEntry], batch_size: int) -> Iterator[list[EventEntry]]:
+        batch = list()
+        for entry in entries:
+            if batch and (len(batch) >= batch_size or batch[0].transaction_uuid != entry.transaction_uuid):
+                yield batch
+                batch = list()
+            batch.append(entry)
+        if batch:
+            yield batch
+
+    async def _build_submit_many_operation(self, entries: list[EventEntry]) -> DatabaseOperation:
+        transaction_uuid = entries[0].transaction_uuid
+        if transaction_uuid != NULL_UUID:
+            transaction = await self._transaction_repository.get(uuid=transaction_uuid)
+            transaction_uuids = await transaction.uuids
+        else:
+            transaction_uuids = (NULL_UUID,)
+
+        return self.database_operation_factory.build_submit_many(
+            transaction_uuids=transaction_uuids,
+            transaction_uuid=transaction_uuid,
+            entries=[entry.as_raw() for entry in entries],
+        )
+
     async def _build_submit_operation(self, entry: EventEntry) -> DatabaseOperation:
         lock = None
         if entry.uuid != NULL_UUID:
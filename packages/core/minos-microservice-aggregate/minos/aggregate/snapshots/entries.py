@@ -18,6 +18,7 @@ from uuid import (
 )
 
 from minos.common import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
     NULL_UUID,
     MinosJsonBinaryProtocol,
     import_module,
@@ -152,6 +153,8 @@ class SnapshotEntry:
     def build(self, **kwargs) -> RootEntity:
         """Rebuild the stored ``RootEntity`` object instance from the internal state.
 
+        The stored data is trusted, so the fields of the instance are checked lazily.
+
         :param kwargs: Additional named arguments.
         :return: A ``RootEntity`` instance.
         """
@@ -169,7 +172,13 @@ class SnapshotEntry:
             "updated_at": self.updated_at,
         }
         data |= kwargs
-        instance = RootEntity.from_avro(self.schema, data)
+
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            instance = RootEntity.from_avro(self.schema, data)
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
         return instance
 
     @property
@@ -242,3 +242,14 @@ class SnapshotRepository(ABC, SetupMixin):
     @abstractmethod
     async def _synchronize(self, **kwargs) -> None:
         raise NotImplementedError
+
+    def rebuild(self, **kwargs) -> Awaitable[None]:
+        """Rebuild the snapshot from scratch, replaying all the stored events.
+
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        return self._rebuild(**kwargs, synchronize=False)
+
+    async def _rebuild(self, **kwargs) -> None:
+        await self._synchronize(**kwargs)
@@ -45,6 +45,13 @@ class SnapshotDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``DatabaseOperation`` instance.
         """
 
+    @abstractmethod
+    def build_delete_all(self) -> DatabaseOperation:
+        """Build the database operation to delete all the rows.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+
     @abstractmethod
     def build_submit(
         self,
@@ -70,6 +77,16 @@ class SnapshotDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``DatabaseOperation`` instance.
         """
 
+    @abstractmethod
+    def build_submit_many(self, entries: Iterable[dict[str, Any]]) -> DatabaseOperation:
+        """Build the database operation to insert (or update if already exist) a batch of rows.
+
+        :param entries: The raw representation of the entries (containing the ``uuid``, ``name``, ``version``,
+            ``schema``, ``data``, ``created_at``, ``updated_at`` and ``transaction_uuid`` values). Each
+            ``(uuid, transaction_uuid)`` pair must be unique within the batch.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
     @abstractmethod
     def build_query(
         self,
@@ -8,6 +8,7 @@ from collections.abc import (
 from typing import (
     TYPE_CHECKING,
     Optional,
+    Union,
 )
 from uuid import (
     UUID,
@@ -15,7 +16,9 @@ from uuid import (
 
 from minos.common import (
     NULL_UUID,
+    ComposedDatabaseOperation,
     DatabaseMixin,
+    DatabaseOperation,
     Inject,
     NotProvidedException,
     ProgrammingException,
@@ -132,20 +135,97 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
             return True
 
     async def _synchronize(self, **kwargs) -> None:
-        initial_offset = await self._load_offset()
-
-        offset = initial_offset
-        async for event_entry in self._event_repository.select(id_gt=offset, **kwargs):
+        # The whole synchronization is applied atomically, so that the offset is never stored without its entries.
+        async with self.database_transaction():
+            initial_offset = await self._load_offset()
+
+            offset = initial_offset
+            async for event_entry in self._event_repository.select(id_gt=offset, **kwargs):
+                try:
+                    await self._dispatch_one(event_entry, **kwargs)
+                except SnapshotRepositoryConflictException:
+                    pass
+                offset = max(event_entry.id, offset)
+
+            operations = list()
+            if initial_offset < offset:
+                operations.extend(await self._build_clean_transactions(initial_offset))
+            operations.append(self.database_operation_factory.build_submit_offset(offset))
+
+            # Both the cleaning and the offset storing are sent together, so that they are pipelined if supported.
+            await self.execute_on_database(ComposedDatabaseOperation(operations))
+
+    async def _rebuild(self, batch_size: int = 1000, **kwargs) -> None:
+        async with self.database_transaction():
+            operations = [
+                self.database_operation_factory.build_delete_all(),
+                self.database_operation_factory.build_submit_offset(0),
+            ]
+            await self.execute_on_database(ComposedDatabaseOperation(operations))
+
+        # The events are read in id-ranged pages outside the write transaction (otherwise they would be fully preloaded
+        # on memory), and each page is committed along with its offset, so an interrupted rebuild is resumed by the
+        # synchronization.
+        offset = 0
+        last_offset = await self._event_repository.offset
+        while offset < last_offset:
+            page_offset = min(offset + batch_size, last_offset)
+            event_entries = [
+                event_entry
+                async for event_entry in self._event_repository.select(id_gt=offset, id_le=page_offset, **kwargs)
+            ]
+
+            async with self.database_transaction():
+                await self._rebuild_page(event_entries, **kwargs)
+
+                # A transaction's events are stored before its offset, so it is cleaned once the page reaches it.
+                operations = await self._build_clean_transactions(offset, event_offset_le=page_offset + 1)
+                operations.append(self.database_operation_factory.build_submit_offset(page_offset))
+                await self.execute_on_database(ComposedDatabaseOperation(operations))
+
+            offset = page_offset
+
+    async def _rebuild_page(self, event_entries: list[EventEntry], **kwargs) -> None:
+        pending = dict()
+        for event_entry in event_entries:
             try:
-                await self._dispatch_one(event_entry, **kwargs)
+                if event_entry.transaction_uuid != NULL_UUID:
+                    # The transaction entries depend on the whole transaction chain, so they are not buffered.
+                    await self._submit_many_entries(pending)
+                    await self._dispatch_one(event_entry, **kwargs)
+                else:
+                    pending[event_entry.uuid] = await self._rebuild_one(event_entry, pending, **kwargs)
             except SnapshotRepositoryConflictException:
                 pass
-            offset = max(event_entry.id, offset)
 
-        if initial_offset < offset:
-            await self._clean_transactions(initial_offset)
+        await self._submit_many_entries(pending)
+
+    async def _rebuild_one(
+        self, event_entry: EventEntry, pending: dict[UUID, Union[RootEntity, SnapshotEntry]], **kwargs
+    ) -> Union[RootEntity, SnapshotEntry]:
+        if event_entry.action.is_delete:
+            return SnapshotEntry.from_event_entry(event_entry)
+
+        event = event_entry.event
+        if (previous := pending.get(event_entry.uuid)) is None:
+            return await self._update_instance_if_exists(event, transaction=None, **kwargs)
+
+        if isinstance(previous, SnapshotEntry):
+            previous = previous.build(**kwargs)
+
+        return self._apply_event(previous, event)
 
-        await self._store_offset(offset)
+    async def _submit_many_entries(self, pending: dict[UUID, Union[RootEntity, SnapshotEntry]]) -> None:
+        if not pending:
+            return
+
+        entries = [
+            value if isinstance(value, SnapshotEntry) else SnapshotEntry.from_root_entity(value)
+            for value in pending.values()
+        ]
+        operation = self.database_operation_factory.build_submit_many([entry.as_raw() for entry in entries])
+        await self.execute_on_database(operation)
+        pending.clear()
 
     async def _load_offset(self) -> int:
         operation = self.database_operation_factory.build_query_offset()
@@ -156,10 +236,6 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
             return 0
         return row[0]
 
-    async def _store_offset(self, offset: int) -> None:
-        operation = self.database_operation_factory.build_submit_offset(offset)
-        await self.execute_on_database(operation)
-
     async def _dispatch_one(self, event_entry: EventEntry, **kwargs) -> SnapshotEntry:
         if event_entry.action.is_delete:
             return await self._submit_delete(event_entry)
@@ -199,6 +275,10 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
             cls = import_module(event.name)
             return cls.from_diff(event, **kwargs)
 
+        return self._apply_event(previous, event)
+
+    @staticmethod
+    def _apply_event(previous: RootEntity, event: Event) -> RootEntity:
         if previous.version >= event.version:
             raise SnapshotRepositoryConflictException(previous, event)
 
@@ -217,11 +297,11 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
 
         return snapshot_entry
 
-    async def _clean_transactions(self, offset: int, **kwargs) -> None:
+    async def _build_clean_transactions(self, offset: int, **kwargs) -> list[DatabaseOperation]:
         iterable = self._transaction_repository.select(
             event_offset_gt=offset, status_in=(TransactionStatus.COMMITTED, TransactionStatus.REJECTED), **kwargs
         )
         transaction_uuids = {transaction.uuid async for transaction in iterable}
-        if len(transaction_uuids):
-            operation = self.database_operation_factory.build_delete(transaction_uuids)
-            await self.execute_on_database(operation)
+        if not len(transaction_uuids):
+            return list()
+        return [self.database_operation_factory.build_delete(transaction_uuids)]
@@ -1,5 +1,6 @@
 from .events import (
     EventRepositoryTestCase,
+    MockedEventCompressorDatabaseOperationFactory,
     MockedEventDatabaseOperationFactory,
 )
 from .snapshots import (
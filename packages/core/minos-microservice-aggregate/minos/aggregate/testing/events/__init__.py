@@ -1,3 +1,6 @@
+from .compressors import (
+    MockedEventCompressorDatabaseOperationFactory,
+)
 from .repositories import (
     EventRepositoryTestCase,
     MockedEventDatabaseOperationFactory,
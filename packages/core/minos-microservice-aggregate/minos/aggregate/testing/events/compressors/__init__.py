@@ -0,0 +1,3 @@
+from .factories import (
+    MockedEventCompressorDatabaseOperationFactory,
+)
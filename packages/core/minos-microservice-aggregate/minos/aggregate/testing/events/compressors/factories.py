@@ -0,0 +1,38 @@
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Optional,
+)
+
+from minos.common import (
+    DatabaseOperation,
+)
+from minos.common.testing import (
+    MockedDatabaseClient,
+    MockedDatabaseOperation,
+)
+
+from ....events import (
+    EventCompressorDatabaseOperationFactory,
+)
+
+
+class MockedEventCompressorDatabaseOperationFactory(EventCompressorDatabaseOperationFactory):
+    """For testing purposes."""
+
+    def build_create(self) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("create")
+
+    # noinspection PyShadowingBuiltins
+    def build_submit(self, id: int, name: str, version: int, data: bytes, **kwargs) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("submit")
+
+    def build_query(self, ids: Optional[Iterable[int]] = None) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("select_rows")
+
+
+MockedDatabaseClient.set_factory(EventCompressorDatabaseOperationFactory, MockedEventCompressorDatabaseOperationFactory)
@@ -1,7 +1,11 @@
+from collections.abc import (
+    Iterable,
+)
 from datetime import (
     datetime,
 )
 from typing import (
+    Any,
     Optional,
 )
 from uuid import (
@@ -47,6 +51,12 @@ class MockedEventDatabaseOperationFactory(EventDatabaseOperationFactory):
         """For testing purposes."""
         return MockedDatabaseOperation("submit")
 
+    def build_submit_many(
+        self, transaction_uuids: Iterable[UUID], transaction_uuid: UUID, entries: Iterable[dict[str, Any]]
+    ) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("submit_many")
+
     def build_query(
         self,
         uuid: Optional[UUID] = None,
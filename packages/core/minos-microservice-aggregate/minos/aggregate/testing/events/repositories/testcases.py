@@ -237,6 +237,46 @@ class EventRepositoryTestCase(MinosTestCase, ABC):
         with self.assertRaises(EventRepositoryException):
             await self.event_repository.submit(EventEntry(self.uuid, "example.Car", 1, "foo".encode()))
 
+    async def test_submit_many(self):
+        await self.event_repository.create(EventEntry(self.uuid, "example.Car", 1, bytes("foo", "utf-8")))
+
+        observed = await self.event_repository.submit_many(
+            [
+                EventEntry(self.uuid, "example.Car", data=bytes("bar", "utf-8"), action=Action.UPDATE),
+                EventEntry(self.uuid_2, "example.Car", data=bytes("hello", "utf-8"), action=Action.CREATE),
+                EventEntry(self.uuid, "example.Car", data=bytes("foobar", "utf-8"), action=Action.UPDATE),
+            ]
+        )
+
+        expected = [
+            EventEntry(self.uuid, "example.Car", 2, bytes("bar", "utf-8"), 2, Action.UPDATE),
+            EventEntry(self.uuid_2, "example.Car", 1, bytes("hello", "utf-8"), 3, Action.CREATE),
+            EventEntry(self.uuid, "example.Car", 3, bytes("foobar", "utf-8"), 4, Action.UPDATE),
+        ]
+        self.assert_equal_repository_entries(expected, observed)
+
+        expected.insert(0, EventEntry(self.uuid, "example.Car", 1, bytes("foo", "utf-8"), 1, Action.CREATE))
+        observed = [v async for v in self.event_repository.select()]
+        self.assert_equal_repository_entries(expected, observed)
+
+    async def test_submit_many_raises_duplicate(self):
+        await self.event_repository.submit(EventEntry(self.uuid, "example.Car", 1, action=Action.CREATE))
+        with self.assertRaises(EventRepositoryConflictException):
+            await self.event_repository.submit_many([EventEntry(self.uuid, "example.Car", 1, action=Action.CREATE)])
+
+    async def test_submit_many_raises_no_action(self):
+        with self.assertRaises(EventRepositoryException):
+            await self.event_repository.submit_many([EventEntry(self.uuid, "example.Car", 1, "foo".encode())])
+
+    async def test_submit_many_raises_mixed_versions(self):
+        with self.assertRaises(EventRepositoryException):
+            await self.event_repository.submit_many(
+                [
+                    EventEntry(self.uuid, "example.Car", data=bytes("foo", "utf-8"), action=Action.CREATE),
+                    EventEntry(self.uuid, "example.Car", 2, bytes("bar", "utf-8"), action=Action.UPDATE),
+                ]
+            )
+
     async def test_select_empty(self):
         self.assertEqual([], [v async for v in self.event_repository.select()])
 
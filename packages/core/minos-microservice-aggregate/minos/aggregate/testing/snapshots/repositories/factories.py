@@ -40,6 +40,10 @@ class MockedSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
         """For testing purposes."""
         return MockedDatabaseOperation("delete")
 
+    def build_delete_all(self) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("delete_all")
+
     def build_submit(
         self,
         uuid: UUID,
@@ -54,6 +58,10 @@ class MockedSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
         """For testing purposes."""
         return MockedDatabaseOperation("insert")
 
+    def build_submit_many(self, entries: Iterable[dict[str, Any]]) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("insert_many")
+
     def build_query(
         self,
         name: str,
@@ -4,12 +4,15 @@ from __future__ import (
 
 from typing import (
     Any,
+    Optional,
     TypeVar,
 )
 
 from minos.common import (
     DeclarativeModel,
+    MissingSentinel,
     Model,
+    is_immutable,
 )
 
 from .collections import (
@@ -21,11 +24,63 @@ from .exceptions import (
 
 
 class ValueObject(DeclarativeModel):
-    """Value Object class."""
+    """Value Object class.
+
+    As value objects are immutable, both the encoded ``avro`` data and the hash are computed only once per instance and
+    then reused (by the ``AvroDataEncoder``, the set operations of the ``IncrementalSetDiff`` and the equality checks).
+    The fields can not be reassigned, but their values could be modified in place (as a ``list``), so the values are
+    only cached if all the field values are immutable too. That check is performed the first time that it is needed, so
+    the fields that are decoded lazily are not decoded by the instances that are never hashed nor encoded.
+    """
+
+    _encoded: Any
+    _hash: Optional[int]
+    _immutable: Optional[bool]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._encoded = MissingSentinel
+        self._hash = None
+        self._immutable = None
 
     def __setitem__(self, key: str, value: Any) -> None:
         raise ValueObjectException("modification of an immutable value object not allowed")
 
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if (
+            type(self) is type(other)
+            and self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        if not self._is_immutable():
+            return super().__hash__()
+        if self._hash is None:
+            self._hash = super().__hash__()
+        return self._hash
+
+    @property
+    def _avro_data(self) -> Any:
+        # The ``AvroDataEncoder`` stores the data if it is ``MissingSentinel``, or skips the cache if ``None``.
+        if not self._is_immutable():
+            return None
+        return self._encoded
+
+    @_avro_data.setter
+    def _avro_data(self, value: Any) -> None:
+        self._encoded = value
+
+    def _is_immutable(self) -> bool:
+        if self._immutable is None:
+            self._immutable = all(is_immutable(field.value) for field in self._fields.values())
+        return self._immutable
+
 
 T = TypeVar("T", bound=Model)
 
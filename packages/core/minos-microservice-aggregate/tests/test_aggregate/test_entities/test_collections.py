@@ -2,9 +2,6 @@ import unittest
 from operator import (
     attrgetter,
 )
-from unittest.mock import (
-    patch,
-)
 
 from minos.aggregate import (
     Action,
@@ -122,15 +119,14 @@ class TestEntitySet(unittest.TestCase):
         self.assertEqual(expected, observed)
 
     def test_avro_schema(self):
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            expected = [
-                {
-                    "logicalType": "minos.aggregate.entities.collections.EntitySet",
-                    "type": "array",
-                    "items": OrderItem.avro_schema[0],
-                },
-            ]
-            observed = EntitySet({OrderItem("John"), OrderItem("Michael")}).avro_schema
+        expected = [
+            {
+                "logicalType": "minos.aggregate.entities.collections.EntitySet",
+                "type": "array",
+                "items": OrderItem.avro_schema[0],
+            },
+        ]
+        observed = EntitySet({OrderItem("John"), OrderItem("Michael")}).avro_schema
         self.assertEqual(expected, observed)
 
     def test_avro_data(self):
@@ -0,0 +1,82 @@
+import unittest
+from uuid import (
+    uuid4,
+)
+
+from minos.aggregate import (
+    Entity,
+    RootEntity,
+)
+from minos.common import (
+    CompactDeclarativeModel,
+)
+from tests.utils import (
+    AggregateTestCase,
+    CompactCar,
+    CompactOrderItem,
+)
+
+
+class TestCompactEntity(unittest.TestCase):
+    def test_subclass(self):
+        self.assertTrue(issubclass(CompactOrderItem, Entity))
+        self.assertTrue(issubclass(CompactOrderItem, CompactDeclarativeModel))
+
+    def test_constructor(self):
+        uuid = uuid4()
+        entity = CompactOrderItem("foo", uuid=uuid)
+
+        self.assertEqual(uuid, entity.uuid)
+        self.assertEqual("foo", entity.name)
+        self.assertEqual([uuid, "foo"], entity._values)
+
+    def test_constructor_default_uuid(self):
+        self.assertIsNotNone(CompactOrderItem("foo").uuid)
+
+    def test_avro(self):
+        entity = CompactOrderItem("foo")
+        self.assertEqual(entity, CompactOrderItem.from_avro_bytes(entity.avro_bytes))
+
+
+class TestCompactRootEntity(AggregateTestCase):
+    def test_subclass(self):
+        self.assertTrue(issubclass(CompactCar, RootEntity))
+        self.assertTrue(issubclass(CompactCar, CompactDeclarativeModel))
+
+    async def test_create(self):
+        observed = await CompactCar.create(doors=3, color="blue")
+        expected = CompactCar(
+            3,
+            "blue",
+            uuid=observed.uuid,
+            version=1,
+            created_at=observed.created_at,
+            updated_at=observed.updated_at,
+        )
+        self.assertEqual(expected, observed)
+        self.assertNotIn("_fields", vars(observed))
+
+    async def test_save_and_get(self):
+        car = await CompactCar.create(doors=3, color="blue")
+        car.color = "red"
+        await car.save()
+
+        self.assertEqual(2, car.version)
+        self.assertEqual(car, await CompactCar.get(car.uuid))
+
+    async def test_diff_and_apply_diff(self):
+        initial = await CompactCar.create(doors=3, color="blue")
+        final = await CompactCar.get(initial.uuid)
+        final.doors = 5
+        await final.save()
+
+        initial.apply_diff(final.diff(initial))
+        self.assertEqual(final, initial)
+
+    async def test_avro(self):
+        car = await CompactCar.create(doors=3, color="blue")
+        self.assertEqual(car, CompactCar.from_avro_bytes(car.avro_bytes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import (
+    patch,
+)
+
+from zstandard import (
+    train_dictionary,
+)
+
+from minos.aggregate import (
+    CompressionDictionary,
+    DatabaseEventCompressor,
+    EventCompressor,
+    EventRepositoryException,
+)
+from minos.common import (
+    DatabaseClient,
+    DatabaseMixin,
+)
+from tests.utils import (
+    AggregateTestCase,
+    FakeAsyncIterator,
+)
+
+
+class TestDatabaseEventCompressor(AggregateTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        samples = [f'{{"doors": {i % 5}, "color": "red", "id": {i}}}'.encode() for i in range(500)]
+        self.dictionary = CompressionDictionary.from_zstd_dict("example.Car", 1, train_dictionary(1024, samples))
+
+    def test_subclass(self):
+        self.assertTrue(issubclass(DatabaseEventCompressor, (EventCompressor, DatabaseMixin)))
+
+    async def test_setup(self):
+        fetch_all = [("example.Car", 1, self.dictionary.data)]
+        compressor = DatabaseEventCompressor.from_config(self.config)
+        with patch.object(DatabaseClient, "execute") as execute_mock:
+            with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator(fetch_all)):
+                async with compressor:
+                    self.assertEqual(self.dictionary, compressor.get_latest("example.Car"))
+
+        self.assertEqual("create", execute_mock.call_args_list[0].args[0].content)
+
+    async def test_train(self):
+        fetch_all = [("example.Car", 1, self.dictionary.data)]
+        compressor = DatabaseEventCompressor.from_config(self.config)
+        with patch.object(DatabaseClient, "execute") as execute_mock:
+            with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator(fetch_all)):
+                with patch(
+                    "minos.aggregate.events.compressors.abc.train_dictionary", return_value=self.dictionary.zstd_dict
+                ):
+                    observed = await compressor.train("example.Car", [b"foo"])
+
+        self.assertEqual(self.dictionary, observed)
+        self.assertEqual(["submit", "select_rows"], [call.args[0].content for call in execute_mock.call_args_list])
+
+    async def test_train_raises_not_stored(self):
+        compressor = DatabaseEventCompressor.from_config(self.config)
+        with patch.object(DatabaseClient, "execute"):
+            with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([])):
+                with patch(
+                    "minos.aggregate.events.compressors.abc.train_dictionary", return_value=self.dictionary.zstd_dict
+                ):
+                    with self.assertRaises(EventRepositoryException):
+                        await compressor.train("example.Car", [b"foo"])
+
+        self.assertIsNone(compressor.get_latest("example.Car"))
+
+
+if __name__ == "__main__":
+    unittest.main()
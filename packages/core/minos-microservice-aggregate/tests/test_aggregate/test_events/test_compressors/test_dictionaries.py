@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import (
+    patch,
+)
+
+from zstandard import (
+    train_dictionary,
+)
+
+from minos.aggregate import (
+    CompressionDictionary,
+)
+
+
+class TestCompressionDictionary(unittest.TestCase):
+    def setUp(self) -> None:
+        samples = [
+            f'{{"doors": {i % 5}, "color": "{["red", "blue"][i % 2]}", "owner": null}}'.encode() for i in range(500)
+        ]
+        self.zstd_dict = train_dictionary(1024, samples)
+
+    def test_constructor(self):
+        dictionary = CompressionDictionary("example.Car", 1, memoryview(self.zstd_dict.as_bytes()))
+        self.assertEqual("example.Car", dictionary.name)
+        self.assertEqual(1, dictionary.version)
+        self.assertEqual(self.zstd_dict.as_bytes(), dictionary.data)
+        self.assertEqual(self.zstd_dict.dict_id(), dictionary.id)
+
+    def test_constructor_without_zstandard(self):
+        with patch("minos.aggregate.events.compressors.dictionaries.ZstdCompressionDict", None):
+            with self.assertRaises(ImportError):
+                CompressionDictionary("example.Car", 1, self.zstd_dict.as_bytes())
+
+    def test_from_zstd_dict(self):
+        dictionary = CompressionDictionary.from_zstd_dict("example.Car", 1, self.zstd_dict)
+        self.assertEqual(CompressionDictionary("example.Car", 1, self.zstd_dict.as_bytes()), dictionary)
+
+    def test_as_raw(self):
+        dictionary = CompressionDictionary.from_zstd_dict("example.Car", 1, self.zstd_dict)
+        expected = {
+            "id": self.zstd_dict.dict_id(),
+            "name": "example.Car",
+            "version": 1,
+            "data": self.zstd_dict.as_bytes(),
+        }
+        self.assertEqual(expected, dictionary.as_raw())
+
+    def test_hash(self):
+        dictionary = CompressionDictionary.from_zstd_dict("example.Car", 1, self.zstd_dict)
+        self.assertIsInstance(hash(dictionary), int)
+
+    def test_repr(self):
+        dictionary = CompressionDictionary.from_zstd_dict("example.Car", 1, self.zstd_dict)
+        expected = (
+            f"CompressionDictionary(id={self.zstd_dict.dict_id()!r}, name='example.Car', version=1, "
+            f"len(data)={len(self.zstd_dict.as_bytes())!r})"
+        )
+        self.assertEqual(expected, repr(dictionary))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+from unittest.mock import (
+    patch,
+)
+
+from zstandard import (
+    FRAME_HEADER,
+    ZstdError,
+    train_dictionary,
+)
+
+from minos.aggregate import (
+    CompressionDictionary,
+    EventCompressor,
+    EventRepositoryException,
+    InMemoryEventCompressor,
+)
+
+
+def _build_samples(count: int) -> list[bytes]:
+    return [
+        f'{{"doors": {i % 5}, "color": "{["red", "blue", "yellow"][i % 3]}", "owner": null, "id": {i}}}'.encode()
+        for i in range(count)
+    ]
+
+
+class TestInMemoryEventCompressor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.samples = _build_samples(500)
+        self.compressor = InMemoryEventCompressor(dictionary_size=1024, training_size=len(self.samples))
+
+    def test_subclass(self):
+        self.assertTrue(issubclass(InMemoryEventCompressor, EventCompressor))
+
+    def test_constructor_without_zstandard(self):
+        with patch("minos.aggregate.events.compressors.abc.ZstdCompressor", None):
+            with self.assertRaises(ImportError):
+                InMemoryEventCompressor()
+
+    async def test_compress_empty(self):
+        self.assertEqual(bytes(), await self.compressor.compress("example.Car", bytes()))
+
+    async def test_compress_not_smaller(self):
+        self.assertEqual(b"foo", await self.compressor.compress("example.Car", b"foo"))
+
+    async def test_compress_without_dictionary(self):
+        data = b"foo" * 100
+        observed = await self.compressor.compress("example.Car", data)
+
+        self.assertTrue(observed.startswith(FRAME_HEADER))
+        self.assertLess(len(observed), len(data))
+        self.assertEqual(data, await self.compressor.decompress(observed))
+
+    async def test_decompress_not_compressed(self):
+        self.assertEqual(b"Obj\x01foo", await self.compressor.decompress(b"Obj\x01foo"))
+
+    async def test_train_automatically(self):
+        async with self.compressor:
+            for sample in self.samples:
+                await self.compressor.compress("example.Car", sample)
+
+        dictionary = self.compressor.get_latest("example.Car")
+        self.assertIsInstance(dictionary, CompressionDictionary)
+        self.assertEqual(1, dictionary.version)
+        self.assertEqual({dictionary.id: dictionary}, self.compressor.dictionaries)
+        self.assertIsNone(self.compressor.get_latest("example.Owner"))
+
+        observed = await self.compressor.compress("example.Car", self.samples[0])
+        self.assertLess(len(observed), len(await InMemoryEventCompressor().compress("example.Car", self.samples[0])))
+        self.assertEqual(self.samples[0], await self.compressor.decompress(observed))
+
+    async def test_train_automatically_does_not_block(self):
+        async with self.compressor:
+            for sample in self.samples:
+                await self.compressor.compress("example.Car", sample)
+
+            self.assertIsNone(self.compressor.get_latest("example.Car"))
+            data = await self.compressor.compress("example.Car", self.samples[0])
+
+        self.assertIsNotNone(self.compressor.get_latest("example.Car"))
+        self.assertEqual(self.samples[0], await self.compressor.decompress(data))
+
+    async def test_train_automatically_raises(self):
+        compressor = InMemoryEventCompressor(training_size=2)
+        with patch("minos.aggregate.events.compressors.abc.train_dictionary", side_effect=ZstdError("")):
+            async with compressor:
+                for sample in self.samples[:2]:
+                    observed = await compressor.decompress(await compressor.compress("example.Car", sample))
+                    self.assertEqual(sample, observed)
+
+        self.assertIsNone(compressor.get_latest("example.Car"))
+
+    async def test_train_automatically_raises_store(self):
+        compressor = InMemoryEventCompressor(dictionary_size=1024, training_size=len(self.samples))
+        with patch.object(InMemoryEventCompressor, "_store", side_effect=ValueError("")):
+            async with compressor:
+                for sample in self.samples:
+                    await compressor.compress("example.Car", sample)
+
+        self.assertIsNone(compressor.get_latest("example.Car"))
+        self.assertEqual({}, compressor.dictionaries)
+
+        data = await compressor.compress("example.Car", self.samples[0])
+        self.assertEqual(self.samples[0], await compressor.decompress(data))
+
+    async def test_train_versions(self):
+        one = await self.compressor.train("example.Car", self.samples)
+        data = await self.compressor.compress("example.Car", self.samples[0])
+
+        two = await self.compressor.train("example.Car", self.samples[::-1])
+
+        self.assertEqual(1, one.version)
+        self.assertEqual(2, two.version)
+        self.assertEqual(two, self.compressor.get_latest("example.Car"))
+        self.assertEqual(self.samples[0], await self.compressor.decompress(data))
+
+    async def test_train_already_stored(self):
+        zstd_dict = train_dictionary(1024, self.samples)
+        stored = CompressionDictionary.from_zstd_dict("example.Car", 56, zstd_dict)
+        await self.compressor._store(stored)
+
+        with patch("minos.aggregate.events.compressors.abc.train_dictionary", return_value=zstd_dict):
+            observed = await self.compressor.train("example.Car", self.samples)
+
+        self.assertEqual(stored, observed)
+        self.assertEqual(stored, self.compressor.get_latest("example.Car"))
+
+    async def test_decompress_loads_dictionary(self):
+        dictionary = await self.compressor.train("example.Car", self.samples)
+        data = await self.compressor.compress("example.Car", self.samples[0])
+
+        compressor = InMemoryEventCompressor()
+        compressor._storage = self.compressor._storage
+        self.assertEqual(self.samples[0], await compressor.decompress(data))
+        self.assertEqual({dictionary.id: dictionary}, compressor.dictionaries)
+
+    async def test_decompress_raises_unknown_dictionary(self):
+        await self.compressor.train("example.Car", self.samples)
+        data = await self.compressor.compress("example.Car", self.samples[0])
+
+        with self.assertRaises(EventRepositoryException):
+            await InMemoryEventCompressor().decompress(data)
+
+    async def test_setup_loads_dictionaries(self):
+        zstd_dict = train_dictionary(1024, self.samples)
+        dictionary = CompressionDictionary.from_zstd_dict("example.Car", 3, zstd_dict)
+        await self.compressor._store(dictionary)
+
+        async with self.compressor:
+            self.assertEqual(dictionary, self.compressor.get_latest("example.Car"))
+
+
+if __name__ == "__main__":
+    unittest.main()
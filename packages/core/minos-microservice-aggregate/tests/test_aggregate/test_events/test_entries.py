@@ -16,6 +16,7 @@ from minos.aggregate import (
 )
 from minos.common import (
     NULL_UUID,
+    MinosMsgPackProtocol,
     current_datetime,
 )
 from tests.utils import (
@@ -79,6 +80,14 @@ class TestRepositoryEntry(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(None, entry.created_at)
         self.assertEqual(NULL_UUID, entry.transaction_uuid)
 
+    async def test_from_event_with_protocol(self):
+        fields_diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+        event = Event(self.uuid, Car.classname, 1, Action.CREATE, current_datetime(), fields_diff)
+
+        entry = EventEntry.from_event(event, protocol=MinosMsgPackProtocol)
+        self.assertTrue(MinosMsgPackProtocol.is_encoded(entry.data))
+        self.assertEqual(fields_diff, entry.field_diff_container)
+
     async def test_from_event_with_transaction(self):
         transaction = TransactionEntry(self.transaction_uuid)
         fields_diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
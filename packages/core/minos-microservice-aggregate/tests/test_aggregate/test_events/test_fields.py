@@ -5,9 +5,6 @@ from datetime import (
 from typing import (
     Optional,
 )
-from unittest.mock import (
-    patch,
-)
 from uuid import (
     UUID,
 )
@@ -98,39 +95,36 @@ class TestFieldDiffContainer(AggregateTestCase):
             {
                 "fields": [
                     {
-                        "name": "hello",
+                        "name": "diff_0",
                         "type": {
                             "fields": [{"name": "name", "type": "string"}, {"name": "value", "type": "int"}],
                             "name": "FieldDiff",
-                            "namespace": "minos.aggregate.events.fields.hola",
+                            "namespace": "minos.aggregate.events.fields.s1",
                             "type": "record",
                         },
                     },
                     {
-                        "name": "goodbye",
+                        "name": "diff_1",
                         "type": {
                             "fields": [{"name": "name", "type": "string"}, {"name": "value", "type": "string"}],
                             "name": "FieldDiff",
-                            "namespace": "minos.aggregate.events.fields.adios",
+                            "namespace": "minos.aggregate.events.fields.s2",
                             "type": "record",
                         },
                     },
                 ],
                 "name": "FieldDiffContainer",
-                "namespace": "minos.aggregate.events.fields.uno",
+                "namespace": "minos.aggregate.events.fields.s0",
                 "type": "record",
             }
         ]
-        with patch("minos.aggregate.FieldDiffContainer.generate_random_str", side_effect=["hello", "goodbye"]):
-            diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["uno", "hola", "adios"]):
-            self.assertEqual(expected, diff.avro_schema)
+        diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
+        self.assertEqual(expected, diff.avro_schema)
 
     def test_avro_data(self):
-        expected = {"hello": {"name": "doors", "value": 5}, "goodbye": {"name": "color", "value": "yellow"}}
+        expected = {"diff_0": {"name": "doors", "value": 5}, "diff_1": {"name": "color", "value": "yellow"}}
 
-        with patch("minos.aggregate.FieldDiffContainer.generate_random_str", side_effect=["hello", "goodbye"]):
-            diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
+        diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
 
         self.assertEqual(expected, diff.avro_data)
 
@@ -138,6 +132,11 @@ class TestFieldDiffContainer(AggregateTestCase):
         diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
         self.assertIsInstance(diff.avro_bytes, bytes)
 
+    def test_avro_schema_deterministic(self):
+        one = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
+        two = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "red")])
+        self.assertEqual(one.avro_schema, two.avro_schema)
+
     def test_from_avro_bytes(self):
         initial = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
         observed = FieldDiffContainer.from_avro_bytes(initial.avro_bytes)
@@ -33,6 +33,9 @@ from minos.aggregate import (
 )
 from minos.common import (
     NULL_UUID,
+    Config,
+    MinosConfigException,
+    MinosMsgPackProtocol,
     NotProvidedException,
     SetupMixin,
     classname,
@@ -81,6 +84,19 @@ class TestEventRepository(AggregateTestCase):
         self.assertEqual(self.broker_publisher, repository._broker_publisher)
         self.assertEqual(self.transaction_repository, repository._transaction_repository)
         self.assertEqual(self.pool_factory.get_pool("lock"), repository._lock_pool)
+        self.assertEqual(None, repository.protocol)
+
+    def test_from_config_with_protocol(self):
+        config = Config(self.config.file_path)
+        with patch.object(Config, "get_aggregate", return_value={"protocols": {"event": MinosMsgPackProtocol}}):
+            repository = _EventRepository.from_config(config)
+        self.assertEqual(MinosMsgPackProtocol, repository.protocol)
+
+    def test_from_config_without_protocol(self):
+        config = Config(self.config.file_path)
+        with patch.object(Config, "get_aggregate", side_effect=MinosConfigException("")):
+            repository = _EventRepository.from_config(config)
+        self.assertEqual(None, repository.protocol)
 
     async def test_constructor_raises(self):
         with self.assertRaises(NotProvidedException):
@@ -13,6 +13,7 @@ from uuid import (
 from minos.aggregate import (
     Action,
     DatabaseEventRepository,
+    EventEntry,
     EventRepository,
 )
 from minos.aggregate.testing import (
@@ -82,6 +83,58 @@ class TestDatabaseEventRepositorySubmit(AggregateTestCase, EventRepositoryTestCa
         with patch.object(DatabaseClient, "fetch_one", side_effect=fetch_one):
             await super().test_submit_raises_duplicate()
 
+    async def test_submit_many(self):
+        fetch_one = [
+            (1, self.uuid, 1, current_datetime()),
+        ]
+        fetch_all = [
+            FakeAsyncIterator(
+                [
+                    (2, self.uuid, 2, current_datetime()),
+                    (3, self.uuid_2, 1, current_datetime()),
+                    (4, self.uuid, 3, current_datetime()),
+                ]
+            ),
+            FakeAsyncIterator(
+                [
+                    (self.uuid, "example.Car", 1, bytes("foo", "utf-8"), 1, Action.CREATE, current_datetime()),
+                    (self.uuid, "example.Car", 2, bytes("bar", "utf-8"), 2, Action.UPDATE, current_datetime()),
+                    (self.uuid_2, "example.Car", 1, bytes("hello", "utf-8"), 3, Action.CREATE, current_datetime()),
+                    (self.uuid, "example.Car", 3, bytes("foobar", "utf-8"), 4, Action.UPDATE, current_datetime()),
+                ]
+            ),
+        ]
+        with patch.object(DatabaseClient, "fetch_one", side_effect=fetch_one):
+            with patch.object(DatabaseClient, "fetch_all", side_effect=fetch_all):
+                await super().test_submit_many()
+
+    async def test_submit_many_batches(self):
+        entries = [
+            EventEntry(self.uuid, "example.Car", data=bytes(), action=Action.CREATE),
+            EventEntry(self.uuid_1, "example.Car", data=bytes(), action=Action.CREATE),
+            EventEntry(self.uuid_2, "example.Car", data=bytes(), action=Action.CREATE),
+        ]
+        fetch_all = [
+            FakeAsyncIterator([(1, self.uuid, 1, current_datetime()), (2, self.uuid_1, 1, current_datetime())]),
+            FakeAsyncIterator([(3, self.uuid_2, 1, current_datetime())]),
+        ]
+        with patch.object(DatabaseClient, "fetch_all", side_effect=fetch_all), patch.object(
+            DatabaseClient, "commit"
+        ) as commit_mock:
+            observed = await self.event_repository.submit_many(entries, batch_size=2)
+
+        self.assertEqual([1, 2, 3], [entry.id for entry in observed])
+        self.assertEqual(1, commit_mock.call_count)
+
+    async def test_submit_many_raises_duplicate(self):
+        fetch_one = [
+            (1, uuid4(), 1, current_datetime()),
+            (1,),
+        ]
+        with patch.object(DatabaseClient, "fetch_one", side_effect=fetch_one):
+            with patch.object(DatabaseClient, "fetch_all", side_effect=IntegrityException("")):
+                await super().test_submit_many_raises_duplicate()
+
     async def test_offset(self):
         fetch_one = [
             (0,),
@@ -1,14 +1,25 @@
 import unittest
 
 from minos.aggregate import (
+    Action,
+    Event,
+    EventEntry,
     EventRepository,
+    FieldDiff,
+    FieldDiffContainer,
+    InMemoryEventCompressor,
     InMemoryEventRepository,
 )
 from minos.aggregate.testing import (
     EventRepositoryTestCase,
 )
+from minos.common import (
+    MinosMsgPackProtocol,
+    current_datetime,
+)
 from tests.utils import (
     AggregateTestCase,
+    Car,
 )
 
 
@@ -20,5 +31,41 @@ class TestInMemoryEventRepositorySubmit(AggregateTestCase, EventRepositoryTestCa
         return InMemoryEventRepository()
 
 
+class TestInMemoryEventRepositorySubmitCompressed(AggregateTestCase, EventRepositoryTestCase):
+    __test__ = True
+
+    def build_event_repository(self) -> EventRepository:
+        """For testing purposes."""
+        return InMemoryEventRepository(event_compressor=InMemoryEventCompressor())
+
+    async def test_data_stored_compressed(self):
+        data = b"foo" * 100
+        entry = await self.event_repository.submit(
+            EventEntry(self.uuid, "example.Car", data=data, action=Action.CREATE)
+        )
+
+        self.assertEqual(data, entry.data)
+        self.assertLess(len(self.event_repository._storage[-1].data), len(data))
+        self.assertEqual([data], [e.data async for e in self.event_repository.select()])
+
+
+class TestInMemoryEventRepositorySubmitMsgPack(AggregateTestCase, EventRepositoryTestCase):
+    __test__ = True
+
+    def build_event_repository(self) -> EventRepository:
+        """For testing purposes."""
+        return InMemoryEventRepository(protocol=MinosMsgPackProtocol)
+
+    async def test_event_stored_with_protocol(self):
+        fields_diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+        event = Event(self.uuid, Car.classname, 1, Action.CREATE, current_datetime(), fields_diff)
+
+        await self.event_repository.submit(event)
+
+        entries = [entry async for entry in self.event_repository.select()]
+        self.assertTrue(MinosMsgPackProtocol.is_encoded(entries[-1].data))
+        self.assertEqual(fields_diff, entries[-1].field_diff_container)
+
+
 if __name__ == "__main__":
     unittest.main()
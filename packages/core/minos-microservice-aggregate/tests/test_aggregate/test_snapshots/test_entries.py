@@ -3,9 +3,6 @@ import unittest
 from datetime import (
     datetime,
 )
-from unittest.mock import (
-    patch,
-)
 from uuid import (
     uuid4,
 )
@@ -79,27 +76,25 @@ class TestSnapshotEntry(AggregateTestCase):
 
     def test_from_root_entity(self):
         car = Car(3, "blue", uuid=self.uuid, version=1)
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            entry = SnapshotEntry.from_root_entity(car)
-            self.assertEqual(car.uuid, entry.uuid)
-            self.assertEqual(car.classname, entry.name)
-            self.assertEqual(car.version, entry.version)
-            self.assertEqual(car.avro_schema, entry.schema)
-            self.assertEqual({"color": "blue", "doors": 3, "owner": None}, entry.data)
-            self.assertEqual(car.created_at, entry.created_at)
-            self.assertEqual(car.updated_at, entry.updated_at)
+        entry = SnapshotEntry.from_root_entity(car)
+        self.assertEqual(car.uuid, entry.uuid)
+        self.assertEqual(car.classname, entry.name)
+        self.assertEqual(car.version, entry.version)
+        self.assertEqual(car.avro_schema, entry.schema)
+        self.assertEqual({"color": "blue", "doors": 3, "owner": None}, entry.data)
+        self.assertEqual(car.created_at, entry.created_at)
+        self.assertEqual(car.updated_at, entry.updated_at)
 
     def test_from_event_entry(self):
         car = Car(3, "blue", uuid=self.uuid, version=1)
         event_entry = EventEntry.from_event(Event.from_root_entity(car), version=1)
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            snapshot_entry = SnapshotEntry.from_event_entry(event_entry)
-            self.assertEqual(event_entry.uuid, snapshot_entry.uuid)
-            self.assertEqual(event_entry.name, snapshot_entry.name)
-            self.assertEqual(event_entry.version, snapshot_entry.version)
-            self.assertEqual(event_entry.created_at, snapshot_entry.created_at)
-            self.assertEqual(event_entry.created_at, snapshot_entry.updated_at)
-            self.assertEqual(event_entry.transaction_uuid, snapshot_entry.transaction_uuid)
+        snapshot_entry = SnapshotEntry.from_event_entry(event_entry)
+        self.assertEqual(event_entry.uuid, snapshot_entry.uuid)
+        self.assertEqual(event_entry.name, snapshot_entry.name)
+        self.assertEqual(event_entry.version, snapshot_entry.version)
+        self.assertEqual(event_entry.created_at, snapshot_entry.created_at)
+        self.assertEqual(event_entry.created_at, snapshot_entry.updated_at)
+        self.assertEqual(event_entry.transaction_uuid, snapshot_entry.transaction_uuid)
 
     def test_equals(self):
         a = SnapshotEntry(self.uuid, "example.Car", 0, self.schema, self.data)
@@ -166,6 +166,12 @@ class TestSnapshotRepository(AggregateTestCase):
         self.assertEqual(1, self.synchronize_mock.call_count)
         self.assertEqual(call(synchronize=False), self.synchronize_mock.call_args)
 
+    async def test_rebuild(self):
+        await self.snapshot_repository.rebuild()
+
+        self.assertEqual(1, self.synchronize_mock.call_count)
+        self.assertEqual(call(synchronize=False), self.synchronize_mock.call_args)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,12 +4,19 @@ from itertools import (
     cycle,
 )
 from unittest.mock import (
+    AsyncMock,
     MagicMock,
+    PropertyMock,
+    call,
     patch,
 )
 
 from minos.aggregate import (
+    Action,
     DatabaseSnapshotRepository,
+    EventEntry,
+    FieldDiff,
+    FieldDiffContainer,
     SnapshotEntry,
     SnapshotRepository,
 )
@@ -315,6 +322,112 @@ class TestDatabaseSnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
         ):
             await super().test_dispatch_with_offset()
 
+    async def test_synchronize_transaction(self):
+        self.event_repository.select = MagicMock(return_value=FakeAsyncIterator([]))
+
+        with patch.object(DatabaseClient, "fetch_one", return_value=(0,)), patch.object(
+            DatabaseClient, "begin"
+        ) as begin_mock, patch.object(DatabaseClient, "commit") as commit_mock:
+            await self.snapshot_repository.synchronize()
+
+        self.assertEqual(1, begin_mock.call_count)
+        self.assertEqual(1, commit_mock.call_count)
+
+    async def test_synchronize_transaction_rollback(self):
+        self.event_repository.select = MagicMock(side_effect=ValueError)
+
+        with patch.object(DatabaseClient, "fetch_one", return_value=(0,)), patch.object(
+            DatabaseClient, "commit"
+        ) as commit_mock, patch.object(DatabaseClient, "rollback") as rollback_mock:
+            with self.assertRaises(ValueError):
+                await self.snapshot_repository.synchronize()
+
+        self.assertEqual(0, commit_mock.call_count)
+        self.assertEqual(1, rollback_mock.call_count)
+
+    async def test_rebuild(self):
+        diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+        name = classname(SnapshotRepositoryTestCase.Car)
+        self.event_repository.select = MagicMock(
+            return_value=FakeAsyncIterator(
+                [
+                    EventEntry(self.uuid_1, name, 1, diff.avro_bytes, 1, Action.CREATE, current_datetime()),
+                    EventEntry(self.uuid_2, name, 1, diff.avro_bytes, 2, Action.CREATE, current_datetime()),
+                    EventEntry(self.uuid_1, name, 2, diff.avro_bytes, 3, Action.UPDATE, current_datetime()),
+                    EventEntry(self.uuid_2, name, 2, bytes(), 4, Action.DELETE, current_datetime()),
+                ]
+            )
+        )
+        factory = self.snapshot_repository.database_operation_factory
+
+        with patch(
+            "minos.aggregate.EventRepository.offset", new_callable=PropertyMock, side_effect=AsyncMock(return_value=4)
+        ), patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([])), patch.object(
+            type(factory), "build_delete_all", side_effect=factory.build_delete_all
+        ) as delete_all_mock, patch.object(
+            type(factory), "build_submit_many", side_effect=factory.build_submit_many
+        ) as submit_many_mock, patch.object(
+            type(factory), "build_submit_offset", side_effect=factory.build_submit_offset
+        ) as submit_offset_mock:
+            await self.snapshot_repository.rebuild()
+
+        self.assertEqual(1, delete_all_mock.call_count)
+        self.assertEqual(1, submit_many_mock.call_count)
+        self.assertEqual(
+            [(self.uuid_1, 2, False), (self.uuid_2, 2, True)],
+            [(raw["uuid"], raw["version"], raw["data"] is None) for raw in submit_many_mock.call_args.args[0]],
+        )
+        self.assertEqual([call(0), call(4)], submit_offset_mock.call_args_list)
+        self.assertEqual([call(id_gt=0, id_le=4, synchronize=False)], self.event_repository.select.call_args_list)
+
+    async def test_rebuild_paged(self):
+        diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+        name = classname(SnapshotRepositoryTestCase.Car)
+        self.event_repository.select = MagicMock(
+            side_effect=[
+                FakeAsyncIterator(
+                    [
+                        EventEntry(self.uuid_1, name, 1, diff.avro_bytes, 1, Action.CREATE, current_datetime()),
+                        EventEntry(self.uuid_2, name, 1, diff.avro_bytes, 2, Action.CREATE, current_datetime()),
+                    ]
+                ),
+                FakeAsyncIterator(
+                    [EventEntry(self.uuid_3, name, 1, diff.avro_bytes, 3, Action.CREATE, current_datetime())]
+                ),
+            ]
+        )
+        factory = self.snapshot_repository.database_operation_factory
+
+        with patch(
+            "minos.aggregate.EventRepository.offset", new_callable=PropertyMock, side_effect=AsyncMock(return_value=3)
+        ), patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([])), patch.object(
+            type(factory), "build_submit_offset", side_effect=factory.build_submit_offset
+        ) as submit_offset_mock, patch.object(
+            DatabaseClient, "commit"
+        ) as commit_mock:
+            await self.snapshot_repository.rebuild(batch_size=2)
+
+        self.assertEqual(
+            [call(id_gt=0, id_le=2, synchronize=False), call(id_gt=2, id_le=3, synchronize=False)],
+            self.event_repository.select.call_args_list,
+        )
+        self.assertEqual([call(0), call(2), call(3)], submit_offset_mock.call_args_list)
+        self.assertEqual(3, commit_mock.call_count)
+
+    async def test_rebuild_empty(self):
+        self.event_repository.select = MagicMock()
+        factory = self.snapshot_repository.database_operation_factory
+
+        with patch(
+            "minos.aggregate.EventRepository.offset", new_callable=PropertyMock, side_effect=AsyncMock(return_value=0)
+        ), patch.object(
+            type(factory), "build_submit_offset", side_effect=factory.build_submit_offset
+        ) as submit_offset_mock:
+            await self.snapshot_repository.rebuild()
+
+        self.assertEqual(0, self.event_repository.select.call_count)
+        self.assertEqual([call(0)], submit_offset_mock.call_args_list)
+
     async def test_find_by_uuid(self):
         entities = [
             SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2),
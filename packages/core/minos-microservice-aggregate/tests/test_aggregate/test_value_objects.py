@@ -2,6 +2,9 @@ import unittest
 from unittest import (
     TestCase,
 )
+from unittest.mock import (
+    patch,
+)
 
 from minos.aggregate import (
     Action,
@@ -11,12 +14,20 @@ from minos.aggregate import (
     ValueObjectException,
     ValueObjectSet,
 )
+from minos.common import (
+    AvroDataEncoder,
+    DeclarativeModel,
+)
 
 
 class _Location(ValueObject):
     street: str
 
 
+class _Names(ValueObject):
+    names: list[str]
+
+
 class TestValueObject(TestCase):
     def setUp(self) -> None:
         self.value = _Location(street="street name")
@@ -28,6 +39,101 @@ class TestValueObject(TestCase):
         with self.assertRaises(ValueObjectException):
             self.value["street"] = "this assignment must raise"
 
+    def test_avro_data_cached(self):
+        self.assertEqual({"street": "street name"}, self.value.avro_data)
+
+        with patch.object(AvroDataEncoder, "_build_model_uncached") as mock:
+            self.assertEqual({"street": "street name"}, self.value.avro_data)
+            self.assertEqual(0, mock.call_count)
+
+    def test_avro_data_cached_on_parent(self):
+        class _Parent(DeclarativeModel):
+            location: _Location
+            locations: list[_Location]
+
+        other = _Location(street="another street name")
+        parent = _Parent(self.value, [self.value, other])
+        expected = {
+            "location": {"street": "street name"},
+            "locations": [{"street": "street name"}, {"street": "another street name"}],
+        }
+        self.assertEqual(expected, parent.avro_data)
+        self.assertEqual({"street": "street name"}, self.value._avro_data)
+        self.assertEqual({"street": "another street name"}, other._avro_data)
+
+        with patch.object(
+            AvroDataEncoder, "_build_model_uncached", wraps=AvroDataEncoder()._build_model_uncached
+        ) as mock:
+            self.assertEqual(expected, parent.avro_data)
+            self.assertEqual(1, mock.call_count)
+
+    def test_avro_data_cached_is_not_shared(self):
+        self.value.avro_data["street"] = "modified"
+
+        self.assertEqual({"street": "street name"}, self.value.avro_data)
+
+    def test_avro_data_not_cached_with_mutable_values(self):
+        value = _Names(["a"])
+        self.assertEqual({"names": ["a"]}, value.avro_data)
+        self.assertIsNone(value._avro_data)
+
+        value.names.append("b")
+        self.assertEqual({"names": ["a", "b"]}, value.avro_data)
+
+    def test_hash_not_cached_with_mutable_values(self):
+        class _Text(DeclarativeModel):
+            text: str
+
+        class _Holder(ValueObject):
+            inner: _Text
+
+        value = _Holder(_Text("a"))
+        expected = hash(value)
+
+        value.inner.text = "b"
+        self.assertNotEqual(expected, hash(value))
+        self.assertEqual(_Holder(_Text("b")), value)
+
+    def test_immutable_checked_lazily(self):
+        with patch("minos.aggregate.value_objects.is_immutable") as mock:
+            value = _Location(street="street name")
+            self.assertEqual(0, mock.call_count)
+
+        self.assertTrue(value._is_immutable())
+        self.assertTrue(vars(value)["_immutable"])
+
+    def test_hash_cached_with_nested_value_objects(self):
+        class _Route(ValueObject):
+            origin: _Location
+            destination: _Location
+
+        value = _Route(self.value, _Location(street="another street name"))
+        expected = hash(value)
+
+        with patch.object(DeclarativeModel, "__hash__") as mock:
+            self.assertEqual(expected, hash(value))
+            self.assertEqual(0, mock.call_count)
+
+    def test_hash_cached(self):
+        expected = hash(self.value)
+
+        with patch.object(DeclarativeModel, "__hash__") as mock:
+            self.assertEqual(expected, hash(self.value))
+            self.assertEqual(0, mock.call_count)
+
+    def test_eq(self):
+        self.assertEqual(_Location(street="street name"), self.value)
+        self.assertNotEqual(_Location(street="another street name"), self.value)
+
+    def test_eq_with_cached_hashes(self):
+        one, two = _Location(street="street name"), _Location(street="another street name")
+        hash(one), hash(two), hash(self.value)
+
+        self.assertEqual(one, self.value)
+        with patch.object(DeclarativeModel, "__eq__") as mock:
+            self.assertNotEqual(two, self.value)
+            self.assertEqual(0, mock.call_count)
+
 
 class TestValueObjectSet(TestCase):
     def setUp(self) -> None:
@@ -140,6 +246,17 @@ class TestValueObjectSetDiff(TestCase):
         )
         self.assertEqual(expected, observed)
 
+    def test_from_difference_without_intermediate_sets(self):
+        entities = ValueObjectSet(self.clone)
+        new = _Location("Europa, 12")
+        entities.add(new)
+
+        with patch.object(ValueObjectSet, "_from_iterable") as mock:
+            observed = IncrementalSetDiff.from_difference(entities, self.old)
+
+        self.assertEqual(0, mock.call_count)
+        self.assertEqual(IncrementalSetDiff([IncrementalSetDiffEntry(Action.CREATE, new)]), observed)
+
 
 if __name__ == "__main__":
     unittest.main()
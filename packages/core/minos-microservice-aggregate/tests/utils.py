@@ -30,6 +30,7 @@ from minos.aggregate import (
     testing,
 )
 from minos.common import (
+    CompactDeclarativeModel,
     DatabaseClientPool,
     Lock,
     LockPool,
@@ -137,6 +138,10 @@ class Car(RootEntity):
     owner: Optional[Ref[Owner]]
 
 
+class CompactCar(Car, CompactDeclarativeModel):
+    """For testing purposes"""
+
+
 class Order(RootEntity):
     """For testing purposes"""
 
@@ -150,6 +155,10 @@ class OrderItem(Entity):
     name: str
 
 
+class CompactOrderItem(OrderItem, CompactDeclarativeModel):
+    """For testing purposes"""
+
+
 class Review(ValueObject):
     """For testing purposes."""
 
@@ -0,0 +1,27 @@
+"""Serialization benchmarks of the ``minos.common.model`` hot paths.
+
+They can be run as a standalone command (``python -m benchmarks``) or with ``pytest-benchmark``
+(``pytest benchmarks/bench_model.py``). In both cases the results can be stored as ``json`` for regression comparison.
+"""
+
+from .cases import (
+    BenchmarkCase,
+    get_cases,
+)
+from .models import (
+    MODEL_BUILDERS,
+    LeafModel,
+    ListModel,
+    NestedModel,
+    SmallModel,
+    WideModel,
+    build_list,
+    build_nested,
+    build_small,
+    build_wide,
+)
+from .runner import (
+    BenchmarkResult,
+    BenchmarkRunner,
+    compare_reports,
+)
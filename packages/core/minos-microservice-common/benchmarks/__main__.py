@@ -0,0 +1,81 @@
+import json
+import sys
+from argparse import (
+    ArgumentParser,
+    Namespace,
+)
+from typing import (
+    Optional,
+)
+
+from .cases import (
+    get_cases,
+)
+from .runner import (
+    BenchmarkRunner,
+    compare_reports,
+)
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> Namespace:
+    parser = ArgumentParser(prog="python -m benchmarks", description="Run the minos-microservice-common benchmarks.")
+    parser.add_argument("-k", "--filter", help="only run the cases whose name contains the given pattern")
+    parser.add_argument("-o", "--output", help="write the json report to the given file instead of stdout")
+    parser.add_argument("-n", "--number", type=int, help="calls per repetition (automatically computed by default)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="repetitions per case (default: %(default)s)")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results against the given json report")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative slowdown considered a regression (default: %(default)s)"
+    )
+    parser.add_argument("--list", action="store_true", help="list the available cases and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmarks from the command line.
+
+    :param argv: The command line arguments. If not set, ``sys.argv`` is used.
+    :return: The exit code (``1`` if any regression has been found on comparison mode or ``0`` otherwise).
+    """
+    args = _parse_args(argv)
+
+    cases = get_cases(args.filter)
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    runner = BenchmarkRunner(number=args.number, repeat=args.repeat)
+    results = list()
+    for case in cases:
+        result = runner.run_one(case)
+        print(f"{result.name:<40} {result.best * 1e6:>12.2f} us (x{result.number})", file=sys.stderr)
+        results.append(result)
+
+    report = runner.build_report(results)
+
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare) as file:
+        baseline = json.load(file)
+
+    regressed = False
+    for name, old, new, ratio, is_regression in compare_reports(baseline, report, args.threshold):
+        line = f"{name:<40} {old * 1e6:>12.2f} us -> {new * 1e6:>12.2f} us ({ratio:.2f}x)"
+        if is_regression:
+            line += " REGRESSION"
+        print(line, file=sys.stderr)
+        regressed |= is_regression
+
+    return int(regressed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+"""``pytest-benchmark`` entry point of the benchmark cases.
+
+Usage: ``pytest benchmarks/bench_model.py --benchmark-json=output.json``
+"""
+
+from operator import (
+    attrgetter,
+)
+
+import pytest
+
+from benchmarks import (
+    BenchmarkCase,
+    get_cases,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("case", get_cases(), ids=attrgetter("name"))
+def test_benchmark(benchmark, case: BenchmarkCase):
+    benchmark.group = case.group
+    benchmark.extra_info["model"] = case.model
+    benchmark(case.setup())
@@ -0,0 +1,121 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+from minos.common import (
+    AvroDataDecoder,
+    AvroSchemaEncoder,
+    Model,
+)
+
+from .models import (
+    MODEL_BUILDERS,
+)
+
+
+class BenchmarkCase:
+    """Benchmark Case class."""
+
+    __slots__ = "group", "model", "_setup"
+
+    def __init__(self, group: str, model: str, setup: Callable[[Model, Model], Callable[[], Any]]):
+        self.group = group
+        self.model = model
+        self._setup = setup
+
+    @property
+    def name(self) -> str:
+        """Get the name of the case.
+
+        :return: A ``str`` value.
+        """
+        return f"{self.group}[{self.model}]"
+
+    def setup(self) -> Callable[[], Any]:
+        """Prepare the case, returning the callable to be measured.
+
+        :return: A callable without arguments.
+        """
+        return self._setup(MODEL_BUILDERS[self.model](1), MODEL_BUILDERS[self.model](2))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+def _setup_construct(instance: Model, _: Model) -> Callable[[], Any]:
+    cls, fields = type(instance), dict(instance)
+    return lambda: cls(**fields)
+
+
+def _setup_avro_bytes(instance: Model, _: Model) -> Callable[[], Any]:
+    return lambda: instance.avro_bytes
+
+
+def _setup_from_avro_bytes(instance: Model, _: Model) -> Callable[[], Any]:
+    cls, data = type(instance), instance.avro_bytes
+    return lambda: cls.from_avro_bytes(data)
+
+
+def _setup_avro_schema_encoder(instance: Model, _: Model) -> Callable[[], Any]:
+    type_ = type(instance)
+    return lambda: AvroSchemaEncoder(type_).build()
+
+
+def _setup_avro_data_decoder(instance: Model, _: Model) -> Callable[[], Any]:
+    type_, data = type(instance), instance.avro_data
+    return lambda: AvroDataDecoder().build(data, type_)
+
+
+def _setup_event_from_difference(old: Model, new: Model) -> Callable[[], Any]:
+    from minos.aggregate import (
+        Event,
+    )
+
+    return lambda: Event.from_difference(new, old)
+
+
+def _is_aggregate_available() -> bool:
+    try:
+        import minos.aggregate  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_SETUPS: dict[str, Callable[[Model, Model], Callable[[], Any]]] = {
+    "construct": _setup_construct,
+    "avro_bytes": _setup_avro_bytes,
+    "from_avro_bytes": _setup_from_avro_bytes,
+    "avro_schema_encoder": _setup_avro_schema_encoder,
+    "avro_data_decoder": _setup_avro_data_decoder,
+    "event_from_difference": _setup_event_from_difference,
+}
+
+
+def get_cases(pattern: Optional[str] = None) -> list[BenchmarkCase]:
+    """Get the benchmark cases.
+
+    The ``event_from_difference`` cases are only available if ``minos-microservice-aggregate`` is installed.
+
+    :param pattern: If set, only the cases whose name contains the given pattern are returned.
+    :return: A list of ``BenchmarkCase`` instances.
+    """
+    groups: Iterable[str] = _SETUPS.keys()
+    if not _is_aggregate_available():
+        groups = (group for group in groups if group != "event_from_difference")
+
+    cases = [BenchmarkCase(group, model, _SETUPS[group]) for group in groups for model in MODEL_BUILDERS]
+
+    if pattern is not None:
+        cases = [case for case in cases if pattern in case.name]
+
+    return cases
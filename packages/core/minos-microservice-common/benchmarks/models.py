@@ -0,0 +1,172 @@
+from __future__ import (
+    annotations,
+)
+
+from datetime import (
+    datetime,
+    timezone,
+)
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+from uuid import (
+    UUID,
+)
+
+from minos.common import (
+    DeclarativeModel,
+    Model,
+)
+
+WIDE_MODEL_FIELDS = 64
+NESTED_MODEL_DEPTH = 8
+LIST_MODEL_ITEMS = 20
+
+_UUID = UUID("c2d5b2c6-4d1e-4d7f-9a55-3f0c2b8d6e11")
+_DATETIME = datetime(2022, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class SmallModel(DeclarativeModel):
+    """Small model (a few primitive fields) used for benchmarking purposes."""
+
+    uuid: UUID
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    name: str
+    amount: int
+
+
+class LeafModel(DeclarativeModel):
+    """Leaf model of the ``NestedModel`` used for benchmarking purposes."""
+
+    name: str
+    value: int
+    tags: list[str]
+
+
+class ListModel(DeclarativeModel):
+    """Model with a list of ``LeafModel`` instances used for benchmarking purposes.
+
+    Its construction sets a field per item, so it measures the per-field overhead (like the log calls of the field
+    setter, which must not format their messages while the level is disabled).
+    """
+
+    uuid: UUID
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    name: str
+    items: list[LeafModel]
+
+
+def _build_model_cls(name: str, annotations_: dict[str, Any]) -> type[DeclarativeModel]:
+    cls = type(name, (DeclarativeModel,), {"__annotations__": annotations_, "__module__": __name__})
+    cls.__qualname__ = name
+    globals()[name] = cls  # The classes must be importable to be decoded.
+    return cls
+
+
+def _wide_field_type(index: int) -> Any:
+    return (str, int, float, bool, Optional[str], list[int], dict[str, int])[index % 7]
+
+
+def _build_wide_model_cls() -> type[DeclarativeModel]:
+    annotations_ = {"uuid": UUID, "version": int, "created_at": datetime, "updated_at": datetime}
+    annotations_ |= {f"field_{i}": _wide_field_type(i) for i in range(WIDE_MODEL_FIELDS)}
+    return _build_model_cls("WideModel", annotations_)
+
+
+def _build_nested_model_cls() -> type[DeclarativeModel]:
+    child = LeafModel
+    for level in range(1, NESTED_MODEL_DEPTH):
+        child = _build_model_cls(f"NestedModelLevel{level}", {"name": str, "child": child, "leaves": list[LeafModel]})
+
+    annotations_ = {"uuid": UUID, "version": int, "created_at": datetime, "updated_at": datetime}
+    annotations_ |= {"name": str, "child": child, "leaves": list[LeafModel]}
+    return _build_model_cls("NestedModel", annotations_)
+
+
+WideModel = _build_wide_model_cls()
+NestedModel = _build_nested_model_cls()
+
+
+def build_small(version: int = 1) -> SmallModel:
+    """Build a ``SmallModel`` instance.
+
+    :param version: The version of the instance.
+    :return: A ``SmallModel`` instance.
+    """
+    return SmallModel(_UUID, version, _DATETIME, _DATETIME, f"small-{version}", 10 * version)
+
+
+def _wide_field_value(index: int, version: int) -> Any:
+    type_ = _wide_field_type(index)
+    if type_ is str:
+        return f"value-{index}-{version}"
+    if type_ is int:
+        return index * version
+    if type_ is float:
+        return index / (version + 1)
+    if type_ is bool:
+        return bool((index + version) % 2)
+    if type_ == Optional[str]:
+        return None if index % 2 else f"optional-{index}"
+    if type_ == list[int]:
+        return list(range(index % 5 + version))
+    return {f"key_{i}": i * version for i in range(index % 5)}
+
+
+def build_wide(version: int = 1) -> DeclarativeModel:
+    """Build a ``WideModel`` instance.
+
+    :param version: The version of the instance.
+    :return: A ``WideModel`` instance.
+    """
+    fields = {f"field_{i}": _wide_field_value(i, version) for i in range(WIDE_MODEL_FIELDS)}
+    return WideModel(uuid=_UUID, version=version, created_at=_DATETIME, updated_at=_DATETIME, **fields)
+
+
+def _build_leaves(level: int, version: int) -> list[LeafModel]:
+    return [LeafModel(f"leaf-{level}-{i}", level * version + i, ["one", "two", str(version)]) for i in range(2)]
+
+
+def build_nested(version: int = 1) -> DeclarativeModel:
+    """Build a ``NestedModel`` instance.
+
+    :param version: The version of the instance.
+    :return: A ``NestedModel`` instance.
+    """
+    child = LeafModel("leaf", version, ["one", "two"])
+    for level in range(1, NESTED_MODEL_DEPTH):
+        child = globals()[f"NestedModelLevel{level}"](f"level-{level}", child, _build_leaves(level, version))
+
+    return NestedModel(
+        uuid=_UUID,
+        version=version,
+        created_at=_DATETIME,
+        updated_at=_DATETIME,
+        name=f"nested-{version}",
+        child=child,
+        leaves=_build_leaves(NESTED_MODEL_DEPTH, version),
+    )
+
+
+def build_list(version: int = 1) -> ListModel:
+    """Build a ``ListModel`` instance.
+
+    :param version: The version of the instance.
+    :return: A ``ListModel`` instance.
+    """
+    items = [LeafModel(f"item-{i}", i * version, ["one", "two", str(version)]) for i in range(LIST_MODEL_ITEMS)]
+    return ListModel(_UUID, version, _DATETIME, _DATETIME, f"list-{version}", items)
+
+
+MODEL_BUILDERS: dict[str, Callable[[int], Model]] = {
+    "small": build_small,
+    "wide": build_wide,
+    "nested": build_nested,
+    "list": build_list,
+}
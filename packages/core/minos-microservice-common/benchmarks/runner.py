@@ -0,0 +1,174 @@
+from __future__ import (
+    annotations,
+)
+
+import platform
+import statistics
+import sys
+from collections.abc import (
+    Iterable,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from timeit import (
+    Timer,
+)
+from typing import (
+    Any,
+    Optional,
+)
+
+from minos.common import (
+    __version__,
+)
+
+from .cases import (
+    BenchmarkCase,
+)
+
+
+class BenchmarkResult:
+    """Benchmark Result class."""
+
+    __slots__ = "name", "group", "model", "number", "timings"
+
+    def __init__(self, name: str, group: str, model: str, number: int, timings: list[float]):
+        self.name = name
+        self.group = group
+        self.model = model
+        self.number = number
+        self.timings = timings
+
+    @property
+    def best(self) -> float:
+        """Get the best time per call, in seconds.
+
+        :return: A ``float`` value.
+        """
+        return min(self.timings)
+
+    @property
+    def mean(self) -> float:
+        """Get the mean time per call, in seconds.
+
+        :return: A ``float`` value.
+        """
+        return statistics.mean(self.timings)
+
+    @property
+    def stdev(self) -> float:
+        """Get the standard deviation of the time per call, in seconds.
+
+        :return: A ``float`` value.
+        """
+        if len(self.timings) < 2:
+            return 0.0
+        return statistics.stdev(self.timings)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the result as a json-serializable dictionary.
+
+        :return: A dictionary.
+        """
+        return {
+            "name": self.name,
+            "group": self.group,
+            "model": self.model,
+            "number": self.number,
+            "repeat": len(self.timings),
+            "best": self.best,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "ops": 1 / self.best if self.best else None,
+            "timings": self.timings,
+        }
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, best={self.best!r})"
+
+
+class BenchmarkRunner:
+    """Benchmark Runner class."""
+
+    def __init__(self, number: Optional[int] = None, repeat: int = 5, min_time: float = 0.2):
+        self.number = number
+        self.repeat = repeat
+        self.min_time = min_time
+
+    def run(self, cases: Iterable[BenchmarkCase]) -> list[BenchmarkResult]:
+        """Run the given benchmark cases.
+
+        :param cases: The cases to be run.
+        :return: A list of ``BenchmarkResult`` instances (one per case and following the same order).
+        """
+        return [self.run_one(case) for case in cases]
+
+    def run_one(self, case: BenchmarkCase) -> BenchmarkResult:
+        """Run the given benchmark case.
+
+        :param case: The case to be run.
+        :return: A ``BenchmarkResult`` instance.
+        """
+        timer = Timer(case.setup())
+
+        timer.timeit(1)  # warm up the caches.
+
+        number = self.number
+        if number is None:
+            number = self._autorange(timer)
+
+        timings = [elapsed / number for elapsed in timer.repeat(repeat=self.repeat, number=number)]
+        return BenchmarkResult(case.name, case.group, case.model, number, timings)
+
+    def _autorange(self, timer: Timer) -> int:
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= self.min_time:
+                return number
+            number *= 10 if elapsed < self.min_time / 10 else 2
+
+    @staticmethod
+    def build_report(results: Iterable[BenchmarkResult]) -> dict[str, Any]:
+        """Build a json-serializable report from the given results.
+
+        :param results: The benchmark results.
+        :return: A dictionary.
+        """
+        return {
+            "machine_info": {
+                "python_version": platform.python_version(),
+                "python_implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "argv": sys.argv,
+            },
+            "minos_version": __version__,
+            "datetime": datetime.now(tz=timezone.utc).isoformat(),
+            "benchmarks": [result.as_dict() for result in results],
+        }
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.1
+) -> list[tuple[str, float, float, float, bool]]:
+    """Compare two benchmark reports.
+
+    :param baseline: The reference report.
+    :param current: The report to be compared against the baseline.
+    :param threshold: The maximum relative slowdown before considering a case as a regression.
+    :return: A list of ``(name, baseline_best, current_best, ratio, regressed)`` tuples, one per case present on both
+        reports.
+    """
+    baseline_best = {entry["name"]: entry["best"] for entry in baseline["benchmarks"]}
+
+    ans = list()
+    for entry in current["benchmarks"]:
+        if entry["name"] not in baseline_best:
+            continue
+        old, new = baseline_best[entry["name"]], entry["best"]
+        ratio = new / old
+        ans.append((entry["name"], old, new, ratio, ratio > 1 + threshold))
+    return ans
@@ -13,9 +13,14 @@ from .config import (
     ConfigV2,
     MinosConfig,
 )
+from .contextvars import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
+)
 from .database import (
+    AvroSchemaRegistryDatabaseOperationFactory,
     ComposedDatabaseOperation,
     ConnectionException,
+    DatabaseAvroSchemaRegistry,
     DatabaseClient,
     DatabaseClientBuilder,
     DatabaseClientException,
@@ -87,6 +92,7 @@ from .model import (
     AvroSchemaDecoder,
     AvroSchemaEncoder,
     BucketModel,
+    CompactDeclarativeModel,
     DataDecoder,
     DataEncoder,
     DataTransferObject,
@@ -105,6 +111,7 @@ from .model import (
     TypeHintBuilder,
     TypeHintComparator,
     TypeHintParser,
+    is_immutable,
     is_model_type,
 )
 from .object import (
@@ -120,11 +127,16 @@ from .ports import (
     Port,
 )
 from .protocol import (
+    AvroSchemaCache,
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
     MinosBinaryProtocol,
     MinosJsonBinaryProtocol,
+    MinosMsgPackProtocol,
+    build_schema_fingerprint,
 )
 from .retries import (
     CircuitBreakerMixin,
@@ -102,6 +102,8 @@ class ConfigV2(Config):
         for database in data.values():
             if database.get("client") is not None:
                 database["client"] = import_module(database["client"])
+            if database.get("protocol") is not None:
+                database["protocol"] = import_module(database["protocol"])
         return data
 
     def _get_interfaces(self) -> dict[str, dict[str, Any]]:
@@ -133,6 +135,8 @@ class ConfigV2(Config):
             data["publisher"]["client"] = import_module(data["publisher"]["client"])
             if data["publisher"].get("queue") is not None:
                 data["publisher"]["queue"] = import_module(data["publisher"]["queue"])
+            if data["publisher"].get("protocol") is not None:
+                data["publisher"]["protocol"] = import_module(data["publisher"]["protocol"])
 
         if data.get("subscriber") is not None:
             data["subscriber"]["client"] = import_module(data["subscriber"]["client"])
@@ -208,6 +212,8 @@ class ConfigV2(Config):
 
         data["entities"] = [import_module(classname) for classname in data.get("entities", list())]
         data["repositories"] = {name: import_module(value) for name, value in data.get("repositories", dict()).items()}
+        if data.get("protocols") is not None:
+            data["protocols"] = {name: import_module(value) for name, value in data["protocols"].items()}
         return data
 
     def _get_saga(self) -> dict[str, Any]:
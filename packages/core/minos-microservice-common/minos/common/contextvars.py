@@ -0,0 +1,14 @@
+from contextvars import (
+    ContextVar,
+)
+from typing import (
+    Final,
+)
+
+IS_TRUSTED_DECODING_CONTEXT_VAR: Final[ContextVar[bool]] = ContextVar("is_trusted_decoding", default=False)
+"""Context variable containing ``True`` if the decoded data is trusted (it has been written by the framework itself), or
+``False`` otherwise.
+
+On trusted mode, the model fields skip the parsers and validators, and the decoding (type checking) of their values is
+deferred until they are accessed for the first time.
+"""
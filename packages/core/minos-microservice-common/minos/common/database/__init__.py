@@ -25,3 +25,7 @@ from .pools import (
     DatabaseClientPool,
     DatabaseLockPool,
 )
+from .registries import (
+    AvroSchemaRegistryDatabaseOperationFactory,
+    DatabaseAvroSchemaRegistry,
+)
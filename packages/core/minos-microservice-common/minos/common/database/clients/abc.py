@@ -111,6 +111,36 @@ class DatabaseClient(ABC, BuildableMixin):
     async def _execute(self, operation: DatabaseOperation) -> None:
         raise NotImplementedError
 
+    async def begin(self) -> None:
+        """Begin a transaction, so that the following operations are not applied until it is committed.
+
+        :return: This method does not return anything.
+        """
+        await self._begin()
+
+    async def _begin(self) -> None:
+        """By default, the transactions are not supported, so the operations are applied as soon as executed."""
+
+    async def commit(self) -> None:
+        """Commit the current transaction.
+
+        :return: This method does not return anything.
+        """
+        await self._commit()
+
+    async def _commit(self) -> None:
+        """By default, the transactions are not supported, so there is nothing to be committed."""
+
+    async def rollback(self) -> None:
+        """Rollback the current transaction.
+
+        :return: This method does not return anything.
+        """
+        await self._rollback()
+
+    async def _rollback(self) -> None:
+        """By default, the transactions are not supported, so there is nothing to be rolled back."""
+
     async def _create_lock(self, lock: Hashable, *args, **kwargs):
         if self._lock is not None and self._lock.key == lock:
             return
@@ -1,9 +1,17 @@
+from asyncio import (
+    Task,
+    current_task,
+)
 from collections.abc import (
     AsyncIterator,
 )
 from contextlib import (
+    asynccontextmanager,
     suppress,
 )
+from contextvars import (
+    ContextVar,
+)
 from typing import (
     Any,
     Generic,
@@ -37,6 +45,13 @@ from .pools import (
 
 GenericDatabaseOperationFactory = TypeVar("GenericDatabaseOperationFactory", bound=DatabaseOperationFactory)
 
+# The clients in which a transaction is open on the current context, indexed by the pool from which they were acquired.
+# Each client is stored along with the task that opened the transaction, as the tasks created inside it copy the context
+# but must not use its client (they could run concurrently with the transaction or outlive it).
+_TRANSACTION_CLIENTS: ContextVar[dict[DatabaseClientPool, tuple[Task, DatabaseClient]]] = ContextVar(
+    "database_transaction_clients", default=dict()
+)
+
 
 class DatabaseMixin(SetupMixin, Generic[GenericDatabaseOperationFactory]):
     """Database Mixin class."""
@@ -104,13 +119,60 @@ class DatabaseMixin(SetupMixin, Generic[GenericDatabaseOperationFactory]):
                 raise TypeError(f"{type(self)!r} must contain a {DatabaseOperationFactory!r} as generic value.")
         return operation_factory_cls
 
+    @asynccontextmanager
+    async def database_transaction(self) -> AsyncIterator[DatabaseClient]:
+        """Open a database transaction in which the operations executed by this instance are applied atomically.
+
+        While the transaction is open, the operations executed (on the current task) by this instance or by any other
+        one that shares its database pool are applied on the same database client, which is committed on exit or
+        rolled back if an exception has been raised. Nested calls reuse the outer transaction, but the tasks created
+        within it acquire their own clients. Sharing the client also
+        prevents the transaction from waiting for additional clients of the pool while it retains one of them, which
+        could exhaust the pool under concurrency.
+
+        :return: An asynchronous context manager that yields the ``DatabaseClient`` in which the transaction is open.
+        """
+        if (client := self._get_transaction_client()) is not None:
+            yield client
+            return
+
+        async with self.database_pool.acquire() as client:
+            await client.begin()
+            token = _TRANSACTION_CLIENTS.set(
+                _TRANSACTION_CLIENTS.get() | {self.database_pool: (current_task(), client)}
+            )
+            try:
+                yield client
+            except BaseException:
+                await client.rollback()
+                raise
+            else:
+                await client.commit()
+            finally:
+                _TRANSACTION_CLIENTS.reset(token)
+
+    def _get_transaction_client(self) -> Optional[DatabaseClient]:
+        task, client = _TRANSACTION_CLIENTS.get().get(self.database_pool, (None, None))
+        if task is not current_task():
+            return None
+        return client
+
+    @asynccontextmanager
+    async def _acquire_database_client(self) -> AsyncIterator[DatabaseClient]:
+        if (client := self._get_transaction_client()) is not None:
+            yield client
+            return
+
+        async with self.database_pool.acquire() as client:
+            yield client
+
     async def execute_on_database_and_fetch_one(self, operation: DatabaseOperation) -> Any:
         """Submit an Operation and get the first response.
 
         :param operation: The operation to be executed.
         :return: This method does not return anything.
         """
-        async with self.database_pool.acquire() as client:
+        async with self._acquire_database_client() as client:
             await client.execute(operation)
             return await client.fetch_one()
 
@@ -122,13 +184,14 @@ class DatabaseMixin(SetupMixin, Generic[GenericDatabaseOperationFactory]):
 
         :param operation: The operation to be executed.
         :param streaming_mode: If ``True`` return the values in streaming directly from the database (keep an open
-            database connection), otherwise preloads the full set of values on memory and then retrieves them.
+            database connection), otherwise preloads the full set of values on memory and then retrieves them. Within
+            a database transaction the values are always preloaded, as the connection is shared.
         :return: This method does not return anything.
         """
-        if streaming_mode is None:
+        if streaming_mode is None or self._get_transaction_client() is not None:
             streaming_mode = False
 
-        async with self.database_pool.acquire() as client:
+        async with self._acquire_database_client() as client:
             await client.execute(operation)
             async_iterable = client.fetch_all()
             if streaming_mode:
@@ -148,7 +211,7 @@ class DatabaseMixin(SetupMixin, Generic[GenericDatabaseOperationFactory]):
         :param operation: The operation to be executed.
         :return: This method does not return anything.
         """
-        async with self.database_pool.acquire() as client:
+        async with self._acquire_database_client() as client:
             return await client.execute(operation)
 
     @property
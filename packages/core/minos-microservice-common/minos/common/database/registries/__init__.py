@@ -0,0 +1,6 @@
+from .factories import (
+    AvroSchemaRegistryDatabaseOperationFactory,
+)
+from .impl import (
+    DatabaseAvroSchemaRegistry,
+)
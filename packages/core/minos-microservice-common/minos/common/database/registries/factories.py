@@ -0,0 +1,40 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import (
+    Iterable,
+)
+
+from ..operations import (
+    DatabaseOperation,
+    DatabaseOperationFactory,
+)
+
+
+class AvroSchemaRegistryDatabaseOperationFactory(DatabaseOperationFactory, ABC):
+    """Avro Schema Registry Database Operation Factory base class."""
+
+    @abstractmethod
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the schema registry table.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_submit(self, fingerprint: int, schema: str) -> DatabaseOperation:
+        """Build the database operation to store a schema.
+
+        :param fingerprint: The signed 64-bit fingerprint of the schema.
+        :param schema: The ``json`` representation of the schema.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_query(self, fingerprints: Iterable[int]) -> DatabaseOperation:
+        """Build the database operation to get the schemas identified by the given fingerprints.
+
+        :param fingerprints: The signed 64-bit fingerprints of the schemas.
+        :return: A ``DatabaseOperation`` instance.
+        """
@@ -0,0 +1,53 @@
+from typing import (
+    Any,
+)
+
+import orjson
+
+from ...protocol import (
+    AvroSchemaRegistry,
+)
+from ..mixins import (
+    DatabaseMixin,
+)
+from .factories import (
+    AvroSchemaRegistryDatabaseOperationFactory,
+)
+
+
+class DatabaseAvroSchemaRegistry(AvroSchemaRegistry, DatabaseMixin[AvroSchemaRegistryDatabaseOperationFactory]):
+    """Database Avro Schema Registry class."""
+
+    async def _setup(self) -> None:
+        await super()._setup()
+        await self._create_table()
+
+    async def _create_table(self) -> None:
+        operation = self.database_operation_factory.build_create()
+        await self.execute_on_database(operation)
+
+    async def _load(self, fingerprints: set[int]) -> dict[int, Any]:
+        operation = self.database_operation_factory.build_query(map(_to_signed, fingerprints))
+        return {
+            _to_unsigned(fingerprint): orjson.loads(schema)
+            async for fingerprint, schema in self.execute_on_database_and_fetch_all(operation)
+        }
+
+    async def _store(self, schemas: dict[int, Any]) -> None:
+        for fingerprint, schema in schemas.items():
+            operation = self.database_operation_factory.build_submit(
+                _to_signed(fingerprint), orjson.dumps(schema).decode()
+            )
+            await self.execute_on_database(operation)
+
+
+def _to_signed(fingerprint: int) -> int:
+    if fingerprint >= 1 << 63:
+        fingerprint -= 1 << 64
+    return fingerprint
+
+
+def _to_unsigned(fingerprint: int) -> int:
+    if fingerprint < 0:
+        fingerprint += 1 << 64
+    return fingerprint
@@ -2,6 +2,7 @@ from .abc import (
     Model,
 )
 from .declarative import (
+    CompactDeclarativeModel,
     DeclarativeModel,
     MinosModel,
 )
@@ -13,6 +14,7 @@ from .dynamic import (
 from .fields import (
     Field,
     ModelField,
+    is_immutable,
 )
 from .serializers import (
     AvroDataDecoder,
@@ -13,10 +13,17 @@ from base64 import (
 from collections.abc import (
     Mapping,
 )
+from copy import (
+    deepcopy,
+)
+from functools import (
+    lru_cache,
+)
 from typing import (
     Any,
     Iterable,
     Iterator,
+    Optional,
     Type,
     TypedDict,
     TypeVar,
@@ -36,7 +43,11 @@ from ..meta import (
     self_or_classmethod,
 )
 from ..protocol import (
+    AvroSchemaCache,
     MinosAvroProtocol,
+    MinosBinaryProtocol,
+    MinosMsgPackProtocol,
+    build_schema_fingerprint,
 )
 from .fields import (
     Field,
@@ -63,6 +74,7 @@ class Model(Mapping):
     """Base class for ``minos`` model entities."""
 
     _field_cls: Type[Field] = Field
+    _avro_schema_type_cache = AvroSchemaCache()
 
     _fields: dict[str, Field]
     __eq_reversing: bool
@@ -111,41 +123,132 @@ class Model(Mapping):
         raw = b64decode(raw.encode())
         return cls.from_avro_bytes(raw, **kwargs)
 
-    # noinspection PyUnusedLocal
     @classmethod
-    def from_avro_bytes(cls: Type[T], raw: bytes, batch_mode: bool = False, **kwargs) -> Union[T, list[T]]:
+    def from_avro_bytes(
+        cls: Type[T], raw: Union[bytes, memoryview], batch_mode: bool = False, **kwargs
+    ) -> Union[T, list[T]]:
         """Build a single instance or a sequence of instances from bytes.
 
         :param raw: A ``bytes`` representation of the model.
         :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
             single model.
-        :param kwargs: Additional named arguments.
+        :param kwargs: Additional named arguments to be passed to the protocol (as the ``schema_registry``).
         :return: A single instance or a sequence of instances.
         """
-        schema = MinosAvroProtocol.decode_schema(raw)
-        data = MinosAvroProtocol.decode(raw, batch_mode=batch_mode)
+        schema, data = MinosAvroProtocol.decode_with_schema(raw, batch_mode=batch_mode, **kwargs)
 
         if batch_mode:
             return [cls.from_avro(schema, entry) for entry in data]
 
         return cls.from_avro(schema, data)
 
+    @classmethod
+    def from_avro_bytes_many(cls: Type[T], raws: Iterable[bytes], batch_mode: bool = False, **kwargs) -> list[Any]:
+        """Build a sequence of instances from a sequence of bytes.
+
+        The bytes objects are grouped by their schema, so the schema and the type are resolved only once per group.
+
+        :param raws: A sequence of ``bytes`` representations of models.
+        :param batch_mode: If ``True`` each entry is processed as a list of models, otherwise each entry is processed as
+            a single model.
+        :param kwargs: Additional named arguments to be passed to the protocol (as the ``schema_registry``).
+        :return: A list containing a single instance or a sequence of instances for each entry, following the same
+            order.
+        """
+        decoded = MinosAvroProtocol.decode_many(raws, batch_mode=batch_mode, **kwargs)
+        return cls._from_decoded_many(decoded, batch_mode)
+
+    @classmethod
+    def from_bytes(
+        cls: Type[T], raw: Union[bytes, memoryview], batch_mode: bool = False, **kwargs
+    ) -> Union[T, list[T]]:
+        """Build a single instance or a sequence of instances from bytes encoded with any of the supported protocols.
+
+        The protocol (``MinosAvroProtocol`` or ``MinosMsgPackProtocol``) is detected from the header of the bytes.
+
+        :param raw: A ``bytes`` representation of the model.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param kwargs: Additional named arguments to be passed to the protocol (as the ``schema_registry``).
+        :return: A single instance or a sequence of instances.
+        """
+        if not MinosMsgPackProtocol.is_encoded(raw):
+            return cls.from_avro_bytes(raw, batch_mode=batch_mode, **kwargs)
+
+        schema, data = MinosMsgPackProtocol.decode_with_schema(raw, batch_mode=batch_mode, **kwargs)
+
+        if batch_mode:
+            return [cls.from_avro(schema, entry) for entry in data]
+
+        return cls.from_avro(schema, data)
+
+    @classmethod
+    def from_bytes_many(cls: Type[T], raws: Iterable[bytes], batch_mode: bool = False, **kwargs) -> list[Any]:
+        """Build a sequence of instances from a sequence of bytes encoded with any of the supported protocols.
+
+        The protocol of each entry is detected from its header and the entries are grouped by protocol and schema, so
+        the schema and the type are resolved only once per group.
+
+        :param raws: A sequence of ``bytes`` representations of models.
+        :param batch_mode: If ``True`` each entry is processed as a list of models, otherwise each entry is processed as
+            a single model.
+        :param kwargs: Additional named arguments to be passed to the protocol (as the ``schema_registry``).
+        :return: A list containing a single instance or a sequence of instances for each entry, following the same
+            order.
+        """
+        raws = list(raws)
+        msgpack_indices = [index for index, raw in enumerate(raws) if MinosMsgPackProtocol.is_encoded(raw)]
+        if not msgpack_indices:
+            return cls.from_avro_bytes_many(raws, batch_mode=batch_mode, **kwargs)
+
+        avro_raws = [raw for raw in raws if not MinosMsgPackProtocol.is_encoded(raw)]
+        msgpack_raws = [raws[index] for index in msgpack_indices]
+
+        decoded = MinosAvroProtocol.decode_many(avro_raws, batch_mode=batch_mode, **kwargs)
+        msgpack_decoded = MinosMsgPackProtocol.decode_many(msgpack_raws, batch_mode=batch_mode, **kwargs)
+        for index, entry in zip(msgpack_indices, msgpack_decoded):
+            decoded.insert(index, entry)
+
+        return cls._from_decoded_many(decoded, batch_mode)
+
+    @classmethod
+    def _from_decoded_many(cls, decoded: list[tuple[Any, Any]], batch_mode: bool) -> list[Any]:
+        data_decoder = AvroDataDecoder()
+        types = dict()
+        ans = list()
+        for schema, data in decoded:
+            if (type_ := types.get(id(schema))) is None:
+                type_ = types[id(schema)] = cls._build_avro_schema_type(schema)
+
+            if batch_mode:
+                ans.append([data_decoder.build(entry, type_) for entry in data])
+            else:
+                ans.append(data_decoder.build(data, type_))
+
+        return ans
+
     @classmethod
     def from_avro(cls: Type[T], schema: Any, data: Any) -> T:
         """Build a new instance from the ``avro`` schema and data.
 
+        The type decoded from the schema is cached by the schema fingerprint, so it is only built once per schema.
+
         :param schema: The avro schema of the model.
         :param data: The avro data of the model.
         :return: A new ``DynamicModel`` instance.
         """
-        schema_decoder = AvroSchemaDecoder()
-        type_ = schema_decoder.build(schema)
+        type_ = cls._build_avro_schema_type(schema)
 
         data_decoder = AvroDataDecoder()
         instance = data_decoder.build(data, type_)
 
         return instance
 
+    @classmethod
+    def _build_avro_schema_type(cls, schema: Any) -> type:
+        fingerprint = build_schema_fingerprint(schema)
+        return cls._avro_schema_type_cache.get_or_build(fingerprint, lambda: AvroSchemaDecoder().build(schema))
+
     @classmethod
     def to_avro_str(cls: Type[T], models: list[T]) -> str:
         """Build the avro string representation of the given object instances.
@@ -256,11 +359,16 @@ class Model(Mapping):
     def avro_schema(self_or_cls) -> list[dict[str, Any]]:
         """Compute the avro schema of the model.
 
+        The schema is computed once per class (when called from the class) or once per model type (when called from
+        an instance, as the type of an instance may depend on its values). A copy is returned each time, so the callers
+        can modify it without altering the cached one.
+
         :return: A dictionary object.
         """
+        if isinstance(self_or_cls, type):
+            return deepcopy(_build_class_avro_schema(self_or_cls))
         # noinspection PyTypeChecker
-        encoder = AvroSchemaEncoder()
-        return encoder.build(self_or_cls)
+        return deepcopy(_build_model_type_avro_schema(self_or_cls.model_type))
 
     @property
     def avro_data(self) -> dict[str, Any]:
@@ -289,6 +397,20 @@ class Model(Mapping):
         # noinspection PyTypeChecker
         return MinosAvroProtocol.encode(self.avro_data, self.avro_schema)
 
+    def to_bytes(self, protocol: Optional[type[MinosBinaryProtocol]] = None, **kwargs) -> bytes:
+        """Generate bytes representation of the current instance with the given protocol.
+
+        :param protocol: The protocol to be used (``MinosAvroProtocol`` or ``MinosMsgPackProtocol``). If not set, the
+            ``avro`` representation is generated.
+        :param kwargs: Additional named arguments to be passed to the protocol (as ``schemaless``).
+        :return: A bytes object.
+        """
+        if protocol is None:
+            return self.avro_bytes
+
+        # noinspection PyTypeChecker
+        return protocol.encode(self.avro_data, self.avro_schema, **kwargs)
+
     # noinspection PyUnusedLocal
     @staticmethod
     def encode_schema(encoder: SchemaEncoder, target: Any, **kwargs) -> Any:
@@ -365,4 +487,18 @@ class Model(Mapping):
         return f"{type(self).__name__}({fields_repr})"
 
 
+@lru_cache(maxsize=1024)
+def _build_class_avro_schema(cls: type[Model]) -> list[dict[str, Any]]:
+    encoder = AvroSchemaEncoder()
+    return encoder.build(cls)
+
+
+# ``ModelType`` instances are hashed by structure (name, namespace and type hints), so the equivalent model types that
+# are built from different instances share the same entry.
+@lru_cache(maxsize=1024)
+def _build_model_type_avro_schema(model_type: ModelType) -> list[dict[str, Any]]:
+    encoder = AvroSchemaEncoder()
+    return [encoder.build(model_type)]
+
+
 T = TypeVar("T", bound=Model)
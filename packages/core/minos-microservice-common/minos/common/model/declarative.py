@@ -11,6 +11,8 @@ from itertools import (
 )
 from typing import (
     Any,
+    Callable,
+    Iterable,
     Iterator,
     Optional,
     TypeVar,
@@ -23,6 +25,9 @@ from ..meta import (
 from .abc import (
     Model,
 )
+from .fields import (
+    Field,
+)
 from .types import (
     MissingSentinel,
     ModelType,
@@ -80,7 +85,7 @@ class DeclarativeModel(Model):
         for b in cls.__mro__[::-1]:
             list_fields = _get_class_type_hints(b)
             type_hints |= list_fields
-        logger.debug(f"The obtained type hints are: {type_hints!r}")
+        logger.debug("The obtained type hints are: %r", type_hints)
 
         if additional_type_hints:
             for name, hint in additional_type_hints.items():
@@ -96,5 +101,177 @@ def _get_class_type_hints(b: type) -> dict[str, type]:
     return {k: v for k, v in get_type_hints(b).items() if not k.startswith("_")}
 
 
+class CompactDeclarativeModel(DeclarativeModel):
+    """Declarative model with compact storage.
+
+    The values are stored on a per-instance list, while the fields metadata (names, types, parsers and validators) is
+    shared between all the instances of the class with the same type hints. The ``Field`` instances are only created on
+    demand when the ``fields`` attribute is accessed, as views that read and write the values of the model.
+
+    Compact storage can be enabled on any declarative model (including the subclasses of ``Entity`` or
+    ``RootEntity``) by adding this class to its bases.
+    """
+
+    _layout: _CompactLayout
+    _values: list[Any]
+
+    def _build_fields(self, *args, additional_type_hints: Optional[dict[str, type]] = None, **kwargs) -> None:
+        layout = _build_compact_layout(type(self), tuple(self._type_hints(additional_type_hints)))
+        if len(args) > len(layout.names):
+            raise TypeError(
+                f"{type(self).__name__!r} takes {len(layout.names)} positional arguments but {len(args)} were given"
+            )
+
+        # The values are appended one by one, so the validators are able to access the already built ones.
+        self._layout = layout
+        self._values = values = list()
+        for index, name in enumerate(layout.names):
+            if index < len(args):
+                if name in kwargs:
+                    raise TypeError(f"got multiple values for argument {repr(name)}")
+                value = args[index]
+            else:
+                value = kwargs.get(name, MissingSentinel)
+            values.append(self._build_value(layout, index, value))
+
+    def _build_value(self, layout: _CompactLayout, index: int, data: Any) -> Any:
+        parser, validator = self._get_parser(layout, index), self._get_validator(layout, index)
+        return Field._build_value(layout.names[index], layout.types[index], data, parser, validator)
+
+    def _get_parser(self, layout: _CompactLayout, index: int) -> Optional[Callable[[Any], Any]]:
+        if (name := layout.parsers[index]) is None:
+            return None
+        return getattr(self, name)
+
+    def _get_validator(self, layout: _CompactLayout, index: int) -> Optional[Callable[[Any], Any]]:
+        if (name := layout.validators[index]) is None:
+            return None
+        return getattr(self, name)
+
+    @property
+    def fields(self) -> dict[str, Field]:
+        """Fields getter.
+
+        The fields are views that read and write the values stored on the model.
+        """
+        if (layout := self.__dict__.get("_layout")) is None:
+            return dict()
+
+        return {
+            name: _CompactFieldView(
+                self, name, type_, self._get_parser(layout, index), self._get_validator(layout, index)
+            )
+            for index, (name, type_) in enumerate(zip(layout.names, layout.types))
+        }
+
+    @property
+    def _fields(self) -> dict[str, Field]:
+        return self.fields
+
+    @_fields.setter
+    def _fields(self, fields: dict[str, Field]) -> None:
+        for name, field in fields.items():
+            self._values[self._get_index(name)] = field.value
+
+    def _get_index(self, name: str) -> int:
+        index = self._layout.index.get(name)
+        if index is None or index >= len(self._values):
+            raise KeyError(f"{type(self).__name__!r} does not contain the {name!r} field.")
+        return index
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        index = self._get_index(key)
+        self._values[index] = self._build_value(self._layout, index, value)
+
+    def __getitem__(self, item: str) -> Any:
+        return self._values[self._get_index(item)]
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key.startswith("_"):
+            object.__setattr__(self, key, value)
+            return
+
+        if key not in self._layout.index:
+            raise AttributeError(f"{type(self).__name__!r} does not contain the {key!r} attribute.")
+
+        self[key] = value
+
+    def __getattr__(self, item: str) -> Any:
+        if item.startswith("_"):
+            raise AttributeError(f"{type(self).__name__!r} does not contain the {item!r} attribute.")
+
+        try:
+            return self[item]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} does not contain the {item!r} attribute.")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) == type(other) and self._layout is other._layout and self._values == other._values:
+            return True
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._layout.names
+
+    def __len__(self) -> int:
+        return len(self._layout.names)
+
+
+class _CompactLayout:
+    __slots__ = "names", "types", "index", "parsers", "validators"
+
+    def __init__(self, cls: type, type_hints: Iterable[tuple[str, Any]]):
+        self.names, self.types = tuple(zip(*type_hints)) or (tuple(), tuple())
+        self.index = {name: index for index, name in enumerate(self.names)}
+        self.parsers = tuple(f"parse_{n}" if hasattr(cls, f"parse_{n}") else None for n in self.names)
+        self.validators = tuple(f"validate_{n}" if hasattr(cls, f"validate_{n}") else None for n in self.names)
+
+
+@lru_cache(maxsize=1024)
+def _build_compact_layout(cls: type, type_hints: tuple[tuple[str, Any], ...]) -> _CompactLayout:
+    return _CompactLayout(cls, type_hints)
+
+
+class _CompactFieldView(Field):
+    __slots__ = ("_model",)
+
+    # noinspection PyMissingConstructor
+    def __init__(
+        self,
+        model: CompactDeclarativeModel,
+        name: str,
+        type_: type,
+        parser: Optional[Callable[[Any], Any]],
+        validator: Optional[Callable[[Any], Any]],
+    ):
+        self._model = model
+        self._name = name
+        self._type = type_
+        self._parser = parser
+        self._validator = validator
+        self._trusted_data = MissingSentinel
+        self._parsed_type = None
+        self._hash = None
+
+    @property
+    def value(self) -> Any:
+        """Value getter."""
+        return self._model[self._name]
+
+    @value.setter
+    def value(self, data: Any) -> None:
+        self._model[self._name] = data
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Field) and self._equal_field(other)
+
+    def __hash__(self) -> int:
+        # The value is stored on the model, so the hash cannot be cached on the view.
+        return hash(tuple(self))
+
+
 T = TypeVar("T", bound=DeclarativeModel)
 MinosModel = DeclarativeModel
@@ -4,13 +4,31 @@ from __future__ import (
 
 import inspect
 import logging
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+from enum import (
+    Enum,
+)
+from functools import (
+    lru_cache,
+)
 from typing import (
     Any,
     Callable,
     Iterable,
     Optional,
 )
+from uuid import (
+    UUID,
+)
 
+from ..contextvars import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
+)
 from ..exceptions import (
     DataDecoderMalformedTypeException,
     DataDecoderRequiredValueException,
@@ -40,7 +58,7 @@ logger = logging.getLogger(__name__)
 class Field:
     """Represents a model field."""
 
-    __slots__ = "_name", "_type", "_value", "_parser", "_validator"
+    __slots__ = "_name", "_type", "_value", "_trusted_data", "_parser", "_validator", "_parsed_type", "_hash"
 
     def __init__(
         self,
@@ -54,6 +72,9 @@ class Field:
         self._type = type_
         self._parser = parser
         self._validator = validator
+        self._trusted_data = MissingSentinel
+        self._parsed_type = None
+        self._hash = None
 
         self.value = value
 
@@ -65,7 +86,9 @@ class Field:
     @property
     def type(self) -> type:
         """Type getter."""
-        return TypeHintParser(self._type).build()
+        if self._parsed_type is None:
+            self._parsed_type = TypeHintParser(self._type).build()
+        return self._parsed_type
 
     @property
     def real_type(self) -> type:
@@ -102,36 +125,71 @@ class Field:
     @property
     def value(self) -> Any:
         """Value getter."""
+        if self._trusted_data is not MissingSentinel:
+            self._decode_trusted_data()
         return self._value
 
     @value.setter
     def value(self, data: Any) -> None:
         """Check if the given value is correct and stores it if ``True``, otherwise raises an exception.
 
+        On trusted decoding mode (see ``IS_TRUSTED_DECODING_CONTEXT_VAR``) the given value is stored as it is, skipping
+        the parser and validator, and it is checked lazily when the value is accessed for the first time.
+
         :param data: new value.
         :return: This method does not return anything.
         """
-        logger.debug(f"Setting {data!r} value to {self._name!r} field with {self._type!r} type...")
+        logger.debug("Setting %r value to %r field with %r type...", data, self._name, self._type)
+
+        self._hash = None
+        if IS_TRUSTED_DECODING_CONTEXT_VAR.get() and data is not MissingSentinel:
+            self._trusted_data = data
+            return
+
+        self._trusted_data = MissingSentinel
+        self._value = self._build_value(self._name, self._type, data, self.parser, self.validator)
 
-        if self._parser is not None:
+    def _decode_trusted_data(self) -> None:
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            value = self._decode_value(self._name, self._type, self._trusted_data)
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        self._value, self._trusted_data = value, MissingSentinel
+
+    @classmethod
+    def _build_value(
+        cls,
+        name: str,
+        type_: type,
+        data: Any,
+        parser: Optional[Callable[[Any], Any]] = None,
+        validator: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        if parser is not None:
             try:
-                data = self.parser(data)
+                data = parser(data)
             except Exception as exc:
-                raise MinosParseAttributeException(self.name, data, exc)
+                raise MinosParseAttributeException(name, data, exc)
 
+        value = cls._decode_value(name, type_, data)
+
+        if validator is not None and value is not None and not validator(value):
+            raise MinosAttributeValidationException(name, value)
+
+        return value
+
+    @staticmethod
+    def _decode_value(name: str, type_: type, data: Any) -> Any:
         try:
-            value = AvroDataDecoder(self.type).build(data)
+            return _build_decoder(type_)(data)
         except DataDecoderMalformedTypeException as exc:
-            raise MinosMalformedAttributeException(f"{self.name!r} field is malformed. {exc}")
+            raise MinosMalformedAttributeException(f"{name!r} field is malformed. {exc}")
         except DataDecoderRequiredValueException as exc:
-            raise MinosReqAttributeException(f"{self.name!r} field is required. {exc}")
+            raise MinosReqAttributeException(f"{name!r} field is required. {exc}")
         except DataDecoderTypeException:
-            raise MinosTypeAttributeException(self.name, self.type, data)
-
-        if self.validator is not None and value is not None and not self.validator(value):
-            raise MinosAttributeValidationException(self.name, value)
-
-        self._value = value
+            raise MinosTypeAttributeException(name, TypeHintParser(type_).build(), data)
 
     @property
     def avro_schema(self) -> dict[str, Any]:
@@ -163,9 +221,25 @@ class Field:
         return cls(schema["name"], type_val, value)
 
     def __eq__(self, other: Field) -> bool:
+        return type(self) == type(other) and self._equal_field(other)
+
+    def _equal_field(self, other: Field) -> bool:
+        if self is other:
+            return True
+
+        if self._type is other._type:
+            # Fields built from the same type hint (i.e. same class fields) do not need the type comparison.
+            if self._hash is not None and other._hash is not None and self._hash != other._hash:
+                return False
+            return (
+                self.name == other.name
+                and self.value == other.value
+                and self._parser_function == other._parser_function
+                and self._validator_function == other._validator_function
+            )
+
         return (
-            type(self) == type(other)
-            and self.name == other.name
+            self.name == other.name
             and self.value == other.value
             and self._parser_function == other._parser_function
             and self._validator_function == other._validator_function
@@ -173,7 +247,15 @@ class Field:
         )
 
     def __hash__(self) -> int:
-        return hash(tuple(self))
+        if self._hash is not None:
+            return self._hash
+
+        value = tuple(self)
+        ans = hash(value)
+        if is_immutable(value[2]):
+            # The hash is cached only if it cannot change without setting the value again.
+            self._hash = ans
+        return ans
 
     def __iter__(self) -> Iterable:
         # noinspection PyRedundantParentheses
@@ -183,4 +265,30 @@ class Field:
         return f"{self.name}={self.value!r}"
 
 
+_IMMUTABLE_TYPES = frozenset({type(None), bool, int, float, str, bytes, UUID, date, time, datetime, timedelta})
+
+
+def is_immutable(value: Any) -> bool:
+    """Check if the given value is immutable, so that the values computed from it can be cached.
+
+    Besides the immutable builtin values, the ``tuple`` and ``frozenset`` instances are immutable if their items are,
+    and so are the instances whose type defines an ``_is_immutable`` method that returns ``True``.
+
+    :param value: The value to be checked.
+    :return: ``True`` if the value is immutable or ``False`` otherwise.
+    """
+    if type(value) in _IMMUTABLE_TYPES or isinstance(value, Enum):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+    if (fn := getattr(type(value), "_is_immutable", None)) is not None:
+        return fn(value)
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _build_decoder(type_: type) -> Callable[[Any], Any]:
+    return AvroDataDecoder.compile(TypeHintParser(type_).build())
+
+
 ModelField = Field
@@ -4,6 +4,7 @@ from __future__ import (
 
 import logging
 from collections.abc import (
+    Callable,
     Iterable,
     Mapping,
 )
@@ -17,6 +18,10 @@ from datetime import (
     timedelta,
     timezone,
 )
+from functools import (
+    lru_cache,
+    partial,
+)
 from itertools import (
     zip_longest,
 )
@@ -34,6 +39,9 @@ from uuid import (
     UUID,
 )
 
+from .....contextvars import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
+)
 from .....exceptions import (
     DataDecoderMalformedTypeException,
     DataDecoderRequiredValueException,
@@ -77,6 +85,165 @@ class AvroDataDecoder(DataDecoder):
             type_ = self.type_
         return self._build(type_, data, **kwargs)
 
+    @classmethod
+    def compile(cls, type_: Any) -> Callable[[Any], Any]:
+        """Compile a decoding function specialized on the given type.
+
+        The returned function is equivalent to ``AvroDataDecoder(type_).build``, but the type dispatch (including the
+        resolution of the union alternatives) is performed only once per type instead of once per decoded value.
+
+        :param type_: The type of the decoded data.
+        :return: A function that receives the data to be casted and returns the casted object.
+        """
+        return cls._compile(type_)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _compile(cls, type_: Any) -> Callable[[Any], Any]:
+        if get_origin(type_) is Union:
+            return cls._compile_union(type_)
+        return cls._compile_single(type_)
+
+    @classmethod
+    def _compile_union(cls, type_: Any) -> Callable[[Any], Any]:
+        alternatives = get_args(type_)
+        if _is_ambiguous_union(alternatives):
+            fns = tuple(cls._compile_alternative(alternative_type) for alternative_type in alternatives)
+        else:
+            fns = tuple(cls._compile_single(alternative_type) for alternative_type in alternatives)
+        nullable = NoneType in alternatives
+
+        def _fn(data: Any) -> Any:
+            if nullable and (data is None or data is MissingSentinel):
+                return None
+
+            for fn in fns:
+                try:
+                    return fn(data)
+                except Exception:
+                    continue
+
+            if data is None:
+                raise DataDecoderRequiredValueException(f"Value is {None!r}.")
+
+            if data is MissingSentinel:
+                raise DataDecoderRequiredValueException("Value is missing.")
+
+            raise DataDecoderTypeException(type_, data)
+
+        return _fn
+
+    @classmethod
+    def _compile_alternative(cls, type_: Any) -> Callable[[Any], Any]:
+        if is_type_subclass(type_) and not isinstance(type_, ModelType) and not is_model_subclass(type_):
+            return cls._compile_single(type_)
+        return partial(cls(type_)._build_single, type_, is_union_alternative=True)
+
+    @classmethod
+    def _compile_single(cls, type_: Any) -> Callable[[Any], Any]:
+        if type_ is NoneType:
+            return partial(cls._build_none, type_)
+
+        if (
+            type_ is Any
+            or isinstance(type_, TypeVar)
+            or isinstance(type_, ModelType)
+            or is_model_subclass(type_)
+            or (fn := cls._compile_value(type_)) is None
+        ):
+            return partial(cls(type_)._build_single, type_)
+
+        def _fn(data: Any) -> Any:
+            if data is None:
+                raise DataDecoderRequiredValueException(f"Value is {None!r}.")
+
+            if data is MissingSentinel:
+                raise DataDecoderRequiredValueException("Value is missing.")
+
+            return fn(data)
+
+        return _fn
+
+    @classmethod
+    def _compile_value(cls, type_: Any) -> Optional[Callable[[Any], Any]]:
+        if is_type_subclass(type_):
+            if issubclass(type_, bool):
+                return cls._build_bool
+
+            if issubclass(type_, int):
+                return partial(cls._build_int, type_)
+
+            if issubclass(type_, float):
+                return cls._build_float
+
+            if issubclass(type_, str):
+                return partial(cls._build_string, type_)
+
+            if issubclass(type_, bytes):
+                return cls._build_bytes
+
+            if issubclass(type_, datetime):
+                return cls._build_datetime
+
+            if issubclass(type_, timedelta):
+                return cls._build_timedelta
+
+            if issubclass(type_, date):
+                return cls._build_date
+
+            if issubclass(type_, time):
+                return cls._build_time
+
+            if issubclass(type_, UUID):
+                return cls._build_uuid
+
+            return None
+
+        origin_type = get_origin(type_)
+        if origin_type is list:
+            return cls._compile_list(type_)
+
+        if origin_type is set:
+            return cls._compile_set(type_)
+
+        if origin_type is dict and get_args(type_)[0] is str:
+            return cls._compile_dict(type_)
+
+        return None
+
+    @classmethod
+    def _compile_list(cls, type_: Any) -> Callable[[Any], Any]:
+        fn = cls._compile(get_args(type_)[0])
+
+        def _fn(data: Any) -> list[Any]:
+            if isinstance(data, str) or not isinstance(data, Iterable):
+                raise DataDecoderTypeException(list, data)
+            return [fn(item) for item in data]
+
+        return _fn
+
+    @classmethod
+    def _compile_set(cls, type_: Any) -> Callable[[Any], Any]:
+        fn = cls._compile(get_args(type_)[0])
+
+        def _fn(data: Any) -> set[Any]:
+            if isinstance(data, str) or not isinstance(data, Iterable):
+                raise DataDecoderTypeException(set, data)
+            return {fn(item) for item in data}
+
+        return _fn
+
+    @classmethod
+    def _compile_dict(cls, type_: Any) -> Callable[[Any], Any]:
+        key_fn, value_fn = cls._compile(str), cls._compile(get_args(type_)[1])
+
+        def _fn(data: Any) -> dict[str, Any]:
+            if not isinstance(data, Mapping):
+                raise DataDecoderTypeException(dict, data)
+            return {key_fn(key): value_fn(value) for key, value in data.items()}
+
+        return _fn
+
     def _build(self, type_: type, data: Any, **kwargs) -> Any:
         origin = get_origin(type_)
         if origin is not Union:
@@ -85,6 +252,9 @@ class AvroDataDecoder(DataDecoder):
 
     def _build_union(self, type_: type, data: Any, **kwargs) -> Any:
         alternatives = get_args(type_)
+        if _is_ambiguous_union(alternatives):
+            kwargs["is_union_alternative"] = True
+
         for alternative_type in alternatives:
             with suppress(Exception):
                 return self._build_single(alternative_type, data, **kwargs)
@@ -246,7 +416,7 @@ class AvroDataDecoder(DataDecoder):
             return data
         return self._build_model_type(ModelType.from_model(type_), data, **kwargs)
 
-    def _build_model_type(self, type_: ModelType, data: Any, **kwargs) -> Any:
+    def _build_model_type(self, type_: ModelType, data: Any, is_union_alternative: bool = False, **kwargs) -> Any:
         if hasattr(data, "model_type"):
             if ModelType.from_model(data) >= type_:
                 return data
@@ -254,6 +424,12 @@ class AvroDataDecoder(DataDecoder):
         if (ans := type_.model_cls.decode_data(self, data, type_, **kwargs)) is not MissingSentinel:
             return ans
 
+        # The trusted shortcut does not check the field types, so it cannot tell apart the alternatives of a union.
+        if isinstance(data, dict) and IS_TRUSTED_DECODING_CONTEXT_VAR.get() and not is_union_alternative:
+            with suppress(Exception):
+                trusted_data = {field_name: data[field_name] for field_name in type_.type_hints if field_name in data}
+                return type_(**trusted_data, additional_type_hints=type_.type_hints)
+
         if isinstance(data, dict):
             with suppress(Exception):
                 decoded_data = {
@@ -316,3 +492,7 @@ class AvroDataDecoder(DataDecoder):
 
     def _build_iterable(self, data: Iterable, type_params: type, **kwargs) -> Iterable:
         return (self._build(type_params, item, **kwargs) for item in data)
+
+
+def _is_ambiguous_union(alternatives: tuple[Any, ...]) -> bool:
+    return sum(alternative_type is not NoneType for alternative_type in alternatives) > 1
@@ -16,6 +16,7 @@ from decimal import (
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
 )
 from uuid import (
     UUID,
@@ -101,14 +102,97 @@ class AvroDataEncoder(DataEncoder):
             return self._build_uuid(value, **kwargs)
 
         if isinstance(value, (list, set)):
-            return [self._build(v, **kwargs) for v in value]
+            return self._build_iterable(value, **kwargs)
 
         if isinstance(value, dict):
             return {k: self._build(v, **kwargs) for k, v in value.items()}
 
         raise MinosMalformedAttributeException(f"Given type is not supported: {type(value)!r} ({value!r})")
 
+    def _build_iterable(self, value: Any, **kwargs) -> list[Any]:
+        if len(value) > 1:
+            value = list(value)
+            if (ans := self._build_model_list(value, **kwargs)) is not MissingSentinel:
+                return ans
+        return [self._build(v, **kwargs) for v in value]
+
+    def _build_model_list(self, models: list[Any], **kwargs) -> Any:
+        from ....abc import (
+            Model,
+        )
+        from ....declarative import (
+            DeclarativeModel,
+        )
+
+        cls = type(models[0])
+        if (
+            not issubclass(cls, DeclarativeModel)
+            or cls.encode_data is not Model.encode_data
+            or _get_cached_avro_data(models[0]) is not None
+            or any(type(model) is not cls for model in models)
+        ):
+            return MissingSentinel
+
+        # The list is homogeneous, so the values are encoded column by column, resolving the encoder once per field.
+        # The fields are read once per model, as some models (i.e. the compact ones) build them on each access.
+        rows = [model.fields for model in models]
+        names = list(rows[0].keys())
+        if any(len(row) != len(names) for row in rows):
+            return MissingSentinel
+        try:
+            columns = [[row[name].value for row in rows] for name in names]
+        except KeyError:
+            return MissingSentinel
+
+        columns = [self._build_column(column, **kwargs) for column in columns]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def _build_column(self, values: list[Any], **kwargs) -> list[Any]:
+        type_ = type(values[0])
+        if any(type(value) is not type_ for value in values):
+            return [self._build(value, **kwargs) for value in values]
+
+        if type_ in (str, int, bool, float, bytes) or values[0] is None:
+            return values
+
+        if type_ in (list, set):
+            return [self._build_iterable(value, **kwargs) for value in values]
+
+        from ....abc import (
+            Model,
+        )
+
+        if issubclass(type_, Model):
+            if (ans := self._build_model_list(values, **kwargs)) is not MissingSentinel:
+                return ans
+
+        builder = self._get_column_builder(type_)
+        return [builder(value, **kwargs) for value in values]
+
+    def _get_column_builder(self, type_: type) -> Callable[..., Any]:
+        if issubclass(type_, datetime):
+            return self._build_datetime
+        if issubclass(type_, timedelta):
+            return self._build_timedelta
+        if issubclass(type_, date):
+            return self._build_date
+        if issubclass(type_, time):
+            return self._build_time
+        if issubclass(type_, UUID):
+            return self._build_uuid
+        return self._build
+
     def _build_model(self, model: Model, **kwargs) -> Any:
+        if kwargs or (cached := _get_cached_avro_data(model)) is None:
+            return self._build_model_uncached(model, **kwargs)
+
+        # The model has opted in to cache its encoded data (i.e. it is immutable), so it is only encoded once. The
+        # cached data is shared, so a copy of it is returned to keep it safe from the modifications made by the caller.
+        if cached is MissingSentinel:
+            cached = model._avro_data = self._build_model_uncached(model)
+        return _copy_encoded(cached)
+
+    def _build_model_uncached(self, model: Model, **kwargs) -> Any:
         raw = {name: self._build_field(field, **kwargs) for name, field in model.fields.items()}
 
         if (ans := model.encode_data(self, raw, **kwargs)) is not MissingSentinel:
@@ -138,3 +222,19 @@ class AvroDataEncoder(DataEncoder):
     @staticmethod
     def _build_uuid(value: UUID, **kwargs) -> str:
         return str(value)
+
+
+def _get_cached_avro_data(model: Model) -> Any:
+    # The cache is opted in by setting the ``_avro_data`` attribute on the instance or by defining it on the class (i.e.
+    # as a property that decides lazily if the data can be cached).
+    if hasattr(type(model), "_avro_data"):
+        return model._avro_data
+    return vars(model).get("_avro_data")
+
+
+def _copy_encoded(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _copy_encoded(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_encoded(v) for v in value]
+    return value
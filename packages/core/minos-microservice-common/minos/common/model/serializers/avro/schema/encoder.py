@@ -12,6 +12,9 @@ from datetime import (
 from enum import (
     Enum,
 )
+from itertools import (
+    count,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -23,7 +26,6 @@ from typing import (
 )
 from uuid import (
     UUID,
-    uuid4,
 )
 
 from .....importlib import (
@@ -73,6 +75,7 @@ class AvroSchemaEncoder(SchemaEncoder):
 
     def __init__(self, type_: type = None):
         self.type_ = type_
+        self._namespace_suffixes = count()
 
     def build(self, type_=MissingSentinel, **kwargs) -> Union[dict, list, str]:
         """Build the avro schema for the given field.
@@ -182,10 +185,9 @@ class AvroSchemaEncoder(SchemaEncoder):
         }
         return schema
 
-    @classmethod
-    def _patch_namespace(cls, namespace: Optional[str]) -> Optional[str]:
+    def _patch_namespace(self, namespace: Optional[str]) -> Optional[str]:
         if len(namespace) > 0:
-            namespace += f".{cls.generate_random_str()}"
+            namespace += f".{self.generate_namespace_suffix()}"
         return namespace
 
     def _build_field(self, field: Union[Field, FieldType], **kwargs):
@@ -215,10 +217,12 @@ class AvroSchemaEncoder(SchemaEncoder):
     def _build_dict(self, type_: type, **kwargs) -> dict[str, Any]:
         return {"type": AVRO_MAP, "values": self._build(get_args(type_)[1], **kwargs)}
 
-    @staticmethod
-    def generate_random_str() -> str:
-        """Generate a random string
+    def generate_namespace_suffix(self) -> str:
+        """Generate the suffix used to distinguish the record namespaces of the schema.
+
+        The suffixes are sequential, so they are unique within the schema built by this encoder but the same schema is
+        obtained each time the same type is encoded.
 
-        :return: A random string value.
+        :return: A ``str`` value.
         """
-        return str(uuid4())
+        return f"s{next(self._namespace_suffixes)}"
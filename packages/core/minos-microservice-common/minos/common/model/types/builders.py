@@ -54,6 +54,8 @@ class TypeHintBuilder:
         return self._build(self.value, self.type_)
 
     def _build(self, value, type_: Optional[type]) -> type:
+        if self._is_leaf(value):
+            return self._build_from_leaf_type(type(value), type_)
 
         if type_ is not None:
             if get_origin(type_) is Union:
@@ -71,21 +73,41 @@ class TypeHintBuilder:
                 self._build_from_iterable(value.keys(), b1), self._build_from_iterable(value.values(), b2)
             ]
 
-        if is_model_type(value):
-            return ModelType.from_model(value)
+        return ModelType.from_model(value)
 
-        if type_ is not None:
-            dynamic = self._build(value, None)
-            return self._build_from_dynamic(dynamic, type_)
+    @staticmethod
+    def _is_leaf(value: Any) -> bool:
+        return not isinstance(value, (tuple, list, set, dict)) and not is_model_type(value)
+
+    @classmethod
+    @lru_cache()
+    def _build_from_leaf_type(cls, dynamic: type, type_: Optional[type]) -> type:
+        if type_ is None:
+            return dynamic
+
+        if get_origin(type_) is Union:
+            return build_union(cls._build_from_dynamic(dynamic, static) for static in get_args(type_))
 
-        return type(value)
+        return cls._build_from_dynamic(dynamic, type_)
 
     def _build_from_iterable(self, values: Iterable, type_: Optional[type]) -> type:
         values = tuple(values)
         if len(values) == 0:
             return type_
 
-        options = tuple(self._build(value, type_) for value in values)
+        first = type(values[0])
+        if self._is_leaf(values[0]) and all(type(value) is first for value in values):
+            # The collection is homogeneous, so there is no need to inspect every single value.
+            return self._build_from_leaf_type(first, type_)
+
+        options = list()
+        leaves = set()
+        for value in values:
+            if self._is_leaf(value):
+                if type(value) in leaves:
+                    continue
+                leaves.add(type(value))
+            options.append(self._build(value, type_))
         return build_union(options)
 
     @staticmethod
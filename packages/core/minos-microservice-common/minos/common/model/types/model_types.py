@@ -2,9 +2,6 @@ from __future__ import (
     annotations,
 )
 
-from functools import (
-    lru_cache,
-)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,6 +11,9 @@ from typing import (
     Type,
     Union,
 )
+from weakref import (
+    WeakValueDictionary,
+)
 
 from ...exceptions import (
     MinosImportException,
@@ -32,12 +32,18 @@ if TYPE_CHECKING:
 
 
 class ModelType(type):
-    """Model Type class."""
+    """Model Type class.
+
+    The instances are interned, so building a structurally identical model type returns the same instance while it is
+    still referenced somewhere.
+    """
 
     name: str
     namespace: str
     type_hints: dict[str, Type]
 
+    _interned: WeakValueDictionary[tuple, ModelType] = WeakValueDictionary()
+
     @classmethod
     def build(
         mcs, name_: str, type_hints_: Optional[dict[str, type]] = None, *, namespace_: Optional[str] = None, **kwargs
@@ -67,9 +73,19 @@ class ModelType(type):
         return mcs._build(name_, type_hints_, namespace_)
 
     @classmethod
-    @lru_cache()
-    def _build(mcs, name_: str, type_hints_: tuple[tuple[str, type], ...], namespace_: Optional[str]):
-        return mcs(name_, tuple(), {"type_hints": dict(type_hints_), "namespace": namespace_})
+    def _build(mcs, name_: str, type_hints_: tuple[tuple[str, type], ...], namespace_: Optional[str]) -> ModelType:
+        key = (mcs, name_, type_hints_, namespace_)
+        try:
+            return mcs._interned[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # The type hints are not hashable, so the instance cannot be interned.
+            return mcs(name_, tuple(), {"type_hints": dict(type_hints_), "namespace": namespace_})
+
+        ans = mcs(name_, tuple(), {"type_hints": dict(type_hints_), "namespace": namespace_})
+        mcs._interned[key] = ans
+        return ans
 
     @classmethod
     def from_typed_dict(mcs, typed_dict) -> ModelType:
@@ -187,6 +203,9 @@ class ModelType(type):
         )
 
     def __eq__(cls, other: Any) -> bool:
+        if cls is other:
+            return True
+
         conditions = (
             cls._equal_with_model_type,
             cls._equal_with_model,
@@ -229,7 +248,10 @@ class ModelType(type):
         )
 
     def __hash__(cls) -> int:
-        return hash(tuple(cls))
+        if (ans := vars(cls).get("_hash")) is None:
+            ans = hash(tuple(cls))
+            type.__setattr__(cls, "_hash", ans)
+        return ans
 
     def __iter__(cls) -> Iterable:
         # noinspection PyRedundantParentheses
@@ -141,14 +141,14 @@ class Pool(SetupMixin, _PoolBase, Generic[P], ABC):
                 return await self._PoolBase__acquire()
 
         self._used.add(instance)
-        logger.debug(f"Acquired instance: {instance!r}")
+        logger.debug("Acquired instance: %r", instance)
         return instance
 
     # noinspection PyUnresolvedReferences
     async def __release(self, instance: Any) -> Any:  # pragma: no cover
         await self._release_instance(instance)
         await self._PoolBase__release(instance)
-        logger.debug(f"Released instance: {instance!r}")
+        logger.debug("Released instance: %r", instance)
 
     def acquire(self, *args, **kwargs) -> AsyncContextManager[P]:
         """Acquire a new instance wrapped on an asynchronous context manager.
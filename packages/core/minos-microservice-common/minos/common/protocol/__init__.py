@@ -2,10 +2,17 @@ from .abc import (
     MinosBinaryProtocol,
 )
 from .avro import (
+    AvroSchemaCache,
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
+    build_schema_fingerprint,
 )
 from .json import (
     MinosJsonBinaryProtocol,
 )
+from .msgpack import (
+    MinosMsgPackProtocol,
+)
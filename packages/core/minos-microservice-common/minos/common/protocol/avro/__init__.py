@@ -1,9 +1,19 @@
 from .base import (
     MinosAvroProtocol,
 )
+from .caches import (
+    AvroSchemaCache,
+)
 from .databases import (
     MinosAvroDatabaseProtocol,
 )
+from .fingerprints import (
+    build_schema_fingerprint,
+)
 from .messages import (
     MinosAvroMessageProtocol,
 )
+from .registries import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
+)
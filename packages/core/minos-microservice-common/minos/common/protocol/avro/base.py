@@ -1,14 +1,25 @@
 import io
+import json
+from collections.abc import (
+    Iterable,
+)
 from typing import (
     Any,
+    Optional,
     Union,
 )
 
 from fastavro import (
     parse_schema,
     reader,
+    schemaless_reader,
+    schemaless_writer,
     writer,
 )
+from fastavro.read import (
+    HEADER_SCHEMA,
+    SYNC_SIZE,
+)
 
 from ...exceptions import (
     MinosProtocolException,
@@ -16,13 +27,51 @@ from ...exceptions import (
 from ..abc import (
     MinosBinaryProtocol,
 )
+from .caches import (
+    AvroSchemaCache,
+)
+from .fingerprints import (
+    build_schema_fingerprint,
+)
+from .registries import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
+)
+
+SCHEMALESS_MAGIC = b"Min\x01"
+SCHEMALESS_MAGIC_SIZE = len(SCHEMALESS_MAGIC)
+SCHEMALESS_HEADER_SIZE = SCHEMALESS_MAGIC_SIZE + 8
+
+PARSED_CONTAINER_HEADER_SCHEMA = parse_schema(HEADER_SCHEMA)
+
+Buffer = Union[bytes, bytearray, memoryview]
 
 
 class MinosAvroProtocol(MinosBinaryProtocol):
-    """Minos Avro Protocol class."""
+    """Minos Avro Protocol class.
+
+    The values can be encoded as avro container files (the schema is embedded on the bytes) or, in ``schemaless`` mode,
+    as a small header containing the 64-bit fingerprint of the schema followed by the avro datums. In the second case,
+    the schema is resolved through an ``AvroSchemaRegistry``.
+
+    The parsed schemas are cached by fingerprint, so the same schema is only parsed once. The encoding and the writer
+    (decoding) schemas are cached under different keys, as the same raw schema is parsed differently on each case.
+    """
+
+    default_schema_registry: AvroSchemaRegistry = InMemoryAvroSchemaRegistry()
+    schema_cache: AvroSchemaCache = AvroSchemaCache()
 
     @classmethod
-    def encode(cls, value: Any, schema: Any, *args, batch_mode: bool = False, **kwargs) -> bytes:
+    def encode(
+        cls,
+        value: Any,
+        schema: Any,
+        *args,
+        batch_mode: bool = False,
+        schemaless: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> bytes:
         """Encoder in avro for database Values
         all the headers are converted in fields with double underscore name
         the body is a set fields coming from the data type.
@@ -32,6 +81,10 @@ class MinosAvroProtocol(MinosBinaryProtocol):
         :param args: Additional positional arguments.
         :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
             single model.
+        :param schemaless: If ``True`` the schema is registered on the schema registry and only its fingerprint is
+            stored on the bytes, otherwise the schema is embedded on the bytes.
+        :param schema_registry: The schema registry to be used on ``schemaless`` mode. If not set, the default one is
+            used.
         :param kwargs: Additional named arguments.
         :return: A bytes object.
         """
@@ -43,17 +96,33 @@ class MinosAvroProtocol(MinosBinaryProtocol):
 
         try:
             raw_schema = cls._parse_schema(schema)
+            if schemaless:
+                fingerprint = cls._get_schema_registry(schema_registry).register(cls._build_writer_schema(raw_schema))
+                return cls._write_schemaless_data(value, raw_schema, fingerprint)
             return cls._write_data(value, raw_schema)
         except Exception as exc:
             raise MinosProtocolException(f"Error encoding data: {exc!r}")
 
+    @classmethod
+    def _parse_schema(cls, schema: list[dict[str, Any]]) -> dict[str, Any]:
+        key = ("encode", build_schema_fingerprint(schema))
+        return cls.schema_cache.get_or_build(key, lambda: cls._build_parsed_schema(schema))
+
     @staticmethod
-    def _parse_schema(schema: list[dict[str, Any]]) -> dict[str, Any]:
+    def _build_parsed_schema(schema: list[dict[str, Any]]) -> dict[str, Any]:
         named_schemas = {}
         for item in schema[1::-1]:
             parse_schema(item, named_schemas)
         return parse_schema(schema[0], named_schemas, expand=True)
 
+    @classmethod
+    def _build_writer_schema(cls, schema: Any) -> Any:
+        if isinstance(schema, list):
+            return [cls._build_writer_schema(item) for item in schema]
+        if isinstance(schema, dict):
+            return {key: value for key, value in schema.items() if key not in ("__fastavro_parsed", "__named_schemas")}
+        return schema
+
     @staticmethod
     def _write_data(value: list[dict[str, Any]], schema: dict[str, Any]):
         with io.BytesIO() as file:
@@ -62,50 +131,223 @@ class MinosAvroProtocol(MinosBinaryProtocol):
             content = file.getvalue()
         return content
 
+    @staticmethod
+    def _write_schemaless_data(value: list[dict[str, Any]], schema: dict[str, Any], fingerprint: int) -> bytes:
+        with io.BytesIO() as file:
+            file.write(SCHEMALESS_MAGIC)
+            file.write(fingerprint.to_bytes(8, "little"))
+            for item in value:
+                schemaless_writer(file, schema, item)
+            content = file.getvalue()
+        return content
+
     @classmethod
-    def decode(cls, data: bytes, *args, batch_mode: bool = False, **kwargs) -> Any:
+    def decode(
+        cls,
+        data: Buffer,
+        *args,
+        batch_mode: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> Any:
         """Decode the given bytes of data into a single dictionary or a sequence of dictionaries.
 
-        :param data: A bytes object.
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
         :param args: Additional positional arguments.
         :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
             single model.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
         :param kwargs: Additional named arguments.
         :return: A dictionary or a list of dictionaries.
         """
+        _, ans = cls.decode_with_schema(data, batch_mode=batch_mode, schema_registry=schema_registry)
+        return ans
 
-        try:
-            with io.BytesIO(data) as file:
-                ans = list(reader(file))
-        except Exception as exc:
-            raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
+    @classmethod
+    def decode_with_schema(
+        cls,
+        data: Buffer,
+        *args,
+        batch_mode: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> tuple[Union[dict[str, Any], list[dict[str, Any]]], Any]:
+        """Decode the given bytes of data, getting both the schema and the value with a single read of the header.
 
-        if not batch_mode:
-            if len(ans) > 1:
-                raise MinosProtocolException(
-                    f"The 'batch_mode' argument was set to {False!r} but data contains multiple values: {ans!r}"
-                )
-            ans = ans[0]
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
+        :param kwargs: Additional named arguments.
+        :return: A ``(schema, value)`` pair.
+        """
+        return cls.decode_many([data], batch_mode=batch_mode, schema_registry=schema_registry)[0]
+
+    @classmethod
+    def decode_many(
+        cls,
+        data: Iterable[Buffer],
+        *args,
+        batch_mode: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> list[tuple[Union[dict[str, Any], list[dict[str, Any]]], Any]]:
+        """Decode the given sequence of bytes objects, resolving the schema only once for the entries that share it.
+
+        The entries are grouped by the fingerprint (``schemaless`` mode) or the embedded schema (container mode), so the
+        schema is resolved and parsed once per group and the rest of entries only decode their datums.
+
+        :param data: A sequence of bytes objects (or any other objects supporting the buffer protocol).
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` each entry is processed as a list of models, otherwise each entry is processed as
+            a single model.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
+        :param kwargs: Additional named arguments.
+        :return: A list of ``(schema, value)`` pairs (one per entry and following the same order). The entries that
+            share the schema share also the same schema instance.
+        """
+        schemas = dict()
+        ans = list()
+        for entry in data:
+            try:
+                entry = cls._as_bytes(entry)
+                if (fingerprint := cls.decode_fingerprint(entry)) is not None:
+                    schema, values = cls._read_schemaless_entry(entry, fingerprint, schemas, schema_registry)
+                else:
+                    schema, values = cls._read_container_entry(entry, schemas)
+            except Exception as exc:
+                raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
+
+            if not batch_mode:
+                if len(values) > 1:
+                    raise MinosProtocolException(
+                        f"The 'batch_mode' argument was set to {False!r} but data contains multiple values: {values!r}"
+                    )
+                values = values[0]
+
+            ans.append((schema, values))
 
         return ans
 
+    @classmethod
+    def _read_schemaless_entry(
+        cls,
+        data: bytes,
+        fingerprint: int,
+        schemas: dict[Any, tuple[Any, dict[str, Any]]],
+        schema_registry: Optional[AvroSchemaRegistry],
+    ) -> tuple[Any, list[Any]]:
+        if (key := ("schemaless", fingerprint)) not in schemas:
+            schema = cls._get_schema_registry(schema_registry).get(fingerprint)
+            schemas[key] = schema, cls._parse_writer_schema(schema, fingerprint)
+
+        schema, parsed_schema = schemas[key]
+        return schema, cls._read_schemaless_data(data, parsed_schema)
+
+    @classmethod
+    def _read_container_entry(
+        cls, data: bytes, schemas: dict[Any, tuple[Any, dict[str, Any]]]
+    ) -> tuple[Any, list[Any]]:
+        with io.BytesIO(data) as file:
+            header = schemaless_reader(file, PARSED_CONTAINER_HEADER_SCHEMA)
+            if header["meta"].get("avro.codec", b"null") != b"null":
+                file.seek(0)
+                r = reader(file)
+                return r.writer_schema, list(r)
+
+            if (key := ("container", header["meta"]["avro.schema"])) not in schemas:
+                schema = json.loads(key[1])
+                schemas[key] = schema, cls._parse_writer_schema(schema)
+
+            schema, parsed_schema = schemas[key]
+            ans = list()
+            while file.tell() < len(data):
+                count = schemaless_reader(file, "long")
+                schemaless_reader(file, "long")  # The block size is not needed as the block is not compressed.
+                for _ in range(count):
+                    ans.append(schemaless_reader(file, parsed_schema))
+                file.seek(SYNC_SIZE, io.SEEK_CUR)
+        return schema, ans
+
+    @classmethod
+    def _parse_writer_schema(cls, schema: Any, fingerprint: Optional[int] = None) -> dict[str, Any]:
+        if fingerprint is None:
+            fingerprint = build_schema_fingerprint(schema)
+        return cls.schema_cache.get_or_build(("writer", fingerprint), lambda: parse_schema(schema))
+
+    @staticmethod
+    def _read_schemaless_data(data: bytes, schema: dict[str, Any]) -> list[Any]:
+        ans = list()
+        with io.BytesIO(data) as file:
+            file.seek(SCHEMALESS_HEADER_SIZE)
+            while file.tell() < len(data):
+                ans.append(schemaless_reader(file, schema))
+        return ans
+
     # noinspection PyUnusedLocal
     @classmethod
-    def decode_schema(cls, data: bytes, *args, **kwargs) -> Union[dict[str, Any], list[dict[str, Any]]]:
+    def decode_schema(
+        cls, data: Buffer, *args, schema_registry: Optional[AvroSchemaRegistry] = None, **kwargs
+    ) -> Union[dict[str, Any], list[dict[str, Any]]]:
         """Decode the given bytes of data into a single dictionary or a sequence of dictionaries.
 
-        :param data: A bytes object.
+        Only the header is read, so the datums are not decoded.
+
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
         :param args: Additional positional arguments.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
         :param kwargs: Additional named arguments.
         :return: A tuple or a list of tuples.
         """
 
         try:
+            data = cls._as_bytes(data)
+            if (fingerprint := cls.decode_fingerprint(data)) is not None:
+                return cls._get_schema_registry(schema_registry).get(fingerprint)
+
             with io.BytesIO(data) as file:
-                r = reader(file)
-                schema = r.writer_schema
+                header = schemaless_reader(file, PARSED_CONTAINER_HEADER_SCHEMA)
+            schema = json.loads(header["meta"]["avro.schema"])
 
         except Exception as exc:
             raise MinosProtocolException(f"Error getting avro schema: {exc}")
 
         return schema
+
+    @staticmethod
+    def decode_fingerprint(data: Buffer) -> Optional[int]:
+        """Get the schema fingerprint of the given bytes of data.
+
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
+        :return: An ``int`` value if the data has been encoded on ``schemaless`` mode or ``None`` otherwise.
+        """
+        if not isinstance(data, bytes):
+            data = memoryview(data)
+            if data.nbytes < SCHEMALESS_HEADER_SIZE or data[:SCHEMALESS_MAGIC_SIZE] != SCHEMALESS_MAGIC:
+                return None
+        elif len(data) < SCHEMALESS_HEADER_SIZE or not data.startswith(SCHEMALESS_MAGIC):
+            return None
+        return int.from_bytes(data[SCHEMALESS_MAGIC_SIZE:SCHEMALESS_HEADER_SIZE], "little")
+
+    @staticmethod
+    def _as_bytes(data: Buffer) -> bytes:
+        # ``io.BytesIO`` shares the memory of ``bytes`` instances, so the copy is only needed by other buffers.
+        if isinstance(data, bytes):
+            return data
+
+        data = memoryview(data)
+        if isinstance(data.obj, bytes) and data.c_contiguous and data.nbytes == len(data.obj):
+            return data.obj
+
+        return data.tobytes()
+
+    @classmethod
+    def _get_schema_registry(cls, schema_registry: Optional[AvroSchemaRegistry]) -> AvroSchemaRegistry:
+        if schema_registry is None:
+            schema_registry = cls.default_schema_registry
+        return schema_registry
@@ -0,0 +1,98 @@
+from collections import (
+    OrderedDict,
+)
+from collections.abc import (
+    Callable,
+)
+from threading import (
+    Lock,
+)
+from typing import (
+    Any,
+    Hashable,
+)
+
+
+class AvroSchemaCache:
+    """Avro Schema Cache class.
+
+    Bounded (least recently used entries are evicted first) and thread-safe cache of the values derived from avro
+    schemas (as the parsed schemas or the decoded types), indexed by keys built from the schema fingerprint.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"The 'maxsize' value must be positive. Obtained: {maxsize!r}")
+
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Get the max number of entries.
+
+        :return: An ``int`` value.
+        """
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """Get the number of lookups that found the entry.
+
+        :return: An ``int`` value.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of lookups that did not find the entry.
+
+        :return: An ``int`` value.
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get_or_build(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Get the entry identified by the given key, building and storing it if it is not cached yet.
+
+        :param key: The key of the entry, usually the fingerprint of the schema or a tuple containing it.
+        :param fn: The function that builds the entry.
+        :return: The cached entry.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+
+        value = fn()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters.
+
+        :return: This method does not return anything.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
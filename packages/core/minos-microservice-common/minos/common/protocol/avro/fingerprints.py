@@ -0,0 +1,22 @@
+from hashlib import (
+    blake2b,
+)
+from typing import (
+    Any,
+)
+
+import orjson
+
+
+def build_schema_fingerprint(schema: Any) -> int:
+    """Compute the 64-bit fingerprint of the given avro schema.
+
+    The fingerprint is computed over a normalized ``json`` representation of the schema (with sorted keys), so that
+    equivalent schemas always obtain the same fingerprint. Logical types are part of the representation, so two schemas
+    that only differ on them obtain different fingerprints.
+
+    :param schema: The avro schema.
+    :return: An unsigned 64-bit ``int`` value.
+    """
+    content = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    return int.from_bytes(blake2b(content, digest_size=8).digest(), "little")
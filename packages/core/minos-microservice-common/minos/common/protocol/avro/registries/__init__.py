@@ -0,0 +1,6 @@
+from .abc import (
+    AvroSchemaRegistry,
+)
+from .memory import (
+    InMemoryAvroSchemaRegistry,
+)
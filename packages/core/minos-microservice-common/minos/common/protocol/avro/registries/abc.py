@@ -0,0 +1,132 @@
+from __future__ import (
+    annotations,
+)
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import (
+    Iterable,
+)
+from threading import (
+    Lock,
+)
+from typing import (
+    Any,
+    Optional,
+)
+
+from ....exceptions import (
+    MinosProtocolException,
+)
+from ..fingerprints import (
+    build_schema_fingerprint,
+)
+
+
+class AvroSchemaRegistry(ABC):
+    """Avro Schema Registry base class.
+
+    The registry maps schema fingerprints into avro schemas, so that the encoded data can reference its schema through
+    the fingerprint instead of embedding it. The known schemas are always cached in-process, and the implementations
+    are responsible for sharing them (loading the unknown ones and storing the new ones).
+    """
+
+    def __init__(self, schemas: Optional[Iterable[Any]] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._schemas = dict()
+        self._pending = dict()
+        self._lock = Lock()
+
+        if schemas is not None:
+            for schema in schemas:
+                self.register(schema)
+
+    @property
+    def schemas(self) -> dict[int, Any]:
+        """Get the known schemas.
+
+        :return: A ``dict`` with ``int`` fingerprints as keys and avro schemas as values.
+        """
+        return dict(self._schemas)
+
+    @property
+    def pending(self) -> dict[int, Any]:
+        """Get the registered schemas that have not been stored yet.
+
+        :return: A ``dict`` with ``int`` fingerprints as keys and avro schemas as values.
+        """
+        return dict(self._pending)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return fingerprint in self._schemas
+
+    def register(self, schema: Any) -> int:
+        """Register the given schema.
+
+        :param schema: The avro schema to be registered.
+        :return: The ``int`` fingerprint of the schema.
+        """
+        fingerprint = build_schema_fingerprint(schema)
+        if fingerprint not in self._schemas:
+            with self._lock:
+                if fingerprint not in self._schemas:
+                    self._schemas[fingerprint] = schema
+                    self._pending[fingerprint] = schema
+        return fingerprint
+
+    def get(self, fingerprint: int) -> Any:
+        """Get the schema identified by the given fingerprint.
+
+        :param fingerprint: The fingerprint of the schema.
+        :return: The avro schema.
+        """
+        try:
+            return self._schemas[fingerprint]
+        except KeyError:
+            raise MinosProtocolException(
+                f"There is not any registered avro schema with the {fingerprint!r} fingerprint."
+            )
+
+    async def load(self, fingerprints: Iterable[int]) -> None:
+        """Load the schemas identified by the given fingerprints that are not known yet.
+
+        :param fingerprints: The fingerprints of the schemas.
+        :return: This method does not return anything.
+        """
+        missing = {fingerprint for fingerprint in fingerprints if fingerprint not in self._schemas}
+        if not missing:
+            return
+
+        schemas = await self._load(missing)
+
+        with self._lock:
+            for fingerprint, schema in schemas.items():
+                self._schemas.setdefault(fingerprint, schema)
+
+    @abstractmethod
+    async def _load(self, fingerprints: set[int]) -> dict[int, Any]:
+        raise NotImplementedError
+
+    async def store(self) -> None:
+        """Store the registered schemas that have not been stored yet.
+
+        :return: This method does not return anything.
+        """
+        if not self._pending:
+            return
+
+        with self._lock:
+            pending, self._pending = self._pending, dict()
+
+        try:
+            await self._store(pending)
+        except BaseException:
+            with self._lock:
+                self._pending |= pending
+            raise
+
+    @abstractmethod
+    async def _store(self, schemas: dict[int, Any]) -> None:
+        raise NotImplementedError
@@ -0,0 +1,17 @@
+from typing import (
+    Any,
+)
+
+from .abc import (
+    AvroSchemaRegistry,
+)
+
+
+class InMemoryAvroSchemaRegistry(AvroSchemaRegistry):
+    """In Memory Avro Schema Registry class."""
+
+    async def _load(self, fingerprints: set[int]) -> dict[int, Any]:
+        return dict()
+
+    async def _store(self, schemas: dict[int, Any]) -> None:
+        pass
@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    Union,
 )
 
 import orjson
@@ -10,7 +11,12 @@ from .abc import (
 
 
 class MinosJsonBinaryProtocol(MinosBinaryProtocol):
-    """JSON based binary encoder / decoder implementation."""
+    """JSON based binary encoder / decoder implementation.
+
+    The encoding is backed by ``orjson``, so ``UUID``, ``datetime``, ``date``, ``time`` and ``Enum`` values are natively
+    encoded as strings, without a previous conversion. The values without a lossless ``json`` representation (as
+    ``bytes`` or ``set`` values, or non-string dictionary keys) are not supported.
+    """
 
     @classmethod
     def encode(cls, data: Any, *args, **kwargs) -> bytes:
@@ -24,7 +30,7 @@ class MinosJsonBinaryProtocol(MinosBinaryProtocol):
         return orjson.dumps(data)
 
     @classmethod
-    def decode(cls, data: bytes, *args, **kwargs) -> Any:
+    def decode(cls, data: Union[bytes, bytearray, memoryview, str], *args, **kwargs) -> Any:
         """Decodes the given bytes data.
 
         :param data: bytes data to be decoded.
@@ -0,0 +1,227 @@
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Any,
+    Optional,
+    Union,
+)
+
+import msgpack
+
+from ..exceptions import (
+    MinosProtocolException,
+)
+from .abc import (
+    MinosBinaryProtocol,
+)
+from .avro import (
+    AvroSchemaRegistry,
+    MinosAvroProtocol,
+)
+
+MSGPACK_MAGIC = b"Mmp\x01"
+MSGPACK_MAGIC_SIZE = len(MSGPACK_MAGIC)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class MinosMsgPackProtocol(MinosBinaryProtocol):
+    """MessagePack based binary encoder / decoder implementation.
+
+    The values are encoded as a small magic header followed by a msgpack ``[schema, values]`` array, in which the values
+    are the ``avro``-compatible data and the schema is the ``avro`` schema used to rebuild them. On ``schemaless`` mode,
+    the schema is replaced by its 64-bit fingerprint, which is resolved through an ``AvroSchemaRegistry`` (the default
+    one is shared with ``MinosAvroProtocol``). Plain values can also be encoded without any schema, so the protocol can
+    be used as a drop-in replacement of ``MinosJsonBinaryProtocol``.
+    """
+
+    @classmethod
+    def encode(
+        cls,
+        value: Any,
+        schema: Any = None,
+        *args,
+        batch_mode: bool = False,
+        schemaless: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> bytes:
+        """Encodes the given value into bytes.
+
+        :param value: The data to be encoded.
+        :param schema: The ``avro`` schema relative to the data. It can be omitted if the values are plain (msgpack
+            serializable) values that do not need to be rebuilt as models.
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param schemaless: If ``True`` the schema is registered on the schema registry and only its fingerprint is
+            stored on the bytes, otherwise the schema is embedded on the bytes.
+        :param schema_registry: The schema registry to be used on ``schemaless`` mode. If not set, the default one is
+            used.
+        :param kwargs: Additional named arguments.
+        :return: A bytes instance.
+        """
+        if not batch_mode:
+            value = [value]
+
+        try:
+            if schemaless:
+                schema = cls._get_schema_registry(schema_registry).register(schema)
+            return MSGPACK_MAGIC + msgpack.packb([schema, value], use_bin_type=True)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error encoding data: {exc!r}")
+
+    @classmethod
+    def decode(
+        cls,
+        data: Buffer,
+        *args,
+        batch_mode: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> Any:
+        """Decodes the given bytes data.
+
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
+        :param kwargs: Additional named arguments.
+        :return: A dictionary or a list of dictionaries.
+        """
+        _, ans = cls.decode_with_schema(data, batch_mode=batch_mode, schema_registry=schema_registry)
+        return ans
+
+    @classmethod
+    def decode_with_schema(
+        cls,
+        data: Buffer,
+        *args,
+        batch_mode: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> tuple[Union[dict[str, Any], list[dict[str, Any]]], Any]:
+        """Decode the given bytes of data, getting both the schema and the value.
+
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+            single model.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
+        :param kwargs: Additional named arguments.
+        :return: A ``(schema, value)`` pair.
+        """
+        return cls.decode_many([data], batch_mode=batch_mode, schema_registry=schema_registry)[0]
+
+    @classmethod
+    def decode_many(
+        cls,
+        data: Iterable[Buffer],
+        *args,
+        batch_mode: bool = False,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
+        **kwargs,
+    ) -> list[tuple[Union[dict[str, Any], list[dict[str, Any]]], Any]]:
+        """Decode the given sequence of bytes objects, resolving the schema only once for the entries that share it.
+
+        :param data: A sequence of bytes objects (or any other objects supporting the buffer protocol).
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` each entry is processed as a list of models, otherwise each entry is processed as
+            a single model.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
+        :param kwargs: Additional named arguments.
+        :return: A list of ``(schema, value)`` pairs (one per entry and following the same order). The entries that
+            share the schema share also the same schema instance.
+        """
+        schemas = dict()
+        ans = list()
+        for entry in data:
+            try:
+                unpacker = cls._build_unpacker(entry)
+                schema = cls._read_schema(unpacker, entry, schemas, schema_registry)
+                values = unpacker.unpack()
+            except Exception as exc:
+                raise MinosProtocolException(f"Error decoding the msgpack bytes: {exc!r}")
+
+            if not batch_mode:
+                if len(values) > 1:
+                    raise MinosProtocolException(
+                        f"The 'batch_mode' argument was set to {False!r} but data contains multiple values: {values!r}"
+                    )
+                values = values[0]
+
+            ans.append((schema, values))
+
+        return ans
+
+    @classmethod
+    def decode_schema(
+        cls, data: Buffer, *args, schema_registry: Optional[AvroSchemaRegistry] = None, **kwargs
+    ) -> Union[dict[str, Any], list[dict[str, Any]]]:
+        """Decode the schema of the given bytes of data, without decoding the values.
+
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
+        :param args: Additional positional arguments.
+        :param schema_registry: The schema registry used to resolve the schema of ``schemaless`` encoded data. If not
+            set, the default one is used.
+        :param kwargs: Additional named arguments.
+        :return: A dictionary or a list of dictionaries.
+        """
+        try:
+            return cls._read_schema(cls._build_unpacker(data), data, dict(), schema_registry)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error getting msgpack schema: {exc!r}")
+
+    @staticmethod
+    def is_encoded(data: Buffer) -> bool:
+        """Check if the given bytes of data has been encoded with this protocol.
+
+        :param data: A bytes object or any other object supporting the buffer protocol (as ``memoryview``).
+        :return: ``True`` if the data starts with the protocol header or ``False`` otherwise.
+        """
+        return memoryview(data)[:MSGPACK_MAGIC_SIZE] == MSGPACK_MAGIC
+
+    @classmethod
+    def _build_unpacker(cls, data: Buffer) -> msgpack.Unpacker:
+        if not cls.is_encoded(data):
+            raise ValueError("The given data does not start with the msgpack protocol header.")
+
+        unpacker = msgpack.Unpacker(raw=False, max_buffer_size=memoryview(data).nbytes)
+        unpacker.feed(memoryview(data)[MSGPACK_MAGIC_SIZE:])
+        if unpacker.read_array_header() != 2:
+            raise ValueError("The given data does not contain a '[schema, values]' array.")
+        return unpacker
+
+    @classmethod
+    def _read_schema(
+        cls,
+        unpacker: msgpack.Unpacker,
+        data: Buffer,
+        schemas: dict[Any, Any],
+        schema_registry: Optional[AvroSchemaRegistry],
+    ) -> Any:
+        start = MSGPACK_MAGIC_SIZE + unpacker.tell()
+        schema = unpacker.unpack()
+        if isinstance(schema, int):
+            key = ("schemaless", schema)
+        else:
+            end = MSGPACK_MAGIC_SIZE + unpacker.tell()
+            key = ("embedded", bytes(memoryview(data)[start:end]))
+
+        if key not in schemas:
+            if isinstance(schema, int):
+                schema = cls._get_schema_registry(schema_registry).get(schema)
+            schemas[key] = schema
+
+        return schemas[key]
+
+    @staticmethod
+    def _get_schema_registry(schema_registry: Optional[AvroSchemaRegistry]) -> AvroSchemaRegistry:
+        if schema_registry is None:
+            schema_registry = MinosAvroProtocol.default_schema_registry
+        return schema_registry
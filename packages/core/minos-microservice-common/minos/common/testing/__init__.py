@@ -1,4 +1,5 @@
 from .database import (
+    MockedAvroSchemaRegistryDatabaseOperationFactory,
     MockedDatabaseClient,
     MockedDatabaseOperation,
     MockedLockDatabaseOperationFactory,
@@ -2,6 +2,7 @@ from .clients import (
     MockedDatabaseClient,
 )
 from .factories import (
+    MockedAvroSchemaRegistryDatabaseOperationFactory,
     MockedLockDatabaseOperationFactory,
     MockedManagementDatabaseOperationFactory,
 )
@@ -4,3 +4,6 @@ from .locks import (
 from .managements import (
     MockedManagementDatabaseOperationFactory,
 )
+from .registries import (
+    MockedAvroSchemaRegistryDatabaseOperationFactory,
+)
@@ -0,0 +1,36 @@
+from collections.abc import (
+    Iterable,
+)
+
+from ....database import (
+    AvroSchemaRegistryDatabaseOperationFactory,
+    DatabaseOperation,
+)
+from ..clients import (
+    MockedDatabaseClient,
+)
+from ..operations import (
+    MockedDatabaseOperation,
+)
+
+
+class MockedAvroSchemaRegistryDatabaseOperationFactory(AvroSchemaRegistryDatabaseOperationFactory):
+    """For testing purposes"""
+
+    def build_create(self) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("create")
+
+    def build_submit(self, fingerprint: int, schema: str) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("submit")
+
+    def build_query(self, fingerprints: Iterable[int]) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("query")
+
+
+MockedDatabaseClient.set_factory(
+    AvroSchemaRegistryDatabaseOperationFactory,
+    MockedAvroSchemaRegistryDatabaseOperationFactory,
+)
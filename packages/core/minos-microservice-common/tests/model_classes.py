@@ -5,12 +5,14 @@ from typing import (
     Generic,
     Optional,
     TypeVar,
+    Union,
 )
 from uuid import (
     UUID,
 )
 
 from minos.common import (
+    CompactDeclarativeModel,
     DeclarativeModel,
     MissingSentinel,
 )
@@ -124,6 +126,12 @@ class Customer(User):
         return name.title()
 
 
+class CompactCustomer(Customer, CompactDeclarativeModel):
+    """
+    Test a Model Class with compact storage
+    """
+
+
 class CustomerDict(User):
     """
     Test a Model Class with Dictionary
@@ -205,3 +213,21 @@ class TextNumber(DeclarativeModel):
         if text is None:
             text = "foo"
         super().__init__(text, *args, **kwargs)
+
+
+class IntText(DeclarativeModel):
+    """For testing purposes."""
+
+    text: int
+
+
+class StrText(DeclarativeModel):
+    """For testing purposes."""
+
+    text: str
+
+
+class TextContainer(DeclarativeModel):
+    """For testing purposes."""
+
+    item: Union[IntText, StrText]
@@ -0,0 +1,119 @@
+import json
+import unittest
+from contextlib import (
+    redirect_stderr,
+    redirect_stdout,
+)
+from io import (
+    StringIO,
+)
+
+from benchmarks import (
+    MODEL_BUILDERS,
+    BenchmarkResult,
+    BenchmarkRunner,
+    compare_reports,
+    get_cases,
+)
+from benchmarks.__main__ import (
+    main,
+)
+
+
+class TestBenchmarkModels(unittest.TestCase):
+    def test_avro_round_trip(self):
+        for name, builder in MODEL_BUILDERS.items():
+            with self.subTest(name):
+                model = builder(1)
+                self.assertEqual(model, type(model).from_avro_bytes(model.avro_bytes))
+
+
+class TestBenchmarkCases(unittest.TestCase):
+    def test_get_cases(self):
+        cases = get_cases()
+        self.assertEqual(len(cases), len({case.name for case in cases}))
+        self.assertLessEqual(
+            {"construct", "avro_bytes", "from_avro_bytes", "avro_schema_encoder", "avro_data_decoder"},
+            {case.group for case in cases},
+        )
+        self.assertEqual(set(MODEL_BUILDERS), {case.model for case in cases})
+
+    def test_get_cases_with_pattern(self):
+        self.assertEqual(
+            ["avro_bytes[small]", "from_avro_bytes[small]"], [c.name for c in get_cases("avro_bytes[small")]
+        )
+
+    def test_setup(self):
+        for case in get_cases():
+            with self.subTest(case.name):
+                self.assertIsNotNone(case.setup()())
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_run(self):
+        runner = BenchmarkRunner(number=2, repeat=3)
+        results = runner.run(get_cases("construct[small]"))
+
+        self.assertEqual(1, len(results))
+        self.assertEqual("construct[small]", results[0].name)
+        self.assertEqual(2, results[0].number)
+        self.assertEqual(3, len(results[0].timings))
+
+    def test_run_autorange(self):
+        runner = BenchmarkRunner(repeat=1, min_time=0.001)
+        result = runner.run_one(get_cases("construct[small]")[0])
+        self.assertGreaterEqual(result.number, 1)
+
+    def test_build_report(self):
+        result = BenchmarkResult("construct[small]", "construct", "small", 10, [2.0, 1.0, 3.0])
+        report = BenchmarkRunner.build_report([result])
+
+        self.assertEqual({"machine_info", "minos_version", "datetime", "benchmarks"}, set(report))
+        self.assertEqual(
+            {
+                "name": "construct[small]",
+                "group": "construct",
+                "model": "small",
+                "number": 10,
+                "repeat": 3,
+                "best": 1.0,
+                "mean": 2.0,
+                "stdev": 1.0,
+                "ops": 1.0,
+                "timings": [2.0, 1.0, 3.0],
+            },
+            report["benchmarks"][0],
+        )
+
+    def test_compare_reports(self):
+        baseline = {"benchmarks": [{"name": "one", "best": 1.0}, {"name": "two", "best": 1.0}]}
+        current = {
+            "benchmarks": [{"name": "one", "best": 1.05}, {"name": "two", "best": 1.5}, {"name": "three", "best": 1}]
+        }
+
+        observed = compare_reports(baseline, current, threshold=0.1)
+
+        self.assertEqual([("one", 1.0, 1.05, 1.05, False), ("two", 1.0, 1.5, 1.5, True)], observed)
+
+
+class TestBenchmarkMain(unittest.TestCase):
+    def test_main(self):
+        stdout = StringIO()
+        with redirect_stdout(stdout), redirect_stderr(StringIO()):
+            code = main(["--filter", "construct[small]", "--number", "1", "--repeat", "1"])
+
+        self.assertEqual(0, code)
+        report = json.loads(stdout.getvalue())
+        self.assertEqual(["construct[small]"], [entry["name"] for entry in report["benchmarks"]])
+
+    def test_main_list(self):
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            code = main(["--list", "--filter", "[wide]"])
+
+        self.assertEqual(0, code)
+        self.assertEqual([case.name for case in get_cases("[wide]")], stdout.getvalue().split())
+
+
+if __name__ == "__main__":
+    unittest.main()
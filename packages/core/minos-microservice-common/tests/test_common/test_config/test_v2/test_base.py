@@ -7,6 +7,8 @@ from minos.common import (
     Config,
     ConfigV2,
     MinosConfigException,
+    MinosJsonBinaryProtocol,
+    MinosMsgPackProtocol,
     PoolFactory,
 )
 from tests.utils import (
@@ -46,6 +48,7 @@ class TestConfigV2(unittest.TestCase):
                 "snapshot": FakeSnapshotRepository,
                 "transaction": FakeTransactionRepository,
             },
+            "protocols": {"event": MinosMsgPackProtocol},
         }
         self.assertEqual(expected, self.config.get_aggregate())
 
@@ -108,7 +111,7 @@ class TestConfigV2(unittest.TestCase):
                 "port": 9092,
                 "queue": {"records": 10, "retry": 2},
             },
-            "publisher": {"client": FakeBrokerPublisher, "queue": int},
+            "publisher": {"client": FakeBrokerPublisher, "queue": int, "protocol": MinosMsgPackProtocol},
             "subscriber": {"client": FakeBrokerSubscriber, "queue": int, "validator": float},
         }
 
@@ -204,6 +207,7 @@ class TestConfigV2(unittest.TestCase):
         config = ConfigV2(self.file_path, with_environment=False)
         saga = config.get_database_by_name("saga")
         self.assertEqual("./order.lmdb", saga["path"])
+        self.assertEqual(MinosJsonBinaryProtocol, saga["protocol"])
 
     def test_discovery(self):
         config = ConfigV2(self.file_path, with_environment=False)
@@ -143,6 +143,23 @@ class TestDatabaseClient(CommonTestCase):
             [call(composed), call(composed.operations[0]), call(composed.operations[1])], mock.call_args_list
         )
 
+    async def test_transaction(self):
+        client = _DatabaseClient()
+        mock = AsyncMock()
+        client._begin, client._commit, client._rollback = mock.begin, mock.commit, mock.rollback
+
+        await client.begin()
+        await client.commit()
+        await client.rollback()
+
+        self.assertEqual([call.begin(), call.commit(), call.rollback()], mock.mock_calls)
+
+    async def test_transaction_not_supported(self):
+        async with _DatabaseClient() as client:
+            await client.begin()
+            await client.execute(_DatabaseOperation())
+            await client.commit()
+
     async def test_execute_with_lock(self):
         op1 = _DatabaseOperation(lock="foo")
         with patch.object(DatabaseLock, "acquire") as enter_lock_mock:
@@ -1,4 +1,10 @@
 import unittest
+from asyncio import (
+    create_task,
+)
+from unittest.mock import (
+    patch,
+)
 
 from minos.common import (
     DatabaseClientPool,
@@ -149,6 +155,74 @@ class TestDatabaseMixin(CommonTestCase, DatabaseMinosTestCase):
 
         self.assertEqual([(3,), (4,), (5,)], observed)
 
+    async def test_database_transaction(self):
+        op1 = MockedDatabaseOperation("insert")
+        op2 = MockedDatabaseOperation("select", [(3,), (4,), (5,)])
+
+        async with DatabaseMixin() as database:
+            with patch.object(MockedDatabaseClient, "begin") as begin_mock, patch.object(
+                MockedDatabaseClient, "commit"
+            ) as commit_mock, patch.object(MockedDatabaseClient, "rollback") as rollback_mock:
+                async with database.database_transaction() as client:
+                    self.assertIsInstance(client, MockedDatabaseClient)
+                    with patch.object(database.database_pool, "acquire") as acquire_mock:
+                        await database.execute_on_database(op1)
+                        observed = [v async for v in database.execute_on_database_and_fetch_all(op2, True)]
+                        async with database.database_transaction() as nested:
+                            self.assertEqual(client, nested)
+
+        self.assertEqual([(3,), (4,), (5,)], observed)
+        self.assertEqual(0, acquire_mock.call_count)
+        self.assertEqual(1, begin_mock.call_count)
+        self.assertEqual(1, commit_mock.call_count)
+        self.assertEqual(0, rollback_mock.call_count)
+
+    async def test_database_transaction_shared_by_pool(self):
+        async with DatabaseMixin() as database, DatabaseMixin(database.database_pool) as other:
+            async with database.database_transaction() as client:
+                with patch.object(database.database_pool, "acquire") as acquire_mock:
+                    await other.execute_on_database(MockedDatabaseOperation("insert"))
+                    async with other.database_transaction() as nested:
+                        self.assertEqual(client, nested)
+
+            async with DatabaseMixin(DatabaseClientPool.from_config(self.config)) as unrelated:
+                async with database.database_transaction() as client:
+                    async with unrelated.database_transaction() as nested:
+                        self.assertNotEqual(client, nested)
+
+        self.assertEqual(0, acquire_mock.call_count)
+
+    async def test_database_transaction_not_shared_by_created_tasks(self):
+        async def _fn():
+            async with database.database_transaction() as created:
+                return created
+
+        async with DatabaseMixin() as database:
+            pool = database.database_pool
+            async with database.database_transaction() as client:
+                nested = await create_task(_fn())
+                with patch.object(pool, "acquire", side_effect=pool.acquire) as acquire_mock:
+                    await create_task(database.execute_on_database(MockedDatabaseOperation("insert")))
+
+        self.assertNotEqual(client, nested)
+        self.assertEqual(1, acquire_mock.call_count)
+
+    async def test_database_transaction_rollback(self):
+        async with DatabaseMixin() as database:
+            with patch.object(MockedDatabaseClient, "commit") as commit_mock, patch.object(
+                MockedDatabaseClient, "rollback"
+            ) as rollback_mock:
+                with self.assertRaises(ValueError):
+                    async with database.database_transaction():
+                        raise ValueError()
+
+                with patch.object(database.database_pool, "acquire", side_effect=ValueError):
+                    with self.assertRaises(ValueError):
+                        await database.execute_on_database(MockedDatabaseOperation("insert"))
+
+        self.assertEqual(0, commit_mock.call_count)
+        self.assertEqual(1, rollback_mock.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+from minos.common import (
+    AvroSchemaRegistry,
+    DatabaseAvroSchemaRegistry,
+    DatabaseMixin,
+    build_schema_fingerprint,
+)
+from minos.common.testing import (
+    DatabaseMinosTestCase,
+    MockedAvroSchemaRegistryDatabaseOperationFactory,
+    MockedDatabaseClient,
+)
+from tests.utils import (
+    CommonTestCase,
+    FakeAsyncIterator,
+)
+
+
+class TestDatabaseAvroSchemaRegistry(CommonTestCase, DatabaseMinosTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = {"type": "record", "name": "Foo", "fields": [{"name": "bar", "type": "string"}]}
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(DatabaseAvroSchemaRegistry, (AvroSchemaRegistry, DatabaseMixin)))
+
+    async def test_operation_factory(self):
+        registry = DatabaseAvroSchemaRegistry()
+        self.assertIsInstance(registry.database_operation_factory, MockedAvroSchemaRegistryDatabaseOperationFactory)
+
+    async def test_setup(self):
+        mock = AsyncMock()
+        with patch.object(MockedDatabaseClient, "execute", mock):
+            async with DatabaseAvroSchemaRegistry():
+                pass
+
+        self.assertEqual(["create"], [c.args[0].content for c in mock.call_args_list])
+
+    async def test_store(self):
+        mock = AsyncMock()
+        async with DatabaseAvroSchemaRegistry() as registry:
+            registry.register(self.schema)
+            with patch.object(MockedDatabaseClient, "execute", mock):
+                await registry.store()
+                await registry.store()
+
+        self.assertEqual(["submit"], [c.args[0].content for c in mock.call_args_list])
+        self.assertEqual(dict(), registry.pending)
+
+    async def test_store_raises(self):
+        async with DatabaseAvroSchemaRegistry() as registry:
+            fingerprint = registry.register(self.schema)
+            with patch.object(MockedDatabaseClient, "execute", side_effect=ValueError):
+                with self.assertRaises(ValueError):
+                    await registry.store()
+
+        self.assertEqual({fingerprint: self.schema}, registry.pending)
+
+    async def test_load(self):
+        fingerprint = build_schema_fingerprint(self.schema)
+        signed = fingerprint - 2**64 if fingerprint >= 2**63 else fingerprint
+
+        async with DatabaseAvroSchemaRegistry() as registry:
+            with patch.object(
+                MockedDatabaseClient,
+                "fetch_all",
+                return_value=FakeAsyncIterator([(signed, '{"type":"record","name":"Foo","fields":[]}')]),
+            ):
+                await registry.load([fingerprint])
+
+        self.assertEqual({"type": "record", "name": "Foo", "fields": []}, registry.get(fingerprint))
+        self.assertEqual(dict(), registry.pending)
+
+    async def test_load_already_known(self):
+        async with DatabaseAvroSchemaRegistry() as registry:
+            fingerprint = registry.register(self.schema)
+            mock = AsyncMock()
+            with patch.object(MockedDatabaseClient, "execute", mock):
+                await registry.load([fingerprint])
+
+        self.assertEqual([], mock.call_args_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,11 @@ from uuid import (
 )
 
 from minos.common import (
+    AvroSchemaDecoder,
+    AvroSchemaEncoder,
     EmptyMinosModelSequenceException,
+    MinosAvroProtocol,
+    MinosMsgPackProtocol,
     MissingSentinel,
     Model,
     MultiTypeMinosModelSequenceException,
@@ -39,7 +43,7 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
                                     {"name": "username", "type": ["string", "null"]},
                                 ],
                                 "name": "User",
-                                "namespace": "tests.model_classes.goodbye",
+                                "namespace": "tests.model_classes.s1",
                                 "type": "record",
                             },
                             "null",
@@ -48,24 +52,22 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
                     {"name": "cost", "type": "double"},
                 ],
                 "name": "ShoppingList",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes.s0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello", "goodbye"]):
-            self.assertEqual(expected, ShoppingList.avro_schema)
+        self.assertEqual(expected, ShoppingList.avro_schema)
 
     def test_avro_schema_generics(self):
         expected = [
             {
                 "fields": [{"name": "username", "type": ["string", "int"]}],
                 "name": "GenericUser",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes.s0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(expected, GenericUser.avro_schema)
+        self.assertEqual(expected, GenericUser.avro_schema)
 
     def test_avro_schema_generics_nested(self):
         expected = [
@@ -76,18 +78,17 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
                         "type": {
                             "fields": [{"name": "username", "type": "string"}],
                             "name": "GenericUser",
-                            "namespace": "tests.model_classes.goodbye",
+                            "namespace": "tests.model_classes.s1",
                             "type": "record",
                         },
                     }
                 ],
                 "name": "Auth",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes.s0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello", "goodbye"]):
-            self.assertEqual(expected, Auth.avro_schema)
+        self.assertEqual(expected, Auth.avro_schema)
 
     def test_avro_schema_simple(self):
         customer = Customer(1234)
@@ -102,12 +103,11 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
                     {"name": "lists", "type": [{"items": "int", "type": "array"}, "null"]},
                 ],
                 "name": "Customer",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes.s0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(expected, customer.avro_schema)
+        self.assertEqual(expected, customer.avro_schema)
 
     def test_avro_schema_multiple_fields(self):
         bar = Bar(first=Foo("one"), second=Foo("two"))
@@ -119,7 +119,7 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
                         "type": {
                             "fields": [{"name": "text", "type": "string"}],
                             "name": "Foo",
-                            "namespace": "tests.model_classes.hello",
+                            "namespace": "tests.model_classes.s1",
                             "type": "record",
                         },
                     },
@@ -128,26 +128,25 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
                         "type": {
                             "fields": [{"name": "text", "type": "string"}],
                             "name": "Foo",
-                            "namespace": "tests.model_classes.goodbye",
+                            "namespace": "tests.model_classes.s2",
                             "type": "record",
                         },
                     },
                 ],
                 "name": "Bar",
-                "namespace": "tests.model_classes.one",
+                "namespace": "tests.model_classes.s0",
                 "type": "record",
             }
         ]
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["one", "hello", "goodbye"]):
-            self.assertEqual(expected, bar.avro_schema)
+        self.assertEqual(expected, bar.avro_schema)
 
     def test_encode_schema(self):
         user = User(1234)
         shopping_list = ShoppingList(user)
         with patch.object(ShoppingList, "encode_schema", return_value=MissingSentinel) as shopping_mock:
             with patch.object(User, "encode_schema", return_value=user.avro_schema) as user_mock:
-                shopping_list.avro_schema
+                AvroSchemaEncoder().build(shopping_list)
 
         encoder = shopping_mock.call_args_list[0].args[0]
 
@@ -194,6 +193,29 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual([call(encoder, {"id": 1234, "username": None})], user_mock.call_args_list)
 
+    def test_avro_schema_cached(self):
+        expected_cls, expected = ShoppingList.avro_schema, ShoppingList(User(1234)).avro_schema
+
+        with patch.object(AvroSchemaEncoder, "build") as mock:
+            self.assertEqual(expected_cls, ShoppingList.avro_schema)
+            self.assertEqual(expected, ShoppingList(User(5678)).avro_schema)
+
+        self.assertEqual(0, mock.call_count)
+
+    def test_avro_schema_cached_copy(self):
+        schema = ShoppingList.avro_schema
+        schema.append("null")
+        self.assertNotEqual(schema, ShoppingList.avro_schema)
+
+    def test_avro_schema_cached_deep_copy(self):
+        expected_cls, expected = ShoppingList.avro_schema, ShoppingList(User(1234)).avro_schema
+
+        ShoppingList.avro_schema[0]["namespace"] = "foo"
+        ShoppingList(User(1234)).avro_schema[0]["fields"].clear()
+
+        self.assertEqual(expected_cls, ShoppingList.avro_schema)
+        self.assertEqual(expected, ShoppingList(User(1234)).avro_schema)
+
     def test_avro_bytes(self):
         shopping_list = ShoppingList(User(1234))
         self.assertIsInstance(shopping_list.avro_bytes, bytes)
@@ -225,16 +247,28 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
         user = User(1234)
         shopping_list = ShoppingList(user)
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            with patch.object(Model, "decode_schema", side_effect=[MissingSentinel, User]) as mock:
-                # noinspection PyTypeChecker
-                Model.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
+        schema = shopping_list.avro_schema
+        Model._avro_schema_type_cache.clear()
+        with patch.object(Model, "decode_schema", side_effect=[MissingSentinel, User]) as mock:
+            # noinspection PyTypeChecker
+            Model.from_avro(schema, shopping_list.avro_data)
+
+        decoder = mock.call_args_list[0].args[0]
+
+        self.assertEqual(
+            [call(decoder, schema[0]), call(decoder, schema[0]["fields"][0]["type"][0])], mock.call_args_list
+        )
+
+    def test_from_avro_type_cached(self):
+        shopping_list = ShoppingList(User(1234))
+        schema = shopping_list.avro_schema
+        Model.from_avro(schema, shopping_list.avro_data)
 
-            decoder = mock.call_args_list[0].args[0]
+        with patch.object(AvroSchemaDecoder, "build") as mock:
+            observed = Model.from_avro(schema, ShoppingList(User(5678)).avro_data)
 
-            self.assertEqual(
-                [call(decoder, shopping_list.avro_schema[0]), call(decoder, user.avro_schema[0])], mock.call_args_list
-            )
+        self.assertEqual(0, mock.call_count)
+        self.assertEqual(ShoppingList(User(5678)), observed)
 
     def test_decode_data(self):
         user = User(1234)
@@ -268,6 +302,25 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
         decoded_customer = Customer.from_avro_bytes(avro_bytes, batch_mode=True)
         self.assertEqual(customers, decoded_customer)
 
+    def test_from_avro_bytes_many(self):
+        expected = [ShoppingList(User(1234), cost=1.5), Customer(5678), ShoppingList(User(9012), cost=2.5)]
+        observed = Model.from_avro_bytes_many(model.avro_bytes for model in expected)
+        self.assertEqual(expected, observed)
+
+    def test_from_avro_bytes_many_in_batch(self):
+        customers = [Customer(1234), Customer(5678)]
+        raws = [Customer.to_avro_bytes(customers), Customer.to_avro_bytes(customers[:1])]
+        observed = Customer.from_avro_bytes_many(raws, batch_mode=True)
+        self.assertEqual([customers, customers[:1]], observed)
+
+    def test_from_avro_bytes_many_type_resolved_once(self):
+        models = [ShoppingList(User(1234)), ShoppingList(User(5678)), ShoppingList(User(9012))]
+        with patch.object(Model, "_build_avro_schema_type", wraps=Model._build_avro_schema_type) as mock:
+            observed = Model.from_avro_bytes_many(model.avro_bytes for model in models)
+
+        self.assertEqual(models, observed)
+        self.assertEqual(1, mock.call_count)
+
     def test_from_avro_bytes_composed(self):
         shopping_list = ShoppingList(User(1234), cost="1.234")
         avro_bytes = shopping_list.avro_bytes
@@ -294,6 +347,45 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
         base = Auth(GenericUser("foo"))
         self.assertEqual(base, Auth.from_avro_bytes(base.avro_bytes))
 
+    def test_to_bytes(self):
+        customer = Customer(1234)
+        self.assertEqual(customer, Customer.from_avro_bytes(customer.to_bytes()))
+        self.assertEqual(customer, Customer.from_avro_bytes(customer.to_bytes(MinosAvroProtocol)))
+
+    def test_from_bytes_msgpack(self):
+        original = Auth(GenericUser("foo"))
+        serialized = original.to_bytes(MinosMsgPackProtocol)
+        self.assertTrue(MinosMsgPackProtocol.is_encoded(serialized))
+        self.assertEqual(original, Auth.from_bytes(serialized))
+
+    def test_from_bytes_msgpack_uuid(self):
+        original = FooBar(uuid4())
+        self.assertEqual(original, FooBar.from_bytes(original.to_bytes(MinosMsgPackProtocol)))
+
+    def test_from_bytes_msgpack_in_batch(self):
+        customers = [Customer(1234), Customer(5678)]
+        serialized = MinosMsgPackProtocol.encode(
+            [customer.avro_data for customer in customers], customers[0].avro_schema, batch_mode=True
+        )
+        self.assertEqual(customers, Customer.from_bytes(serialized, batch_mode=True))
+
+    def test_from_bytes_avro(self):
+        shopping_list = ShoppingList(User(1234), cost="1.234")
+        self.assertEqual(shopping_list, ShoppingList.from_bytes(shopping_list.avro_bytes))
+
+    def test_from_bytes_many(self):
+        expected = [ShoppingList(User(1234), cost=1.5), Customer(5678), ShoppingList(User(9012), cost=2.5)]
+        raws = [expected[0].to_bytes(MinosMsgPackProtocol), expected[1].avro_bytes, expected[2].avro_bytes]
+        observed = Model.from_bytes_many(raws)
+        self.assertEqual(expected, observed)
+
+    def test_from_bytes_many_avro(self):
+        expected = [ShoppingList(User(1234), cost=1.5), Customer(5678)]
+        with patch.object(Model, "from_avro_bytes_many", wraps=Model.from_avro_bytes_many) as mock:
+            observed = Model.from_bytes_many(model.avro_bytes for model in expected)
+        self.assertEqual(expected, observed)
+        self.assertEqual(1, mock.call_count)
+
     def test_from_avro_str_single(self):
         customer = Customer(1234)
         avro_str = customer.avro_str
@@ -0,0 +1,114 @@
+import unittest
+
+from minos.common import (
+    CompactDeclarativeModel,
+    Field,
+    MinosAttributeValidationException,
+    MinosTypeAttributeException,
+)
+from tests.model_classes import (
+    CompactCustomer,
+    Customer,
+)
+
+
+class TestCompactDeclarativeModel(unittest.TestCase):
+    def test_subclass(self):
+        self.assertTrue(issubclass(CompactCustomer, CompactDeclarativeModel))
+        self.assertTrue(issubclass(CompactCustomer, Customer))
+
+    def test_constructor(self):
+        model = CompactCustomer(1234, "JohnDoe", name="john", surname="Doe")
+        self.assertEqual(1234, model.id)
+        self.assertEqual("johndoe", model.username)
+        self.assertEqual("John", model.name)
+        self.assertEqual("Doe", model.surname)
+        self.assertEqual(None, model.is_admin)
+        self.assertEqual(None, model.lists)
+
+    def test_constructor_multiple_values(self):
+        with self.assertRaises(TypeError):
+            CompactCustomer(1234, id=1234)
+
+    def test_constructor_too_many_positional_values(self):
+        with self.assertRaises(TypeError):
+            CompactCustomer(1234, "johndoe", "John", "Doe", True, [1], "foo")
+
+    def test_constructor_raises(self):
+        with self.assertRaises(MinosTypeAttributeException):
+            CompactCustomer("foo")
+        with self.assertRaises(MinosAttributeValidationException):
+            CompactCustomer(1234, "john doe")
+
+    def test_storage(self):
+        model = CompactCustomer(1234, "johndoe", name="John", surname="Doe")
+        self.assertEqual([1234, "johndoe", "John", "Doe", None, None], model._values)
+        self.assertNotIn("_fields", vars(model))
+
+    def test_layout_shared(self):
+        one = CompactCustomer(1234)
+        two = CompactCustomer(5678)
+        self.assertIs(one._layout, two._layout)
+
+    def test_setattr(self):
+        model = CompactCustomer(1234)
+        model.name = "john"
+        model["surname"] = "Doe"
+        self.assertEqual("John", model.name)
+        self.assertEqual("Doe", model["surname"])
+
+    def test_setattr_raises(self):
+        model = CompactCustomer(1234)
+        with self.assertRaises(MinosTypeAttributeException):
+            model.id = "foo"
+        with self.assertRaises(AttributeError):
+            model.foo = "bar"
+        with self.assertRaises(KeyError):
+            model["foo"] = "bar"
+        self.assertEqual(1234, model.id)
+
+    def test_getattr_raises(self):
+        model = CompactCustomer(1234)
+        with self.assertRaises(AttributeError):
+            model.foo
+        with self.assertRaises(KeyError):
+            model["foo"]
+
+    def test_fields(self):
+        model = CompactCustomer(1234, "johndoe", name="John", surname="Doe")
+        self.assertEqual(Customer(1234, "johndoe", name="John", surname="Doe").fields, model.fields)
+        self.assertIsInstance(model.fields["id"], Field)
+
+    def test_fields_write_through(self):
+        model = CompactCustomer(1234)
+        model.fields["name"].value = "john"
+        self.assertEqual("John", model.name)
+
+    def test_iter_len(self):
+        model = CompactCustomer(1234)
+        self.assertEqual(["id", "username", "name", "surname", "is_admin", "lists"], list(model))
+        self.assertEqual(6, len(model))
+
+    def test_equal(self):
+        self.assertEqual(CompactCustomer(1234, "johndoe"), CompactCustomer(1234, "johndoe"))
+        self.assertNotEqual(CompactCustomer(1234, "johndoe"), CompactCustomer(5678, "johndoe"))
+        self.assertNotEqual(CompactCustomer(1234, "johndoe"), Customer(1234, "johndoe"))
+
+    def test_hash(self):
+        one = CompactCustomer(1234, "johndoe")
+        self.assertEqual(hash(one), hash(CompactCustomer(1234, "johndoe")))
+        self.assertEqual(hash(Customer(1234, "johndoe")), hash(one))
+
+    def test_repr(self):
+        model = CompactCustomer(1234, "johndoe")
+        expected = repr(Customer(1234, "johndoe")).replace("Customer", "CompactCustomer", 1)
+        self.assertEqual(expected, repr(model))
+
+    def test_avro(self):
+        model = CompactCustomer(1234, "johndoe", name="John", surname="Doe", lists=[1, 2])
+        self.assertEqual(Customer(1234, "johndoe", name="John", surname="Doe", lists=[1, 2]).avro_data, model.avro_data)
+        self.assertEqual(model, CompactCustomer.from_avro_bytes(model.avro_bytes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,6 @@ import unittest
 from typing import (
     TypedDict,
 )
-from unittest.mock import (
-    patch,
-)
 
 from minos.common import (
     DataTransferObject,
@@ -127,14 +124,13 @@ class TestDataTransferObject(unittest.IsolatedAsyncioTestCase):
             {
                 "fields": [{"name": "price", "type": "int"}],
                 "name": "Order",
-                "namespace": "example.hello",
+                "namespace": "example.s0",
                 "type": "record",
             }
         ]
         dto = DataTransferObject.from_avro(schema, {"price": 120})
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(schema, dto.avro_schema)
+        self.assertEqual(schema, dto.avro_schema)
 
     def test_classname(self):
         dto = DataTransferObject("Order", {}, namespace="example")
@@ -3,13 +3,20 @@ from typing import (
     Optional,
 )
 from unittest.mock import (
+    MagicMock,
     call,
     patch,
 )
 
 from minos.common import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
     Field,
     MinosAttributeValidationException,
+    MinosTypeAttributeException,
+    is_immutable,
+)
+from tests.model_classes import (
+    Foo,
 )
 
 
@@ -24,22 +31,32 @@ class TestField(unittest.IsolatedAsyncioTestCase):
 
     def test_value_setter(self):
         field = Field("test", int, 3)
-        with patch("minos.common.AvroDataDecoder.build", return_value=56) as mock_build:
+        mock_decoder = MagicMock(return_value=56)
+        with patch("minos.common.model.fields._build_decoder", return_value=mock_decoder) as mock_build:
             field.value = 3
 
-            self.assertEqual(1, mock_build.call_count)
-            self.assertEqual(call(3), mock_build.call_args)
+            self.assertEqual([call(int)], mock_build.call_args_list)
+            self.assertEqual([call(3)], mock_decoder.call_args_list)
 
         self.assertEqual(56, field.value)
 
     def test_value(self):
-        with patch("minos.common.AvroDataDecoder.build", return_value=56) as mock:
+        mock_decoder = MagicMock(return_value=56)
+        with patch("minos.common.model.fields._build_decoder", return_value=mock_decoder) as mock_build:
             field = Field("test", int, 3)
-            self.assertEqual(1, mock.call_count)
-            self.assertEqual(call(3), mock.call_args)
+            self.assertEqual([call(int)], mock_build.call_args_list)
+            self.assertEqual([call(3)], mock_decoder.call_args_list)
 
         self.assertEqual(56, field.value)
 
+    def test_value_decoder_compiled_once(self):
+        Field("test", list[Optional[int]], [1, None])
+        with patch("minos.common.AvroDataDecoder.compile") as mock:
+            field = Field("test", list[Optional[int]], [3, None])
+
+        self.assertEqual(0, mock.call_count)
+        self.assertEqual([3, None], field.value)
+
     def test_value_setter_update(self):
         field = Field("test", Optional[int], 3)
         self.assertEqual(3, field.value)
@@ -48,6 +65,52 @@ class TestField(unittest.IsolatedAsyncioTestCase):
         field.value = 4
         self.assertEqual(4, field.value)
 
+    def test_value_setter_logging_deferred(self):
+        class _Value(str):
+            calls = 0
+
+            def __repr__(self):
+                type(self).calls += 1
+                return super().__repr__()
+
+        Field("test", str, _Value("foo"))
+
+        self.assertEqual(0, _Value.calls)
+
+    def test_value_trusted(self):
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            field = Field("test", list[int], ["1", "2"], parser=str.title, validator=len)
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        mock_decoder = MagicMock(side_effect=lambda data: [int(v) for v in data])
+        with patch("minos.common.model.fields._build_decoder", return_value=mock_decoder):
+            self.assertEqual([1, 2], field.value)
+            self.assertEqual([1, 2], field.value)
+
+        self.assertEqual([call(["1", "2"])], mock_decoder.call_args_list)
+
+    def test_value_trusted_raises_on_access(self):
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            field = Field("test", int, "foo")
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        with self.assertRaises(MinosTypeAttributeException):
+            field.value
+
+    def test_value_trusted_overwritten(self):
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            field = Field("test", int, "foo")
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        field.value = 3
+        self.assertEqual(3, field.value)
+
     def test_avro_schema(self):
         field = Field("test", int, 1)
         self.assertEqual({"name": "test", "type": "int"}, field.avro_schema)
@@ -109,12 +172,61 @@ class TestField(unittest.IsolatedAsyncioTestCase):
         self.assertNotEqual(Field("id", Optional[int], 3), Field("foo", Optional[int], 3))
         self.assertNotEqual(Field("id", Optional[int], 3), Field("id", int, 3))
 
+    def test_equal_same_type_skips_type_comparison(self):
+        type_ = Optional[int]
+        with patch("minos.common.model.fields.TypeHintComparator") as mock:
+            self.assertEqual(Field("id", type_, 3), Field("id", type_, 3))
+            self.assertNotEqual(Field("id", type_, 3), Field("id", type_, 4))
+        self.assertEqual(0, mock.call_count)
+
     def test_iter(self):
         self.assertEqual(("id", Optional[int], 3, None, None), tuple(Field("id", Optional[int], 3)))
 
     def test_hash(self):
         self.assertEqual(hash(("id", Optional[int], 3, None, None)), hash(Field("id", Optional[int], 3)))
 
+    def test_hash_cached(self):
+        field = Field("id", Optional[int], 3)
+        with patch("minos.common.model.fields.Field.__iter__", side_effect=Field.__iter__, autospec=True) as mock:
+            self.assertEqual(hash(field), hash(field))
+        self.assertEqual(1, mock.call_count)
+
+    def test_hash_invalidated(self):
+        field = Field("id", Optional[int], 3)
+        hash(field)
+        field.value = 4
+        self.assertEqual(hash(("id", Optional[int], 4, None, None)), hash(field))
+
+    def test_hash_not_cached_model(self):
+        foo = Foo("hello")
+        field = Field("foo", Foo, foo)
+        hash(field)
+        self.assertIsNone(field._hash)
+
+        foo.text = "bye"
+        self.assertEqual(hash(Field("foo", Foo, Foo("bye"))), hash(field))
+
+    def test_is_immutable(self):
+        self.assertTrue(is_immutable("foo"))
+        self.assertTrue(is_immutable(None))
+        self.assertTrue(is_immutable((1, ("two", 3.0))))
+        self.assertTrue(is_immutable(frozenset({1, 2})))
+        self.assertFalse(is_immutable([1, 2]))
+        self.assertFalse(is_immutable((1, [2])))
+        self.assertFalse(is_immutable(Foo("hello")))
+
+    def test_is_immutable_with_hook(self):
+        class _Frozen:
+            def __init__(self, immutable: bool):
+                self.immutable = immutable
+
+            def _is_immutable(self) -> bool:
+                return self.immutable
+
+        self.assertTrue(is_immutable(_Frozen(True)))
+        self.assertFalse(is_immutable(_Frozen(False)))
+        self.assertFalse(is_immutable((1, _Frozen(False))))
+
     def test_repr(self):
         field = Field("foo", str, "bar")
         self.assertEqual("foo='bar'", repr(field))
@@ -11,12 +11,16 @@ from typing import (
     Optional,
     Union,
 )
+from unittest.mock import (
+    patch,
+)
 from uuid import (
     UUID,
     uuid4,
 )
 
 from minos.common import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
     AvroDataDecoder,
     DataDecoderException,
     DataDecoderMalformedTypeException,
@@ -32,6 +36,8 @@ from tests.model_classes import (
     Analytics,
     Base,
     GenericUser,
+    StrText,
+    TextContainer,
     TextNumber,
     User,
 )
@@ -372,6 +378,39 @@ class TestAvroDataDecoder(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(raw, observed)
 
+    def test_model_type_trusted(self):
+        decoder = AvroDataDecoder(User)
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            with patch("minos.common.model.fields._build_decoder") as mock:
+                observed = decoder.build({"id": 1234, "username": "foo"})
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        self.assertEqual(0, mock.call_count)
+        self.assertEqual(User(1234, "foo"), observed)
+
+    def test_model_type_trusted_union(self):
+        decoder = AvroDataDecoder(TextContainer)
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            observed = decoder.build({"item": {"text": "hello"}})
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        self.assertIsInstance(observed.item, StrText)
+        self.assertEqual("hello", observed.item.text)
+
+    def test_model_type_trusted_union_from_avro_bytes(self):
+        raw = TextContainer(StrText("hello")).avro_bytes
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            observed = TextContainer.from_avro_bytes(raw)
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        self.assertEqual(TextContainer(StrText("hello")), observed)
+
     def test_default_values(self):
         decoder = AvroDataDecoder(TextNumber)
         expected = TextNumber(number=56, text="foo")
@@ -379,5 +418,57 @@ class TestAvroDataDecoder(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(expected, observed)
 
 
+class TestAvroDataDecoderCompile(unittest.TestCase):
+    def test_compile_cached(self):
+        self.assertIs(AvroDataDecoder.compile(list[Optional[int]]), AvroDataDecoder.compile(list[Optional[int]]))
+
+    def test_compile_equivalent(self):
+        uuid = uuid4()
+        cases = [
+            (int, 56),
+            (int, "56"),
+            (bool, True),
+            (float, 3.14),
+            (str, "foo"),
+            (bytes, b"foo"),
+            (datetime, 1615584741000000),
+            (date, 18700),
+            (time, 43200000000),
+            (timedelta, 1000),
+            (UUID, str(uuid)),
+            (Optional[int], None),
+            (Optional[int], MissingSentinel),
+            (Union[int, str], "foo"),
+            (list[int], [1, 2, 3]),
+            (set[str], ["foo", "bar"]),
+            (dict[str, list[int]], {"foo": [1], "bar": [2, 3]}),
+            (Optional[User], {"id": 1234, "username": "foo"}),
+            (list[User], [User(1234), {"id": 5678}]),
+            (Any, [1, 2, 3]),
+        ]
+        for type_, value in cases:
+            with self.subTest(type_=type_, value=value):
+                self.assertEqual(AvroDataDecoder(type_).build(value), AvroDataDecoder.compile(type_)(value))
+
+    def test_compile_raises(self):
+        cases = [
+            (int, None, DataDecoderRequiredValueException),
+            (int, MissingSentinel, DataDecoderRequiredValueException),
+            (int, "foo", DataDecoderTypeException),
+            (bool, 1, DataDecoderTypeException),
+            (Union[int, str], None, DataDecoderRequiredValueException),
+            (Union[int, bytes], 3.14j, DataDecoderTypeException),
+            (list[int], "foo", DataDecoderTypeException),
+            (dict[int, int], {1: 2}, DataDecoderMalformedTypeException),
+            (dict[str, int], [1, 2], DataDecoderTypeException),
+        ]
+        for type_, value, exc in cases:
+            with self.subTest(type_=type_, value=value):
+                with self.assertRaises(exc):
+                    AvroDataDecoder(type_).build(value)
+                with self.assertRaises(exc):
+                    AvroDataDecoder.compile(type_)(value)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,10 @@ from datetime import (
 from decimal import (
     Decimal,
 )
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
 from uuid import (
     uuid4,
 )
@@ -16,8 +20,15 @@ from uuid import (
 from minos.common import (
     AvroDataEncoder,
     MinosMalformedAttributeException,
+    MissingSentinel,
 )
 from tests.model_classes import (
+    Car,
+    CompactCustomer,
+    Foo,
+    FooBar,
+    Owner,
+    ShoppingList,
     User,
 )
 
@@ -92,5 +103,86 @@ class TestAvroDataEncoder(unittest.TestCase):
         self.assertEqual(str(value), observed)
 
 
+class TestAvroDataEncoderCachedModel(unittest.TestCase):
+    def test_without_cache(self):
+        model = Foo("bar")
+        AvroDataEncoder(model).build()
+        self.assertNotIn("_avro_data", vars(model))
+
+    def test_cache_filled(self):
+        model = Foo("bar")
+        model._avro_data = MissingSentinel
+
+        self.assertEqual({"text": "bar"}, AvroDataEncoder(model).build())
+        self.assertEqual({"text": "bar"}, vars(model)["_avro_data"])
+
+    def test_cache_reused(self):
+        model = Foo("bar")
+        model._avro_data = {"text": "cached"}
+
+        self.assertEqual({"text": "cached"}, AvroDataEncoder(model).build())
+        self.assertEqual([{"text": "cached"}, {"text": "cached"}], AvroDataEncoder([model, model]).build())
+
+    def test_cache_copied(self):
+        model = Foo("bar")
+        model._avro_data = {"text": "cached", "nested": {"values": [1, 2]}}
+
+        observed = AvroDataEncoder(model).build()
+        observed["text"] = "modified"
+        observed["nested"]["values"].append(3)
+
+        self.assertEqual({"text": "cached", "nested": {"values": [1, 2]}}, vars(model)["_avro_data"])
+
+
+class TestAvroDataEncoderModelList(unittest.TestCase):
+    def assertEqualToItemByItem(self, models):
+        expected = [AvroDataEncoder(model).build() for model in models]
+        observed = AvroDataEncoder(models).build()
+        self.assertEqual(expected, observed)
+
+    def test_primitive_fields(self):
+        self.assertEqualToItemByItem([User(1, "foo"), User(2, None), User(3, "bar")])
+
+    def test_logical_fields(self):
+        self.assertEqualToItemByItem([FooBar(uuid4()), FooBar(uuid4())])
+
+    def test_nested_models(self):
+        models = [ShoppingList(User(1, "foo"), "3,5"), ShoppingList(None, "1,2"), ShoppingList(User(2), "0,1")]
+        self.assertEqualToItemByItem(models)
+
+    def test_nested_model_lists(self):
+        models = [
+            Car(3, "blue", [Owner("foo", "bar", 56), Owner("one", "two", None)]),
+            Car(5, "red", None),
+            Car(4, "green", [Owner("three", "four", 12)]),
+        ]
+        self.assertEqualToItemByItem(models)
+
+    def test_compact_models(self):
+        models = [
+            CompactCustomer(1, "foo", "bar", "baz", True, [1, 2]),
+            CompactCustomer(2, None, "two", None, False, None),
+        ]
+        self.assertEqualToItemByItem(models)
+
+    def test_compact_models_fields_read_once(self):
+        models = [
+            CompactCustomer(1, "foo", "bar", "baz", True, [1, 2]),
+            CompactCustomer(2, None, "two", None, False, None),
+        ]
+        getter = MagicMock(side_effect=CompactCustomer.fields.fget)
+        with patch.object(CompactCustomer, "fields", property(getter)):
+            AvroDataEncoder(models).build()
+        self.assertEqual(len(models), getter.call_count)
+
+    def test_set(self):
+        observed = AvroDataEncoder({FooBar(uuid4()), FooBar(uuid4())}).build()
+        self.assertEqual(2, len(observed))
+        self.assertTrue(all(isinstance(item["identifier"], str) for item in observed))
+
+    def test_heterogeneous(self):
+        self.assertEqualToItemByItem([User(1, "foo"), Foo("bar"), 3])
+
+
 if __name__ == "__main__":
     unittest.main()
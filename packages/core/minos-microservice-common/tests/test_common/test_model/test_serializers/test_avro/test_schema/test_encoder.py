@@ -37,11 +37,22 @@ class TestAvroSchemaEncoder(unittest.TestCase):
         }
         encoder = AvroSchemaEncoder(ModelType.build("User", {"username": str}, namespace_="path.to"))
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
+        with patch("minos.common.AvroSchemaEncoder.generate_namespace_suffix", return_value="hello"):
             observed = encoder.build()
 
         self.assertEqual(expected, observed)
 
+    def test_namespace_suffixes(self):
+        type_ = ModelType.build("User", {"username": str}, namespace_="path.to")
+        encoder = AvroSchemaEncoder(list[type_])
+
+        self.assertEqual("path.to.s0", encoder.build()["items"]["namespace"])
+        self.assertEqual("path.to.s1", encoder.build()["items"]["namespace"])
+
+    def test_namespace_suffixes_deterministic(self):
+        type_ = ModelType.build("User", {"username": str}, namespace_="path.to")
+        self.assertEqual(AvroSchemaEncoder(type_).build(), AvroSchemaEncoder(type_).build())
+
     def test_int(self):
         observed = AvroSchemaEncoder(int).build()
         expected = "int"
@@ -112,7 +123,7 @@ class TestAvroSchemaEncoder(unittest.TestCase):
         }
         encoder = AvroSchemaEncoder(list[Optional[User]])
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
+        with patch("minos.common.AvroSchemaEncoder.generate_namespace_suffix", return_value="hello"):
             observed = encoder.build()
 
         self.assertEqual(expected, observed)
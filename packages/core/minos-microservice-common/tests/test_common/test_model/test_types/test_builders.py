@@ -47,6 +47,24 @@ class TestTypeHintBuilder(unittest.TestCase):
         observed = TypeHintBuilder([123], list[Union[int, Any]]).build()
         self.assertEqual(expected, observed)
 
+    def test_list_homogeneous(self):
+        self.assertEqual(list[int], TypeHintBuilder(list(range(10_000))).build())
+
+    def test_list_homogeneous_with_base(self):
+        observed = TypeHintBuilder(list(range(10_000)), list[Optional[int]]).build()
+        self.assertEqual(list[Optional[int]], observed)
+
+    def test_list_heterogeneous_tail(self):
+        self.assertEqual(list[Union[int, str]], TypeHintBuilder([*range(10_000), "hello"]).build())
+
+    def test_list_nested(self):
+        observed = TypeHintBuilder([[1, 2], [3, "four"], []]).build()
+        self.assertEqual(list[Union[list[int], list[Union[int, str]], list[Any]]], observed)
+
+    def test_dict_homogeneous(self):
+        observed = TypeHintBuilder({str(i): float(i) for i in range(10_000)}).build()
+        self.assertEqual(dict[str, float], observed)
+
 
 class TestTypeHintParser(unittest.TestCase):
     def test_immutable(self):
@@ -1,3 +1,4 @@
+import gc
 import unittest
 from typing import (
     Optional,
@@ -47,6 +48,29 @@ class TestModelType(unittest.TestCase):
         model_type = ModelType.build("Foo", {"text": int}, namespace_="bar")
         self.assertIsInstance(hash(model_type), int)
 
+    def test_hash_structural(self):
+        model_type = ModelType.build("Foo", {"text": int}, namespace_="bar")
+        self.assertEqual(hash(("Foo", "bar", (("text", int),))), hash(model_type))
+
+    def test_build_interned(self):
+        one = ModelType.build("bar.Foo", {"text": int, "user": Optional[ModelType.build("User", {"id": int})]})
+        two = ModelType.build("Foo", {"text": int, "user": Optional[ModelType.build("User", id=int)]}, namespace_="bar")
+        self.assertIs(one, two)
+
+    def test_build_interned_different(self):
+        one = ModelType.build("Foo", {"text": int}, namespace_="bar")
+        two = ModelType.build("Foo", {"text": str}, namespace_="bar")
+        self.assertIsNot(one, two)
+
+    def test_build_interned_weak(self):
+        key = (ModelType, "Interned", (("text", int),), "bar")
+        ModelType.build("Interned", {"text": int}, namespace_="bar")
+        gc.collect()
+        self.assertNotIn(key, ModelType._interned)
+
+    def test_from_model_interned(self):
+        self.assertIs(ModelType.from_model(Foo), ModelType.from_model(Foo("hello")))
+
     def test_lt(self):
         one = ModelType.build("Foo", {"text": int}, namespace_="bar")
         two = ModelType.build("Foo", {"text": int, "number": int}, namespace_="bar")
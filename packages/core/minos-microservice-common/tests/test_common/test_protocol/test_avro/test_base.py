@@ -1,6 +1,15 @@
+import io
 import unittest
+from unittest.mock import (
+    patch,
+)
+
+from fastavro import (
+    writer,
+)
 
 from minos.common import (
+    InMemoryAvroSchemaRegistry,
     MinosAvroProtocol,
     MinosProtocolException,
 )
@@ -123,6 +132,192 @@ class TestMinosAvroProtocol(unittest.TestCase):
         with self.assertRaises(MinosProtocolException):
             MinosAvroProtocol.decode(serialized)
 
+    def test_schemaless(self):
+        registry = InMemoryAvroSchemaRegistry()
+        schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+        serialized = MinosAvroProtocol.encode({"foo": 3.14}, schema, schemaless=True, schema_registry=registry)
+
+        fingerprint = MinosAvroProtocol.decode_fingerprint(serialized)
+        self.assertEqual({fingerprint: schema}, registry.schemas)
+        self.assertEqual(schema, MinosAvroProtocol.decode_schema(serialized, schema_registry=registry))
+        self.assertEqual({"foo": 3.14}, MinosAvroProtocol.decode(serialized, schema_registry=registry))
+
+    def test_schemaless_size(self):
+        schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+        container = MinosAvroProtocol.encode({"foo": 3.14}, schema)
+        schemaless = MinosAvroProtocol.encode({"foo": 3.14}, schema, schemaless=True)
+
+        self.assertEqual(12 + 8, len(schemaless))
+        self.assertLess(len(schemaless), len(container))
+
+    def test_schemaless_multi_schema(self):
+        data = {"cost": float("inf"), "user": {"id": 1234, "username": None}}
+        schema = [
+            {
+                "fields": [{"name": "user", "type": ["User", "null"]}, {"name": "cost", "type": "float"}],
+                "name": "ShoppingList",
+                "namespace": "tests.model_classes",
+                "type": "record",
+            },
+            {
+                "fields": [{"name": "id", "type": "int"}, {"name": "username", "type": ["string", "null"]}],
+                "name": "User",
+                "namespace": "tests.model_classes",
+                "type": "record",
+            },
+        ]
+        container = MinosAvroProtocol.encode(data, schema)
+        schemaless = MinosAvroProtocol.encode(data, schema, schemaless=True)
+
+        self.assertEqual(MinosAvroProtocol.decode_schema(container), MinosAvroProtocol.decode_schema(schemaless))
+        self.assertEqual(data, MinosAvroProtocol.decode(schemaless))
+
+    def test_schemaless_batch_mode(self):
+        serialized = MinosAvroProtocol.encode(["one", 1], [["string", "int"]], batch_mode=True, schemaless=True)
+
+        self.assertEqual(["string", "int"], MinosAvroProtocol.decode_schema(serialized))
+        self.assertEqual(["one", 1], MinosAvroProtocol.decode(serialized, batch_mode=True))
+
+    def test_schemaless_unknown_fingerprint_raises(self):
+        serialized = MinosAvroProtocol.encode("one", "string", schemaless=True)
+        registry = InMemoryAvroSchemaRegistry()
+
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode(serialized, schema_registry=registry)
+
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_schema(serialized, schema_registry=registry)
+
+    def test_decode_many(self):
+        registry = InMemoryAvroSchemaRegistry()
+        serialized = [
+            MinosAvroProtocol.encode("one", "string"),
+            MinosAvroProtocol.encode(1, "int", schemaless=True, schema_registry=registry),
+            MinosAvroProtocol.encode("two", "string"),
+            MinosAvroProtocol.encode(2, "int", schemaless=True, schema_registry=registry),
+            MinosAvroProtocol.encode(3, "long"),
+        ]
+
+        observed = MinosAvroProtocol.decode_many(serialized, schema_registry=registry)
+
+        self.assertEqual([("string", "one"), ("int", 1), ("string", "two"), ("int", 2), ("long", 3)], observed)
+
+    def test_decode_many_shares_schema(self):
+        schema = {"type": "record", "name": "tests.model_classes.Shared", "fields": [{"type": "int", "name": "foo"}]}
+        serialized = [MinosAvroProtocol.encode({"foo": i}, schema) for i in range(3)]
+
+        observed = MinosAvroProtocol.decode_many(serialized)
+
+        self.assertEqual([{"foo": 0}, {"foo": 1}, {"foo": 2}], [value for _, value in observed])
+        self.assertEqual(MinosAvroProtocol.decode_schema(serialized[0]), observed[0][0])
+        self.assertTrue(all(observed[0][0] is s for s, _ in observed))
+
+    def test_decode_many_batch_mode(self):
+        serialized = [
+            MinosAvroProtocol.encode(["one", 1], [["string", "int"]], batch_mode=True),
+            MinosAvroProtocol.encode(["two", 2, 3], [["string", "int"]], batch_mode=True),
+            MinosAvroProtocol.encode(["three"], [["string", "int"]], batch_mode=True, schemaless=True),
+        ]
+
+        observed = MinosAvroProtocol.decode_many(serialized, batch_mode=True)
+
+        self.assertEqual([["one", 1], ["two", 2, 3], ["three"]], [value for _, value in observed])
+
+    def test_decode_many_batch_mode_raises(self):
+        serialized = [MinosAvroProtocol.encode(["one", 1], [["string", "int"]], batch_mode=True)]
+
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_many(serialized)
+
+    def test_decode_many_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_many([MinosAvroProtocol.encode("one", "string"), bytes()])
+
+    def test_decode_fingerprint_container(self):
+        serialized = MinosAvroProtocol.encode("one", "string")
+        self.assertIsNone(MinosAvroProtocol.decode_fingerprint(serialized))
+
+    def test_decode_fingerprint_memoryview(self):
+        registry = InMemoryAvroSchemaRegistry()
+        serialized = MinosAvroProtocol.encode(1, "int", schemaless=True, schema_registry=registry)
+        self.assertEqual(
+            MinosAvroProtocol.decode_fingerprint(serialized),
+            MinosAvroProtocol.decode_fingerprint(memoryview(serialized)),
+        )
+        self.assertIsNone(MinosAvroProtocol.decode_fingerprint(memoryview(MinosAvroProtocol.encode(1, "int"))))
+
+    def test_decode_with_schema(self):
+        schema = {
+            "type": "record",
+            "name": "tests.model_classes.WithSchema",
+            "fields": [{"type": "int", "name": "foo"}],
+        }
+        serialized = MinosAvroProtocol.encode({"foo": 1}, schema)
+
+        with patch("minos.common.protocol.avro.base.reader") as mock:
+            observed = MinosAvroProtocol.decode_with_schema(serialized)
+
+        self.assertEqual((MinosAvroProtocol.decode_schema(serialized), {"foo": 1}), observed)
+        self.assertEqual(0, mock.call_count)
+
+    def test_decode_with_schema_schemaless(self):
+        registry = InMemoryAvroSchemaRegistry()
+        serialized = MinosAvroProtocol.encode(
+            ["one", "two"], "string", batch_mode=True, schemaless=True, schema_registry=registry
+        )
+
+        observed = MinosAvroProtocol.decode_with_schema(serialized, batch_mode=True, schema_registry=registry)
+
+        self.assertEqual(("string", ["one", "two"]), observed)
+
+    def test_decode_memoryview(self):
+        serialized = MinosAvroProtocol.encode({"foo": 1}, {"type": "map", "values": "int"})
+
+        self.assertEqual({"foo": 1}, MinosAvroProtocol.decode(memoryview(serialized)))
+        self.assertEqual({"foo": 1}, MinosAvroProtocol.decode(memoryview(b"prefix" + serialized)[6:]))
+        self.assertEqual({"foo": 1}, MinosAvroProtocol.decode(bytearray(serialized)))
+        self.assertEqual({"type": "map", "values": "int"}, MinosAvroProtocol.decode_schema(memoryview(serialized)))
+
+    def test_decode_memoryview_schemaless(self):
+        registry = InMemoryAvroSchemaRegistry()
+        serialized = MinosAvroProtocol.encode("one", "string", schemaless=True, schema_registry=registry)
+
+        self.assertEqual("one", MinosAvroProtocol.decode(memoryview(serialized), schema_registry=registry))
+        self.assertEqual("string", MinosAvroProtocol.decode_schema(memoryview(serialized), schema_registry=registry))
+
+    def test_encode_uses_schema_cache(self):
+        schema = {
+            "type": "record",
+            "name": "tests.model_classes.CachedList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+        MinosAvroProtocol.encode({"foo": 1.0}, schema)
+        hits, misses = MinosAvroProtocol.schema_cache.hits, MinosAvroProtocol.schema_cache.misses
+
+        serialized = MinosAvroProtocol.encode({"foo": 2.0}, schema)
+
+        self.assertEqual(hits + 1, MinosAvroProtocol.schema_cache.hits)
+        self.assertEqual(misses, MinosAvroProtocol.schema_cache.misses)
+        self.assertEqual({"foo": 2.0}, MinosAvroProtocol.decode(serialized))
+
+    def test_encode_schema_cache_does_not_collide_with_writer_schemas(self):
+        schema = ["string", "null"]
+        MinosAvroProtocol.encode("hello", schema)
+
+        with io.BytesIO() as file:
+            writer(file, schema, ["hello", None])
+            serialized = file.getvalue()
+
+        self.assertEqual(["hello", None], MinosAvroProtocol.decode(serialized, batch_mode=True))
+
 
 if __name__ == "__main__":
     unittest.main()
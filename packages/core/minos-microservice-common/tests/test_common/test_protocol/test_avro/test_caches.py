@@ -0,0 +1,73 @@
+import unittest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+from unittest.mock import (
+    MagicMock,
+)
+
+from minos.common import (
+    AvroSchemaCache,
+)
+
+
+class TestAvroSchemaCache(unittest.TestCase):
+    def test_constructor(self):
+        cache = AvroSchemaCache()
+        self.assertEqual(1024, cache.maxsize)
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, cache.misses)
+
+    def test_constructor_raises(self):
+        with self.assertRaises(ValueError):
+            AvroSchemaCache(maxsize=0)
+
+    def test_get_or_build(self):
+        cache = AvroSchemaCache()
+        fn = MagicMock(return_value="foo")
+
+        self.assertEqual("foo", cache.get_or_build(56, fn))
+        self.assertEqual("foo", cache.get_or_build(56, fn))
+
+        self.assertEqual(1, fn.call_count)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertIn(56, cache)
+
+    def test_get_or_build_evicts_least_recently_used(self):
+        cache = AvroSchemaCache(maxsize=2)
+
+        cache.get_or_build(1, lambda: "one")
+        cache.get_or_build(2, lambda: "two")
+        cache.get_or_build(1, lambda: "one")
+        cache.get_or_build(3, lambda: "three")
+
+        self.assertEqual(2, len(cache))
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+
+    def test_get_or_build_concurrently(self):
+        cache = AvroSchemaCache(maxsize=8)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            observed = list(executor.map(lambda i: cache.get_or_build(i % 16, lambda: i % 16), range(1000)))
+
+        self.assertEqual([i % 16 for i in range(1000)], observed)
+        self.assertEqual(8, len(cache))
+        self.assertEqual(1000, cache.hits + cache.misses)
+
+    def test_clear(self):
+        cache = AvroSchemaCache()
+        cache.get_or_build(56, lambda: "foo")
+
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, cache.misses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from minos.common import (
+    build_schema_fingerprint,
+)
+
+
+class TestBuildSchemaFingerprint(unittest.TestCase):
+    def test_fingerprint(self):
+        observed = build_schema_fingerprint({"type": "record", "name": "Foo", "fields": []})
+        self.assertIsInstance(observed, int)
+        self.assertTrue(0 <= observed < 2**64)
+
+    def test_fingerprint_ignores_keys_order(self):
+        one = build_schema_fingerprint({"type": "record", "name": "Foo", "fields": []})
+        two = build_schema_fingerprint({"fields": [], "name": "Foo", "type": "record"})
+        self.assertEqual(one, two)
+
+    def test_fingerprint_logical_type(self):
+        one = build_schema_fingerprint({"type": "string"})
+        two = build_schema_fingerprint({"type": "string", "logicalType": "uuid"})
+        self.assertNotEqual(one, two)
+
+
+if __name__ == "__main__":
+    unittest.main()
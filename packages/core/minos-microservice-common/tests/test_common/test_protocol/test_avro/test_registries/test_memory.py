@@ -0,0 +1,64 @@
+import unittest
+
+from minos.common import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
+    MinosProtocolException,
+    build_schema_fingerprint,
+)
+
+
+class TestInMemoryAvroSchemaRegistry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.schema = {"type": "record", "name": "Foo", "fields": [{"name": "bar", "type": "string"}]}
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(InMemoryAvroSchemaRegistry, AvroSchemaRegistry))
+
+    def test_constructor(self):
+        registry = InMemoryAvroSchemaRegistry([self.schema])
+        self.assertEqual({build_schema_fingerprint(self.schema): self.schema}, registry.schemas)
+
+    def test_register(self):
+        registry = InMemoryAvroSchemaRegistry()
+
+        fingerprint = registry.register(self.schema)
+
+        self.assertEqual(build_schema_fingerprint(self.schema), fingerprint)
+        self.assertIn(fingerprint, registry)
+        self.assertEqual({fingerprint: self.schema}, registry.pending)
+
+    def test_register_already_known(self):
+        registry = InMemoryAvroSchemaRegistry()
+        self.assertEqual(registry.register(self.schema), registry.register(dict(self.schema)))
+        self.assertEqual(1, len(registry.schemas))
+
+    def test_get(self):
+        registry = InMemoryAvroSchemaRegistry()
+        fingerprint = registry.register(self.schema)
+        self.assertEqual(self.schema, registry.get(fingerprint))
+
+    def test_get_raises(self):
+        registry = InMemoryAvroSchemaRegistry()
+        with self.assertRaises(MinosProtocolException):
+            registry.get(56)
+
+    async def test_store(self):
+        registry = InMemoryAvroSchemaRegistry()
+        registry.register(self.schema)
+
+        await registry.store()
+
+        self.assertEqual(dict(), registry.pending)
+        self.assertEqual(1, len(registry.schemas))
+
+    async def test_load(self):
+        registry = InMemoryAvroSchemaRegistry()
+
+        await registry.load([56])
+
+        self.assertNotIn(56, registry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,18 @@
 import unittest
+from datetime import (
+    datetime,
+    timezone,
+)
+from uuid import (
+    uuid4,
+)
 
 from minos.common import (
     MinosJsonBinaryProtocol,
 )
+from tests.model_classes import (
+    Status,
+)
 
 
 class TestMinosJsonBinaryProtocol(unittest.TestCase):
@@ -14,6 +24,39 @@ class TestMinosJsonBinaryProtocol(unittest.TestCase):
         decoded = MinosJsonBinaryProtocol.decode(encoded)
         self.assertEqual(data, decoded)
 
+    def test_encode_uuid(self):
+        uuid = uuid4()
+        self.assertEqual(
+            {"uuid": str(uuid)}, MinosJsonBinaryProtocol.decode(MinosJsonBinaryProtocol.encode({"uuid": uuid}))
+        )
+
+    def test_encode_raises_non_str_key(self):
+        with self.assertRaises(TypeError):
+            MinosJsonBinaryProtocol.encode({uuid4(): 1})
+
+    def test_encode_datetime(self):
+        value = datetime(2021, 3, 12, 21, 32, 21, tzinfo=timezone.utc)
+        observed = MinosJsonBinaryProtocol.decode(MinosJsonBinaryProtocol.encode([value]))
+        self.assertEqual([value.isoformat()], observed)
+
+    def test_encode_enum(self):
+        self.assertEqual(["pending"], MinosJsonBinaryProtocol.decode(MinosJsonBinaryProtocol.encode([Status.PENDING])))
+
+    def test_encode_raises_bytes(self):
+        with self.assertRaises(TypeError):
+            MinosJsonBinaryProtocol.encode({"data": b"foo"})
+
+    def test_encode_raises_set(self):
+        with self.assertRaises(TypeError):
+            MinosJsonBinaryProtocol.encode({"data": {1}})
+
+    def test_encode_raises(self):
+        with self.assertRaises(TypeError):
+            MinosJsonBinaryProtocol.encode({"data": object()})
+
+    def test_decode_memoryview(self):
+        self.assertEqual({"foo": "bar"}, MinosJsonBinaryProtocol.decode(memoryview(b'{"foo": "bar"}')))
+
 
 if __name__ == "__main__":
     unittest.main()
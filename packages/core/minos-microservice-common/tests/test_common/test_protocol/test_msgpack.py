@@ -0,0 +1,97 @@
+import unittest
+
+from minos.common import (
+    InMemoryAvroSchemaRegistry,
+    MinosAvroProtocol,
+    MinosMsgPackProtocol,
+    MinosProtocolException,
+    build_schema_fingerprint,
+)
+
+
+class TestMinosMsgPackProtocol(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = {
+            "type": "record",
+            "name": "tests.model_classes.Foo",
+            "fields": [{"type": "bytes", "name": "foo"}],
+        }
+
+    def test_encode_decode(self):
+        serialized = MinosMsgPackProtocol.encode({"foo": b"bar"}, self.schema)
+        self.assertIsInstance(serialized, bytes)
+        self.assertEqual({"foo": b"bar"}, MinosMsgPackProtocol.decode(serialized))
+        self.assertEqual(self.schema, MinosMsgPackProtocol.decode_schema(serialized))
+
+    def test_encode_decode_without_schema(self):
+        data = {"foo": "bar", "one": 2, "arr": [{"a": b"b"}], "none": None}
+        serialized = MinosMsgPackProtocol.encode(data)
+        self.assertEqual(data, MinosMsgPackProtocol.decode(serialized))
+        self.assertIsNone(MinosMsgPackProtocol.decode_schema(serialized))
+
+    def test_decode_memoryview(self):
+        serialized = MinosMsgPackProtocol.encode({"foo": b"bar"}, self.schema)
+        self.assertEqual(
+            (self.schema, {"foo": b"bar"}), MinosMsgPackProtocol.decode_with_schema(memoryview(serialized))
+        )
+
+    def test_batch_mode(self):
+        serialized = MinosMsgPackProtocol.encode([{"foo": b"one"}, {"foo": b"two"}], self.schema, batch_mode=True)
+        self.assertEqual([{"foo": b"one"}, {"foo": b"two"}], MinosMsgPackProtocol.decode(serialized, batch_mode=True))
+
+    def test_batch_mode_raises(self):
+        serialized = MinosMsgPackProtocol.encode([{"foo": b"one"}, {"foo": b"two"}], self.schema, batch_mode=True)
+        with self.assertRaises(MinosProtocolException):
+            MinosMsgPackProtocol.decode(serialized)
+
+    def test_schemaless(self):
+        registry = InMemoryAvroSchemaRegistry()
+        serialized = MinosMsgPackProtocol.encode(
+            {"foo": b"bar"}, self.schema, schemaless=True, schema_registry=registry
+        )
+
+        self.assertLess(len(serialized), len(MinosMsgPackProtocol.encode({"foo": b"bar"}, self.schema)))
+        self.assertEqual(
+            (self.schema, {"foo": b"bar"}),
+            MinosMsgPackProtocol.decode_with_schema(serialized, schema_registry=registry),
+        )
+
+    def test_schemaless_default_registry(self):
+        serialized = MinosMsgPackProtocol.encode({"foo": b"bar"}, self.schema, schemaless=True)
+        self.assertIn(build_schema_fingerprint(self.schema), MinosAvroProtocol.default_schema_registry)
+        self.assertEqual({"foo": b"bar"}, MinosMsgPackProtocol.decode(serialized))
+
+    def test_schemaless_unknown_fingerprint_raises(self):
+        serialized = MinosMsgPackProtocol.encode(
+            {"foo": b"bar"}, self.schema, schemaless=True, schema_registry=InMemoryAvroSchemaRegistry()
+        )
+        with self.assertRaises(MinosProtocolException):
+            MinosMsgPackProtocol.decode(serialized, schema_registry=InMemoryAvroSchemaRegistry())
+
+    def test_encode_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosMsgPackProtocol.encode({"foo": object()}, self.schema)
+
+    def test_decode_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosMsgPackProtocol.decode(MinosAvroProtocol.encode("one", "string"))
+
+        with self.assertRaises(MinosProtocolException):
+            MinosMsgPackProtocol.decode_schema(bytes())
+
+    def test_decode_many_shares_schema(self):
+        serialized = [MinosMsgPackProtocol.encode({"foo": bytes([i])}, self.schema) for i in range(3)]
+
+        observed = MinosMsgPackProtocol.decode_many(serialized)
+
+        self.assertEqual([{"foo": b"\x00"}, {"foo": b"\x01"}, {"foo": b"\x02"}], [value for _, value in observed])
+        self.assertTrue(all(observed[0][0] is schema for schema, _ in observed))
+
+    def test_is_encoded(self):
+        self.assertTrue(MinosMsgPackProtocol.is_encoded(MinosMsgPackProtocol.encode(1, "int")))
+        self.assertFalse(MinosMsgPackProtocol.is_encoded(MinosAvroProtocol.encode(1, "int")))
+        self.assertFalse(MinosMsgPackProtocol.is_encoded(bytes()))
+
+
+if __name__ == "__main__":
+    unittest.main()
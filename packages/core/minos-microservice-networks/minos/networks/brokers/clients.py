@@ -152,7 +152,7 @@ class BrokerClient(SetupMixin):
             )
 
         for message in messages:
-            logger.info(f"Dispatching '{message!s}'...")
+            logger.info("Dispatching '%s'...", message)
             yield message
 
     async def _get_many(self, count, *args, **kwargs) -> list[BrokerMessage]:
@@ -27,7 +27,7 @@ class BrokerQueue(ABC, BuildableMixin):
 
     async def enqueue(self, message: BrokerMessage) -> None:
         """Enqueue method."""
-        logger.debug(f"Enqueuing {message!r} message...")
+        logger.debug("Enqueuing %r message...", message)
         await self._enqueue(message)
 
     @abstractmethod
@@ -45,7 +45,7 @@ class BrokerQueue(ABC, BuildableMixin):
     async def dequeue(self) -> BrokerMessage:
         """Dequeue method."""
         message = await self._dequeue()
-        logger.debug(f"Dequeuing {message!r} message...")
+        logger.debug("Dequeuing %r message...", message)
         return message
 
     @abstractmethod
@@ -28,10 +28,16 @@ from cached_property import (
 )
 
 from minos.common import (
+    IS_TRUSTED_DECODING_CONTEXT_VAR,
+    AvroSchemaRegistry,
     Builder,
+    ComposedDatabaseOperation,
     Config,
+    DatabaseAvroSchemaRegistry,
     DatabaseClient,
     DatabaseMixin,
+    MinosAvroProtocol,
+    SetupMixin,
 )
 
 from ....messages import (
@@ -65,6 +71,8 @@ class DatabaseBrokerQueue(
         *args,
         retry: Optional[int] = None,
         records: Optional[int] = None,
+        schemaless: Optional[bool] = None,
+        schema_registry: Optional[AvroSchemaRegistry] = None,
         database_key: Optional[tuple[str]] = None,
         **kwargs,
     ):
@@ -76,9 +84,15 @@ class DatabaseBrokerQueue(
             retry = 2
         if records is None:
             records = 1000
+        if schemaless is None:
+            schemaless = False
+        if schemaless and schema_registry is None:
+            schema_registry = DatabaseAvroSchemaRegistry(database_pool=self.database_pool)
 
         self._retry = retry
         self._records = records
+        self._schemaless = schemaless
+        self._schema_registry = schema_registry
 
         self._queue = PriorityQueue(maxsize=records)
 
@@ -101,6 +115,22 @@ class DatabaseBrokerQueue(
         """
         return self._records
 
+    @property
+    def schemaless(self) -> bool:
+        """Get the schemaless value.
+
+        :return: ``True`` if the messages are stored without embedding their avro schema or ``False`` otherwise.
+        """
+        return self._schemaless
+
+    @property
+    def schema_registry(self) -> Optional[AvroSchemaRegistry]:
+        """Get the schema registry used to resolve the schemas of the stored messages.
+
+        :return: An ``AvroSchemaRegistry`` instance or ``None``.
+        """
+        return self._schema_registry
+
     @classmethod
     def _from_config(cls, config: Config, **kwargs) -> DatabaseBrokerQueue:
         broker_interface = config.get_interface_by_name("broker")
@@ -111,12 +141,16 @@ class DatabaseBrokerQueue(
 
     async def _setup(self) -> None:
         await super()._setup()
+        if isinstance(self._schema_registry, SetupMixin):
+            await self._schema_registry.setup()
         await self._create_table()
         await self._start_run()
 
     async def _destroy(self) -> None:
         await self._stop_run()
         await self._flush_queue()
+        if isinstance(self._schema_registry, SetupMixin):
+            await self._schema_registry.destroy()
         await super()._destroy()
 
     async def _create_table(self) -> None:
@@ -137,20 +171,33 @@ class DatabaseBrokerQueue(
                 await wait_for(task, 0.5)
 
     async def _flush_queue(self):
+        operations = list()
         while True:
             try:
                 entry = self._queue.get_nowait()
             except QueueEmpty:
                 break
-            operation = self.database_operation_factory.build_mark_processed(entry.id_)
-            await self.execute_on_database(operation)
+            operations.append(self.database_operation_factory.build_mark_processed(entry.id_))
             self._queue.task_done()
 
+        if operations:
+            await self.execute_on_database(ComposedDatabaseOperation(operations))
+
     async def _enqueue(self, message: BrokerMessage) -> None:
-        operation = self.database_operation_factory.build_submit(message.topic, message.avro_bytes)
+        operation = self.database_operation_factory.build_submit(message.topic, await self._encode(message))
         await self.execute_on_database(operation)
         await self._notify_enqueued(message)
 
+    async def _encode(self, message: BrokerMessage) -> bytes:
+        if not self._schemaless:
+            return message.avro_bytes
+
+        data = MinosAvroProtocol.encode(
+            message.avro_data, message.avro_schema, schemaless=True, schema_registry=self._schema_registry
+        )
+        await self._schema_registry.store()
+        return data
+
     # noinspection PyUnusedLocal
     async def _notify_enqueued(self, message: BrokerMessage) -> None:
         self._enqueued_event.set()
@@ -207,15 +254,44 @@ class DatabaseBrokerQueue(
             if not len(rows):
                 return
 
-            entries = [_Entry(*row) for row in rows]
+            entries = [_Entry(*row, schema_registry=self._schema_registry) for row in rows]
 
             ids = tuple(entry.id_ for entry in entries)
             operation = self.database_operation_factory.build_mark_processing(ids)
             await client.execute(operation)
 
+        await self._load_schemas(entries)
+        self._decode_entries(entries)
+
         for entry in entries:
             await self._queue.put(entry)
 
+    async def _load_schemas(self, entries: list[_Entry]) -> None:
+        if self._schema_registry is None:
+            return
+
+        fingerprints = set()
+        for entry in entries:
+            if (fingerprint := MinosAvroProtocol.decode_fingerprint(entry.data_bytes)) is not None:
+                fingerprints.add(fingerprint)
+
+        await self._schema_registry.load(fingerprints)
+
+    def _decode_entries(self, entries: list[_Entry]) -> None:
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            messages = BrokerMessage.from_avro_bytes_many(
+                (entry.data_bytes for entry in entries), schema_registry=self._schema_registry
+            )
+        except Exception as exc:
+            logger.debug("The entries could not be decoded together (they will be decoded one by one): %r", exc)
+            return
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
+
+        for entry, message in zip(entries, messages):
+            entry.data = message
+
     async def _dequeue_rows(self, client: DatabaseClient) -> list[Any]:
         operation = self.database_operation_factory.build_query(self._retry, self._records)
         await client.execute(operation)
@@ -223,17 +299,24 @@ class DatabaseBrokerQueue(
 
 
 class _Entry:
-    def __init__(self, id_: int, data_bytes: bytes):
+    def __init__(self, id_: int, data_bytes: bytes, schema_registry: Optional[AvroSchemaRegistry] = None):
         self.id_ = id_
         self.data_bytes = data_bytes
+        self.schema_registry = schema_registry
 
     @cached_property
     def data(self) -> BrokerMessage:
         """Get the data.
 
+        The stored data is trusted, so the fields of the message are checked lazily.
+
         :return: A ``Model`` inherited instance.
         """
-        return BrokerMessage.from_avro_bytes(self.data_bytes)
+        token = IS_TRUSTED_DECODING_CONTEXT_VAR.set(True)
+        try:
+            return BrokerMessage.from_avro_bytes(self.data_bytes, schema_registry=self.schema_registry)
+        finally:
+            IS_TRUSTED_DECODING_CONTEXT_VAR.reset(token)
 
     def __lt__(self, other: Any) -> bool:
         # noinspection PyBroadException
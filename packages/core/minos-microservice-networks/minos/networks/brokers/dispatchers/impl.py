@@ -138,7 +138,7 @@ class BrokerDispatcher(SetupMixin):
 
         @wraps(fn)
         async def _wrapper(raw: BrokerMessage) -> BrokerMessageV1Payload:
-            logger.info(f"Dispatching '{raw!s}'...")
+            logger.info("Dispatching '%s'...", raw)
 
             request = BrokerRequest(raw)
             user_token = REQUEST_USER_CONTEXT_VAR.set(request.user)
@@ -182,5 +182,5 @@ class BrokerDispatcher(SetupMixin):
 
         action = self._actions[topic]
 
-        logger.debug(f"Loaded {action!r} action!")
+        logger.debug("Loaded %r action!", action)
         return action
@@ -21,6 +21,7 @@ from minos.common import (
     Builder,
     Config,
     Injectable,
+    MinosBinaryProtocol,
     MinosConfigException,
 )
 
@@ -41,13 +42,25 @@ logger = logging.getLogger(__name__)
 class BrokerPublisher(ABC, BuildableMixin):
     """Broker Publisher class."""
 
+    def __init__(self, *args, protocol: Optional[type[MinosBinaryProtocol]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._protocol = protocol
+
+    @property
+    def protocol(self) -> Optional[type[MinosBinaryProtocol]]:
+        """Get the protocol used to encode the messages.
+
+        :return: A ``MinosBinaryProtocol`` subclass or ``None`` if the default (``avro``) one is used.
+        """
+        return self._protocol
+
     async def send(self, message: BrokerMessage) -> None:
         """Send a message.
 
         :param message: The message to be sent.
         :return: This method does not return anything.
         """
-        logger.debug(f"Sending {message!r} message...")
+        logger.debug("Sending %r message...", message)
         await self._send(message)
 
     @abstractmethod
@@ -114,6 +127,9 @@ class BrokerPublisherBuilder(Builder[BrokerPublisher], Generic[BrokerPublisherCl
         if "queue" in broker_publisher_config:
             self.with_queue(broker_publisher_config["queue"])
 
+        if "protocol" in broker_publisher_config:
+            self.kwargs["protocol"] = broker_publisher_config["protocol"]
+
     def with_queue(self, queue: Union[type[BrokerPublisherQueue], Builder[BrokerPublisherQueue]]):
         """Set the queue builder.
 
@@ -76,7 +76,7 @@ class BrokerSubscriber(ABC, BuildableMixin):
         :return: A ``BrokerMessage`` instance.
         """
         message = await self._receive()
-        logger.debug(f"Receiving {message!r} message...")
+        logger.debug("Receiving %r message...", message)
         return message
 
     @abstractmethod
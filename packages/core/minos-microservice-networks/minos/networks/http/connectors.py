@@ -151,7 +151,7 @@ class HttpConnector(ABC, SetupMixin, Generic[RawRequest, RawResponse]):
         @wraps(callback)
         async def _wrapper(raw: RawRequest) -> RawResponse:
             async with self._semaphore:
-                logger.info(f"Dispatching '{raw!s}'...")
+                logger.info("Dispatching '%s'...", raw)
 
                 request = await self._build_request(raw)
                 token = REQUEST_USER_CONTEXT_VAR.set(request.user)
@@ -162,7 +162,8 @@ class HttpConnector(ABC, SetupMixin, Generic[RawRequest, RawResponse]):
                     if isawaitable(response):
                         response = await response
 
-                    return await self._build_response(response)
+                    raw_response = await self._build_response(response)
+                    return await self._send_response(raw, raw_response)
 
                 except ResponseException as exc:
                     tb = traceback.format_exc()
@@ -189,6 +190,12 @@ class HttpConnector(ABC, SetupMixin, Generic[RawRequest, RawResponse]):
     async def _build_error_response(self, message: str, status: int) -> RawResponse:
         raise NotImplementedError
 
+    # noinspection PyUnusedLocal
+    async def _send_response(self, request: RawRequest, response: RawResponse) -> RawResponse:
+        # The content that must be written while the request is being dispatched (as the streamed one) is sent here, so
+        # that it is limited by the semaphore and its errors are handled as the callback ones.
+        return response
+
     @property
     def host(self) -> str:
         """Get the host.
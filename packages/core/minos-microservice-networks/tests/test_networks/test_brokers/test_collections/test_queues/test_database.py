@@ -12,13 +12,17 @@ from unittest.mock import (
 )
 
 from minos.common import (
+    DatabaseAvroSchemaRegistry,
     DatabaseMixin,
+    InMemoryAvroSchemaRegistry,
+    MinosAvroProtocol,
 )
 from minos.common.testing import (
     DatabaseMinosTestCase,
     MockedDatabaseClient,
 )
 from minos.networks import (
+    BrokerMessage,
     BrokerMessageV1,
     BrokerMessageV1Payload,
     BrokerQueue,
@@ -47,6 +51,14 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
         self.assertEqual(self.operation_factory, queue.database_operation_factory)
         self.assertEqual(2, queue.retry)
         self.assertEqual(1000, queue.records)
+        self.assertFalse(queue.schemaless)
+        self.assertIsNone(queue.schema_registry)
+
+    def test_constructor_schemaless(self):
+        queue = DatabaseBrokerQueue(schemaless=True, operation_factory=self.operation_factory)
+        self.assertTrue(queue.schemaless)
+        self.assertIsInstance(queue.schema_registry, DatabaseAvroSchemaRegistry)
+        self.assertEqual(queue.database_pool, queue.schema_registry.database_pool)
 
     async def test_operation_factory(self):
         queue = DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory)
@@ -68,6 +80,64 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
                 await queue.enqueue(message)
                 await sleep(0.5)  # To give time to consume the message from db.
 
+    async def test_enqueue_schemaless(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        registry = InMemoryAvroSchemaRegistry()
+
+        with patch.object(
+            self.operation_factory, "build_submit", wraps=self.operation_factory.build_submit
+        ) as submit_mock, patch.object(MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator([(0,)])):
+            async with DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, schemaless=True, schema_registry=registry
+            ) as queue:
+                await queue.enqueue(message)
+
+        data = submit_mock.call_args.args[1]
+        self.assertIn(MinosAvroProtocol.decode_fingerprint(data), registry)
+        self.assertLess(len(data), len(message.avro_bytes))
+        self.assertEqual(dict(), registry.pending)
+
+    async def test_dequeue_schemaless(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+        registry = InMemoryAvroSchemaRegistry()
+        rows = [
+            (i, MinosAvroProtocol.encode(m.avro_data, m.avro_schema, schemaless=True, schema_registry=registry))
+            for i, m in enumerate(messages, start=1)
+        ]
+
+        with patch.object(MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator(rows)):
+            async with DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, schemaless=True, schema_registry=registry
+            ) as queue:
+                queue._get_count = AsyncMock(side_effect=[2, 0])
+                with patch.object(registry, "load", wraps=registry.load) as load_mock:
+                    observed = [await queue.dequeue(), await queue.dequeue()]
+
+        self.assertEqual(messages, observed)
+        self.assertEqual(1, load_mock.call_count)
+
+    async def test_dequeue_decoded_together(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+        rows = [(i, m.avro_bytes) for i, m in enumerate(messages, start=1)]
+
+        with patch.object(MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator(rows)):
+            async with DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory) as queue:
+                queue._get_count = AsyncMock(side_effect=[2, 0])
+                with patch.object(
+                    BrokerMessage, "from_avro_bytes_many", wraps=BrokerMessage.from_avro_bytes_many
+                ) as many_mock, patch.object(BrokerMessage, "from_avro_bytes") as single_mock:
+                    observed = [await queue.dequeue(), await queue.dequeue()]
+
+        self.assertEqual(messages, observed)
+        self.assertEqual(1, many_mock.call_count)
+        self.assertEqual(0, single_mock.call_count)
+
     async def test_aiter(self):
         messages = [
             BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
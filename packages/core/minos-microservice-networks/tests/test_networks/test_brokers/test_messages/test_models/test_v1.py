@@ -1,8 +1,5 @@
 import unittest
 import warnings
-from unittest.mock import (
-    patch,
-)
 from uuid import (
     UUID,
     uuid4,
@@ -210,7 +207,7 @@ class TestBrokerMessageV1(unittest.TestCase):
                                     "items": {
                                         "fields": [{"name": "data", "type": "string"}],
                                         "name": "FakeModel",
-                                        "namespace": "tests.utils.hello",
+                                        "namespace": "tests.utils.s2",
                                         "type": "record",
                                     },
                                     "type": "array",
@@ -226,18 +223,17 @@ class TestBrokerMessageV1(unittest.TestCase):
                             {"name": "headers", "type": {"type": "map", "values": "string"}},
                         ],
                         "name": "BrokerMessageV1Payload",
-                        "namespace": "minos.networks.brokers.messages.models.v1.hello",
+                        "namespace": "minos.networks.brokers.messages.models.v1.s1",
                         "type": "record",
                     },
                 },
                 {"name": "version", "type": "int"},
             ],
             "name": "BrokerMessage",
-            "namespace": "minos.networks.brokers.messages.models.abc.hello",
+            "namespace": "minos.networks.brokers.messages.models.abc.s0",
             "type": "record",
         }
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            observed = BrokerMessageV1(self.topic, self.payload).avro_schema
+        observed = BrokerMessageV1(self.topic, self.payload).avro_schema
         self.assertEqual([schema], observed)
 
     def test_avro_data(self):
@@ -12,6 +12,7 @@ from minos.common import (
     Builder,
     Config,
     MinosConfigException,
+    MinosMsgPackProtocol,
     SetupMixin,
 )
 from minos.networks import (
@@ -52,6 +53,10 @@ class TestBrokerPublisher(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual([call(message)], mock.call_args_list)
 
+    def test_protocol(self):
+        self.assertEqual(None, _BrokerPublisher().protocol)
+        self.assertEqual(MinosMsgPackProtocol, _BrokerPublisher(protocol=MinosMsgPackProtocol).protocol)
+
 
 class TestBrokerPublisherBuilder(unittest.TestCase):
     def test_constructor(self):
@@ -100,6 +105,18 @@ class TestBrokerPublisherBuilder(unittest.TestCase):
         self.assertEqual(Builder().with_cls(InMemoryBrokerPublisherQueue), builder.queue_builder)
         self.assertEqual({}, builder.kwargs)
 
+    def test_with_config_with_protocol(self):
+        config = Config(CONFIG_FILE_PATH)
+
+        mock = MagicMock(
+            return_value={"publisher": {"queue": InMemoryBrokerPublisherQueue, "protocol": MinosMsgPackProtocol}}
+        )
+        config.get_interface_by_name = mock
+
+        builder = BrokerPublisherBuilder().with_config(config)
+        self.assertEqual(Builder().with_cls(InMemoryBrokerPublisherQueue), builder.queue_builder)
+        self.assertEqual({"protocol": MinosMsgPackProtocol}, builder.kwargs)
+
     def test_with_queue_with_config(self):
         config = Config(CONFIG_FILE_PATH)
 
@@ -143,6 +160,15 @@ class TestBrokerPublisherBuilder(unittest.TestCase):
         self.assertIsInstance(publisher.impl, InMemoryBrokerPublisher)
         self.assertIsInstance(publisher.queue, InMemoryBrokerPublisherQueue)
 
+    def test_build_with_queue_with_protocol(self):
+        builder = BrokerPublisherBuilder().with_cls(InMemoryBrokerPublisher).with_queue(InMemoryBrokerPublisherQueue)
+        builder.kwargs["protocol"] = MinosMsgPackProtocol
+
+        publisher = builder.build()
+
+        self.assertEqual(MinosMsgPackProtocol, publisher.protocol)
+        self.assertEqual(MinosMsgPackProtocol, publisher.impl.protocol)
+
 
 if __name__ == "__main__":
     unittest.main()
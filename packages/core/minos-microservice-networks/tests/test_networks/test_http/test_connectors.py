@@ -116,6 +116,17 @@ class TestHttpConnector(unittest.IsolatedAsyncioTestCase):
         self.assertEqual([call(HttpResponse("foo"))], self.response_mock.call_args_list)
         self.assertEqual([], self.error_response_mock.call_args_list)
 
+    async def test_get_callback_raises_send_response(self):
+        self.connector._send_response = AsyncMock(side_effect=ValueError)
+        handler = self.connector.adapt_callback(_Cls._fn)
+
+        with patch("traceback.format_exc", return_value="error"):
+            response = await handler("foo")
+        self.assertEqual("foobar", response)
+
+        self.assertEqual([call("foo", "bar")], self.connector._send_response.call_args_list)
+        self.assertEqual([call("error", 500)], self.error_response_mock.call_args_list)
+
     async def test_get_callback_raises_response(self):
         handler = self.connector.adapt_callback(_Cls._fn_raises_response)
 
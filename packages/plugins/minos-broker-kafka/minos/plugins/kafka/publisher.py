@@ -89,7 +89,7 @@ class KafkaBrokerPublisher(BrokerPublisher, KafkaCircuitBreakerMixin):
             await wait_for(self._client.stop(), 0.5)
 
     async def _send(self, message: BrokerMessage) -> None:
-        fn = partial(self.client.send_and_wait, message.topic, message.avro_bytes)
+        fn = partial(self.client.send_and_wait, message.topic, message.to_bytes(self.protocol))
         await self.with_circuit_breaker(fn)
 
     @property
@@ -7,6 +7,10 @@ from asyncio import (
     TimeoutError,
     wait_for,
 )
+from collections import (
+    defaultdict,
+    deque,
+)
 from collections.abc import (
     Iterable,
 )
@@ -18,11 +22,17 @@ from functools import (
 )
 from typing import (
     Optional,
+    Union,
 )
 
 from aiokafka import (
     AIOKafkaConsumer,
+    ConsumerRecord,
     ConsumerStoppedError,
+    TopicPartition,
+)
+from aiokafka.errors import (
+    KafkaError,
 )
 from cached_property import (
     cached_property,
@@ -37,6 +47,9 @@ from kafka.errors import (
     TopicAlreadyExistsError,
 )
 
+from minos.common import (
+    MinosAvroProtocol,
+)
 from minos.networks import (
     BrokerMessage,
     BrokerSubscriber,
@@ -52,7 +65,15 @@ logger = logging.getLogger(__name__)
 
 
 class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
-    """Kafka Broker Subscriber class."""
+    """Kafka Broker Subscriber class.
+
+    The records are fetched in batches of up to ``max_records`` and buffered until they are received. The offsets are
+    committed (when a ``group_id`` is set) only up to the already received records, so the buffered ones are fetched
+    again if the subscriber stops unexpectedly.
+
+    The records that cannot be decoded raise an exception when they are received, unless ``skip_undecodable`` is set,
+    in which case they are logged and skipped.
+    """
 
     def __init__(
         self,
@@ -61,6 +82,8 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
         port: Optional[int] = None,
         group_id: Optional[str] = None,
         remove_topics_on_destroy: bool = False,
+        max_records: Optional[int] = None,
+        skip_undecodable: bool = False,
         **kwargs,
     ):
         super().__init__(topics, **kwargs)
@@ -70,11 +93,19 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
         if port is None:
             port = 9092
 
+        if max_records is None:
+            max_records = 500
+
         self._host = host
         self._port = port
         self._group_id = group_id
 
         self._remove_topics_on_destroy = remove_topics_on_destroy
+        self._max_records = max_records
+        self._skip_undecodable = skip_undecodable
+
+        self._buffer: deque[tuple[TopicPartition, int, Union[BrokerMessage, Exception]]] = deque()
+        self._received: dict[TopicPartition, int] = dict()
 
     @property
     def host(self) -> str:
@@ -108,12 +139,30 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
         """
         return self._remove_topics_on_destroy
 
+    @property
+    def max_records(self) -> int:
+        """The max number of records to be fetched from kafka at once.
+
+        :return: An ``int`` value.
+        """
+        return self._max_records
+
+    @property
+    def skip_undecodable(self) -> bool:
+        """Flag to check if the records that cannot be decoded are skipped instead of raising an exception.
+
+        :return: A ``bool`` value.
+        """
+        return self._skip_undecodable
+
     async def _setup(self) -> None:
         await super()._setup()
         await self._create_topics()
         await self._start_client()
 
     async def _destroy(self) -> None:
+        await self._commit()
+        self._buffer.clear()
         await self._stop_client()
         await self._delete_topics()
         await self._stop_admin_client()
@@ -164,15 +213,84 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
         return KafkaAdminClient(bootstrap_servers=f"{self.host}:{self.port}")
 
     async def _receive(self) -> BrokerMessage:
-        try:
-            record = await self.client.getone()
-        except ConsumerStoppedError:
-            raise StopAsyncIteration
+        while not self._buffer:
+            await self._commit()
+            try:
+                records = await self.client.getmany(timeout_ms=1000, max_records=self._max_records)
+            except ConsumerStoppedError:
+                raise StopAsyncIteration
+
+            self._buffer.extend(self._decode_records(records))
 
-        bytes_ = record.value
-        message = BrokerMessage.from_avro_bytes(bytes_)
+        partition, offset, message = self._buffer.popleft()
+        self._received[partition] = offset + 1
+
+        if isinstance(message, Exception):
+            raise message
         return message
 
+    async def _commit(self) -> None:
+        if not self._received:
+            return
+
+        offsets, self._received = self._received, dict()
+        if self.group_id is None:
+            return
+
+        try:
+            await self.client.commit(offsets)
+        except KafkaError as exc:
+            logger.warning("The %r offsets could not be committed (they will be received again): %r", offsets, exc)
+
+    def _decode_records(
+        self, records: dict[TopicPartition, list[ConsumerRecord]]
+    ) -> list[tuple[TopicPartition, int, Union[BrokerMessage, Exception]]]:
+        entries = [
+            (partition, record) for partition, partition_records in records.items() for record in partition_records
+        ]
+
+        groups = defaultdict(list)
+        for index, (_, record) in enumerate(entries):
+            groups[MinosAvroProtocol.decode_fingerprint(record.value)].append(index)
+
+        messages = dict()
+        for indices in groups.values():
+            group = [entries[index] for index in indices]
+            messages.update(zip(indices, self._decode_group(group)))
+
+        ans = list()
+        for index, (partition, record) in enumerate(entries):
+            if (message := messages[index]) is not None:
+                ans.append((partition, record.offset, message))
+        return ans
+
+    def _decode_group(
+        self, entries: list[tuple[TopicPartition, ConsumerRecord]]
+    ) -> list[Union[BrokerMessage, Exception, None]]:
+        try:
+            return BrokerMessage.from_bytes_many(record.value for _, record in entries)
+        except Exception as exc:
+            logger.debug("The records could not be decoded together (they will be decoded one by one): %r", exc)
+
+        return [self._decode_record(partition, record) for partition, record in entries]
+
+    def _decode_record(
+        self, partition: TopicPartition, record: ConsumerRecord
+    ) -> Union[BrokerMessage, Exception, None]:
+        try:
+            return BrokerMessage.from_bytes(record.value)
+        except Exception as exc:
+            if not self._skip_undecodable:
+                return exc
+
+            logger.warning(
+                "The record %s at offset %s could not be decoded (it will be skipped): %r",
+                partition,
+                record.offset,
+                exc,
+            )
+            return None
+
     @cached_property
     def client(self) -> AIOKafkaConsumer:
         """Get the kafka consumer client.
@@ -184,6 +302,7 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
             bootstrap_servers=f"{self.host}:{self.port}",
             group_id=self.group_id,
             auto_offset_reset="earliest",
+            enable_auto_commit=False,
         )
 
 
@@ -12,6 +12,7 @@ from kafka.errors import (
 
 from minos.common import (
     Config,
+    MinosMsgPackProtocol,
 )
 from minos.networks import (
     BrokerMessage,
@@ -83,6 +84,18 @@ class TestKafkaBrokerPublisher(unittest.IsolatedAsyncioTestCase):
         self.assertEqual("foo", send_mock.call_args.args[0])
         self.assertEqual(message, BrokerMessage.from_avro_bytes(send_mock.call_args.args[1]))
 
+    async def test_send_with_protocol(self):
+        send_mock = AsyncMock()
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        async with KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH, protocol=MinosMsgPackProtocol) as publisher:
+            publisher.client.send_and_wait = send_mock
+            await publisher.send(message)
+
+        self.assertEqual(1, send_mock.call_count)
+        self.assertTrue(MinosMsgPackProtocol.is_encoded(send_mock.call_args.args[1]))
+        self.assertEqual(message, BrokerMessage.from_bytes(send_mock.call_args.args[1]))
+
     async def test_send_without_connection(self):
         async def _fn(*args, **kwargs):
             if publisher.is_circuit_breaker_recovering:
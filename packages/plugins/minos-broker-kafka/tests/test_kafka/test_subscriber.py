@@ -5,11 +5,13 @@ from collections import (
 from unittest.mock import (
     AsyncMock,
     MagicMock,
+    call,
 )
 
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerStoppedError,
+    TopicPartition,
 )
 from kafka import (
     KafkaAdminClient,
@@ -20,6 +22,8 @@ from kafka.errors import (
 
 from minos.common import (
     Config,
+    MinosMsgPackProtocol,
+    MinosProtocolException,
 )
 from minos.networks import (
     BrokerMessageV1,
@@ -34,7 +38,7 @@ from tests.utils import (
     CONFIG_FILE_PATH,
 )
 
-_ConsumerMessage = namedtuple("_ConsumerMessage", ["value"])
+_ConsumerMessage = namedtuple("_ConsumerMessage", ["value", "offset"], defaults=(0,))
 
 
 class TestKafkaBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
@@ -47,6 +51,16 @@ class TestKafkaBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
         self.assertEqual("localhost", subscriber.host)
         self.assertEqual(9092, subscriber.port)
         self.assertEqual(None, subscriber.group_id)
+        self.assertEqual(500, subscriber.max_records)
+        self.assertEqual(False, subscriber.skip_undecodable)
+
+    def test_constructor_max_records(self):
+        subscriber = KafkaBrokerSubscriber(["foo", "bar"], max_records=100)
+        self.assertEqual(100, subscriber.max_records)
+
+    def test_constructor_skip_undecodable(self):
+        subscriber = KafkaBrokerSubscriber(["foo", "bar"], skip_undecodable=True)
+        self.assertEqual(True, subscriber.skip_undecodable)
 
     async def test_from_config(self):
         config = Config(CONFIG_FILE_PATH)
@@ -195,16 +209,121 @@ class TestKafkaBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
         ]
 
         async with KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"}) as subscriber:
-            get_mock = AsyncMock(side_effect=[_ConsumerMessage(m.avro_bytes) for m in messages])
-            subscriber.client.getone = get_mock
+            get_mock = AsyncMock(side_effect=[dict(), {"foo": [_ConsumerMessage(m.avro_bytes) for m in messages]}])
+            subscriber.client.getmany = get_mock
+            subscriber.client.commit = AsyncMock()
 
             self.assertEqual(messages[0], await subscriber.receive())
             self.assertEqual(messages[1], await subscriber.receive())
 
+        self.assertEqual(2, get_mock.call_count)
+        self.assertEqual(call(timeout_ms=1000, max_records=500), get_mock.call_args)
+
+    async def test_receive_commits_received(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(value)) for value in range(3)]
+        partition = TopicPartition("foo", 0)
+        batches = [
+            {partition: [_ConsumerMessage(m.avro_bytes, offset) for offset, m in enumerate(messages[:2])]},
+            {partition: [_ConsumerMessage(messages[2].avro_bytes, 2)]},
+        ]
+
+        async with KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"}) as subscriber:
+            subscriber.client.getmany = AsyncMock(side_effect=batches)
+            commit_mock = AsyncMock()
+            subscriber.client.commit = commit_mock
+
+            self.assertEqual(messages[0], await subscriber.receive())
+            self.assertEqual(messages[1], await subscriber.receive())
+            self.assertEqual(0, commit_mock.call_count)
+
+            self.assertEqual(messages[2], await subscriber.receive())
+            self.assertEqual([call({partition: 2})], commit_mock.call_args_list)
+
+    async def test_receive_without_group_id_does_not_commit(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        records = {TopicPartition("foo", 0): [_ConsumerMessage(message.avro_bytes)]}
+
+        async with KafkaBrokerSubscriber.from_config(
+            CONFIG_FILE_PATH, topics={"foo", "bar"}, group_id=None
+        ) as subscriber:
+            subscriber.client.getmany = AsyncMock(side_effect=[records])
+            commit_mock = AsyncMock()
+            subscriber.client.commit = commit_mock
+
+            self.assertEqual(message, await subscriber.receive())
+
+        self.assertEqual(0, commit_mock.call_count)
+
+    async def test_receive_with_protocols(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+        raws = [messages[0].to_bytes(MinosMsgPackProtocol), messages[1].avro_bytes]
+
+        async with KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"}) as subscriber:
+            get_mock = AsyncMock(side_effect=[{"foo": [_ConsumerMessage(raw) for raw in raws]}])
+            subscriber.client.getmany = get_mock
+
+            self.assertEqual(messages[0], await subscriber.receive())
+            self.assertEqual(messages[1], await subscriber.receive())
+
+    async def test_receive_raises_undecodable(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+        raws = [messages[0].avro_bytes, b"invalid", messages[1].avro_bytes]
+        records = {TopicPartition("foo", 0): [_ConsumerMessage(raw, offset) for offset, raw in enumerate(raws)]}
+
+        async with KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"}) as subscriber:
+            subscriber.client.getmany = AsyncMock(side_effect=[records])
+            subscriber.client.commit = AsyncMock()
+
+            self.assertEqual(messages[0], await subscriber.receive())
+            with self.assertRaises(MinosProtocolException):
+                await subscriber.receive()
+            self.assertEqual(messages[1], await subscriber.receive())
+
+    async def test_receive_skips_undecodable_opt_in(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+        raws = [messages[0].avro_bytes, b"invalid", messages[1].avro_bytes]
+        records = {TopicPartition("foo", 0): [_ConsumerMessage(raw, offset) for offset, raw in enumerate(raws)]}
+
+        async with KafkaBrokerSubscriber.from_config(
+            CONFIG_FILE_PATH, topics={"foo", "bar"}, skip_undecodable=True
+        ) as subscriber:
+            subscriber.client.getmany = AsyncMock(side_effect=[records])
+            subscriber.client.commit = AsyncMock()
+
+            with self.assertLogs("minos.plugins.kafka.subscriber", "WARNING"):
+                self.assertEqual(messages[0], await subscriber.receive())
+            self.assertEqual(messages[1], await subscriber.receive())
+
+    async def test_destroy_commits_received(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(value)) for value in range(3)]
+        records = {
+            TopicPartition("foo", 0): [_ConsumerMessage(m.avro_bytes, offset) for offset, m in enumerate(messages)],
+            TopicPartition("foo", 1): [_ConsumerMessage(messages[0].avro_bytes, 56)],
+        }
+
+        subscriber = KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"})
+        async with subscriber:
+            subscriber.client.getmany = AsyncMock(side_effect=[records])
+            commit_mock = AsyncMock()
+            subscriber.client.commit = commit_mock
+
+            self.assertEqual(messages[0], await subscriber.receive())
+
+        self.assertEqual([call({TopicPartition("foo", 0): 1})], commit_mock.call_args_list)
+
     async def test_receive_stopped(self):
         async with KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"}) as subscriber:
             get_mock = AsyncMock(side_effect=ConsumerStoppedError)
-            subscriber.client.getone = get_mock
+            subscriber.client.getmany = get_mock
 
             with self.assertRaises(StopAsyncIteration):
                 await subscriber.receive()
@@ -67,7 +67,7 @@ class RabbitMQBrokerPublisher(BrokerPublisher):
         await super()._destroy()
 
     async def _send(self, message: BrokerMessage) -> None:
-        await self.channel.default_exchange.publish(Message(message.avro_bytes), routing_key=message.topic)
+        await self.channel.default_exchange.publish(Message(message.to_bytes(self.protocol)), routing_key=message.topic)
 
 
 class RabbitMQBrokerPublisherBuilder(BrokerPublisherBuilder[RabbitMQBrokerPublisher], RabbitMQBrokerBuilderMixin):
@@ -111,7 +111,7 @@ class RabbitMQBrokerSubscriber(BrokerSubscriber):
 
     async def _receive(self) -> BrokerMessage:
         bytes_ = await self._queue.get()
-        message = BrokerMessage.from_avro_bytes(bytes_)
+        message = BrokerMessage.from_bytes(bytes_)
         return message
 
 
@@ -5,8 +5,10 @@ from unittest.mock import (
 
 from minos.common import (
     Config,
+    MinosMsgPackProtocol,
 )
 from minos.networks import (
+    BrokerMessage,
     BrokerMessageV1,
     BrokerMessageV1Payload,
     BrokerPublisher,
@@ -49,6 +51,15 @@ class TestRabbitMQBrokerPublisher(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(3, mock.call_count)
 
+    async def test_send_with_protocol(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        async with RabbitMQBrokerPublisher.from_config(CONFIG_FILE_PATH, protocol=MinosMsgPackProtocol) as publisher:
+            with patch("aio_pika.Exchange.publish") as mock:
+                await publisher.send(message)
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(message, BrokerMessage.from_bytes(mock.call_args.args[0].body))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ from unittest.mock import (
 
 from minos.common import (
     Config,
+    MinosMsgPackProtocol,
     ModelType,
 )
 from minos.networks import (
@@ -55,6 +56,15 @@ class TestRabbitMQBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(_Foo("foobar"), observed)
 
+    async def test_receive_msgpack(self):
+        message = _ConsumerMessage(_Foo("foobar").to_bytes(MinosMsgPackProtocol))
+
+        async with RabbitMQBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo", "bar"}) as subscriber:
+            with patch("aio_pika.Queue.iterator", return_value=FakeAsyncIterator([message])):
+                observed = await subscriber.receive()
+
+        self.assertEqual(_Foo("foobar"), observed)
+
 
 class TestRabbitMQBrokerSubscriberBuilder(unittest.TestCase):
     def setUp(self) -> None:
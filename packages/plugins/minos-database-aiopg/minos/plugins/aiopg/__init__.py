@@ -8,10 +8,12 @@ from .clients import (
     AiopgDatabaseClient,
 )
 from .factories import (
+    AiopgAvroSchemaRegistryDatabaseOperationFactory,
     AiopgBrokerPublisherQueueDatabaseOperationFactory,
     AiopgBrokerQueueDatabaseOperationFactory,
     AiopgBrokerSubscriberDuplicateValidatorDatabaseOperationFactory,
     AiopgBrokerSubscriberQueueDatabaseOperationFactory,
+    AiopgEventCompressorDatabaseOperationFactory,
     AiopgEventDatabaseOperationFactory,
     AiopgLockDatabaseOperationFactory,
     AiopgManagementDatabaseOperationFactory,
@@ -22,3 +24,6 @@ from .factories import (
 from .operations import (
     AiopgDatabaseOperation,
 )
+from .statements import (
+    AiopgPreparedStatementCache,
+)
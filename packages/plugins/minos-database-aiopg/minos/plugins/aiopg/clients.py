@@ -5,9 +5,12 @@ from __future__ import (
 import logging
 from asyncio import (
     TimeoutError,
+    wait_for,
 )
 from collections.abc import (
     AsyncIterator,
+    Awaitable,
+    Callable,
     Iterable,
 )
 from functools import (
@@ -15,6 +18,7 @@ from functools import (
 )
 from typing import (
     Optional,
+    Union,
 )
 
 import aiopg
@@ -23,15 +27,22 @@ from aiopg import (
     Cursor,
 )
 from psycopg2 import (
+    DataError,
     IntegrityError,
+    NotSupportedError,
     OperationalError,
     ProgrammingError,
 )
+from psycopg2.sql import (
+    Composable,
+)
 
 from minos.common import (
     CircuitBreakerMixin,
+    ComposedDatabaseOperation,
     ConnectionException,
     DatabaseClient,
+    DatabaseOperation,
     IntegrityException,
     ProgrammingException,
 )
@@ -39,12 +50,28 @@ from minos.common import (
 from .operations import (
     AiopgDatabaseOperation,
 )
+from .statements import (
+    AiopgPreparedStatementCache,
+    build_statement_template,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
-    """Aiopg Database Client class."""
+    """Aiopg Database Client class.
+
+    The operations marked with ``prepare=True`` are executed as server-side prepared statements (``PREPARE`` once per
+    connection and query template, then ``EXECUTE``), so that their planning cost is only paid once.
+
+    The ``ComposedDatabaseOperation`` instances are pipelined: their operations are sent to the database as a single
+    multi-statement query (so with a single round trip), which is executed atomically. The composed operations that
+    cannot be pipelined (i.e. because they contain nested composed operations or require distinct locks) are executed
+    sequentially.
+
+    The transactions (``begin``, ``commit`` and ``rollback``) are explicitly opened on top of the autocommit
+    connection. While a transaction is open the failed operations are not retried, and the connection is not recreated.
+    """
 
     _connection: Optional[Connection]
     _cursor: Optional[Cursor]
@@ -59,6 +86,7 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
         circuit_breaker_exceptions: Iterable[type] = tuple(),
         connection_timeout: Optional[float] = None,
         cursor_timeout: Optional[float] = None,
+        statement_cache_size: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -80,6 +108,8 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
             connection_timeout = 1
         if cursor_timeout is None:
             cursor_timeout = 60
+        if statement_cache_size is None:
+            statement_cache_size = 128
 
         self._database = database
         self._host = host
@@ -93,6 +123,10 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
         self._connection = None
         self._cursor = None
 
+        self._statement_cache = AiopgPreparedStatementCache(statement_cache_size)
+
+        self._in_transaction = False
+
     async def _setup(self) -> None:
         await super()._setup()
         await self.recreate()
@@ -136,6 +170,10 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
             logger.debug(f"Destroyed {self.database!r} database connection identified by {id(self._connection)}!")
             self._connection = None
 
+        # The prepared statements only live within the connection that prepared them.
+        self._statement_cache.clear()
+        self._in_transaction = False
+
     async def is_connected(self) -> bool:
         """Check if the client is connected.
 
@@ -153,8 +191,45 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
         return not self._connection.closed
 
     async def _reset(self, **kwargs) -> None:
+        if self._in_transaction:
+            logger.warning(f"Rolling back the unfinished transaction of {self.database!r} database...")
+            await self._rollback()
         await self._destroy_cursor(**kwargs)
 
+    async def _begin(self) -> None:
+        await self._ensure_connected()
+        await self._execute_cursor(operation="BEGIN", parameters=None)
+        self._in_transaction = True
+
+    async def _commit(self) -> None:
+        try:
+            await self._execute_cursor(operation="COMMIT", parameters=None)
+        finally:
+            self._in_transaction = False
+
+    async def _rollback(self) -> None:
+        try:
+            if await self.is_connected():
+                await self._execute_cursor(operation="ROLLBACK", parameters=None)
+        finally:
+            self._in_transaction = False
+
+    async def _ensure_connected(self) -> None:
+        if await self.is_connected():
+            return
+
+        if self._in_transaction:
+            # A new connection would silently discard the operations already executed within the transaction.
+            raise ConnectionException("The database connection was lost within a transaction.")
+
+        await self.recreate()
+
+    async def _with_retries(self, fn: Callable[[], Awaitable[None]]) -> None:
+        if self._in_transaction:
+            # The failed operations cannot be retried, as the transaction has already been aborted.
+            return await fn()
+        return await self.with_circuit_breaker(fn)
+
     # noinspection PyUnusedLocal
     async def _fetch_all(self) -> AsyncIterator[tuple]:
         if self._cursor is None:
@@ -173,12 +248,123 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
         if not isinstance(operation, AiopgDatabaseOperation):
             raise ValueError(f"The operation must be a {AiopgDatabaseOperation!r} instance. Obtained: {operation!r}")
 
-        fn = partial(self._execute_cursor, operation=operation.query, parameters=operation.parameters)
-        await self.with_circuit_breaker(fn)
+        if operation.prepare and self._statement_cache.max_size > 0:
+            fn = partial(self._execute_prepared, operation=operation.query, parameters=operation.parameters)
+        else:
+            fn = partial(self._execute_cursor, operation=operation.query, parameters=operation.parameters)
+        await self._with_retries(fn)
+
+    async def _execute_composed(self, operation: ComposedDatabaseOperation) -> None:
+        operations = operation.operations
+        if not self._is_pipelinable(operations):
+            return await super()._execute_composed(operation)
+
+        if (lock := next((op.lock for op in operations if op.lock is not None), None)) is not None:
+            await self._create_lock(lock)
+
+        timeouts = [op.timeout for op in operations]
+        timeout = None if None in timeouts else sum(timeouts)
+
+        fn = partial(self._execute_pipeline, operations=operations)
+        await wait_for(self._with_retries(fn), timeout)
+
+    @staticmethod
+    def _is_pipelinable(operations: tuple[DatabaseOperation, ...]) -> bool:
+        if len(operations) < 2:
+            return False
+        if not all(isinstance(op, AiopgDatabaseOperation) for op in operations):
+            return False
+        return len({op.lock for op in operations if op.lock is not None}) < 2
+
+    async def _execute_pipeline(self, operations: Iterable[AiopgDatabaseOperation]) -> None:
+        await self._ensure_connected()
+
+        statements = list()
+        for op in operations:
+            operation, parameters = op.query, op.parameters
+            if op.prepare and self._statement_cache.max_size > 0:
+                # The statements are not prepared here, as they could depend on the previous ones of the pipeline.
+                operation, parameters = await self._build_prepared(operation, parameters, prepare=False)
+            statements.append((operation, parameters))
+
+        self._cursor = await self._connection.cursor(timeout=self._cursor_timeout)
+
+        query = b"\n".join(
+            self._cursor.mogrify(operation, parameters).rstrip().rstrip(b";") + b";"
+            for operation, parameters in statements
+        )
+        try:
+            # As the simple query protocol is used, the statements are executed within a single implicit transaction.
+            await self._cursor.execute(operation=query)
+        except OperationalError as exc:
+            raise ConnectionException(f"There was not possible to connect to the database: {exc!r}")
+        except IntegrityError as exc:
+            raise IntegrityException(f"The requested operation raised a integrity error: {exc!r}")
+
+    async def _execute_prepared(self, operation: Union[str, Composable], parameters: dict):
+        await self._ensure_connected()
+
+        operation, parameters = await self._build_prepared(operation, parameters)
+        await self._execute_cursor(operation=operation, parameters=parameters)
+
+    async def _build_prepared(
+        self, operation: Union[str, Composable], parameters: dict, prepare: bool = True
+    ) -> tuple[Union[str, Composable], dict]:
+        query = operation
+        if isinstance(query, Composable):
+            query = query.as_string(self._connection.raw)
+
+        built = build_statement_template(query)
+        if built is None or any(isinstance(parameters.get(name), (tuple, list)) for name in built[1]):
+            # The sequences are expanded on the client side, so they cannot be bound as a single statement parameter.
+            return operation, parameters
+        template, names = built
+
+        if not self._statement_cache.is_supported(template):
+            return operation, parameters
+
+        if (name := self._statement_cache.get(template)) is None:
+            if not prepare or (name := await self._prepare(template)) is None:
+                return operation, parameters
+
+        execution = f"EXECUTE {name}"
+        if names:
+            execution += f" ({', '.join(f'%({parameter})s' for parameter in names)})"
+
+        return execution, parameters
+
+    async def _prepare(self, template: str) -> Optional[str]:
+        name, evicted = self._statement_cache.add(template)
+
+        # A failed statement aborts the current transaction, so within a transaction the preparation is isolated into a
+        # savepoint (the prepared statements are not transactional, so they outlive the savepoint anyway).
+        savepoint = self._in_transaction
+
+        cursor = await self._connection.cursor(timeout=self._cursor_timeout)
+        try:
+            if savepoint:
+                await cursor.execute("SAVEPOINT minos_prepare")
+            if evicted is not None:
+                await cursor.execute(f"DEALLOCATE {evicted}")
+            await cursor.execute(f"PREPARE {name} AS {template}")
+            if savepoint:
+                await cursor.execute("RELEASE SAVEPOINT minos_prepare")
+        except (ProgrammingError, DataError, NotSupportedError) as exc:
+            if savepoint:
+                await cursor.execute("ROLLBACK TO SAVEPOINT minos_prepare")
+            logger.warning(f"The {template!r} query could not be prepared, so it will be executed directly: {exc!r}")
+            self._statement_cache.mark_unsupported(template)
+            return None
+        except OperationalError as exc:
+            self._statement_cache.discard(template)
+            raise ConnectionException(f"There was not possible to connect to the database: {exc!r}")
+        finally:
+            cursor.close()
+
+        return name
 
     async def _execute_cursor(self, operation: str, parameters: dict):
-        if not await self.is_connected():
-            await self.recreate()
+        await self._ensure_connected()
 
         self._cursor = await self._connection.cursor(timeout=self._cursor_timeout)
         try:
@@ -194,6 +380,14 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
                 self._cursor.close()
             self._cursor = None
 
+    @property
+    def statement_cache(self) -> AiopgPreparedStatementCache:
+        """Get the prepared statement cache, including its hit, miss and eviction counters.
+
+        :return: An ``AiopgPreparedStatementCache`` instance.
+        """
+        return self._statement_cache
+
     @property
     def cursor(self) -> Optional[Cursor]:
         """Get the cursor.
@@ -1,10 +1,12 @@
 from .aggregate import (
+    AiopgEventCompressorDatabaseOperationFactory,
     AiopgEventDatabaseOperationFactory,
     AiopgSnapshotDatabaseOperationFactory,
     AiopgSnapshotQueryDatabaseOperationBuilder,
     AiopgTransactionDatabaseOperationFactory,
 )
 from .common import (
+    AiopgAvroSchemaRegistryDatabaseOperationFactory,
     AiopgLockDatabaseOperationFactory,
     AiopgManagementDatabaseOperationFactory,
 )
@@ -1,3 +1,6 @@
+from .compressors import (
+    AiopgEventCompressorDatabaseOperationFactory,
+)
 from .events import (
     AiopgEventDatabaseOperationFactory,
 )
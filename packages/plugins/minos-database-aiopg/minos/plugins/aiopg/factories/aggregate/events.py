@@ -129,20 +129,25 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
             INSERT INTO {table_name} (id, action, uuid, name, version, data, created_at, transaction_uuid)
             VALUES (
                 default,
-                %(action)s,
-                CASE %(uuid)s WHEN uuid_nil() THEN uuid_generate_v4() ELSE %(uuid)s END,
-                %(name)s,
+                %(action)s::action_type,
+                CASE %(uuid)s::uuid WHEN uuid_nil() THEN uuid_generate_v4() ELSE %(uuid)s::uuid END,
+                %(name)s::text,
                 (
-                    SELECT (CASE WHEN %(version)s IS NULL THEN 1 + COALESCE(MAX(t2.version), 0) ELSE %(version)s END)
+                    SELECT (
+                        CASE WHEN %(version)s::int IS NULL
+                            THEN 1 + COALESCE(MAX(t2.version), 0)
+                            ELSE %(version)s::int
+                        END
+                    )
                     FROM (
                              SELECT DISTINCT ON (t1.uuid) t1.version
                              FROM ( {from_parts} ) AS t1
                              ORDER BY t1.uuid, t1.transaction_index DESC
                     ) AS t2
                 ),
-                %(data)s,
-                (CASE WHEN %(created_at)s IS NULL THEN NOW() ELSE %(created_at)s END),
-                %(transaction_uuid)s
+                %(data)s::bytea,
+                (CASE WHEN %(created_at)s::timestamptz IS NULL THEN NOW() ELSE %(created_at)s::timestamptz END),
+                %(transaction_uuid)s::uuid
             )
             RETURNING id, uuid, version, created_at;
             """
@@ -157,19 +162,101 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
             "transaction_uuid": transaction_uuid,
         }
 
-        from_sql, from_parameters = self._build_submit_from(transaction_uuids)
+        from_sql, from_parameters = self._build_submit_from(transaction_uuids, SQL("uuid = %(uuid)s::uuid"))
 
         query = insert_values.format(from_parts=from_sql, table_name=Identifier(self.build_table_name()))
         parameters = from_parameters | insert_parameters
 
-        return AiopgDatabaseOperation(query, parameters, lock)
+        return AiopgDatabaseOperation(query, parameters, lock, prepare=True)
 
-    def _build_submit_from(self, transaction_uuids: Iterable[UUID]) -> tuple[Composable, dict[str, Any]]:
+    def build_submit_many(
+        self, transaction_uuids: Iterable[UUID], transaction_uuid: UUID, entries: Iterable[dict[str, Any]]
+    ) -> DatabaseOperation:
+        """Build the database operation to submit a batch of rows into the event table.
+
+        The rows are inserted with a single statement that unnests a column array per field, so that the versions are
+        assigned (following the entries order) and the collisions detected as if they were submitted one by one. The
+        entries of the same identifier are expected to either set all their versions or none of them.
+
+        :param transaction_uuids: The sequence of nested transaction in on top of the current event's transaction.
+        :param transaction_uuid: The identifier of the transaction of the entries.
+        :param entries: The raw representation of the entries (containing the ``uuid``, ``action``, ``name``,
+            ``version``, ``data`` and ``created_at`` values).
+        :return: A ``DatabaseOperation`` instance.
+        """
+        insert_values = SQL(
+            """
+            WITH input AS (
+                SELECT
+                    t.position,
+                    t.action,
+                    CASE t.uuid WHEN uuid_nil() THEN uuid_generate_v4() ELSE t.uuid END AS uuid,
+                    t.name,
+                    t.version,
+                    t.data,
+                    COALESCE(t.created_at, NOW()) AS created_at
+                FROM unnest(
+                    %(actions)s::action_type[],
+                    %(uuids)s::uuid[],
+                    %(names)s::text[],
+                    %(versions)s::int[],
+                    %(data)s::bytea[],
+                    %(created_ats)s::timestamptz[]
+                ) WITH ORDINALITY AS t (action, uuid, name, version, data, created_at, position)
+            ), previous AS (
+                SELECT DISTINCT ON (t1.uuid) t1.uuid, t1.version
+                FROM ( {from_parts} ) AS t1
+                ORDER BY t1.uuid, t1.transaction_index DESC
+            ), inserted AS (
+                INSERT INTO {table_name} (action, uuid, name, version, data, created_at, transaction_uuid)
+                SELECT
+                    input.action,
+                    input.uuid,
+                    input.name,
+                    COALESCE(
+                        input.version,
+                        COALESCE(previous.version, 0) + ROW_NUMBER() OVER (
+                            PARTITION BY input.uuid ORDER BY input.position
+                        )
+                    ),
+                    input.data,
+                    input.created_at,
+                    %(transaction_uuid)s
+                FROM input LEFT JOIN previous ON previous.uuid = input.uuid
+                ORDER BY input.position
+                RETURNING id, uuid, version, created_at
+            )
+            SELECT id, uuid, version, created_at
+            FROM inserted
+            ORDER BY id;
+            """
+        )
+        entries = list(entries)
+        insert_parameters = {
+            "actions": [entry["action"] for entry in entries],
+            "uuids": [entry["uuid"] for entry in entries],
+            "names": [entry["name"] for entry in entries],
+            "versions": [entry["version"] for entry in entries],
+            "data": [entry["data"] for entry in entries],
+            "created_ats": [entry["created_at"] for entry in entries],
+            "transaction_uuid": transaction_uuid,
+        }
+
+        from_sql, from_parameters = self._build_submit_from(transaction_uuids, SQL("uuid = ANY(%(uuids)s::uuid[])"))
+
+        query = insert_values.format(from_parts=from_sql, table_name=Identifier(self.build_table_name()))
+        parameters = from_parameters | insert_parameters
+
+        return AiopgDatabaseOperation(query, parameters)
+
+    def _build_submit_from(
+        self, transaction_uuids: Iterable[UUID], uuid_condition: Composable
+    ) -> tuple[Composable, dict[str, Any]]:
         select_transaction = SQL(
             """
             SELECT {index} AS transaction_index, uuid, MAX(version) AS version
             FROM {table_name}
-            WHERE uuid = %(uuid)s AND transaction_uuid = {transaction_uuid}
+            WHERE {uuid_condition} AND transaction_uuid = {transaction_uuid}::uuid
             GROUP BY uuid
             """
         )
@@ -182,6 +269,7 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
             from_query_parts.append(
                 select_transaction.format(
                     index=Literal(index),
+                    uuid_condition=uuid_condition,
                     transaction_uuid=Placeholder(name),
                     table_name=Identifier(self.build_table_name()),
                 ),
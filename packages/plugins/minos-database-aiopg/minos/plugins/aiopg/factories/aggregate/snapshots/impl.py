@@ -107,6 +107,13 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
             {"transaction_uuids": tuple(transaction_uuids)},
         )
 
+    def build_delete_all(self) -> DatabaseOperation:
+        """Build the database operation to delete all the rows.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation(f"DELETE FROM {self.build_table_name()};")
+
     def build_submit(
         self,
         uuid: UUID,
@@ -161,6 +168,54 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
                 "updated_at": updated_at,
                 "transaction_uuid": transaction_uuid,
             },
+            prepare=True,
+        )
+
+    def build_submit_many(self, entries: Iterable[dict[str, Any]]) -> DatabaseOperation:
+        """Build the database operation to insert (or update if already exist) a batch of rows.
+
+        The rows are inserted with a single statement that unnests a column array per field.
+
+        :param entries: The raw representation of the entries (containing the ``uuid``, ``name``, ``version``,
+            ``schema``, ``data``, ``created_at``, ``updated_at`` and ``transaction_uuid`` values). Each
+            ``(uuid, transaction_uuid)`` pair must be unique within the batch.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        entries = list(entries)
+        return AiopgDatabaseOperation(
+            f"""
+            INSERT INTO {self.build_table_name()} (
+                uuid, name, version, schema, data, created_at, updated_at, transaction_uuid
+            )
+            SELECT *
+            FROM unnest(
+                %(uuids)s::uuid[],
+                %(names)s::text[],
+                %(versions)s::int[],
+                %(schemas)s::bytea[],
+                %(data)s::jsonb[],
+                %(created_ats)s::timestamptz[],
+                %(updated_ats)s::timestamptz[],
+                %(transaction_uuids)s::uuid[]
+            )
+            ON CONFLICT (uuid, transaction_uuid)
+            DO
+               UPDATE SET
+                    version = EXCLUDED.version,
+                    schema = EXCLUDED.schema,
+                    data = EXCLUDED.data,
+                    updated_at = EXCLUDED.updated_at;
+            """.strip(),
+            {
+                "uuids": [entry["uuid"] for entry in entries],
+                "names": [entry["name"] for entry in entries],
+                "versions": [entry["version"] for entry in entries],
+                "schemas": [entry["schema"] for entry in entries],
+                "data": [entry["data"] for entry in entries],
+                "created_ats": [entry["created_at"] for entry in entries],
+                "updated_ats": [entry["updated_at"] for entry in entries],
+                "transaction_uuids": [entry["transaction_uuid"] for entry in entries],
+            },
         )
 
     def build_query(
@@ -198,7 +253,7 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
         )
         query, parameters = builder.build()
 
-        return AiopgDatabaseOperation(query, parameters)
+        return AiopgDatabaseOperation(query, parameters, prepare=True)
 
     def build_submit_offset(self, value: int) -> DatabaseOperation:
         """Build the database operation to store the offset.
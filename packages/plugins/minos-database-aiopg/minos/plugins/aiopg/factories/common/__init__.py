@@ -4,3 +4,6 @@ from .locks import (
 from .managemens import (
     AiopgManagementDatabaseOperationFactory,
 )
+from .registries import (
+    AiopgAvroSchemaRegistryDatabaseOperationFactory,
+)
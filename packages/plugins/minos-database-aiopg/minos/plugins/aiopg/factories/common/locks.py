@@ -20,7 +20,9 @@ class AiopgLockDatabaseOperationFactory(LockDatabaseOperationFactory):
         :param hashed_key: The hashed key that identifies the lock.
         :return: A ``DatabaseOperation`` instance.
         """
-        return AiopgDatabaseOperation("select pg_advisory_lock(%(hashed_key)s)", {"hashed_key": hashed_key})
+        return AiopgDatabaseOperation(
+            "select pg_advisory_lock(%(hashed_key)s)", {"hashed_key": hashed_key}, prepare=True
+        )
 
     def build_release(self, hashed_key: int) -> DatabaseOperation:
         """Build the database operation to release the lock.
@@ -28,7 +30,9 @@ class AiopgLockDatabaseOperationFactory(LockDatabaseOperationFactory):
         :param hashed_key: The hashed key that identifies the lock.
         :return: A ``DatabaseOperation`` instance.
         """
-        return AiopgDatabaseOperation("select pg_advisory_unlock(%(hashed_key)s)", {"hashed_key": hashed_key})
+        return AiopgDatabaseOperation(
+            "select pg_advisory_unlock(%(hashed_key)s)", {"hashed_key": hashed_key}, prepare=True
+        )
 
 
 AiopgDatabaseClient.set_factory(LockDatabaseOperationFactory, AiopgLockDatabaseOperationFactory)
@@ -64,6 +64,7 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
                 "SET processing = FALSE, retry = retry + 1, updated_at = NOW() WHERE id = %(id)s"
             ),
             {"id": id_},
+            prepare=True,
         )
 
     def build_delete(self, id_: int) -> DatabaseOperation:
@@ -74,6 +75,7 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
         return AiopgDatabaseOperation(
             SQL(f"DELETE FROM {self.build_table_name()} WHERE id = %(id)s"),
             {"id": id_},
+            prepare=True,
         )
 
     def build_mark_processing(self, ids: Iterable[int]) -> DatabaseOperation:
@@ -97,6 +99,7 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
                 "WHERE NOT processing AND retry < %(retry)s FOR UPDATE SKIP LOCKED) s"
             ),
             {"retry": retry},
+            prepare=True,
         )
 
     def build_submit(self, topic: str, data: bytes) -> DatabaseOperation:
@@ -107,6 +110,7 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
         return AiopgDatabaseOperation(
             SQL(f"INSERT INTO {self.build_table_name()} (topic, data) VALUES (%(topic)s, %(data)s) RETURNING id"),
             {"topic": topic, "data": data},
+            prepare=True,
         )
 
     def build_query(self, retry: int, records: int, *args, **kwargs) -> DatabaseOperation:
@@ -128,4 +132,5 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
                 "retry": retry,
                 "records": records,
             },
+            prepare=True,
         )
@@ -15,9 +15,12 @@ from minos.common import (
 class AiopgDatabaseOperation(DatabaseOperation):
     """Aiopg Database Operation class."""
 
-    def __init__(self, query: Union[str, Composable], parameters: dict[str, Any] = None, *args, **kwargs):
+    def __init__(
+        self, query: Union[str, Composable], parameters: dict[str, Any] = None, *args, prepare: bool = False, **kwargs
+    ):
         super().__init__(*args, **kwargs)
         if parameters is None:
             parameters = dict()
         self.query = query
         self.parameters = parameters
+        self.prepare = prepare
@@ -0,0 +1,151 @@
+from __future__ import (
+    annotations,
+)
+
+import re
+from collections import (
+    OrderedDict,
+)
+from functools import (
+    lru_cache,
+)
+from typing import (
+    Optional,
+)
+
+_PLACEHOLDER_PATTERN = re.compile(r"%\((?P<name>[^)]+)\)s|%(?P<other>.)", re.DOTALL)
+
+
+class AiopgPreparedStatementCache:
+    """Aiopg Prepared Statement Cache class.
+
+    It maps the query templates (the queries in which the named placeholders have been replaced by positional ones) to
+    the names of the statements prepared on the current connection, evicting the least recently used ones when the
+    maximum size is reached.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._statements = OrderedDict()
+        self._unsupported = set()
+        self._counter = 0
+
+    def get(self, template: str) -> Optional[str]:
+        """Get the name of the statement prepared for the given template.
+
+        :param template: The query template.
+        :return: The statement name if it is already prepared or ``None`` otherwise.
+        """
+        name = self._statements.get(template)
+        if name is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._statements.move_to_end(template)
+        return name
+
+    def add(self, template: str) -> tuple[str, Optional[str]]:
+        """Register a new statement for the given template.
+
+        :param template: The query template.
+        :return: A tuple containing the new statement name and the name of the evicted statement (that must be
+            deallocated) or ``None`` if there was not any eviction.
+        """
+        self._counter += 1
+        name = f"minos_statement_{self._counter}"
+        self._statements[template] = name
+
+        evicted = None
+        if len(self._statements) > self.max_size:
+            _, evicted = self._statements.popitem(last=False)
+            self.evictions += 1
+
+        return name, evicted
+
+    def discard(self, template: str) -> None:
+        """Discard the statement of the given template.
+
+        :param template: The query template.
+        :return: This method does not return anything.
+        """
+        self._statements.pop(template, None)
+
+    def mark_unsupported(self, template: str) -> None:
+        """Mark the given template as not preparable, so that it is not tried to be prepared again.
+
+        :param template: The query template.
+        :return: This method does not return anything.
+        """
+        self.discard(template)
+        self._unsupported.add(template)
+
+    def is_supported(self, template: str) -> bool:
+        """Check if the given template can be prepared.
+
+        :param template: The query template.
+        :return: ``True`` if it can be prepared or ``False`` otherwise.
+        """
+        return template not in self._unsupported
+
+    def clear(self) -> None:
+        """Clear the prepared statements (i.e. because the connection has been closed).
+
+        :return: This method does not return anything.
+        """
+        self._statements.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the hit rate of the cache.
+
+        :return: A ``float`` value between ``0`` and ``1``.
+        """
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def __contains__(self, template: str) -> bool:
+        return template in self._statements
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(size={len(self)}, max_size={self.max_size}, hits={self.hits}, "
+            f"misses={self.misses}, evictions={self.evictions})"
+        )
+
+
+@lru_cache(maxsize=1024)
+def build_statement_template(query: str) -> Optional[tuple[str, tuple[str, ...]]]:
+    """Build the prepared statement template of the given query.
+
+    :param query: The query, containing ``%(name)s`` placeholders.
+    :return: A tuple containing the template (with ``$n`` positional placeholders) and the placeholder names (following
+        the positional order), or ``None`` if the query contains unsupported placeholders.
+    """
+    names = dict()
+
+    def _replace(match: re.Match) -> str:
+        if (name := match["name"]) is not None:
+            if name not in names:
+                names[name] = len(names) + 1
+            return f"${names[name]}"
+        if match["other"] == "%":
+            return "%"
+        raise ValueError(f"Unsupported placeholder: {match[0]!r}")
+
+    try:
+        template = _PLACEHOLDER_PATTERN.sub(_replace, query)
+    except ValueError:
+        return None
+
+    return template, tuple(names)
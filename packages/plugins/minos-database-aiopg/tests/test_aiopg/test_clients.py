@@ -4,6 +4,9 @@ from unittest.mock import (
     call,
     patch,
 )
+from uuid import (
+    uuid4,
+)
 
 import aiopg
 from aiopg import (
@@ -15,8 +18,13 @@ from psycopg2 import (
     OperationalError,
     ProgrammingError,
 )
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+)
 
 from minos.common import (
+    ComposedDatabaseOperation,
     ConnectionException,
     DatabaseOperation,
     IntegrityException,
@@ -25,6 +33,7 @@ from minos.common import (
 from minos.plugins.aiopg import (
     AiopgDatabaseClient,
     AiopgDatabaseOperation,
+    AiopgPreparedStatementCache,
 )
 from tests.utils import (
     AiopgTestCase,
@@ -167,6 +176,299 @@ class TestAiopgDatabaseClient(AiopgTestCase):
             mock.call_args_list,
         )
 
+    def test_statement_cache(self):
+        client = AiopgDatabaseClient("foo")
+        self.assertIsInstance(client.statement_cache, AiopgPreparedStatementCache)
+        self.assertEqual(128, client.statement_cache.max_size)
+
+    def test_statement_cache_size(self):
+        client = AiopgDatabaseClient("foo", statement_cache_size=16)
+        self.assertEqual(16, client.statement_cache.max_size)
+
+    async def test_execute_prepared(self):
+        operation = AiopgDatabaseOperation("SELECT %(value)s::int + %(value)s::int", {"value": 3}, prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(operation)
+            self.assertEqual((6,), await client.fetch_one())
+
+            await client.execute(AiopgDatabaseOperation(operation.query, {"value": 5}, prepare=True))
+            self.assertEqual((10,), await client.fetch_one())
+
+            self.assertEqual(1, len(client.statement_cache))
+            self.assertEqual(1, client.statement_cache.hits)
+            self.assertEqual(1, client.statement_cache.misses)
+            self.assertEqual(0.5, client.statement_cache.hit_rate)
+
+    async def test_execute_prepared_composable(self):
+        query = SQL("SELECT COUNT(*) FROM {table} WHERE table_name = %(name)s").format(
+            table=Identifier("information_schema", "tables")
+        )
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            for _ in range(3):
+                await client.execute(AiopgDatabaseOperation(query, {"name": "foo"}, prepare=True))
+                self.assertEqual((0,), await client.fetch_one())
+
+            self.assertEqual(2, client.statement_cache.hits)
+
+    async def test_execute_prepared_same_template(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("SELECT %(one)s::int", {"one": 1}, prepare=True))
+            self.assertEqual((1,), await client.fetch_one())
+            await client.execute(AiopgDatabaseOperation("SELECT %(two)s::int", {"two": 2}, prepare=True))
+            self.assertEqual((2,), await client.fetch_one())
+
+            self.assertEqual(1, len(client.statement_cache))
+            self.assertEqual(1, client.statement_cache.hits)
+
+    async def test_execute_prepared_sequence_parameters(self):
+        operation = AiopgDatabaseOperation("SELECT 1 WHERE 1 IN %(values)s", {"values": (1, 2)}, prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(operation)
+            self.assertEqual((1,), await client.fetch_one())
+
+            self.assertEqual(0, len(client.statement_cache))
+
+    async def test_execute_prepared_unsupported(self):
+        operation = AiopgDatabaseOperation("CREATE TABLE IF NOT EXISTS foo (id INT)", prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(operation)
+            await client.execute(operation)
+
+            self.assertEqual(0, len(client.statement_cache))
+            self.assertFalse(client.statement_cache.is_supported(operation.query))
+
+            await client.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((0,), await client.fetch_one())
+
+    async def test_execute_prepared_unsupported_not_missed(self):
+        operation = AiopgDatabaseOperation("CREATE TABLE IF NOT EXISTS foo (id INT)", prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            for _ in range(3):
+                await client.execute(operation)
+
+            self.assertEqual(0, client.statement_cache.hits)
+            self.assertEqual(1, client.statement_cache.misses)
+
+    async def test_execute_prepared_in_transaction(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+            operation = AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (%(id)s)", {"id": 1}, prepare=True)
+
+            await client.begin()
+            await client.execute(operation)
+            await client.rollback()
+
+            await client.execute(operation)
+            await client.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((1,), await client.fetch_one())
+            self.assertEqual(1, client.statement_cache.hits)
+
+    async def test_execute_prepared_unsupported_in_transaction(self):
+        query = "SELECT CASE %(uuid)s WHEN '00000000-0000-0000-0000-000000000000'::uuid THEN 1 ELSE 2 END"
+        operation = AiopgDatabaseOperation(query, {"uuid": uuid4()}, prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+
+            await client.begin()
+            await client.execute(AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            await client.execute(operation)
+            self.assertEqual((2,), await client.fetch_one())
+            await client.commit()
+
+            self.assertEqual(0, len(client.statement_cache))
+
+            await client.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((1,), await client.fetch_one())
+
+    async def test_execute_prepared_eviction(self):
+        one = AiopgDatabaseOperation("SELECT %(value)s::int", {"value": 1}, prepare=True)
+        two = AiopgDatabaseOperation("SELECT %(value)s::text", {"value": "two"}, prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config, statement_cache_size=1) as client:
+            for operation, expected in [(one, (1,)), (two, ("two",)), (one, (1,))]:
+                await client.execute(operation)
+                self.assertEqual(expected, await client.fetch_one())
+
+            self.assertEqual(1, len(client.statement_cache))
+            self.assertEqual(2, client.statement_cache.evictions)
+
+    async def test_execute_prepared_recreate(self):
+        operation = AiopgDatabaseOperation("SELECT %(value)s::int", {"value": 1}, prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(operation)
+            await client.recreate()
+            self.assertEqual(0, len(client.statement_cache))
+
+            await client.execute(operation)
+            self.assertEqual((1,), await client.fetch_one())
+
+    async def test_execute_prepared_disabled(self):
+        operation = AiopgDatabaseOperation("SELECT %(value)s::int", {"value": 1}, prepare=True)
+        async with AiopgDatabaseClient.from_config(self.config, statement_cache_size=0) as client:
+            with patch.object(Cursor, "execute") as execute_mock:
+                await client.execute(operation)
+
+        self.assertEqual(
+            [call(operation=operation.query, parameters=operation.parameters)], execute_mock.call_args_list
+        )
+
+    async def test_execute_prepared_raises_integrity(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+            operation = AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (%(id)s)", {"id": 1}, prepare=True)
+            await client.execute(operation)
+            with self.assertRaises(IntegrityException):
+                await client.execute(operation)
+
+    async def test_execute_composed_pipelined(self):
+        prepared = AiopgDatabaseOperation("INSERT INTO foo (id, name) VALUES (%(id)s, '%%')", {"id": 2}, prepare=True)
+        composed = ComposedDatabaseOperation(
+            [
+                AiopgDatabaseOperation("INSERT INTO foo (id, name) VALUES (%(id)s, %(name)s)", {"id": 1, "name": "%"}),
+                prepared,
+                AiopgDatabaseOperation(SQL("SELECT id, name FROM {} ORDER BY id").format(Identifier("foo"))),
+            ]
+        )
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY, name TEXT)"))
+            await client.execute(prepared)
+            await client.execute(AiopgDatabaseOperation("DELETE FROM foo"))
+
+            with patch.object(Cursor, "execute", side_effect=Cursor.execute, autospec=True) as execute_mock:
+                await client.execute(composed)
+
+            self.assertEqual([(1, "%"), (2, "%")], [row async for row in client.fetch_all()])
+            self.assertEqual(1, client.statement_cache.hits)
+
+        self.assertEqual(1, execute_mock.call_count)
+
+    async def test_execute_composed_pipelined_not_prepared(self):
+        composed = ComposedDatabaseOperation(
+            [
+                AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"),
+                AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (%(id)s)", {"id": 1}, prepare=True),
+                AiopgDatabaseOperation("SELECT id FROM foo"),
+            ]
+        )
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(composed)
+            self.assertEqual([(1,)], [row async for row in client.fetch_all()])
+
+            self.assertEqual(0, len(client.statement_cache))
+            self.assertTrue(client.statement_cache.is_supported("INSERT INTO foo (id) VALUES ($1)"))
+
+    async def test_execute_composed_pipelined_atomic(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+            composed = ComposedDatabaseOperation(
+                [
+                    AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (%(id)s)", {"id": 1}),
+                    AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (%(id)s)", {"id": 1}),
+                ]
+            )
+            with self.assertRaises(IntegrityException):
+                await client.execute(composed)
+
+            await client.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((0,), await client.fetch_one())
+
+    async def test_execute_composed_pipelined_with_lock(self):
+        composed = ComposedDatabaseOperation(
+            [
+                AiopgDatabaseOperation("SELECT 1", lock="foo"),
+                AiopgDatabaseOperation("SELECT 2", lock="foo"),
+            ]
+        )
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            with patch.object(AiopgDatabaseClient, "_execute_pipeline") as pipeline_mock:
+                await client.execute(composed)
+            self.assertEqual("foo", client.lock.key)
+
+        self.assertEqual([call(operations=composed.operations)], pipeline_mock.call_args_list)
+
+    async def test_execute_composed_not_pipelined(self):
+        composed = ComposedDatabaseOperation(
+            [
+                AiopgDatabaseOperation("SELECT 1", lock="foo"),
+                AiopgDatabaseOperation("SELECT 2", lock="bar"),
+            ]
+        )
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            with patch.object(AiopgDatabaseClient, "_execute_pipeline") as pipeline_mock:
+                await client.execute(composed)
+            self.assertEqual((2,), await client.fetch_one())
+
+        self.assertEqual(0, pipeline_mock.call_count)
+
+    async def test_execute_composed_pipelined_raises_operational(self):
+        composed = ComposedDatabaseOperation([AiopgDatabaseOperation("SELECT 1"), AiopgDatabaseOperation("SELECT 2;")])
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            with patch.object(Cursor, "execute", side_effect=(OperationalError, None)) as mock:
+                await client.execute(composed)
+
+        self.assertEqual([call(operation=b"SELECT 1;\nSELECT 2;")] * 2, mock.call_args_list)
+
+    async def test_transaction_commit(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+
+            await client.begin()
+            await client.execute(AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            await client.execute(AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (2)"))
+
+            async with AiopgDatabaseClient.from_config(self.config) as other:
+                await other.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+                self.assertEqual((0,), await other.fetch_one())
+
+                await client.commit()
+
+                await other.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+                self.assertEqual((2,), await other.fetch_one())
+
+    async def test_transaction_rollback(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+
+            await client.begin()
+            await client.execute(AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            with self.assertRaises(IntegrityException):
+                await client.execute(AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            await client.rollback()
+
+            await client.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((0,), await client.fetch_one())
+
+    async def test_transaction_reset(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AiopgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+
+            await client.begin()
+            await client.execute(AiopgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            await client.reset()
+
+            await client.execute(AiopgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((0,), await client.fetch_one())
+
+    async def test_transaction_raises_disconnected(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.begin()
+
+            with patch.object(AiopgDatabaseClient, "is_connected", return_value=False):
+                with self.assertRaises(ConnectionException):
+                    await client.execute(self.operation)
+                await client.rollback()
+
+            await client.execute(self.operation)
+
+    async def test_transaction_raises_operational(self):
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.begin()
+            with patch.object(Cursor, "execute", side_effect=(OperationalError, None)) as mock:
+                with self.assertRaises(ConnectionException):
+                    await client.execute(self.operation)
+            await client.rollback()
+
+        self.assertEqual(1, mock.call_count)
+
     async def test_fetch_one(self):
         async with AiopgDatabaseClient.from_config(self.config) as client:
             await client.execute(self.operation)
@@ -0,0 +1,45 @@
+import unittest
+
+from minos.aggregate import (
+    EventCompressorDatabaseOperationFactory,
+)
+from minos.plugins.aiopg import (
+    AiopgDatabaseOperation,
+    AiopgEventCompressorDatabaseOperationFactory,
+)
+
+
+class TestAiopgEventCompressorDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AiopgEventCompressorDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(
+            issubclass(AiopgEventCompressorDatabaseOperationFactory, EventCompressorDatabaseOperationFactory)
+        )
+
+    def test_build_table_name(self):
+        self.assertEqual("aggregate_event_compression_dictionary", self.factory.build_table_name())
+
+    def test_build_create(self):
+        operation = self.factory.build_create()
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+
+    def test_build_submit(self):
+        operation = self.factory.build_submit(56, "example.Car", 2, b"foo")
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"id": 56, "name": "example.Car", "version": 2, "data": b"foo"}, operation.parameters)
+
+    def test_build_query(self):
+        operation = self.factory.build_query([56, 78])
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"ids": (56, 78)}, operation.parameters)
+
+    def test_build_query_all(self):
+        operation = self.factory.build_query()
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual(dict(), operation.parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
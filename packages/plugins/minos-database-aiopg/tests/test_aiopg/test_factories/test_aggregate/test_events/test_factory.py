@@ -48,6 +48,24 @@ class TestAiopgEventDatabaseOperationFactory(unittest.TestCase):
         )
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_submit_many(self):
+        operation = self.factory.build_submit_many(
+            transaction_uuids=[uuid4(), uuid4()],
+            transaction_uuid=uuid4(),
+            entries=[
+                {
+                    "uuid": uuid4(),
+                    "action": Action.CREATE.value,
+                    "name": "Foo",
+                    "version": None,
+                    "data": bytes(),
+                    "created_at": current_datetime(),
+                }
+            ],
+        )
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual(["create"], operation.parameters["actions"])
+
     def test_build_query(self):
         operation = self.factory.build_query(
             uuid=uuid4(),
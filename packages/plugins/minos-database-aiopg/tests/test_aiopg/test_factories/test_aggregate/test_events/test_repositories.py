@@ -1,13 +1,17 @@
 import unittest
 
 from minos.aggregate import (
+    Action,
     DatabaseEventRepository,
+    EventEntry,
     EventRepository,
+    EventRepositoryConflictException,
 )
 from minos.aggregate.testing import (
     EventRepositoryTestCase,
 )
 from minos.common import (
+    NULL_UUID,
     DatabaseClientPool,
 )
 from minos.plugins.aiopg import (
@@ -46,6 +50,34 @@ class TestDatabaseEventRepositorySubmit(AiopgTestCase, EventRepositoryTestCase):
             response = (await client.fetch_one())[0]
         self.assertTrue(response)
 
+    async def test_submit_prepared(self):
+        await self.event_repository.submit(EventEntry(self.uuid, "example.Car", action=Action.CREATE))
+        await self.event_repository.submit(EventEntry(self.uuid, "example.Car", action=Action.UPDATE))
+
+        async with self.event_repository.database_pool.acquire() as client:
+            self.assertGreater(len(client.statement_cache), 0)
+            self.assertGreater(client.statement_cache.hits, 0)
+            self.assertEqual(set(), client.statement_cache._unsupported)
+
+    async def test_submit_many_atomic(self):
+        await self.event_repository.submit(EventEntry(self.uuid, "example.Car", 1, action=Action.CREATE))
+        entries = [
+            EventEntry(self.uuid_2, "example.Car", action=Action.CREATE),
+            EventEntry(self.uuid, "example.Car", 1, action=Action.CREATE),
+        ]
+        with self.assertRaises(EventRepositoryConflictException):
+            await self.event_repository.submit_many(entries)
+
+        self.assertEqual([self.uuid], [entry.uuid async for entry in self.event_repository.select()])
+
+    async def test_submit_many_generate_uuid(self):
+        entries = [EventEntry(NULL_UUID, "example.Car", action=Action.CREATE) for _ in range(3)]
+        observed = await self.event_repository.submit_many(entries, batch_size=2)
+
+        self.assertEqual([1, 2, 3], [entry.id for entry in observed])
+        self.assertEqual([1, 1, 1], [entry.version for entry in observed])
+        self.assertEqual(3, len({entry.uuid for entry in observed} - {NULL_UUID}))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -42,6 +42,10 @@ class TestAiopgSnapshotDatabaseOperationFactory(unittest.TestCase):
         operation = self.factory.build_delete({uuid4(), uuid4()})
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_delete_all(self):
+        operation = self.factory.build_delete_all()
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+
     def test_build_submit(self):
         operation = self.factory.build_submit(
             uuid=uuid4(),
@@ -55,6 +59,25 @@ class TestAiopgSnapshotDatabaseOperationFactory(unittest.TestCase):
         )
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_submit_many(self):
+        uuid = uuid4()
+        operation = self.factory.build_submit_many(
+            [
+                {
+                    "uuid": uuid,
+                    "name": "Foo",
+                    "version": 34243,
+                    "schema": bytes(),
+                    "data": '{"foo": "bar"}',
+                    "created_at": current_datetime(),
+                    "updated_at": current_datetime(),
+                    "transaction_uuid": uuid4(),
+                }
+            ]
+        )
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual([uuid], operation.parameters["uuids"])
+
     def test_build_query(self):
         operation = self.factory.build_query(
             name="Foo",
@@ -1,11 +1,28 @@
 import unittest
+from asyncio import (
+    gather,
+    wait_for,
+)
+from uuid import (
+    uuid4,
+)
 
 from minos.aggregate import (
+    DatabaseEventRepository,
     DatabaseSnapshotRepository,
+    DatabaseTransactionRepository,
+    EventEntry,
+    FieldDiff,
+    FieldDiffContainer,
+    TransactionEntry,
+    TransactionStatus,
 )
 from minos.aggregate.testing import (
     SnapshotRepositoryTestCase,
 )
+from minos.common import (
+    classname,
+)
 from minos.plugins.aiopg import (
     AiopgDatabaseClient,
     AiopgDatabaseOperation,
@@ -47,6 +64,54 @@ class TestDatabaseSnapshotRepository(AiopgTestCase, SnapshotRepositoryTestCase):
         await self.snapshot_repository.synchronize()
         self.assertTrue(await self.snapshot_repository.is_synced(SnapshotRepositoryTestCase.Car))
 
+    async def test_synchronize_concurrently(self):
+        pool = self.snapshot_repository.database_pool
+        transaction_repository = DatabaseTransactionRepository.from_config(self.config, database_pool=pool)
+        event_repository = DatabaseEventRepository.from_config(
+            self.config, database_pool=pool, transaction_repository=transaction_repository
+        )
+        snapshot_repository = DatabaseSnapshotRepository.from_config(
+            self.config,
+            database_pool=pool,
+            event_repository=event_repository,
+            transaction_repository=transaction_repository,
+        )
+        async with transaction_repository, event_repository, snapshot_repository:
+            name = classname(SnapshotRepositoryTestCase.Car)
+            diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+            for _ in range(10):
+                await event_repository.create(EventEntry(uuid4(), name, 1, diff.avro_bytes))
+            await transaction_repository.submit(
+                TransactionEntry(self.transaction_1, TransactionStatus.PENDING, await event_repository.offset)
+            )
+            await event_repository.create(
+                EventEntry(uuid4(), name, 1, diff.avro_bytes, transaction_uuid=self.transaction_1)
+            )
+
+            # There are more concurrent transactions than pool clients, so none of them can wait for other clients.
+            await wait_for(gather(*(snapshot_repository.synchronize() for _ in range(20))), 10)
+
+            self.assertTrue(await snapshot_repository.is_synced(name))
+
+    async def test_rebuild(self):
+        await self.populate_and_synchronize()
+        expected = await self._get_snapshot_rows()
+
+        await self.snapshot_repository.rebuild(batch_size=2)
+        self.assertEqual(expected, await self._get_snapshot_rows())
+
+        self.assertTrue(await self.snapshot_repository.is_synced(SnapshotRepositoryTestCase.Car))
+
+    async def _get_snapshot_rows(self) -> list[tuple]:
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(
+                AiopgDatabaseOperation(
+                    "SELECT uuid, name, version, schema, data, created_at, updated_at, transaction_uuid "
+                    "FROM snapshot ORDER BY uuid, transaction_uuid;"
+                )
+            )
+            return [row async for row in client.fetch_all()]
+
 
 if __name__ == "__main__":
     unittest.main()
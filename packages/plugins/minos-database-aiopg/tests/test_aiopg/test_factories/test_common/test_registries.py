@@ -0,0 +1,40 @@
+import unittest
+
+from minos.common import (
+    AvroSchemaRegistryDatabaseOperationFactory,
+)
+from minos.plugins.aiopg import (
+    AiopgAvroSchemaRegistryDatabaseOperationFactory,
+    AiopgDatabaseOperation,
+)
+
+
+class TestAiopgAvroSchemaRegistryDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AiopgAvroSchemaRegistryDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(
+            issubclass(AiopgAvroSchemaRegistryDatabaseOperationFactory, AvroSchemaRegistryDatabaseOperationFactory)
+        )
+
+    def test_build_table_name(self):
+        self.assertEqual("avro_schemas", self.factory.build_table_name())
+
+    def test_build_create(self):
+        operation = self.factory.build_create()
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+
+    def test_build_submit(self):
+        operation = self.factory.build_submit(-56, '{"type": "string"}')
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"fingerprint": -56, "schema": '{"type": "string"}'}, operation.parameters)
+
+    def test_build_query(self):
+        operation = self.factory.build_query([56, -56])
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"fingerprints": (56, -56)}, operation.parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,11 @@ class TestAiopgDatabaseOperation(unittest.TestCase):
         self.assertEqual({"foo": "bar"}, operation.parameters)
         self.assertEqual(None, operation.timeout)
         self.assertEqual(None, operation.lock)
+        self.assertFalse(operation.prepare)
+
+    def test_constructor_prepare(self):
+        operation = AiopgDatabaseOperation("query", {"foo": "bar"}, prepare=True)
+        self.assertTrue(operation.prepare)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+import unittest
+
+from minos.plugins.aiopg import (
+    AiopgPreparedStatementCache,
+)
+from minos.plugins.aiopg.statements import (
+    build_statement_template,
+)
+
+
+class TestAiopgPreparedStatementCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = AiopgPreparedStatementCache(max_size=2)
+
+    def test_constructor(self):
+        self.assertEqual(2, self.cache.max_size)
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual(0, self.cache.misses)
+        self.assertEqual(0, self.cache.evictions)
+        self.assertEqual(0.0, self.cache.hit_rate)
+
+    def test_get_add(self):
+        self.assertIsNone(self.cache.get("SELECT $1"))
+
+        name, evicted = self.cache.add("SELECT $1")
+        self.assertIsNone(evicted)
+        self.assertIn("SELECT $1", self.cache)
+        self.assertEqual(name, self.cache.get("SELECT $1"))
+
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(0.5, self.cache.hit_rate)
+
+    def test_add_names(self):
+        one, _ = self.cache.add("SELECT 1")
+        two, _ = self.cache.add("SELECT 2")
+        self.assertNotEqual(one, two)
+
+    def test_add_evicts_least_recently_used(self):
+        one, _ = self.cache.add("SELECT 1")
+        two, _ = self.cache.add("SELECT 2")
+        self.cache.get("SELECT 1")
+
+        _, evicted = self.cache.add("SELECT 3")
+
+        self.assertEqual(two, evicted)
+        self.assertEqual(1, self.cache.evictions)
+        self.assertIn("SELECT 1", self.cache)
+        self.assertNotIn("SELECT 2", self.cache)
+
+    def test_mark_unsupported(self):
+        self.cache.add("CREATE TABLE foo (id INT)")
+        self.assertTrue(self.cache.is_supported("CREATE TABLE foo (id INT)"))
+
+        self.cache.mark_unsupported("CREATE TABLE foo (id INT)")
+
+        self.assertFalse(self.cache.is_supported("CREATE TABLE foo (id INT)"))
+        self.assertNotIn("CREATE TABLE foo (id INT)", self.cache)
+
+    def test_clear(self):
+        self.cache.add("SELECT 1")
+        self.cache.get("SELECT 1")
+
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(1, self.cache.hits)
+
+
+class TestBuildStatementTemplate(unittest.TestCase):
+    def test_without_placeholders(self):
+        self.assertEqual(("SELECT 1", ()), build_statement_template("SELECT 1"))
+
+    def test_placeholders(self):
+        observed = build_statement_template("SELECT * FROM foo WHERE a = %(a)s AND b = %(b)s OR a > %(a)s")
+        self.assertEqual(("SELECT * FROM foo WHERE a = $1 AND b = $2 OR a > $1", ("a", "b")), observed)
+
+    def test_placeholders_with_special_characters(self):
+        observed = build_statement_template("SELECT %(b5e1c9d2-0f9a-4b7e)s")
+        self.assertEqual(("SELECT $1", ("b5e1c9d2-0f9a-4b7e",)), observed)
+
+    def test_escaped_percent(self):
+        observed = build_statement_template("SELECT * FROM foo WHERE name LIKE 'a%%' AND id = %(id)s")
+        self.assertEqual(("SELECT * FROM foo WHERE name LIKE 'a%' AND id = $1", ("id",)), observed)
+
+    def test_positional_placeholders(self):
+        self.assertIsNone(build_statement_template("SELECT %s"))
+
+
+if __name__ == "__main__":
+    unittest.main()
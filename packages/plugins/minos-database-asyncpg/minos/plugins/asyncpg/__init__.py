@@ -0,0 +1,26 @@
+"""The asyncpg plugin of the Minos Framework."""
+
+__author__ = "Minos Framework Devs"
+__email__ = "hey@minos.run"
+__version__ = "0.7.0"
+
+from .clients import (
+    AsyncpgDatabaseClient,
+)
+from .factories import (
+    AsyncpgAvroSchemaRegistryDatabaseOperationFactory,
+    AsyncpgBrokerPublisherQueueDatabaseOperationFactory,
+    AsyncpgBrokerQueueDatabaseOperationFactory,
+    AsyncpgBrokerSubscriberDuplicateValidatorDatabaseOperationFactory,
+    AsyncpgBrokerSubscriberQueueDatabaseOperationFactory,
+    AsyncpgEventCompressorDatabaseOperationFactory,
+    AsyncpgEventDatabaseOperationFactory,
+    AsyncpgLockDatabaseOperationFactory,
+    AsyncpgManagementDatabaseOperationFactory,
+    AsyncpgSnapshotDatabaseOperationFactory,
+    AsyncpgSnapshotQueryDatabaseOperationBuilder,
+    AsyncpgTransactionDatabaseOperationFactory,
+)
+from .operations import (
+    AsyncpgDatabaseOperation,
+)
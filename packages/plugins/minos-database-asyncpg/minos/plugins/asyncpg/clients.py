@@ -0,0 +1,336 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from asyncio import (
+    TimeoutError,
+)
+from collections import (
+    deque,
+)
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from functools import (
+    partial,
+)
+from typing import (
+    Optional,
+)
+
+import asyncpg
+from asyncpg import (
+    Connection,
+    Record,
+)
+from asyncpg.exceptions import (
+    CannotConnectNowError,
+    IntegrityConstraintViolationError,
+    PostgresConnectionError,
+    TooManyConnectionsError,
+)
+from asyncpg.transaction import (
+    Transaction,
+)
+
+from minos.common import (
+    CircuitBreakerMixin,
+    ComposedDatabaseOperation,
+    ConnectionException,
+    DatabaseClient,
+    DatabaseOperation,
+    IntegrityException,
+    ProgrammingException,
+)
+
+from .operations import (
+    AsyncpgDatabaseOperation,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncpgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
+    """Asyncpg Database Client class.
+
+    The operations are executed with the extended query protocol, so that the values are exchanged in binary format and
+    the fetched rows are returned as ``Record`` instances. The statements are prepared and cached by the connection
+    itself (up to ``statement_cache_size`` statements), so that their planning cost is only paid once.
+
+    The ``ComposedDatabaseOperation`` instances are executed atomically (within a transaction) as long as their
+    operations do not require distinct locks. Otherwise, they are executed sequentially.
+
+    While a transaction is open the failed operations are not retried, and the connection is not recreated.
+    """
+
+    _connection: Optional[Connection]
+    _records: Optional[deque[Record]]
+    _transaction: Optional[Transaction]
+
+    def __init__(
+        self,
+        database: str,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        circuit_breaker_exceptions: Iterable[type] = tuple(),
+        connection_timeout: Optional[float] = None,
+        cursor_timeout: Optional[float] = None,
+        statement_cache_size: Optional[int] = None,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(
+            *args,
+            **kwargs,
+            circuit_breaker_exceptions=(ConnectionException, *circuit_breaker_exceptions),
+        )
+
+        if host is None:
+            host = "localhost"
+        if port is None:
+            port = 5432
+        if user is None:
+            user = "postgres"
+        if password is None:
+            password = ""
+        if connection_timeout is None:
+            connection_timeout = 1
+        if cursor_timeout is None:
+            cursor_timeout = 60
+        if statement_cache_size is None:
+            statement_cache_size = 128
+
+        self._database = database
+        self._host = host
+        self._port = port
+        self._user = user
+        self._password = password
+
+        self._connection_timeout = connection_timeout
+        self._cursor_timeout = cursor_timeout
+        self._statement_cache_size = statement_cache_size
+
+        self._connection = None
+        self._records = None
+        self._transaction = None
+
+    async def _setup(self) -> None:
+        await super()._setup()
+        await self.recreate()
+
+    async def _destroy(self) -> None:
+        await super()._destroy()
+        await self.close()
+
+    async def recreate(self) -> None:
+        """Recreate the database connection.
+
+        :return: This method does not return anything.
+        """
+        await self.close()
+
+        self._connection = await self.with_circuit_breaker(self._connect)
+        logger.debug(f"Created {self.database!r} database connection identified by {id(self._connection)}!")
+
+    async def _connect(self) -> Connection:
+        try:
+            return await asyncpg.connect(
+                timeout=self._connection_timeout,
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                statement_cache_size=self._statement_cache_size,
+            )
+        except (
+            OSError,
+            TimeoutError,
+            PostgresConnectionError,
+            CannotConnectNowError,
+            TooManyConnectionsError,
+        ) as exc:
+            raise ConnectionException(f"There was not possible to connect to the database: {exc!r}")
+
+    async def close(self) -> None:
+        """Close database connection.
+
+        :return: This method does not return anything.
+        """
+        if await self.is_connected():
+            await self._connection.close()
+
+        if self._connection is not None:
+            logger.debug(f"Destroyed {self.database!r} database connection identified by {id(self._connection)}!")
+            self._connection = None
+
+        self._transaction = None
+
+    async def is_connected(self) -> bool:
+        """Check if the client is connected.
+
+        :return: ``True`` if it is connected or ``False`` otherwise.
+        """
+        if self._connection is None:
+            return False
+
+        return not self._connection.is_closed()
+
+    async def _reset(self, **kwargs) -> None:
+        if self._transaction is not None:
+            logger.warning(f"Rolling back the unfinished transaction of {self.database!r} database...")
+            await self._rollback()
+        self._records = None
+
+    async def _begin(self) -> None:
+        await self._ensure_connected()
+        transaction = self._connection.transaction()
+        await transaction.start()
+        self._transaction = transaction
+
+    async def _commit(self) -> None:
+        try:
+            await self._transaction.commit()
+        except (OSError, PostgresConnectionError) as exc:
+            raise ConnectionException(f"There was not possible to connect to the database: {exc!r}")
+        finally:
+            self._transaction = None
+
+    async def _rollback(self) -> None:
+        try:
+            if await self.is_connected():
+                await self._transaction.rollback()
+        finally:
+            self._transaction = None
+
+    async def _ensure_connected(self) -> None:
+        if await self.is_connected():
+            return
+
+        if self._transaction is not None:
+            # A new connection would silently discard the operations already executed within the transaction.
+            raise ConnectionException("The database connection was lost within a transaction.")
+
+        await self.recreate()
+
+    async def _with_retries(self, fn: Callable[[], Awaitable[None]]) -> None:
+        if self._transaction is not None:
+            # The failed operations cannot be retried, as the transaction has already been aborted.
+            return await fn()
+        return await self.with_circuit_breaker(fn)
+
+    # noinspection PyUnusedLocal
+    async def _fetch_all(self) -> AsyncIterator[Record]:
+        if self._records is None:
+            raise ProgrammingException("An operation must be executed before fetching any value.")
+
+        while self._records:
+            yield self._records.popleft()
+
+    # noinspection PyUnusedLocal
+    async def _execute(self, operation: AsyncpgDatabaseOperation) -> None:
+        if not isinstance(operation, AsyncpgDatabaseOperation):
+            raise ValueError(f"The operation must be a {AsyncpgDatabaseOperation!r} instance. Obtained: {operation!r}")
+
+        query, arguments = operation.build()
+
+        fn = partial(self._fetch, query=query, arguments=arguments)
+        await self._with_retries(fn)
+
+    async def _fetch(self, query: str, arguments: tuple) -> None:
+        await self._ensure_connected()
+
+        self._records = None
+        try:
+            records = await self._connection.fetch(query, *arguments, timeout=self._cursor_timeout)
+        except (OSError, PostgresConnectionError) as exc:
+            raise ConnectionException(f"There was not possible to connect to the database: {exc!r}")
+        except IntegrityConstraintViolationError as exc:
+            raise IntegrityException(f"The requested operation raised a integrity error: {exc!r}")
+
+        self._records = deque(records)
+
+    async def _execute_composed(self, operation: ComposedDatabaseOperation) -> None:
+        if self._transaction is not None or not self._is_atomic(operation.operations):
+            return await super()._execute_composed(operation)
+
+        fn = partial(self._execute_atomically, operation=operation)
+        await self._with_retries(fn)
+
+    @staticmethod
+    def _is_atomic(operations: tuple[DatabaseOperation, ...]) -> bool:
+        if len(operations) < 2:
+            return False
+        # The locks are released as soon as another one is acquired, so they must be held during the whole transaction.
+        return len({op.lock for op in operations if op.lock is not None}) < 2
+
+    async def _execute_atomically(self, operation: ComposedDatabaseOperation) -> None:
+        await self.begin()
+        try:
+            await super()._execute_composed(operation)
+        except BaseException:
+            await self.rollback()
+            raise
+        await self.commit()
+
+    @property
+    def statement_cache_size(self) -> int:
+        """Get the maximum number of statements to be prepared and cached by the connection.
+
+        :return: An ``int`` value.
+        """
+        return self._statement_cache_size
+
+    @property
+    def connection(self) -> Optional[Connection]:
+        """Get the connection.
+
+        :return: A ``Connection`` instance.
+        """
+        return self._connection
+
+    @property
+    def database(self) -> str:
+        """Get the database's database.
+
+        :return: A ``str`` value.
+        """
+        return self._database
+
+    @property
+    def host(self) -> str:
+        """Get the database's host.
+
+        :return: A ``str`` value.
+        """
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Get the database's port.
+
+        :return: An ``int`` value.
+        """
+        return self._port
+
+    @property
+    def user(self) -> str:
+        """Get the database's user.
+
+        :return: A ``str`` value.
+        """
+        return self._user
+
+    @property
+    def password(self) -> str:
+        """Get the database's password.
+
+        :return: A ``str`` value.
+        """
+        return self._password
@@ -0,0 +1,18 @@
+from .aggregate import (
+    AsyncpgEventCompressorDatabaseOperationFactory,
+    AsyncpgEventDatabaseOperationFactory,
+    AsyncpgSnapshotDatabaseOperationFactory,
+    AsyncpgSnapshotQueryDatabaseOperationBuilder,
+    AsyncpgTransactionDatabaseOperationFactory,
+)
+from .common import (
+    AsyncpgAvroSchemaRegistryDatabaseOperationFactory,
+    AsyncpgLockDatabaseOperationFactory,
+    AsyncpgManagementDatabaseOperationFactory,
+)
+from .networks import (
+    AsyncpgBrokerPublisherQueueDatabaseOperationFactory,
+    AsyncpgBrokerQueueDatabaseOperationFactory,
+    AsyncpgBrokerSubscriberDuplicateValidatorDatabaseOperationFactory,
+    AsyncpgBrokerSubscriberQueueDatabaseOperationFactory,
+)
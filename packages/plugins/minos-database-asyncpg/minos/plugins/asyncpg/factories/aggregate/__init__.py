@@ -0,0 +1,13 @@
+from .compressors import (
+    AsyncpgEventCompressorDatabaseOperationFactory,
+)
+from .events import (
+    AsyncpgEventDatabaseOperationFactory,
+)
+from .snapshots import (
+    AsyncpgSnapshotDatabaseOperationFactory,
+    AsyncpgSnapshotQueryDatabaseOperationBuilder,
+)
+from .transactions import (
+    AsyncpgTransactionDatabaseOperationFactory,
+)
@@ -0,0 +1,91 @@
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Optional,
+)
+
+from minos.aggregate import (
+    EventCompressorDatabaseOperationFactory,
+)
+from minos.common import (
+    DatabaseOperation,
+)
+
+from ...clients import (
+    AsyncpgDatabaseClient,
+)
+from ...operations import (
+    AsyncpgDatabaseOperation,
+)
+
+
+# noinspection SqlNoDataSourceInspection,SqlResolve
+class AsyncpgEventCompressorDatabaseOperationFactory(EventCompressorDatabaseOperationFactory):
+    """Asyncpg Event Compressor Database Operation Factory class."""
+
+    @staticmethod
+    def build_table_name() -> str:
+        """Get the table name.
+
+        :return: A ``str`` value.
+        """
+        return "aggregate_event_compression_dictionary"
+
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the compression dictionary table.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"CREATE TABLE IF NOT EXISTS {self.build_table_name()} ("
+            "   id BIGINT NOT NULL PRIMARY KEY, "
+            "   name TEXT NOT NULL, "
+            "   version INT NOT NULL, "
+            "   data BYTEA NOT NULL, "
+            "   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"
+            ")",
+            lock=self.build_table_name(),
+        )
+
+    # noinspection PyShadowingBuiltins
+    def build_submit(self, id: int, name: str, version: int, data: bytes, **kwargs) -> DatabaseOperation:
+        """Build the database operation to store a compression dictionary.
+
+        :param id: The identifier of the dictionary.
+        :param name: The classname of the ``RootEntity``.
+        :param version: The version of the dictionary.
+        :param data: The content of the dictionary.
+        :param kwargs: Additional named arguments.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"INSERT INTO {self.build_table_name()} (id, name, version, data) "
+            "VALUES (%(id)s, %(name)s, %(version)s, %(data)s) "
+            "ON CONFLICT (id) DO NOTHING",
+            {
+                "id": id,
+                "name": name,
+                "version": version,
+                "data": data,
+            },
+        )
+
+    def build_query(self, ids: Optional[Iterable[int]] = None) -> DatabaseOperation:
+        """Build the database operation to get the compression dictionaries.
+
+        :param ids: The identifiers of the dictionaries. If ``None`` is given, all the dictionaries are selected.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        if ids is None:
+            return AsyncpgDatabaseOperation(f"SELECT name, version, data FROM {self.build_table_name()}")
+
+        return AsyncpgDatabaseOperation(
+            f"SELECT name, version, data FROM {self.build_table_name()} WHERE id = ANY(%(ids)s::bigint[])",
+            {"ids": tuple(ids)},
+        )
+
+
+AsyncpgDatabaseClient.set_factory(
+    EventCompressorDatabaseOperationFactory, AsyncpgEventCompressorDatabaseOperationFactory
+)
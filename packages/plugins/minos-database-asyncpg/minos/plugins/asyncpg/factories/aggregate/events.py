@@ -0,0 +1,366 @@
+from collections.abc import (
+    Iterable,
+)
+from datetime import (
+    datetime,
+)
+from typing import (
+    Any,
+    Optional,
+)
+from uuid import (
+    UUID,
+)
+
+from minos.aggregate import (
+    Action,
+    EventDatabaseOperationFactory,
+)
+from minos.common import (
+    ComposedDatabaseOperation,
+    DatabaseOperation,
+)
+
+from ...clients import (
+    AsyncpgDatabaseClient,
+)
+from ...operations import (
+    AsyncpgDatabaseOperation,
+)
+
+
+# noinspection SqlNoDataSourceInspection,SqlResolve,PyMethodMayBeStatic
+class AsyncpgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
+    """Asyncpg Event Database Operation Factory class."""
+
+    def build_table_name(self) -> str:
+        """Get the table name.
+
+        :return: A ``str`` value.
+        """
+        return "aggregate_event"
+
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the event table.
+
+        :return: A ``DatabaseOperation`` instance.s
+        """
+        return ComposedDatabaseOperation(
+            [
+                AsyncpgDatabaseOperation(
+                    'CREATE EXTENSION IF NOT EXISTS "uuid-ossp";',
+                    lock="uuid-ossp",
+                ),
+                AsyncpgDatabaseOperation(
+                    """
+                    DO
+                    $$
+                        BEGIN
+                            IF NOT EXISTS(SELECT *
+                                          FROM pg_type typ
+                                                   INNER JOIN pg_namespace nsp
+                                                              ON nsp.oid = typ.typnamespace
+                                          WHERE nsp.nspname = current_schema()
+                                            AND typ.typname = 'action_type') THEN
+                                CREATE TYPE action_type AS ENUM ('create', 'update', 'delete');
+                            END IF;
+                        END;
+                    $$
+                    LANGUAGE plpgsql;
+                    """,
+                    lock=self.build_table_name(),
+                ),
+                AsyncpgDatabaseOperation(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.build_table_name()} (
+                        id BIGSERIAL PRIMARY KEY,
+                        action ACTION_TYPE NOT NULL,
+                        uuid UUID NOT NULL,
+                        name TEXT NOT NULL,
+                        version INT NOT NULL,
+                        data BYTEA NOT NULL,
+                        created_at TIMESTAMPTZ NOT NULL,
+                        transaction_uuid UUID NOT NULL DEFAULT uuid_nil(),
+                        UNIQUE (uuid, version, transaction_uuid)
+                    );
+                    """,
+                    lock=self.build_table_name(),
+                ),
+            ]
+        )
+
+    def build_submit(
+        self,
+        transaction_uuids: Iterable[UUID],
+        uuid: UUID,
+        action: Action,
+        name: str,
+        version: int,
+        data: bytes,
+        created_at: datetime,
+        transaction_uuid: UUID,
+        lock: Optional[str],
+        **kwargs,
+    ) -> DatabaseOperation:
+        """Build the database operation to submit a row into the event table.
+
+        :param transaction_uuids: The sequence of nested transaction in on top of the current event's transaction.
+        :param uuid: The identifier of the entity.
+        :param action: The action of the event.
+        :param name: The name of the entity.
+        :param version: The version of the entity
+        :param data: The data of the event.
+        :param created_at: The creation datetime.
+        :param transaction_uuid: The identifier of the transaction.
+        :param lock: The lock identifier.
+        :param kwargs: Additional named arguments.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        from_query, from_parameters = self._build_submit_from(transaction_uuids, "uuid = %(uuid)s::uuid")
+
+        query = f"""
+            INSERT INTO {self.build_table_name()} (id, action, uuid, name, version, data, created_at, transaction_uuid)
+            VALUES (
+                default,
+                %(action)s,
+                CASE %(uuid)s::uuid WHEN uuid_nil() THEN uuid_generate_v4() ELSE %(uuid)s::uuid END,
+                %(name)s,
+                (
+                    SELECT (
+                        CASE
+                            WHEN %(version)s::int IS NULL THEN 1 + COALESCE(MAX(t2.version), 0)
+                            ELSE %(version)s::int
+                        END
+                    )
+                    FROM (
+                             SELECT DISTINCT ON (t1.uuid) t1.version
+                             FROM ( {from_query} ) AS t1
+                             ORDER BY t1.uuid, t1.transaction_index DESC
+                    ) AS t2
+                ),
+                %(data)s,
+                COALESCE(%(created_at)s::timestamptz, NOW()),
+                %(transaction_uuid)s
+            )
+            RETURNING id, uuid, version, created_at;
+            """
+        parameters = from_parameters | {
+            "uuid": uuid,
+            "action": action,
+            "name": name,
+            "version": version,
+            "data": data,
+            "created_at": created_at,
+            "transaction_uuid": transaction_uuid,
+        }
+
+        return AsyncpgDatabaseOperation(query, parameters, lock)
+
+    def build_submit_many(
+        self, transaction_uuids: Iterable[UUID], transaction_uuid: UUID, entries: Iterable[dict[str, Any]]
+    ) -> DatabaseOperation:
+        """Build the database operation to submit a batch of rows into the event table.
+
+        The rows are inserted with a single statement that unnests a column array per field, so that the versions are
+        assigned (following the entries order) and the collisions detected as if they were submitted one by one. The
+        entries of the same identifier are expected to either set all their versions or none of them.
+
+        :param transaction_uuids: The sequence of nested transaction in on top of the current event's transaction.
+        :param transaction_uuid: The identifier of the transaction of the entries.
+        :param entries: The raw representation of the entries (containing the ``uuid``, ``action``, ``name``,
+            ``version``, ``data`` and ``created_at`` values).
+        :return: A ``DatabaseOperation`` instance.
+        """
+        from_query, from_parameters = self._build_submit_from(transaction_uuids, "uuid = ANY(%(uuids)s::uuid[])")
+
+        query = f"""
+            WITH input AS (
+                SELECT
+                    t.position,
+                    t.action,
+                    CASE t.uuid WHEN uuid_nil() THEN uuid_generate_v4() ELSE t.uuid END AS uuid,
+                    t.name,
+                    t.version,
+                    t.data,
+                    COALESCE(t.created_at, NOW()) AS created_at
+                FROM unnest(
+                    %(actions)s::action_type[],
+                    %(uuids)s::uuid[],
+                    %(names)s::text[],
+                    %(versions)s::int[],
+                    %(data)s::bytea[],
+                    %(created_ats)s::timestamptz[]
+                ) WITH ORDINALITY AS t (action, uuid, name, version, data, created_at, position)
+            ), previous AS (
+                SELECT DISTINCT ON (t1.uuid) t1.uuid, t1.version
+                FROM ( {from_query} ) AS t1
+                ORDER BY t1.uuid, t1.transaction_index DESC
+            ), inserted AS (
+                INSERT INTO {self.build_table_name()} (action, uuid, name, version, data, created_at, transaction_uuid)
+                SELECT
+                    input.action,
+                    input.uuid,
+                    input.name,
+                    COALESCE(
+                        input.version,
+                        COALESCE(previous.version, 0) + ROW_NUMBER() OVER (
+                            PARTITION BY input.uuid ORDER BY input.position
+                        )
+                    ),
+                    input.data,
+                    input.created_at,
+                    %(transaction_uuid)s
+                FROM input LEFT JOIN previous ON previous.uuid = input.uuid
+                ORDER BY input.position
+                RETURNING id, uuid, version, created_at
+            )
+            SELECT id, uuid, version, created_at
+            FROM inserted
+            ORDER BY id;
+            """
+        entries = list(entries)
+        parameters = from_parameters | {
+            "actions": [entry["action"] for entry in entries],
+            "uuids": [entry["uuid"] for entry in entries],
+            "names": [entry["name"] for entry in entries],
+            "versions": [entry["version"] for entry in entries],
+            "data": [entry["data"] for entry in entries],
+            "created_ats": [entry["created_at"] for entry in entries],
+            "transaction_uuid": transaction_uuid,
+        }
+
+        return AsyncpgDatabaseOperation(query, parameters)
+
+    def _build_submit_from(self, transaction_uuids: Iterable[UUID], uuid_condition: str) -> tuple[str, dict[str, Any]]:
+        from_query_parts = list()
+        parameters = dict()
+        for index, transaction_uuid in enumerate(transaction_uuids, start=1):
+            name = f"transaction_uuid_{index}"
+            parameters[name] = transaction_uuid
+
+            from_query_parts.append(
+                f"""
+                SELECT {index} AS transaction_index, uuid, MAX(version) AS version
+                FROM {self.build_table_name()}
+                WHERE {uuid_condition} AND transaction_uuid = %({name})s
+                GROUP BY uuid
+                """
+            )
+
+        query = " UNION ALL ".join(from_query_parts)
+        return query, parameters
+
+    # noinspection PyShadowingBuiltins
+    def build_query(
+        self,
+        uuid: Optional[UUID] = None,
+        name: Optional[str] = None,
+        version: Optional[int] = None,
+        version_lt: Optional[int] = None,
+        version_gt: Optional[int] = None,
+        version_le: Optional[int] = None,
+        version_ge: Optional[int] = None,
+        id: Optional[int] = None,
+        id_lt: Optional[int] = None,
+        id_gt: Optional[int] = None,
+        id_le: Optional[int] = None,
+        id_ge: Optional[int] = None,
+        transaction_uuid: Optional[UUID] = None,
+        transaction_uuid_ne: Optional[UUID] = None,
+        transaction_uuid_in: Optional[Iterable[UUID, ...]] = None,
+        **kwargs,
+    ) -> DatabaseOperation:
+        """Build the database operation to select rows.
+
+        :param uuid: The identifier must be equal to the given value.
+        :param name: The classname must be equal to the given value.
+        :param version: The version must be equal to the given value.
+        :param version_lt: The version must be lower than the given value.
+        :param version_gt: The version must be greater than the given value.
+        :param version_le: The version must be lower or equal to the given value.
+        :param version_ge: The version must be greater or equal to the given value.
+        :param id: The entry identifier must be equal to the given value.
+        :param id_lt: The entry identifier must be lower than the given value.
+        :param id_gt: The entry identifier must be greater than the given value.
+        :param id_le: The entry identifier must be lower or equal to the given value.
+        :param id_ge: The entry identifier must be greater or equal to the given value.
+        :param transaction_uuid: The transaction identifier must be equal to the given value.
+        :param transaction_uuid_ne: The transaction identifier must be distinct of the given value.
+        :param transaction_uuid_in: The destination transaction identifier must be equal to one of the given values.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        if transaction_uuid_in is not None:
+            transaction_uuid_in = tuple(transaction_uuid_in)
+
+        _select_all = f"""
+            SELECT uuid, name, version, data, id, action, created_at, transaction_uuid
+            FROM {self.build_table_name()}
+            """
+
+        conditions = list()
+
+        if uuid is not None:
+            conditions.append("uuid = %(uuid)s")
+        if name is not None:
+            conditions.append("name = %(name)s")
+        if version is not None:
+            conditions.append("version = %(version)s")
+        if version_lt is not None:
+            conditions.append("version < %(version_lt)s")
+        if version_gt is not None:
+            conditions.append("version > %(version_gt)s")
+        if version_le is not None:
+            conditions.append("version <= %(version_le)s")
+        if version_ge is not None:
+            conditions.append("version >= %(version_ge)s")
+        if id is not None:
+            conditions.append("id = %(id)s")
+        if id_lt is not None:
+            conditions.append("id < %(id_lt)s")
+        if id_gt is not None:
+            conditions.append("id > %(id_gt)s")
+        if id_le is not None:
+            conditions.append("id <= %(id_le)s")
+        if id_ge is not None:
+            conditions.append("id >= %(id_ge)s")
+        if transaction_uuid is not None:
+            conditions.append("transaction_uuid = %(transaction_uuid)s")
+        if transaction_uuid_ne is not None:
+            conditions.append("transaction_uuid <> %(transaction_uuid_ne)s")
+        if transaction_uuid_in is not None:
+            conditions.append("transaction_uuid = ANY(%(transaction_uuid_in)s::uuid[])")
+
+        if not conditions:
+            return AsyncpgDatabaseOperation(f"{_select_all} ORDER BY id;")
+
+        return AsyncpgDatabaseOperation(
+            f"{_select_all} WHERE {' AND '.join(conditions)} ORDER BY id;",
+            {
+                "uuid": uuid,
+                "name": name,
+                "version": version,
+                "version_lt": version_lt,
+                "version_gt": version_gt,
+                "version_le": version_le,
+                "version_ge": version_ge,
+                "id": id,
+                "id_lt": id_lt,
+                "id_gt": id_gt,
+                "id_le": id_le,
+                "id_ge": id_ge,
+                "transaction_uuid": transaction_uuid,
+                "transaction_uuid_ne": transaction_uuid_ne,
+                "transaction_uuid_in": transaction_uuid_in,
+            },
+        )
+
+    def build_query_offset(self) -> DatabaseOperation:
+        """Build the database operation to get the maximum identifier.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(f"SELECT MAX(id) FROM {self.build_table_name()};")
+
+
+AsyncpgDatabaseClient.set_factory(EventDatabaseOperationFactory, AsyncpgEventDatabaseOperationFactory)
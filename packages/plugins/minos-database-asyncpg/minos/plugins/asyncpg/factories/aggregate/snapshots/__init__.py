@@ -0,0 +1,6 @@
+from .impl import (
+    AsyncpgSnapshotDatabaseOperationFactory,
+)
+from .queries import (
+    AsyncpgSnapshotQueryDatabaseOperationBuilder,
+)
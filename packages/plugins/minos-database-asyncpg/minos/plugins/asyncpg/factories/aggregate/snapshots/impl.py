@@ -0,0 +1,291 @@
+from collections.abc import (
+    Iterable,
+)
+from datetime import (
+    datetime,
+)
+from typing import (
+    Any,
+    Optional,
+)
+from uuid import (
+    UUID,
+)
+
+from minos.aggregate import (
+    SnapshotDatabaseOperationFactory,
+)
+from minos.aggregate.queries import (
+    _Condition,
+    _Ordering,
+)
+from minos.common import (
+    ComposedDatabaseOperation,
+    DatabaseOperation,
+)
+
+from ....clients import (
+    AsyncpgDatabaseClient,
+)
+from ....operations import (
+    AsyncpgDatabaseOperation,
+)
+from .queries import (
+    AsyncpgSnapshotQueryDatabaseOperationBuilder,
+)
+
+
+# noinspection SqlNoDataSourceInspection,SqlResolve
+class AsyncpgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
+    """Asyncpg Snapshot Database Operation Factory class."""
+
+    def build_table_name(self) -> str:
+        """Get the table name.
+
+        :return: A ``str`` value.
+        """
+        return "snapshot"
+
+    def build_offset_table_name(self) -> str:
+        """Get the offset table name.
+
+        :return: A ``str`` value.
+        """
+        return "snapshot_aux_offset"
+
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the snapshot table.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return ComposedDatabaseOperation(
+            [
+                AsyncpgDatabaseOperation(
+                    'CREATE EXTENSION IF NOT EXISTS "uuid-ossp";',
+                    lock="uuid-ossp",
+                ),
+                AsyncpgDatabaseOperation(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.build_table_name()} (
+                        uuid UUID NOT NULL,
+                        name TEXT NOT NULL,
+                        version INT NOT NULL,
+                        schema BYTEA,
+                        data JSONB,
+                        created_at TIMESTAMPTZ NOT NULL,
+                        updated_at TIMESTAMPTZ NOT NULL,
+                        transaction_uuid UUID NOT NULL DEFAULT uuid_nil(),
+                        PRIMARY KEY (uuid, transaction_uuid)
+                    );
+                    """,
+                    lock=self.build_table_name(),
+                ),
+                AsyncpgDatabaseOperation(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.build_offset_table_name()} (
+                        id bool PRIMARY KEY DEFAULT TRUE,
+                        value BIGINT NOT NULL,
+                        CONSTRAINT id_uni CHECK (id)
+                    );
+                    """,
+                    lock=self.build_offset_table_name(),
+                ),
+            ]
+        )
+
+    def build_delete(self, transaction_uuids: Iterable[UUID]) -> DatabaseOperation:
+        """Build the database operation to delete rows by transaction identifiers.
+
+        :param transaction_uuids: The transaction identifiers.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"""
+            DELETE FROM {self.build_table_name()}
+            WHERE transaction_uuid = ANY(%(transaction_uuids)s::uuid[]);
+            """,
+            {"transaction_uuids": tuple(transaction_uuids)},
+        )
+
+    def build_delete_all(self) -> DatabaseOperation:
+        """Build the database operation to delete all the rows.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(f"DELETE FROM {self.build_table_name()};")
+
+    def build_submit(
+        self,
+        uuid: UUID,
+        name: str,
+        version: int,
+        schema: bytes,
+        data: dict[str, Any],
+        created_at: datetime,
+        updated_at: datetime,
+        transaction_uuid: UUID,
+    ) -> DatabaseOperation:
+        """Build the insert database operation.
+
+        :param uuid: The identifier of the entity.
+        :param name: The name of the entity.
+        :param version: The version of the entity.
+        :param schema: The schema of the entity.
+        :param data: The data of the entity.
+        :param created_at: The creation datetime.
+        :param updated_at: The last update datetime.
+        :param transaction_uuid: The transaction identifier.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+        return AsyncpgDatabaseOperation(
+            f"""
+            INSERT INTO {self.build_table_name()} (
+                uuid, name, version, schema, data, created_at, updated_at, transaction_uuid
+            )
+            VALUES (
+                %(uuid)s,
+                %(name)s,
+                %(version)s,
+                %(schema)s,
+                %(data)s,
+                %(created_at)s,
+                %(updated_at)s,
+                %(transaction_uuid)s
+            )
+            ON CONFLICT (uuid, transaction_uuid)
+            DO
+               UPDATE SET version = %(version)s, schema = %(schema)s, data = %(data)s, updated_at = %(updated_at)s
+            RETURNING created_at, updated_at;
+            """.strip(),
+            {
+                "uuid": uuid,
+                "name": name,
+                "version": version,
+                "schema": schema,
+                "data": data,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "transaction_uuid": transaction_uuid,
+            },
+        )
+
+    def build_submit_many(self, entries: Iterable[dict[str, Any]]) -> DatabaseOperation:
+        """Build the database operation to insert (or update if already exist) a batch of rows.
+
+        The rows are inserted with a single statement that unnests a column array per field.
+
+        :param entries: The raw representation of the entries (containing the ``uuid``, ``name``, ``version``,
+            ``schema``, ``data``, ``created_at``, ``updated_at`` and ``transaction_uuid`` values). Each
+            ``(uuid, transaction_uuid)`` pair must be unique within the batch.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        entries = list(entries)
+        return AsyncpgDatabaseOperation(
+            f"""
+            INSERT INTO {self.build_table_name()} (
+                uuid, name, version, schema, data, created_at, updated_at, transaction_uuid
+            )
+            SELECT *
+            FROM unnest(
+                %(uuids)s::uuid[],
+                %(names)s::text[],
+                %(versions)s::int[],
+                %(schemas)s::bytea[],
+                %(data)s::jsonb[],
+                %(created_ats)s::timestamptz[],
+                %(updated_ats)s::timestamptz[],
+                %(transaction_uuids)s::uuid[]
+            )
+            ON CONFLICT (uuid, transaction_uuid)
+            DO
+               UPDATE SET
+                    version = EXCLUDED.version,
+                    schema = EXCLUDED.schema,
+                    data = EXCLUDED.data,
+                    updated_at = EXCLUDED.updated_at;
+            """.strip(),
+            {
+                "uuids": [entry["uuid"] for entry in entries],
+                "names": [entry["name"] for entry in entries],
+                "versions": [entry["version"] for entry in entries],
+                "schemas": [entry["schema"] for entry in entries],
+                "data": [entry["data"] for entry in entries],
+                "created_ats": [entry["created_at"] for entry in entries],
+                "updated_ats": [entry["updated_at"] for entry in entries],
+                "transaction_uuids": [entry["transaction_uuid"] for entry in entries],
+            },
+        )
+
+    def build_query(
+        self,
+        name: str,
+        condition: _Condition,
+        ordering: Optional[_Ordering],
+        limit: Optional[int],
+        transaction_uuids: Iterable[UUID],
+        exclude_deleted: bool,
+    ) -> DatabaseOperation:
+        """Build the query database operation.
+
+        :param name: Class name of the ``RootEntity``.
+        :param condition: The condition that must be satisfied by the ``RootEntity`` instances.
+        :param ordering: Optional argument to return the instance with specific ordering strategy. The default behaviour
+            is to retrieve them without any order pattern.
+        :param limit: Optional argument to return only a subset of instances. The default behaviour is to return all the
+            instances that meet the given condition.
+        :param transaction_uuids: The transaction within the operation is performed. If not any value is provided, then
+            the transaction is extracted from the context var. If not any transaction is being scoped then the query is
+            performed to the global snapshot.
+        :param exclude_deleted: If ``True``, deleted ``RootEntity`` entries are included, otherwise deleted
+            ``RootEntity`` entries are filtered.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        builder = AsyncpgSnapshotQueryDatabaseOperationBuilder(
+            name=name,
+            condition=condition,
+            ordering=ordering,
+            limit=limit,
+            transaction_uuids=transaction_uuids,
+            exclude_deleted=exclude_deleted,
+            table_name=self.build_table_name(),
+        )
+        query, parameters = builder.build()
+
+        return AsyncpgDatabaseOperation(query, parameters)
+
+    def build_submit_offset(self, value: int) -> DatabaseOperation:
+        """Build the database operation to store the offset.
+
+        :param value: The value to be stored as the new offset.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"""
+            INSERT INTO {self.build_offset_table_name()} (id, value)
+            VALUES (TRUE, %(value)s)
+            ON CONFLICT (id)
+            DO UPDATE SET value = GREATEST(
+                %(value)s,
+                (SELECT value FROM {self.build_offset_table_name()} WHERE id = TRUE)
+            );
+            """.strip(),
+            {"value": value},
+            lock=f"insert_{self.build_offset_table_name()}",
+        )
+
+    def build_query_offset(self) -> DatabaseOperation:
+        """Build the database operation to get the current offset.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"""
+            SELECT value
+            FROM {self.build_offset_table_name()}
+            WHERE id = TRUE;
+            """
+        )
+
+
+AsyncpgDatabaseClient.set_factory(SnapshotDatabaseOperationFactory, AsyncpgSnapshotDatabaseOperationFactory)
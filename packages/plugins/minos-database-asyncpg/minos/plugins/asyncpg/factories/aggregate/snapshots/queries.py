@@ -0,0 +1,272 @@
+from __future__ import (
+    annotations,
+)
+
+import json
+from typing import (
+    Any,
+    Iterable,
+    Optional,
+)
+from uuid import (
+    UUID,
+)
+
+from minos.aggregate import (
+    IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR,
+)
+from minos.aggregate.queries import (
+    _FALSE_CONDITION,
+    _AndCondition,
+    _ComposedCondition,
+    _Condition,
+    _EqualCondition,
+    _FalseCondition,
+    _GreaterCondition,
+    _GreaterEqualCondition,
+    _InCondition,
+    _LikeCondition,
+    _LowerCondition,
+    _LowerEqualCondition,
+    _NotCondition,
+    _NotEqualCondition,
+    _OrCondition,
+    _Ordering,
+    _SimpleCondition,
+    _TrueCondition,
+)
+from minos.common import (
+    NULL_UUID,
+    AvroDataEncoder,
+)
+
+
+# noinspection SqlResolve,SqlNoDataSourceInspection
+class AsyncpgSnapshotQueryDatabaseOperationBuilder:
+    """Asyncpg Snapshot Query Database Operation Builder class.
+
+    This class build postgres-compatible database queries over fields based on a condition, ordering, etc.
+
+    The values (including the paths of the ``jsonb`` fields) are always passed as parameters, which are named
+    sequentially, so that the conditions with the same structure are translated into the same query (and then the
+    prepared statement of the connection is reused).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        condition: _Condition,
+        ordering: Optional[_Ordering] = None,
+        limit: Optional[int] = None,
+        transaction_uuids: Iterable[UUID, ...] = (NULL_UUID,),
+        exclude_deleted: bool = False,
+        table_name: Optional[str] = None,
+    ):
+        if not isinstance(transaction_uuids, tuple):
+            transaction_uuids = tuple(transaction_uuids)
+        if table_name is None:
+            table_name = "snapshot"
+        self.name = name
+        self.condition = condition
+        self.ordering = ordering
+        self.limit = limit
+        self.transaction_uuids = transaction_uuids
+        self.exclude_deleted = exclude_deleted
+        self.table_name = table_name
+        self._parameters = None
+
+    def build(self) -> tuple[str, dict[str, Any]]:
+        """Build a query.
+
+        :return: A tuple in which the first value is the sql sentence and the second one is a dictionary containing the
+            query parameters.
+        """
+        self._parameters = dict()
+
+        token = IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.set(True)
+        try:
+            query = self._build()
+        finally:
+            IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.reset(token)
+
+        parameters = self._parameters
+
+        return query, parameters
+
+    def _build(self) -> str:
+        self._parameters["name"] = self.name
+
+        query = f"{self._build_select_from()} WHERE {self._build_condition(self.condition)}"
+
+        if self.exclude_deleted:
+            query = f"{query} AND {self._EXCLUDE_DELETED_CONDITION}"
+
+        if self.ordering is not None:
+            query = f"{query} {self._build_ordering(self.ordering)}"
+
+        if self.limit is not None:
+            query = f"{query} {self._build_limit(self.limit)}"
+
+        return query
+
+    def _build_select_from(self) -> str:
+        from_query_parts = list()
+        for index, transaction_uuid in enumerate(self.transaction_uuids, start=1):
+            name = f"transaction_uuid_{index}"
+            self._parameters[name] = transaction_uuid
+
+            from_query_parts.append(
+                self._SELECT_TRANSACTION_CHUNK.format(index=index, transaction_uuid=name, table_name=self.table_name)
+            )
+
+        from_query = " UNION ALL ".join(from_query_parts)
+
+        query = self._SELECT_ENTRIES_QUERY.format(from_parts=from_query)
+        return query
+
+    def _build_condition(self, condition: _Condition) -> str:
+        if isinstance(condition, _NotCondition):
+            return self._build_condition_not(condition)
+        if isinstance(condition, _ComposedCondition):
+            return self._build_condition_composed(condition)
+        if isinstance(condition, _TrueCondition):
+            return "TRUE"
+        if isinstance(condition, _FalseCondition):
+            return "FALSE"
+        if isinstance(condition, _LikeCondition):
+            return self._build_condition_like(condition)
+        if isinstance(condition, _InCondition):
+            return self._build_condition_in(condition)
+        if isinstance(condition, _SimpleCondition):
+            return self._build_condition_simple(condition)
+
+        raise ValueError(f"Given condition is not supported. Obtained: {condition}")
+
+    def _build_condition_not(self, condition: _NotCondition) -> str:
+        return f"(NOT {self._build_condition(condition.inner)})"
+
+    def _build_condition_composed(self, condition: _ComposedCondition) -> str:
+        # noinspection PyTypeChecker
+        operator = self._COMPOSED_MAPPER[type(condition)]
+        parts = (self._build_condition(c) for c in condition)
+        return f"({operator.join(parts)})"
+
+    def _build_condition_simple(self, condition: _SimpleCondition) -> str:
+        field = condition.field
+        # noinspection PyTypeChecker
+        operator = self._SIMPLE_MAPPER[type(condition)]
+
+        parameter = AvroDataEncoder(condition.parameter).build()
+
+        if field in self._FIXED_FIELDS_MAPPER:
+            name = self._add_parameter(parameter)
+            field = self._FIXED_FIELDS_MAPPER[field]
+            return f"({field} {operator} %({name})s)"
+        else:
+            path = self._add_parameter(self._build_path(field))
+            name = self._add_parameter(json.dumps(parameter))
+            return f"(data#>%({path})s::text[] {operator} %({name})s::jsonb)"
+
+    def _build_condition_in(self, condition: _InCondition) -> str:
+        field = condition.field
+
+        parameter = AvroDataEncoder(condition.parameter).build()
+        if not len(parameter):
+            return self._build_condition(_FALSE_CONDITION)
+
+        if field in self._FIXED_FIELDS_MAPPER:
+            name = self._add_parameter(tuple(parameter))
+            field = self._FIXED_FIELDS_MAPPER[field]
+            return f"({field} = ANY(%({name})s))"
+        else:
+            path = self._add_parameter(self._build_path(field))
+            name = self._add_parameter(tuple(json.dumps(value) for value in parameter))
+            return f"(data#>%({path})s::text[] = ANY(%({name})s::jsonb[]))"
+
+    def _build_condition_like(self, condition: _SimpleCondition) -> str:
+        field = condition.field
+
+        parameter = AvroDataEncoder(condition.parameter).build()
+
+        if field in self._FIXED_FIELDS_MAPPER:
+            name = self._add_parameter(parameter)
+            field = self._FIXED_FIELDS_MAPPER[field]
+            return f"({field}::text LIKE %({name})s)"
+        else:
+            path = self._add_parameter(self._build_path(field))
+            name = self._add_parameter(parameter)
+            return f"(data#>>%({path})s::text[] LIKE %({name})s)"
+
+    def _build_ordering(self, ordering: _Ordering) -> str:
+        field = ordering.by
+        direction = self._ORDERING_MAPPER[ordering.reverse]
+
+        if field in self._FIXED_FIELDS_MAPPER:
+            field = self._FIXED_FIELDS_MAPPER[field]
+            order_by = f"ORDER BY {field} {direction}"
+        else:
+            path = self._add_parameter(self._build_path(field))
+            order_by = f"ORDER BY data#>%({path})s::text[] {direction}"
+
+        return order_by
+
+    def _build_limit(self, value: int) -> str:
+        name = self._add_parameter(value)
+        return f"LIMIT %({name})s"
+
+    @staticmethod
+    def _build_path(field: str) -> list[str]:
+        return field.split(".")
+
+    def _add_parameter(self, value: Any) -> str:
+        name = f"parameter_{len(self._parameters)}"
+        self._parameters[name] = value
+        return name
+
+    _COMPOSED_MAPPER = {_AndCondition: " AND ", _OrCondition: " OR "}
+
+    _SIMPLE_MAPPER = {
+        _LowerCondition: "<",
+        _LowerEqualCondition: "<=",
+        _GreaterCondition: ">",
+        _GreaterEqualCondition: ">=",
+        _EqualCondition: "=",
+        _NotEqualCondition: "<>",
+    }
+
+    _FIXED_FIELDS_MAPPER = {
+        "uuid": "uuid",
+        "version": "version",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    }
+
+    _ORDERING_MAPPER = {
+        True: "DESC",
+        False: "ASC",
+    }
+
+    _SELECT_ENTRIES_QUERY = (
+        "SELECT "
+        "   t2.uuid, "
+        "   t2.name, "
+        "   t2.version, "
+        "   t2.schema, "
+        "   t2.data, "
+        "   t2.created_at, "
+        "   t2.updated_at, "
+        "   t2.transaction_uuid "
+        "FROM ("
+        "   SELECT DISTINCT ON (uuid) t1.* "
+        "   FROM ( {from_parts} ) AS t1 "
+        "   ORDER BY uuid, transaction_index DESC "
+        ") AS t2"
+    )
+
+    _SELECT_TRANSACTION_CHUNK = (
+        "SELECT {index} AS transaction_index, * "
+        "FROM {table_name} "
+        "WHERE name = %(name)s AND transaction_uuid = %({transaction_uuid})s "
+    )
+
+    _EXCLUDE_DELETED_CONDITION = "(data IS NOT NULL)"
@@ -0,0 +1,9 @@
+from .locks import (
+    AsyncpgLockDatabaseOperationFactory,
+)
+from .managemens import (
+    AsyncpgManagementDatabaseOperationFactory,
+)
+from .registries import (
+    AsyncpgAvroSchemaRegistryDatabaseOperationFactory,
+)
@@ -0,0 +1,34 @@
+from minos.common import (
+    DatabaseOperation,
+    LockDatabaseOperationFactory,
+)
+
+from ...clients import (
+    AsyncpgDatabaseClient,
+)
+from ...operations import (
+    AsyncpgDatabaseOperation,
+)
+
+
+class AsyncpgLockDatabaseOperationFactory(LockDatabaseOperationFactory):
+    """Asyncpg Lock Database Operation Factory class."""
+
+    def build_acquire(self, hashed_key: int) -> DatabaseOperation:
+        """Build the database operation to acquire the lock.
+
+        :param hashed_key: The hashed key that identifies the lock.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation("select pg_advisory_lock(%(hashed_key)s)", {"hashed_key": hashed_key})
+
+    def build_release(self, hashed_key: int) -> DatabaseOperation:
+        """Build the database operation to release the lock.
+
+        :param hashed_key: The hashed key that identifies the lock.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation("select pg_advisory_unlock(%(hashed_key)s)", {"hashed_key": hashed_key})
+
+
+AsyncpgDatabaseClient.set_factory(LockDatabaseOperationFactory, AsyncpgLockDatabaseOperationFactory)
@@ -0,0 +1,35 @@
+from minos.common import (
+    DatabaseOperation,
+    ManagementDatabaseOperationFactory,
+)
+
+from ...clients import (
+    AsyncpgDatabaseClient,
+)
+from ...operations import (
+    AsyncpgDatabaseOperation,
+)
+
+
+# noinspection SqlNoDataSourceInspection
+class AsyncpgManagementDatabaseOperationFactory(ManagementDatabaseOperationFactory):
+    """Asyncpg Manage Database Operation Factory class."""
+
+    def build_create(self, database: str) -> DatabaseOperation:
+        """Build the database operation to create a database.
+
+        :param database: The new database's name.
+        :return: A ``DatabaseOperation``.
+        """
+        return AsyncpgDatabaseOperation(f"CREATE DATABASE {database};")
+
+    def build_delete(self, database: str) -> DatabaseOperation:
+        """Build the database operation to create a database.
+
+        :param database: The name of the database to be deleted.
+        :return: A ``DatabaseOperation``.
+        """
+        return AsyncpgDatabaseOperation(f"DROP DATABASE IF EXISTS {database};")
+
+
+AsyncpgDatabaseClient.set_factory(ManagementDatabaseOperationFactory, AsyncpgManagementDatabaseOperationFactory)
@@ -0,0 +1,77 @@
+from collections.abc import (
+    Iterable,
+)
+
+from minos.common import (
+    AvroSchemaRegistryDatabaseOperationFactory,
+    DatabaseOperation,
+)
+
+from ...clients import (
+    AsyncpgDatabaseClient,
+)
+from ...operations import (
+    AsyncpgDatabaseOperation,
+)
+
+
+# noinspection SqlNoDataSourceInspection,SqlResolve
+class AsyncpgAvroSchemaRegistryDatabaseOperationFactory(AvroSchemaRegistryDatabaseOperationFactory):
+    """Asyncpg Avro Schema Registry Database Operation Factory class."""
+
+    @staticmethod
+    def build_table_name() -> str:
+        """Build the table name.
+
+        :return: A ``str`` instance.
+        """
+        return "avro_schemas"
+
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the schema registry table.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"CREATE TABLE IF NOT EXISTS {self.build_table_name()} ("
+            "   fingerprint BIGINT NOT NULL PRIMARY KEY, "
+            "   schema TEXT NOT NULL, "
+            "   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"
+            ")",
+            lock=self.build_table_name(),
+        )
+
+    def build_submit(self, fingerprint: int, schema: str) -> DatabaseOperation:
+        """Build the database operation to store a schema.
+
+        :param fingerprint: The signed 64-bit fingerprint of the schema.
+        :param schema: The ``json`` representation of the schema.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"INSERT INTO {self.build_table_name()} (fingerprint, schema) "
+            "VALUES (%(fingerprint)s, %(schema)s) "
+            "ON CONFLICT (fingerprint) DO NOTHING",
+            {
+                "fingerprint": fingerprint,
+                "schema": schema,
+            },
+        )
+
+    def build_query(self, fingerprints: Iterable[int]) -> DatabaseOperation:
+        """Build the database operation to get the schemas identified by the given fingerprints.
+
+        :param fingerprints: The signed 64-bit fingerprints of the schemas.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            f"SELECT fingerprint, schema FROM {self.build_table_name()} "
+            "WHERE fingerprint = ANY(%(fingerprints)s::bigint[])",
+            {"fingerprints": tuple(fingerprints)},
+        )
+
+
+AsyncpgDatabaseClient.set_factory(
+    AvroSchemaRegistryDatabaseOperationFactory,
+    AsyncpgAvroSchemaRegistryDatabaseOperationFactory,
+)
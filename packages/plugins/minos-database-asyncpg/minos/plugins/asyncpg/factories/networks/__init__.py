@@ -0,0 +1,10 @@
+from .collections import (
+    AsyncpgBrokerQueueDatabaseOperationFactory,
+)
+from .publishers import (
+    AsyncpgBrokerPublisherQueueDatabaseOperationFactory,
+)
+from .subscribers import (
+    AsyncpgBrokerSubscriberDuplicateValidatorDatabaseOperationFactory,
+    AsyncpgBrokerSubscriberQueueDatabaseOperationFactory,
+)
@@ -0,0 +1,3 @@
+from .queues import (
+    AsyncpgBrokerPublisherQueueDatabaseOperationFactory,
+)
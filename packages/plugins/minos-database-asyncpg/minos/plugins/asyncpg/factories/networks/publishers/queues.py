@@ -0,0 +1,28 @@
+from minos.networks import (
+    BrokerPublisherQueueDatabaseOperationFactory,
+)
+
+from ....clients import (
+    AsyncpgDatabaseClient,
+)
+from ..collections import (
+    AsyncpgBrokerQueueDatabaseOperationFactory,
+)
+
+
+class AsyncpgBrokerPublisherQueueDatabaseOperationFactory(
+    BrokerPublisherQueueDatabaseOperationFactory, AsyncpgBrokerQueueDatabaseOperationFactory
+):
+    """Asyncpg Broker Publisher Queue Query Factory class."""
+
+    def build_table_name(self) -> str:
+        """Get the table name.
+
+        :return: A ``str`` value.
+        """
+        return "broker_publisher_queue"
+
+
+AsyncpgDatabaseClient.set_factory(
+    BrokerPublisherQueueDatabaseOperationFactory, AsyncpgBrokerPublisherQueueDatabaseOperationFactory
+)
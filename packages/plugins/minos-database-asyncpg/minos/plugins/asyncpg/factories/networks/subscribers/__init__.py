@@ -0,0 +1,6 @@
+from .queues import (
+    AsyncpgBrokerSubscriberQueueDatabaseOperationFactory,
+)
+from .validators import (
+    AsyncpgBrokerSubscriberDuplicateValidatorDatabaseOperationFactory,
+)
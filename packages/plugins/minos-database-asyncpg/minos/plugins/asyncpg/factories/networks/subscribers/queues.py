@@ -0,0 +1,68 @@
+from collections.abc import (
+    Iterable,
+)
+
+from minos.common import (
+    DatabaseOperation,
+)
+from minos.networks import (
+    BrokerSubscriberQueueDatabaseOperationFactory,
+)
+
+from ....clients import (
+    AsyncpgDatabaseClient,
+)
+from ....operations import (
+    AsyncpgDatabaseOperation,
+)
+from ..collections import (
+    AsyncpgBrokerQueueDatabaseOperationFactory,
+)
+
+
+# noinspection SqlNoDataSourceInspection,SqlResolve,PyTypeChecker,PyArgumentList
+class AsyncpgBrokerSubscriberQueueDatabaseOperationFactory(
+    BrokerSubscriberQueueDatabaseOperationFactory, AsyncpgBrokerQueueDatabaseOperationFactory
+):
+    """Asyncpg Broker Subscriber Queue Database Operation Factory class."""
+
+    def build_table_name(self) -> str:
+        """Get the table name.
+
+        :return: A ``str`` value.
+        """
+        return "broker_subscriber_queue"
+
+    def build_count(self, retry: int, topics: Iterable[str] = tuple(), *args, **kwargs) -> DatabaseOperation:
+        """Build the "count not processed" query.
+
+        :return:
+        """
+        return AsyncpgDatabaseOperation(
+            f"SELECT COUNT(*) FROM (SELECT id FROM {self.build_table_name()} "
+            "WHERE NOT processing AND retry < %(retry)s AND topic = ANY(%(topics)s::text[]) FOR UPDATE SKIP LOCKED) s",
+            {"retry": retry, "topics": tuple(topics)},
+        )
+
+    def build_query(
+        self, retry: int, records: int, topics: Iterable[str] = tuple(), *args, **kwargs
+    ) -> DatabaseOperation:
+        """Build the "select not processed" query.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AsyncpgDatabaseOperation(
+            "SELECT id, data "
+            f"FROM {self.build_table_name()} "
+            "WHERE NOT processing AND retry < %(retry)s AND topic = ANY(%(topics)s::text[]) "
+            "ORDER BY created_at "
+            "LIMIT %(records)s "
+            "FOR UPDATE SKIP LOCKED",
+            {"retry": retry, "topics": tuple(topics), "records": records},
+        )
+
+
+AsyncpgDatabaseClient.set_factory(
+    BrokerSubscriberQueueDatabaseOperationFactory,
+    AsyncpgBrokerSubscriberQueueDatabaseOperationFactory,
+)
@@ -0,0 +1,63 @@
+from __future__ import (
+    annotations,
+)
+
+import re
+from functools import (
+    lru_cache,
+)
+from typing import (
+    Any,
+)
+
+from minos.common import (
+    DatabaseOperation,
+)
+
+_PLACEHOLDER_PATTERN = re.compile(r"%\((?P<name>[^)]+)\)s|%(?P<other>.)", re.DOTALL)
+
+
+class AsyncpgDatabaseOperation(DatabaseOperation):
+    """Asyncpg Database Operation class.
+
+    The query parameters are referenced by name with ``%(name)s`` placeholders, which are translated into the native
+    positional ones (``$1``, ``$2``, ...) before being sent to the database.
+    """
+
+    def __init__(self, query: str, parameters: dict[str, Any] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if parameters is None:
+            parameters = dict()
+        self.query = query
+        self.parameters = parameters
+
+    def build(self) -> tuple[str, tuple[Any, ...]]:
+        """Build the native query and its positional arguments.
+
+        :return: A tuple containing the query (with ``$n`` positional placeholders) and the arguments (following the
+            positional order).
+        """
+        query, names = build_positional_query(self.query)
+        return query, tuple(self.parameters[name] for name in names)
+
+
+@lru_cache(maxsize=1024)
+def build_positional_query(query: str) -> tuple[str, tuple[str, ...]]:
+    """Translate a query with named placeholders into a query with positional ones.
+
+    :param query: The query, containing ``%(name)s`` placeholders (and ``%%`` to represent a literal ``%``).
+    :return: A tuple containing the query (with ``$n`` positional placeholders) and the placeholder names (following
+        the positional order).
+    """
+    names = dict()
+
+    def _replace(match: re.Match) -> str:
+        if (name := match["name"]) is not None:
+            if name not in names:
+                names[name] = len(names) + 1
+            return f"${names[name]}"
+        if match["other"] == "%":
+            return "%"
+        raise ValueError(f"Unsupported placeholder: {match[0]!r}")
+
+    return _PLACEHOLDER_PATTERN.sub(_replace, query), tuple(names)
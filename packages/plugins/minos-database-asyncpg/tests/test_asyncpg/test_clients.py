@@ -0,0 +1,304 @@
+import unittest
+from unittest.mock import (
+    call,
+    patch,
+)
+
+import asyncpg
+from asyncpg import (
+    Connection,
+    Record,
+)
+from asyncpg.exceptions import (
+    ConnectionDoesNotExistError,
+    UniqueViolationError,
+)
+
+from minos.common import (
+    ComposedDatabaseOperation,
+    ConnectionException,
+    DatabaseOperation,
+    IntegrityException,
+    ProgrammingException,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgDatabaseClient,
+    AsyncpgDatabaseOperation,
+)
+from tests.utils import (
+    AsyncpgTestCase,
+)
+
+
+# noinspection SqlNoDataSourceInspection,SqlDialectInspection
+class TestAsyncpgDatabaseClient(AsyncpgTestCase):
+    def setUp(self):
+        super().setUp()
+        self.operation = AsyncpgDatabaseOperation(
+            "SELECT * FROM information_schema.tables WHERE table_schema = %(schema)s", {"schema": "pg_catalog"}
+        )
+
+    def test_constructor(self):
+        client = AsyncpgDatabaseClient("foo")
+        self.assertEqual("foo", client.database)
+        self.assertEqual("postgres", client.user)
+        self.assertEqual("", client.password)
+        self.assertEqual("localhost", client.host)
+        self.assertEqual(5432, client.port)
+        self.assertEqual(128, client.statement_cache_size)
+
+    def test_from_config(self):
+        default_database = self.config.get_default_database()
+        client = AsyncpgDatabaseClient.from_config(self.config)
+        self.assertEqual(default_database["database"], client.database)
+        self.assertEqual(default_database["user"], client.user)
+        self.assertEqual(default_database["password"], client.password)
+        self.assertEqual(default_database["host"], client.host)
+        self.assertEqual(default_database["port"], client.port)
+
+    async def test_is_valid(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            self.assertTrue(await client.is_valid())
+
+    async def test_is_connected_true(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            self.assertTrue(await client.is_connected())
+
+    async def test_is_connected_false_not_setup(self):
+        client = AsyncpgDatabaseClient.from_config(self.config)
+        self.assertFalse(await client.is_connected())
+
+    async def test_is_connected_false_closed(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with patch.object(Connection, "is_closed", return_value=True):
+                self.assertFalse(await client.is_connected())
+
+    async def test_connection(self):
+        client = AsyncpgDatabaseClient.from_config(self.config)
+        self.assertIsNone(client.connection)
+        async with client:
+            self.assertIsInstance(client.connection, Connection)
+        self.assertIsNone(client.connection)
+
+    async def test_connection_with_circuit_breaker(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as c1:
+            with patch.object(asyncpg, "connect", side_effect=(ConnectionRefusedError, c1.connection)):
+                async with AsyncpgDatabaseClient.from_config(self.config) as c2:
+                    self.assertEqual(c1.connection, c2.connection)
+
+    async def test_connection_recreate(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            c1 = client.connection
+            self.assertIsInstance(c1, Connection)
+
+            await client.recreate()
+
+            c2 = client.connection
+            self.assertIsInstance(c2, Connection)
+
+            self.assertNotEqual(c1, c2)
+
+    async def test_execute(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with patch.object(Connection, "fetch", return_value=list()) as fetch_mock:
+                await client.execute(self.operation)
+        self.assertEqual(
+            [call("SELECT * FROM information_schema.tables WHERE table_schema = $1", "pg_catalog", timeout=60)],
+            fetch_mock.call_args_list,
+        )
+
+    async def test_execute_disconnected(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.close()
+            self.assertFalse(await client.is_connected())
+
+            await client.execute(self.operation)
+            self.assertTrue(await client.is_connected())
+
+    async def test_execute_raises_unsupported(self):
+        class _DatabaseOperation(DatabaseOperation):
+            """For testing purposes."""
+
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with self.assertRaises(ValueError):
+                await client.execute(_DatabaseOperation())
+
+    async def test_execute_raises_integrity(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with patch.object(Connection, "fetch", side_effect=UniqueViolationError):
+                with self.assertRaises(IntegrityException):
+                    await client.execute(self.operation)
+
+    async def test_execute_raises_connection(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with patch.object(Connection, "fetch", side_effect=(ConnectionDoesNotExistError, list())) as mock:
+                await client.execute(self.operation)
+
+        self.assertEqual(2, mock.call_count)
+
+    async def test_execute_reuses_prepared_statements(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AsyncpgDatabaseOperation("SELECT %(value)s::int", {"value": 1}))
+            await client.execute(AsyncpgDatabaseOperation("SELECT %(value)s::int", {"value": 2}))
+            self.assertEqual((2,), await client.fetch_one())
+
+            # noinspection PyProtectedMember
+            self.assertEqual(1, sum(1 for _ in client.connection._stmt_cache.iter_statements()))
+
+    async def test_execute_composed_atomic(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AsyncpgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+            composed = ComposedDatabaseOperation(
+                [
+                    AsyncpgDatabaseOperation("INSERT INTO foo (id) VALUES (%(id)s)", {"id": 1}),
+                    AsyncpgDatabaseOperation("INSERT INTO foo (id) VALUES (%(id)s)", {"id": 1}),
+                ]
+            )
+            with self.assertRaises(IntegrityException):
+                await client.execute(composed)
+
+            await client.execute(AsyncpgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((0,), await client.fetch_one())
+
+    async def test_execute_composed_atomic_with_lock(self):
+        composed = ComposedDatabaseOperation(
+            [
+                AsyncpgDatabaseOperation("SELECT 1", lock="foo"),
+                AsyncpgDatabaseOperation("SELECT 2", lock="foo"),
+            ]
+        )
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with patch.object(AsyncpgDatabaseClient, "begin", side_effect=client.begin) as begin_mock:
+                await client.execute(composed)
+            self.assertEqual("foo", client.lock.key)
+            self.assertEqual((2,), await client.fetch_one())
+
+        self.assertEqual(1, begin_mock.call_count)
+
+    async def test_execute_composed_not_atomic(self):
+        composed = ComposedDatabaseOperation(
+            [
+                AsyncpgDatabaseOperation("SELECT 1", lock="foo"),
+                AsyncpgDatabaseOperation("SELECT 2", lock="bar"),
+            ]
+        )
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with patch.object(AsyncpgDatabaseClient, "begin") as begin_mock:
+                await client.execute(composed)
+            self.assertEqual((2,), await client.fetch_one())
+
+        self.assertEqual(0, begin_mock.call_count)
+
+    async def test_execute_composed_atomic_raises_connection(self):
+        composed = ComposedDatabaseOperation(
+            [AsyncpgDatabaseOperation("SELECT 1"), AsyncpgDatabaseOperation("SELECT 2")]
+        )
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with patch.object(
+                Connection, "fetch", side_effect=(ConnectionDoesNotExistError, list(), list())
+            ) as fetch_mock:
+                await client.execute(composed)
+
+        self.assertEqual(
+            [call("SELECT 1", timeout=60), call("SELECT 1", timeout=60), call("SELECT 2", timeout=60)],
+            fetch_mock.call_args_list,
+        )
+
+    async def test_transaction_commit(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AsyncpgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+
+            await client.begin()
+            await client.execute(AsyncpgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            await client.execute(AsyncpgDatabaseOperation("INSERT INTO foo (id) VALUES (2)"))
+
+            async with AsyncpgDatabaseClient.from_config(self.config) as other:
+                await other.execute(AsyncpgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+                self.assertEqual((0,), await other.fetch_one())
+
+                await client.commit()
+
+                await other.execute(AsyncpgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+                self.assertEqual((2,), await other.fetch_one())
+
+    async def test_transaction_rollback(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AsyncpgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+
+            await client.begin()
+            await client.execute(AsyncpgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            with self.assertRaises(IntegrityException):
+                await client.execute(AsyncpgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            await client.rollback()
+
+            await client.execute(AsyncpgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((0,), await client.fetch_one())
+
+    async def test_transaction_reset(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AsyncpgDatabaseOperation("CREATE TABLE foo (id INT PRIMARY KEY)"))
+
+            await client.begin()
+            await client.execute(AsyncpgDatabaseOperation("INSERT INTO foo (id) VALUES (1)"))
+            await client.reset()
+
+            await client.execute(AsyncpgDatabaseOperation("SELECT COUNT(*) FROM foo"))
+            self.assertEqual((0,), await client.fetch_one())
+
+    async def test_transaction_raises_disconnected(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.begin()
+
+            with patch.object(AsyncpgDatabaseClient, "is_connected", return_value=False):
+                with self.assertRaises(ConnectionException):
+                    await client.execute(self.operation)
+                await client.rollback()
+
+            await client.execute(self.operation)
+
+    async def test_transaction_raises_connection(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.begin()
+            with patch.object(Connection, "fetch", side_effect=(ConnectionDoesNotExistError, list())) as mock:
+                with self.assertRaises(ConnectionException):
+                    await client.execute(self.operation)
+            await client.rollback()
+
+        self.assertEqual(1, mock.call_count)
+
+    async def test_fetch_one(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(self.operation)
+            observed = await client.fetch_one()
+        self.assertIsInstance(observed, Record)
+
+    async def test_fetch_one_raises_programming_not_executed(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            with self.assertRaises(ProgrammingException):
+                await client.fetch_one()
+
+    async def test_fetch_one_raises_programming_empty(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AsyncpgDatabaseOperation("SELECT 1 WHERE FALSE"))
+            with self.assertRaises(ProgrammingException):
+                await client.fetch_one()
+
+    async def test_fetch_all(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(self.operation)
+            observed = [value async for value in client.fetch_all()]
+
+        self.assertGreater(len(observed), 0)
+        for obs in observed:
+            self.assertIsInstance(obs, Record)
+
+    async def test_fetch_all_consumed(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(AsyncpgDatabaseOperation("SELECT generate_series(1, 3)"))
+            self.assertEqual((1,), await client.fetch_one())
+            self.assertEqual([(2,), (3,)], [row async for row in client.fetch_all()])
+            self.assertEqual([], [row async for row in client.fetch_all()])
+
+
+if __name__ == "__main__":
+    unittest.main()
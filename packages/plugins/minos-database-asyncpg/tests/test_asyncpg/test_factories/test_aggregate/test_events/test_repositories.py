@@ -0,0 +1,74 @@
+import unittest
+
+from minos.aggregate import (
+    Action,
+    DatabaseEventRepository,
+    EventEntry,
+    EventRepository,
+    EventRepositoryConflictException,
+)
+from minos.aggregate.testing import (
+    EventRepositoryTestCase,
+)
+from minos.common import (
+    NULL_UUID,
+    DatabaseClientPool,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgDatabaseClient,
+    AsyncpgDatabaseOperation,
+)
+from tests.utils import (
+    AsyncpgTestCase,
+)
+
+
+# noinspection SqlNoDataSourceInspection
+class TestDatabaseEventRepositorySubmit(AsyncpgTestCase, EventRepositoryTestCase):
+    __test__ = True
+
+    def build_event_repository(self) -> EventRepository:
+        """Fort testing purposes."""
+        return DatabaseEventRepository.from_config(self.config)
+
+    def test_constructor(self):
+        pool = DatabaseClientPool.from_config(self.config)
+        repository = DatabaseEventRepository(pool)
+        self.assertIsInstance(repository, DatabaseEventRepository)
+        self.assertIsInstance(repository.database_pool, DatabaseClientPool)
+
+    def test_from_config(self):
+        repository = DatabaseEventRepository.from_config(self.config)
+        self.assertIsInstance(repository.database_pool, DatabaseClientPool)
+
+    async def test_setup(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            operation = AsyncpgDatabaseOperation(
+                "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'aggregate_event');"
+            )
+            await client.execute(operation)
+            response = (await client.fetch_one())[0]
+        self.assertTrue(response)
+
+    async def test_submit_many_atomic(self):
+        await self.event_repository.submit(EventEntry(self.uuid, "example.Car", 1, action=Action.CREATE))
+        entries = [
+            EventEntry(self.uuid_2, "example.Car", action=Action.CREATE),
+            EventEntry(self.uuid, "example.Car", 1, action=Action.CREATE),
+        ]
+        with self.assertRaises(EventRepositoryConflictException):
+            await self.event_repository.submit_many(entries)
+
+        self.assertEqual([self.uuid], [entry.uuid async for entry in self.event_repository.select()])
+
+    async def test_submit_many_generate_uuid(self):
+        entries = [EventEntry(NULL_UUID, "example.Car", action=Action.CREATE) for _ in range(3)]
+        observed = await self.event_repository.submit_many(entries, batch_size=2)
+
+        self.assertEqual([1, 2, 3], [entry.id for entry in observed])
+        self.assertEqual([1, 1, 1], [entry.version for entry in observed])
+        self.assertEqual(3, len({entry.uuid for entry in observed} - {NULL_UUID}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,250 @@
+import unittest
+from unittest.mock import (
+    MagicMock,
+)
+from uuid import (
+    uuid4,
+)
+
+from minos.aggregate import (
+    IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR,
+    Condition,
+    Ordering,
+)
+from minos.common import (
+    NULL_UUID,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgDatabaseClient,
+    AsyncpgDatabaseOperation,
+    AsyncpgSnapshotQueryDatabaseOperationBuilder,
+)
+from tests.utils import (
+    AsyncpgTestCase,
+)
+
+
+class TestAsyncpgSnapshotQueryDatabaseOperationBuilder(AsyncpgTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.classname = "path.to.Product"
+        self.base_parameters = {
+            "name": self.classname,
+            "transaction_uuid_1": NULL_UUID,
+        }
+        self.base_select = AsyncpgSnapshotQueryDatabaseOperationBuilder._SELECT_ENTRIES_QUERY.format(
+            from_parts=AsyncpgSnapshotQueryDatabaseOperationBuilder._SELECT_TRANSACTION_CHUNK.format(
+                index=1, transaction_uuid="transaction_uuid_1", table_name="snapshot"
+            )
+        )
+
+    def test_constructor(self):
+        qb = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE)
+        self.assertEqual(self.classname, qb.name)
+        self.assertEqual(Condition.TRUE, qb.condition)
+        self.assertEqual(None, qb.ordering)
+        self.assertEqual(None, qb.limit)
+        self.assertEqual((NULL_UUID,), qb.transaction_uuids)
+        self.assertFalse(qb.exclude_deleted)
+        self.assertEqual("snapshot", qb.table_name)
+
+    def test_constructor_full(self):
+        transaction_uuids = (NULL_UUID, uuid4())
+        qb = AsyncpgSnapshotQueryDatabaseOperationBuilder(
+            self.classname, Condition.TRUE, Ordering.ASC("name"), 10, transaction_uuids, True, "foo"
+        )
+        self.assertEqual(self.classname, qb.name)
+        self.assertEqual(Condition.TRUE, qb.condition)
+        self.assertEqual(Ordering.ASC("name"), qb.ordering)
+        self.assertEqual(10, qb.limit)
+        self.assertEqual(transaction_uuids, qb.transaction_uuids)
+        self.assertTrue(qb.exclude_deleted)
+        self.assertEqual("foo", qb.table_name)
+
+    def test_build_submitting_context_var(self):
+        builder = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE)
+
+        def _fn():
+            self.assertEqual(True, IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.get())
+            return ""
+
+        builder._build = MagicMock(side_effect=_fn)
+
+        self.assertEqual(False, IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.get())
+        builder.build()
+        self.assertEqual(False, IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.get())
+        self.assertEqual(1, builder._build.call_count)
+
+    def test_build_with_transactions(self):
+        transaction_uuids = (NULL_UUID, uuid4())
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(
+            self.classname, Condition.TRUE, transaction_uuids=transaction_uuids
+        ).build()
+
+        self.assertIn("SELECT 1 AS transaction_index", observed[0])
+        self.assertIn("SELECT 2 AS transaction_index", observed[0])
+        self.assertIn("transaction_uuid = %(transaction_uuid_2)s", observed[0])
+        self.assertEqual(
+            {"name": self.classname, "transaction_uuid_1": NULL_UUID, "transaction_uuid_2": transaction_uuids[1]},
+            observed[1],
+        )
+
+    def test_build_true(self):
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE).build()
+
+        self.assertEqual((f"{self.base_select} WHERE TRUE", self.base_parameters), observed)
+
+    def test_build_false(self):
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.FALSE).build()
+
+        self.assertEqual((f"{self.base_select} WHERE FALSE", self.base_parameters), observed)
+
+    def test_build_fixed_uuid(self):
+        uuid = uuid4()
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.EQUAL("uuid", uuid)).build()
+
+        expected_query = f"{self.base_select} WHERE (uuid = %(parameter_2)s)"
+        expected_parameters = self.base_parameters | {"parameter_2": str(uuid)}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_fixed_with_like(self):
+        condition = Condition.LIKE("uuid", "a%")
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE (uuid::text LIKE %(parameter_2)s)"
+        expected_parameters = self.base_parameters | {"parameter_2": "a%"}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_fixed_in(self):
+        condition = Condition.IN("version", [1, 2])
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE (version = ANY(%(parameter_2)s))"
+        expected_parameters = self.base_parameters | {"parameter_2": (1, 2)}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_lower(self):
+        condition = Condition.LOWER("address.age", 1)
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE (data#>%(parameter_2)s::text[] < %(parameter_3)s::jsonb)"
+        expected_parameters = self.base_parameters | {"parameter_2": ["address", "age"], "parameter_3": "1"}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_not_equal(self):
+        condition = Condition.NOT_EQUAL("name", "foo")
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE (data#>%(parameter_2)s::text[] <> %(parameter_3)s::jsonb)"
+        expected_parameters = self.base_parameters | {"parameter_2": ["name"], "parameter_3": '"foo"'}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_in(self):
+        condition = Condition.IN("age", [1, 2, 3])
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE (data#>%(parameter_2)s::text[] = ANY(%(parameter_3)s::jsonb[]))"
+        expected_parameters = self.base_parameters | {"parameter_2": ["age"], "parameter_3": ("1", "2", "3")}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_in_empty(self):
+        condition = Condition.IN("age", [])
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        self.assertEqual((f"{self.base_select} WHERE FALSE", self.base_parameters), observed)
+
+    def test_build_like(self):
+        condition = Condition.LIKE("name", "a%")
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE (data#>>%(parameter_2)s::text[] LIKE %(parameter_3)s)"
+        expected_parameters = self.base_parameters | {"parameter_2": ["name"], "parameter_3": "a%"}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_not(self):
+        condition = Condition.NOT(Condition.LOWER("version", 1))
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE (NOT (version < %(parameter_2)s))"
+        expected_parameters = self.base_parameters | {"parameter_2": 1}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_and(self):
+        condition = Condition.AND(Condition.LOWER("version", 1), Condition.GREATER("version", 3))
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE ((version < %(parameter_2)s) AND (version > %(parameter_3)s))"
+        expected_parameters = self.base_parameters | {"parameter_2": 1, "parameter_3": 3}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_or(self):
+        condition = Condition.OR(Condition.LOWER("version", 1), Condition.GREATER_EQUAL("version", 3))
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
+
+        expected_query = f"{self.base_select} WHERE ((version < %(parameter_2)s) OR (version >= %(parameter_3)s))"
+        expected_parameters = self.base_parameters | {"parameter_2": 1, "parameter_3": 3}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_exclude_deleted(self):
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(
+            self.classname, Condition.TRUE, exclude_deleted=True
+        ).build()
+
+        self.assertEqual((f"{self.base_select} WHERE TRUE AND (data IS NOT NULL)", self.base_parameters), observed)
+
+    def test_build_fixed_ordering_asc(self):
+        ordering = Ordering.ASC("created_at")
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, ordering).build()
+
+        self.assertEqual((f"{self.base_select} WHERE TRUE ORDER BY created_at ASC", self.base_parameters), observed)
+
+    def test_build_ordering_desc(self):
+        ordering = Ordering.DESC("name")
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, ordering).build()
+
+        expected_query = f"{self.base_select} WHERE TRUE ORDER BY data#>%(parameter_2)s::text[] DESC"
+        expected_parameters = self.base_parameters | {"parameter_2": ["name"]}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_limit(self):
+        observed = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, limit=10).build()
+
+        expected_query = f"{self.base_select} WHERE TRUE LIMIT %(parameter_2)s"
+        expected_parameters = self.base_parameters | {"parameter_2": 10}
+        self.assertEqual((expected_query, expected_parameters), observed)
+
+    def test_build_same_structure_same_query(self):
+        one = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.EQUAL("name", "foo")).build()
+        two = AsyncpgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.EQUAL("age", 3)).build()
+
+        self.assertEqual(one[0], two[0])
+        self.assertNotEqual(one[1], two[1])
+
+    async def test_build_complex(self):
+        condition = Condition.AND(
+            Condition.EQUAL("inventory.amount", 0),
+            Condition.OR(Condition.IN("title", ["Fanta Zero", "Coke"]), Condition.GREATER("version", 1)),
+            Condition.LIKE("title", "C%"),
+        )
+        ordering = Ordering.DESC("updated_at")
+        query, parameters = AsyncpgSnapshotQueryDatabaseOperationBuilder(
+            self.classname, condition, ordering, limit=100, exclude_deleted=True
+        ).build()
+
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(
+                AsyncpgDatabaseOperation(
+                    "CREATE TABLE snapshot ("
+                    "   uuid UUID, name TEXT, version INT, schema BYTEA, data JSONB, created_at TIMESTAMPTZ, "
+                    "   updated_at TIMESTAMPTZ, transaction_uuid UUID"
+                    ")"
+                )
+            )
+            await client.execute(AsyncpgDatabaseOperation(query, parameters))
+            observed = [row async for row in client.fetch_all()]
+
+        self.assertEqual([], observed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from minos.aggregate import (
+    DatabaseSnapshotRepository,
+)
+from minos.aggregate.testing import (
+    SnapshotRepositoryTestCase,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgDatabaseClient,
+    AsyncpgDatabaseOperation,
+)
+from tests.utils import (
+    AsyncpgTestCase,
+)
+
+
+# noinspection SqlNoDataSourceInspection
+class TestDatabaseSnapshotRepository(AsyncpgTestCase, SnapshotRepositoryTestCase):
+    __test__ = True
+
+    def build_snapshot_repository(self):
+        return DatabaseSnapshotRepository.from_config(self.config)
+
+    async def test_setup_snapshot_table(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            operation = AsyncpgDatabaseOperation(
+                "SELECT EXISTS (SELECT FROM pg_tables WHERE schemaname = 'public' AND tablename = 'snapshot');"
+            )
+            await client.execute(operation)
+            observed = (await client.fetch_one())[0]
+        self.assertEqual(True, observed)
+
+    async def test_setup_snapshot_aux_offset_table(self):
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            operation = AsyncpgDatabaseOperation(
+                "SELECT EXISTS (SELECT FROM pg_tables WHERE "
+                "schemaname = 'public' AND tablename = 'snapshot_aux_offset');"
+            )
+            await client.execute(operation)
+            observed = (await client.fetch_one())[0]
+        self.assertEqual(True, observed)
+
+    async def test_is_synced(self):
+        await self.populate()
+        self.assertFalse(await self.snapshot_repository.is_synced(SnapshotRepositoryTestCase.Car))
+        await self.snapshot_repository.synchronize()
+        self.assertTrue(await self.snapshot_repository.is_synced(SnapshotRepositoryTestCase.Car))
+
+    async def test_rebuild(self):
+        await self.populate_and_synchronize()
+        expected = await self._get_snapshot_rows()
+
+        await self.snapshot_repository.rebuild(batch_size=2)
+        self.assertEqual(expected, await self._get_snapshot_rows())
+
+        self.assertTrue(await self.snapshot_repository.is_synced(SnapshotRepositoryTestCase.Car))
+
+    async def _get_snapshot_rows(self) -> list[tuple]:
+        async with AsyncpgDatabaseClient.from_config(self.config) as client:
+            await client.execute(
+                AsyncpgDatabaseOperation(
+                    "SELECT uuid, name, version, schema, data, created_at, updated_at, transaction_uuid "
+                    "FROM snapshot ORDER BY uuid, transaction_uuid;"
+                )
+            )
+            return [row async for row in client.fetch_all()]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from minos.common import (
+    LockDatabaseOperationFactory,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgDatabaseOperation,
+    AsyncpgLockDatabaseOperationFactory,
+)
+
+
+class TestAsyncpgLockDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AsyncpgLockDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(AsyncpgLockDatabaseOperationFactory, LockDatabaseOperationFactory))
+
+    def test_build_acquire(self):
+        operation = self.factory.build_acquire(56)
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+
+    def test_build_release(self):
+        operation = self.factory.build_release(56)
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from minos.common import (
+    ManagementDatabaseOperationFactory,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgDatabaseOperation,
+    AsyncpgManagementDatabaseOperationFactory,
+)
+
+
+class TestAsyncpgManagementDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AsyncpgManagementDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(AsyncpgManagementDatabaseOperationFactory, ManagementDatabaseOperationFactory))
+
+    def test_build_create(self):
+        operation = self.factory.build_create("foo")
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+
+    def test_build_delete(self):
+        operation = self.factory.build_delete("foo")
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+
+
+if __name__ == "__main__":
+    unittest.main()
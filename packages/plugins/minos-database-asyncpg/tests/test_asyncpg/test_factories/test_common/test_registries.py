@@ -0,0 +1,40 @@
+import unittest
+
+from minos.common import (
+    AvroSchemaRegistryDatabaseOperationFactory,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgAvroSchemaRegistryDatabaseOperationFactory,
+    AsyncpgDatabaseOperation,
+)
+
+
+class TestAsyncpgAvroSchemaRegistryDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AsyncpgAvroSchemaRegistryDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(
+            issubclass(AsyncpgAvroSchemaRegistryDatabaseOperationFactory, AvroSchemaRegistryDatabaseOperationFactory)
+        )
+
+    def test_build_table_name(self):
+        self.assertEqual("avro_schemas", self.factory.build_table_name())
+
+    def test_build_create(self):
+        operation = self.factory.build_create()
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+
+    def test_build_submit(self):
+        operation = self.factory.build_submit(-56, '{"type": "string"}')
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+        self.assertEqual({"fingerprint": -56, "schema": '{"type": "string"}'}, operation.parameters)
+
+    def test_build_query(self):
+        operation = self.factory.build_query([56, -56])
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+        self.assertEqual({"fingerprints": (56, -56)}, operation.parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from minos.networks import (
+    BrokerPublisherQueueDatabaseOperationFactory,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgBrokerPublisherQueueDatabaseOperationFactory,
+    AsyncpgBrokerQueueDatabaseOperationFactory,
+)
+
+
+class TestAsyncpgBrokerPublisherQueueDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AsyncpgBrokerPublisherQueueDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(
+            AsyncpgBrokerPublisherQueueDatabaseOperationFactory,
+            (BrokerPublisherQueueDatabaseOperationFactory, AsyncpgBrokerQueueDatabaseOperationFactory),
+        )
+
+    def test_build_table_name(self):
+        self.assertEqual("broker_publisher_queue", self.factory.build_table_name())
+
+
+if __name__ == "__main__":
+    unittest.main()
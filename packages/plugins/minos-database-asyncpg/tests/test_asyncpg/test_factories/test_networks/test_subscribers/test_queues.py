@@ -0,0 +1,38 @@
+import unittest
+
+from minos.networks import (
+    BrokerSubscriberQueueDatabaseOperationFactory,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgBrokerQueueDatabaseOperationFactory,
+    AsyncpgBrokerSubscriberQueueDatabaseOperationFactory,
+    AsyncpgDatabaseOperation,
+)
+
+
+class TestAsyncpgBrokerSubscriberQueueDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AsyncpgBrokerSubscriberQueueDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(
+            issubclass(
+                AsyncpgBrokerSubscriberQueueDatabaseOperationFactory,
+                (BrokerSubscriberQueueDatabaseOperationFactory, AsyncpgBrokerQueueDatabaseOperationFactory),
+            )
+        )
+
+    def test_build_table_name(self):
+        self.assertEqual("broker_subscriber_queue", self.factory.build_table_name())
+
+    def test_build_build_count(self):
+        operation = self.factory.build_count(retry=3, topics={"foo", "bar"})
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+
+    def test_build_build_query(self):
+        operation = self.factory.build_query(retry=3, records=100, topics={"foo", "bar"})
+        self.assertIsInstance(operation, AsyncpgDatabaseOperation)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from minos.common import (
+    DatabaseOperation,
+)
+from minos.plugins.asyncpg import (
+    AsyncpgDatabaseOperation,
+)
+from minos.plugins.asyncpg.operations import (
+    build_positional_query,
+)
+
+
+class TestAsyncpgDatabaseOperation(unittest.TestCase):
+    def test_subclass(self) -> None:
+        self.assertTrue(issubclass(AsyncpgDatabaseOperation, DatabaseOperation))
+
+    def test_constructor(self):
+        operation = AsyncpgDatabaseOperation("query", {"foo": "bar"})
+        self.assertEqual("query", operation.query)
+        self.assertEqual({"foo": "bar"}, operation.parameters)
+        self.assertEqual(None, operation.timeout)
+        self.assertEqual(None, operation.lock)
+
+    def test_build(self):
+        operation = AsyncpgDatabaseOperation(
+            "SELECT * FROM foo WHERE a = %(a)s AND b = %(b)s AND c = %(a)s", {"b": 2, "a": 1, "c": 3}
+        )
+        self.assertEqual(("SELECT * FROM foo WHERE a = $1 AND b = $2 AND c = $1", (1, 2)), operation.build())
+
+    def test_build_without_parameters(self):
+        operation = AsyncpgDatabaseOperation("SELECT * FROM foo")
+        self.assertEqual(("SELECT * FROM foo", tuple()), operation.build())
+
+
+class TestBuildPositionalQuery(unittest.TestCase):
+    def test_build(self):
+        self.assertEqual(
+            ("SELECT $1, $2::text[], $1", ("foo", "bar")),
+            build_positional_query("SELECT %(foo)s, %(bar)s::text[], %(foo)s"),
+        )
+
+    def test_build_escaped(self):
+        self.assertEqual(("SELECT 'a%' LIKE $1", ("foo",)), build_positional_query("SELECT 'a%%' LIKE %(foo)s"))
+
+    def test_build_raises_unsupported(self):
+        with self.assertRaises(ValueError):
+            build_positional_query("SELECT %s")
+
+
+if __name__ == "__main__":
+    unittest.main()
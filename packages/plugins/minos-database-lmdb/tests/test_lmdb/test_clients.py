@@ -7,6 +7,7 @@ from pathlib import (
 from minos.common import (
     DatabaseClient,
     DatabaseOperation,
+    MinosMsgPackProtocol,
     ProgrammingException,
 )
 from minos.plugins.lmdb import (
@@ -96,6 +97,18 @@ class TestLmdbDatabaseClient(unittest.IsolatedAsyncioTestCase):
                 {"key_one": "hello", "key_two": {"sub_key": "this is a sub text"}}, await client.fetch_one()
             )
 
+    async def test_execute_create_dict_with_msgpack_protocol(self):
+        create_op = LmdbDatabaseOperation(
+            LmdbDatabaseOperationType.CREATE, "TestOne", "first", {"key_one": "hello", "key_two": [1, 2]}
+        )
+        read_op = LmdbDatabaseOperation(LmdbDatabaseOperationType.READ, "TestOne", "first")
+
+        async with LmdbDatabaseClient(self.path, protocol=MinosMsgPackProtocol) as client:
+            await client.execute(create_op)
+            await client.execute(read_op)
+
+            self.assertEqual({"key_one": "hello", "key_two": [1, 2]}, await client.fetch_one())
+
     async def test_execute_create_list(self):
         create_op = LmdbDatabaseOperation(LmdbDatabaseOperationType.CREATE, "TestOne", "first", ["hello", "minos"])
         read_op = LmdbDatabaseOperation(LmdbDatabaseOperationType.READ, "TestOne", "first")
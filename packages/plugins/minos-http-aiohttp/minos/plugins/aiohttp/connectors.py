@@ -1,9 +1,11 @@
 import logging
 from collections.abc import (
+    AsyncIterator,
     Callable,
 )
 from typing import (
     Optional,
+    Union,
 )
 
 from aiohttp import (
@@ -28,7 +30,7 @@ from .requests import (
 logger = logging.getLogger(__name__)
 
 
-class AioHttpConnector(HttpConnector[web.Request, web.Response]):
+class AioHttpConnector(HttpConnector[web.Request, web.StreamResponse]):
     """AioHttp Connector class."""
 
     def __init__(self, *args, shutdown_timeout: float = 6, **kwargs):
@@ -76,19 +78,28 @@ class AioHttpConnector(HttpConnector[web.Request, web.Response]):
     async def _build_request(self, request: web.Request) -> Request:
         return AioHttpRequest(request)
 
-    async def _build_response(self, response: Optional[Response]) -> web.Response:
+    async def _build_response(self, response: Optional[Response]) -> Union[web.Response, web.StreamResponse]:
         if not isinstance(response, AioHttpResponse):
             response = AioHttpResponse.from_response(response)
 
-        content = await response.content()
         content_type = response.content_type
         status = response.status
 
+        if response.is_streaming:
+            return _AioHttpStreamResponse(response.content_stream(), content_type=content_type, status=status)
+
+        content = await response.content()
+
         return web.Response(body=content, content_type=content_type, status=status)
 
     async def _build_error_response(self, message: str, status: int) -> web.Response:
         return web.Response(text=message, status=status)
 
+    async def _send_response(self, request: web.Request, response: web.StreamResponse) -> web.StreamResponse:
+        if isinstance(response, _AioHttpStreamResponse):
+            await response.send(request)
+        return response
+
     async def _start(self) -> None:
         self._runner = web_runner.AppRunner(self.application, access_log=None)
         await self._runner.setup()
@@ -111,3 +122,41 @@ class AioHttpConnector(HttpConnector[web.Request, web.Response]):
         if self._runner is not None:
             await self._runner.cleanup()
             self._runner = None
+
+
+class _AioHttpStreamResponse(web.StreamResponse):
+    """Stream response that writes the given chunks while the request is being dispatched."""
+
+    def __init__(self, chunks: AsyncIterator[bytes], *args, content_type: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.content_type = content_type
+        self._chunks = chunks
+
+    async def send(self, request: web.Request) -> None:
+        """Prepare the response, write all the chunks and then finish it.
+
+        The first chunk is built before preparing the response, so the errors raised on it can still be returned as an
+        error response. If an error is raised once the status and the headers have been sent, the connection is closed
+        without finishing the body, so the client can detect that the content is incomplete.
+
+        :param request: The request to be responded.
+        :return: This method does not return anything.
+        """
+        chunks = self._chunks.__aiter__()
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = None
+
+        await self.prepare(request)
+        try:
+            if first is not None:
+                await self.write(first)
+            async for chunk in chunks:
+                await self.write(chunk)
+        except Exception as exc:
+            if request.transport is not None:
+                request.transport.close()
+            raise exc
+
+        await self.write_eof()
@@ -2,11 +2,14 @@ from __future__ import (
     annotations,
 )
 
+import io
 import warnings
 from collections import (
     defaultdict,
 )
 from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
     Callable,
     Iterable,
 )
@@ -18,6 +21,7 @@ from typing import (
     Awaitable,
     Optional,
     Union,
+    get_args,
 )
 from urllib.parse import (
     parse_qsl,
@@ -33,6 +37,15 @@ from aiohttp import (
 from cached_property import (
     cached_property,
 )
+from fastavro import (
+    parse_schema,
+)
+from fastavro.validation import (
+    ValidationError,
+)
+from fastavro.write import (
+    Writer,
+)
 from orjson import (
     orjson,
 )
@@ -141,8 +154,7 @@ class AioHttpRequest(HttpRequest):
         return self._parse_multi_dict(form)
 
     async def _raw_avro(self) -> Any:
-        data = MinosAvroProtocol.decode(await self._raw_bytes())
-        schema = MinosAvroProtocol.decode_schema(await self._raw_bytes())
+        schema, data = MinosAvroProtocol.decode_with_schema(await self._raw_bytes())
 
         type_ = AvroSchemaDecoder(schema).build()
         return AvroDataDecoder(type_).build(data)
@@ -247,7 +259,29 @@ class AioHttpRequest(HttpRequest):
 
 
 class AioHttpResponse(HttpResponse):
-    """Aiohttp Response class."""
+    """Aiohttp Response class.
+
+    The data can also be an asynchronous iterable, in which case the content is streamed item by item: ``avro/binary``
+    responses are sent as an avro container file of items, ``application/json`` responses as a ``json`` array and
+    ``application/x-ndjson`` responses as newline-delimited ``json``.
+
+    As the avro schema is written before the items, the ``avro/binary`` content is only written block by block when the
+    type of the items is given by ``avro_item_type`` (and then every item is validated against it). Otherwise, the items
+    are collected first, so that the schema matches all of them.
+    """
+
+    def __init__(self, *args, avro_sync_interval: int = 16 * 1024, avro_item_type: Optional[type] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._avro_sync_interval = avro_sync_interval
+        self._avro_item_type = avro_item_type
+
+    @property
+    def is_streaming(self) -> bool:
+        """Check if the content is streamed.
+
+        :return: ``True`` if the data is an asynchronous iterable or ``False`` otherwise.
+        """
+        return isinstance(self._data, AsyncIterable)
 
     # noinspection PyUnusedLocal
     async def content(self, **kwargs) -> Optional[bytes]:
@@ -258,8 +292,102 @@ class AioHttpResponse(HttpResponse):
         """
         if not self.has_content:
             return None
+        if self.is_streaming:
+            return b"".join([chunk async for chunk in self.content_stream(**kwargs)])
         return await self._content_parser()
 
+    # noinspection PyUnusedLocal
+    async def content_stream(self, **kwargs) -> AsyncIterator[bytes]:
+        """Raw response content as a sequence of chunks.
+
+        :param kwargs: Additional named arguments.
+        :return: An asynchronous iterator of ``bytes`` instances.
+        """
+        if not self.has_content:
+            return
+
+        if not self.is_streaming:
+            yield await self._content_parser()
+            return
+
+        async for chunk in self._stream_parser():
+            yield chunk
+
+    @cached_property
+    def _stream_parser(self) -> Callable[[], AsyncIterator[bytes]]:
+        mapper = {
+            "application/json": self._stream_json,
+            "application/x-ndjson": self._stream_ndjson,
+            "avro/binary": self._stream_avro,
+            "text/plain": self._stream_text,
+            "application/octet-stream": self._stream_bytes,
+        }
+
+        if self.content_type not in mapper:
+            return self._stream_bytes
+
+        return mapper[self.content_type]
+
+    async def _stream_json(self) -> AsyncIterator[bytes]:
+        separator = b"["
+        async for item in self._data:
+            yield separator + orjson.dumps(AvroDataEncoder(item).build())
+            separator = b","
+
+        if separator == b"[":
+            yield b"[]"
+        else:
+            yield b"]"
+
+    async def _stream_ndjson(self) -> AsyncIterator[bytes]:
+        async for item in self._data:
+            yield orjson.dumps(AvroDataEncoder(item).build()) + b"\n"
+
+    async def _stream_avro(self) -> AsyncIterator[bytes]:
+        if self._avro_item_type is None:
+            items = [item async for item in self._data]
+            if not items:
+                return
+
+            type_ = get_args(TypeHintBuilder(items).build())[0]
+            async for chunk in self._write_avro(type_, _iterate(items)):
+                yield chunk
+        else:
+            async for chunk in self._write_avro(self._avro_item_type, self._data):
+                yield chunk
+
+    async def _write_avro(self, type_: type, items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+        schema = AvroSchemaEncoder(type_).build()
+
+        with io.BytesIO() as file:
+            writer = Writer(file, parse_schema(schema), sync_interval=self._avro_sync_interval, validator=True)
+            async for item in items:
+                try:
+                    writer.write(AvroDataEncoder(item).build())
+                except ValidationError as exc:
+                    raise ValueError(f"The given item does not match the {type_!r} type: {item!r}.") from exc
+                if file.tell():
+                    yield _pop_buffer(file)
+
+            writer.flush()
+            yield _pop_buffer(file)
+
+    async def _stream_text(self) -> AsyncIterator[bytes]:
+        async for item in self._data:
+            if not isinstance(item, str):
+                raise ValueError(
+                    f"Given 'Content-Type' ({self.content_type!r}) is not supported for the given data: {item!r}."
+                )
+            yield item.encode()
+
+    async def _stream_bytes(self) -> AsyncIterator[bytes]:
+        async for item in self._data:
+            if not isinstance(item, bytes):
+                raise ValueError(
+                    f"Given 'Content-Type' ({self.content_type!r}) is not supported for the given data: {item!r}."
+                )
+            yield item
+
     @cached_property
     def _content_parser(self) -> Callable[[], Awaitable[bytes]]:
         mapper = {
@@ -312,5 +440,17 @@ class AioHttpResponse(HttpResponse):
         return AvroDataEncoder(self._data).build()
 
 
+async def _iterate(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+def _pop_buffer(file: io.BytesIO) -> bytes:
+    ans = file.getvalue()
+    file.seek(0)
+    file.truncate()
+    return ans
+
+
 class AioHttpResponseException(HttpResponseException):
     """Aiohttp Response Exception class."""
@@ -1,12 +1,14 @@
 import unittest
 from unittest.mock import (
     AsyncMock,
+    patch,
 )
 from uuid import (
     uuid4,
 )
 
 from aiohttp import (
+    ClientPayloadError,
     web,
     web_runner,
 )
@@ -153,5 +155,65 @@ class TestAioHttpConnectorApplication(AioHTTPTestCase):
         assert "ticket_added" in text
 
 
+class TestAioHttpConnectorStreaming(AioHTTPTestCase):
+    async def get_application(self) -> web.Application:
+        """For testing purposes."""
+
+        async def _fn(request: Request) -> Response:
+            async def _iterate():
+                for item in ["foo", "bar"]:
+                    yield item
+
+            return AioHttpResponse(_iterate(), status=201)
+
+        async def _fn_raises_first(request: Request) -> Response:
+            async def _iterate():
+                raise ValueError()
+                # noinspection PyUnreachableCode
+                yield
+
+            return AioHttpResponse(_iterate())
+
+        async def _fn_raises(request: Request) -> Response:
+            async def _iterate():
+                yield "foo"
+                raise ValueError()
+
+            return AioHttpResponse(_iterate())
+
+        self.connector = AioHttpConnector.from_config(CONFIG_FILE_PATH)
+        self.connector.mount_route("/stream", "GET", _fn)
+        self.connector.mount_route("/stream/raises-first", "GET", _fn_raises_first)
+        self.connector.mount_route("/stream/raises", "GET", _fn_raises)
+        return self.connector.application
+
+    async def test_stream(self):
+        resp = await self.client.request("GET", "/stream")
+        self.assertEqual(201, resp.status)
+        self.assertEqual("application/json", resp.content_type)
+        self.assertEqual("chunked", resp.headers["Transfer-Encoding"])
+        self.assertEqual(["foo", "bar"], orjson.loads(await resp.read()))
+
+    async def test_stream_raises_first(self):
+        with self.assertLogs("minos.networks.http.connectors", "ERROR"):
+            resp = await self.client.request("GET", "/stream/raises-first")
+        self.assertEqual(500, resp.status)
+
+    async def test_stream_raises(self):
+        with self.assertLogs("minos.networks.http.connectors", "ERROR"):
+            resp = await self.client.request("GET", "/stream/raises")
+            self.assertEqual(200, resp.status)
+            with self.assertRaises(ClientPayloadError):
+                await resp.read()
+
+    async def test_stream_semaphore(self):
+        # noinspection PyProtectedMember
+        semaphore = self.connector._semaphore
+        with patch.object(semaphore, "release", side_effect=semaphore.release) as release_mock:
+            resp = await self.client.request("GET", "/stream")
+            await resp.read()
+            self.assertEqual(1, release_mock.call_count)
+
+
 if __name__ == "__main__":
     unittest.main()
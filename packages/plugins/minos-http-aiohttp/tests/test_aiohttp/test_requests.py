@@ -444,6 +444,116 @@ class TestAioHttpResponse(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(IMAGE_PNG, response.content_type)
 
 
+class TestAioHttpResponseStreaming(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.data = [FakeModel("foo"), FakeModel("bar"), FakeModel("foobar")]
+
+    async def _iterate(self, data):
+        for item in data:
+            yield item
+
+    def test_is_streaming(self):
+        self.assertTrue(AioHttpResponse(self._iterate(self.data)).is_streaming)
+        self.assertFalse(AioHttpResponse(self.data).is_streaming)
+
+    async def test_content_stream_not_streaming(self):
+        response = AioHttpResponse(self.data)
+        self.assertEqual([await response.content()], [chunk async for chunk in response.content_stream()])
+
+    async def test_content_stream_empty(self):
+        response = AioHttpResponse()
+        self.assertEqual([], [chunk async for chunk in response.content_stream()])
+
+    async def test_content_json(self):
+        response = AioHttpResponse(self._iterate(self.data))
+        self.assertEqual(orjson.dumps([item.avro_data for item in self.data]), await response.content())
+
+    async def test_content_json_empty(self):
+        response = AioHttpResponse(self._iterate([]))
+        self.assertEqual(b"[]", await response.content())
+
+    async def test_content_stream_json(self):
+        response = AioHttpResponse(self._iterate(self.data))
+        chunks = [chunk async for chunk in response.content_stream()]
+        self.assertEqual(len(self.data) + 1, len(chunks))
+
+    async def test_content_ndjson(self):
+        response = AioHttpResponse(self._iterate(self.data), content_type="application/x-ndjson")
+        expected = b"".join(orjson.dumps(item.avro_data) + b"\n" for item in self.data)
+        self.assertEqual(expected, await response.content())
+
+    async def test_content_avro(self):
+        response = AioHttpResponse(self._iterate(self.data), content_type=AVRO_BINARY)
+        content = await response.content()
+        self.assertEqual([item.avro_data for item in self.data], MinosAvroProtocol.decode(content, batch_mode=True))
+
+    async def test_content_stream_avro_blocks(self):
+        data = [FakeModel(str(i)) for i in range(100)]
+        item_type = ModelType.build("FakeModel", {"data": str}, namespace_="tests.utils")
+        response = AioHttpResponse(
+            self._iterate(data), content_type=AVRO_BINARY, avro_sync_interval=64, avro_item_type=item_type
+        )
+        chunks = [chunk async for chunk in response.content_stream()]
+
+        self.assertLess(2, len(chunks))
+        self.assertEqual([item.avro_data for item in data], MinosAvroProtocol.decode(b"".join(chunks), batch_mode=True))
+
+    async def test_content_stream_avro_without_item_type(self):
+        data = [FakeModel(str(i)) for i in range(100)]
+        consumed = list()
+
+        async def _iterate():
+            for item in data:
+                consumed.append(item)
+                yield item
+
+        response = AioHttpResponse(_iterate(), content_type=AVRO_BINARY, avro_sync_interval=64)
+        chunks = response.content_stream()
+
+        first = await chunks.__anext__()
+        self.assertEqual(data, consumed)
+
+        content = first + b"".join([chunk async for chunk in chunks])
+        self.assertEqual([item.avro_data for item in data], MinosAvroProtocol.decode(content, batch_mode=True))
+
+    async def test_content_avro_mixed(self):
+        for data in ([1, 2.5], [{"a": 1}, {"a": "x"}]):
+            with self.subTest(data=data):
+                response = AioHttpResponse(self._iterate(data), content_type=AVRO_BINARY)
+                self.assertEqual(data, MinosAvroProtocol.decode(await response.content(), batch_mode=True))
+
+    async def test_content_avro_item_type_raises(self):
+        response = AioHttpResponse(self._iterate([1, 2.5]), content_type=AVRO_BINARY, avro_item_type=int)
+        with self.assertRaises(ValueError):
+            await response.content()
+
+    async def test_content_avro_empty(self):
+        response = AioHttpResponse(self._iterate([]), content_type=AVRO_BINARY)
+        self.assertEqual(b"", await response.content())
+
+    async def test_content_avro_empty_with_item_type(self):
+        response = AioHttpResponse(self._iterate([]), content_type=AVRO_BINARY, avro_item_type=FakeModel)
+        self.assertEqual([], MinosAvroProtocol.decode(await response.content(), batch_mode=True))
+
+    async def test_content_text(self):
+        response = AioHttpResponse(self._iterate(["foo", "bar"]), content_type=TEXT_PLAIN)
+        self.assertEqual(b"foobar", await response.content())
+
+    async def test_content_text_raises(self):
+        response = AioHttpResponse(self._iterate([56]), content_type=TEXT_PLAIN)
+        with self.assertRaises(ValueError):
+            await response.content()
+
+    async def test_content_bytes(self):
+        response = AioHttpResponse(self._iterate([b"foo", b"bar"]), content_type=APPLICATION_OCTET_STREAM)
+        self.assertEqual(b"foobar", await response.content())
+
+    async def test_content_bytes_raises(self):
+        response = AioHttpResponse(self._iterate([56]), content_type=APPLICATION_OCTET_STREAM)
+        with self.assertRaises(ValueError):
+            await response.content()
+
+
 class TestAioHttpResponseException(unittest.TestCase):
     def test_is_subclass(self):
         self.assertTrue(issubclass(AioHttpResponseException, HttpResponseException))